@@ -8,6 +8,7 @@ from typing import Any, get_args, get_origin, Union, Annotated
 
 from code_generation.shared.utils import camel_to_snake
 
+from multiconn_archicad.core.command_kinds import is_read_only
 from multiconn_archicad.models.official import commands as official_commands
 from multiconn_archicad.models.official import types as official_types
 from multiconn_archicad.models.tapir import commands as tapir_commands
@@ -184,6 +185,7 @@ def _generate_standard_method(
 
     signature, param_docs = _build_signature_and_docs(snake_name, params_model, final_return_type_hint, dependencies)
     docstring = _build_docstring(command_details["description"], param_docs, return_doc_info)
+    chunked_fields = _find_chunked_fields(command_details["name"], params_model, result_model)
 
     body = _build_body(
         command_details["name"],
@@ -193,6 +195,7 @@ def _generate_standard_method(
         result_model,
         result_model_name,
         alias_property_name,
+        chunked_fields,
     )
 
     return {
@@ -200,8 +203,35 @@ def _generate_standard_method(
         "command_model_dependencies": sorted(list(dependencies["commands"])),
         "type_model_dependencies": sorted(list(dependencies["types"])),
         "alias_property_name": alias_property_name,
+        "core_method": _core_method(command_details["source"], chunked_fields),
     }
 
+
+def _find_chunked_fields(original_command_name: str, params_model: Any, result_model: Any) -> tuple[str, str] | None:
+    """
+    Read-only commands that take an 'elements' list and answer with a single list can be split into chunks
+    by the core: concatenating the chunks' result lists keeps the order of the elements.
+    Returns the names of the chunked parameter and result fields, or None.
+    """
+    if not is_read_only(original_command_name) or params_model is None or result_model is None:
+        return None
+    if is_union(params_model) or is_union(result_model):
+        return None
+    elements_field = params_model.model_fields.get("elements")
+    if elements_field is None or get_origin(elements_field.annotation) is not list:
+        return None
+    if len(result_model.model_fields) != 1:
+        return None
+    result_field_name, result_field = next(iter(result_model.model_fields.items()))
+    if get_origin(result_field.annotation) is not list:
+        return None
+    return "elements", result_field_name
+
+
+def _core_method(source: str, chunked_fields: tuple[str, str] | None) -> str:
+    core_method = "post_tapir_command" if source == "tapir" else "post_command"
+    return f"{core_method}_chunked" if chunked_fields else core_method
+
 def _build_signature_and_docs(
     snake_name: str, params_model: Any, return_type_hint: str, dependencies: dict
 ) -> tuple[str, list[str]]:
@@ -297,50 +327,63 @@ def _build_body(
     validation_model: Any,
     validation_model_name: str | None,
     alias_property_name: str | None,
+    chunked_fields: tuple[str, str] | None = None,
 ) -> str:
     """Constructs the method body, creating the params dict and handling alias returns."""
-    core_call_method = "post_tapir_command" if source == "tapir" else "post_command"
+    core_call_method = _core_method(source, chunked_fields)
     body_lines = []
+    # The stages of the call are timed by the profiler in multiconn_archicad.core.profiling, if one is running
+    profiled_lines = []
 
     if params_model:
         if is_union(params_model):
-            body_lines.append(f"validated_params = TypeAdapter({params_model_name}).validate_python(parameters)")
+            profiled_lines.append(f"validated_params = TypeAdapter({params_model_name}).validate_python(parameters)")
         else:
             params_map_lines = ["{"]
             for param in inspect.signature(params_model).parameters.values():
                 params_map_lines.append(f"    '{param.name}': {camel_to_snake(param.name)},")
             params_map_lines.append("}")
             params_map = "\n    ".join(params_map_lines)
-            body_lines.extend(
-                [
-                    f"params_dict = {params_map}",
-                    f"validated_params = {params_model_name}(**params_dict)",
-                ]
-            )
+            body_lines.append(f"params_dict = {params_map}")
+            profiled_lines.append(f"validated_params = {params_model_name}(**params_dict)")
+        profiled_lines.extend(
+            [
+                'profile.lap("validate_parameters")',
+                "dumped_params = validated_params.model_dump(mode='json', by_alias=True, exclude_none=True)",
+                'profile.lap("dump_parameters")',
+            ]
+        )
 
     call_args = [f'"{original_command_name}"']
     if params_model:
-        call_args.append("validated_params.model_dump(mode='json', by_alias=True, exclude_none=True)")
+        call_args.append("dumped_params")
+    if chunked_fields:
+        chunked_parameter, chunked_result = chunked_fields
+        call_args.extend([f'chunked_parameter="{chunked_parameter}"', f'chunked_result="{chunked_result}"'])
     call_expression = f"self._core.{core_call_method}(\n    {',\n    '.join(call_args)}\n)"
 
+    return_line = "return None"
     if not validation_model:
-        body_lines.append(call_expression)
-        body_lines.append("return None")
+        profiled_lines.append(call_expression)
     else:
-        body_lines.append(f"response_dict = {call_expression}")
+        profiled_lines.extend([f"response_dict = {call_expression}", "profile.lap()"])
 
         if is_union(validation_model):
-            body_lines.append(
+            profiled_lines.append(
                 f"validated_response = TypeAdapter({validation_model_name}).validate_python(response_dict)"
             )
         else:
-            body_lines.append(f"validated_response = {validation_model_name}.model_validate(response_dict)")
+            profiled_lines.append(f"validated_response = {validation_model_name}.model_validate(response_dict)")
+        profiled_lines.append('profile.lap("validate_result", validated_response)')
 
         if alias_property_name:
-            body_lines.append(f"return validated_response.{alias_property_name}")
+            return_line = f"return validated_response.{alias_property_name}"
         else:
-            body_lines.append("return validated_response")
+            return_line = "return validated_response"
 
+    body_lines.append(f'with profiled_call("{original_command_name}") as profile:')
+    body_lines.append(textwrap.indent("\n".join(profiled_lines), "    "))
+    body_lines.append(return_line)
     return "\n".join(body_lines)
 
 
@@ -384,10 +427,12 @@ def _generate_rename_navigator_item_fix(command_details: dict[str, Any], depende
         else:
             inner_model = RenameNavigatorItemById(navigatorItemId=navigator_item_id, newId=new_id)
 
-        validated_params = RenameNavigatorItemParameters(root=inner_model)
-        self._core.post_command(
-            "API.RenameNavigatorItem", validated_params.model_dump(mode=\'json\', by_alias=True, exclude_none=True)
-        )
+        with profiled_call("API.RenameNavigatorItem") as profile:
+            validated_params = RenameNavigatorItemParameters(root=inner_model)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode=\'json\', by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_command("API.RenameNavigatorItem", dumped_params)
         return None
     """).strip()
 
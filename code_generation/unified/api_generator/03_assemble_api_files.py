@@ -91,6 +91,7 @@ class FileAssembler:
             "from typing import TYPE_CHECKING",
             "from pydantic import TypeAdapter",
             "",
+            "from multiconn_archicad.core.profiling import profiled_call",
             imports_block,
             "",
             "if TYPE_CHECKING:",
@@ -154,7 +154,7 @@ class TestGenerator:
 
         has_params = "input_data: dict" in given_args
         has_result = "mock_response: dict" in given_args
-        core_method = "post_tapir_command" if source == "tapir" else "post_command"
+        core_method = command_details.get("core_method") or ("post_tapir_command" if source == "tapir" else "post_command")
         alias_prop = command_details.get("alias_property_name")
 
         params_obj = self._get_model_object(params_model_name, source) if params_model_name else None
@@ -0,0 +1,234 @@
+"""
+Validation and serialization micro-benchmarks of the command models.
+
+For every command of the official API and Tapir, payloads of its result and parameters models are drawn from
+the master schemas with hypothesis-jsonschema, then their top-level lists are filled up to `--items` entries.
+Each payload is validated from Python objects and from JSON, dumped to both, and its peak allocation during
+validation is measured. The same recursion patches as the generated model tests keep the schemas finite.
+
+Usage:
+    python scripts/benchmarks/model_benchmarks.py --output models.json
+    python scripts/benchmarks/model_benchmarks.py --filter "Details|Property" --compare models.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import itertools
+import json
+import platform
+import re
+import sys
+import warnings
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from hypothesis import HealthCheck, Phase, given, settings  # noqa: E402
+from hypothesis.errors import HypothesisWarning  # noqa: E402
+from hypothesis_jsonschema import from_schema  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from run_benchmarks import compare, measure, peak_memory  # noqa: E402
+
+from multiconn_archicad.models.official import commands as official_models  # noqa: E402
+from multiconn_archicad.models.tapir import commands as tapir_models  # noqa: E402
+
+SOURCES = {
+    "official": (
+        official_models,
+        PROJECT_ROOT / "code_generation" / "official" / "schema",
+        "official_api_master_schema.json",
+        "code_generation.official.model_generators.07_generate_model_tests",
+    ),
+    "tapir": (
+        tapir_models,
+        PROJECT_ROOT / "code_generation" / "tapir" / "schema",
+        "tapir_master_schema.json",
+        "code_generation.tapir.model_generators.08_generate_model_tests",
+    ),
+}
+KINDS = ("Result", "Parameters")
+# Unions whose variants are drawn one at a time: drawn together, hypothesis rarely produces valid payloads,
+# and the generated tests patch them down to a single variant, which would hide the cost of the union
+UNION_VARIANTS = {"GetDetailsOfElementsResult": "TypeSpecificDetails"}
+
+
+class CommandModel:
+    """A command result or parameters model with the JSON schemas its payloads are drawn from."""
+
+    def __init__(self, source: str, name: str, model: Any, schemas: list[dict[str, Any]]) -> None:
+        self.source = source
+        self.name = name
+        self.adapter: TypeAdapter[Any] = TypeAdapter(model)
+        self.schemas = schemas
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}.{self.name}"
+
+
+def command_models(pattern: str | None = None, kinds: tuple[str, ...] = KINDS) -> Iterator[CommandModel]:
+    for source, (module, schema_dir, master_file, test_generator) in SOURCES.items():
+        definitions = json.loads((schema_dir / master_file).read_text(encoding="utf-8"))["$defs"]
+        commands = json.loads((schema_dir / "_command_details.json").read_text(encoding="utf-8"))
+        generator = importlib.import_module(test_generator)
+        for command, kind in itertools.product(commands, kinds):
+            name = f"{command['name'].removeprefix('API.')}{kind}"
+            model = getattr(module, name, None)
+            if model is None or name not in definitions or (pattern and not re.search(pattern, name)):
+                continue
+            if name in UNION_VARIANTS:
+                schemas = [
+                    _schema(name, {**definitions, UNION_VARIANTS[name]: variant}, generator)
+                    for variant in definitions[UNION_VARIANTS[name]]["oneOf"]
+                ]
+            else:
+                source_definitions = definitions
+                if name in generator.SCHEMAS_TO_PATCH:
+                    source_definitions = generator.patch_schema_definitions(definitions, name)
+                schemas = [_schema(name, source_definitions, generator)]
+            yield CommandModel(source, name, model, schemas)
+
+
+def _schema(name: str, definitions: dict[str, Any], generator: Any) -> dict[str, Any]:
+    minimal: dict[str, Any] = {}
+    generator.collect_dependencies_recursively(name, definitions, minimal, set())
+    return {"$schema": "http://json-schema.org/draft-07/schema#", "$defs": minimal, "$ref": f"#/$defs/{name}"}
+
+
+def draw_examples(schema: dict[str, Any], count: int) -> list[Any]:
+    """`count` deterministic examples of `schema`."""
+    examples: list[Any] = []
+
+    @settings(
+        max_examples=count,
+        database=None,
+        derandomize=True,
+        deadline=None,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+    )
+    @given(from_schema(schema))
+    def collect(example: Any) -> None:
+        examples.append(example)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", HypothesisWarning)
+        collect()
+    return examples
+
+
+def scale(examples: list[Any], items: int) -> tuple[Any, int]:
+    """
+    The richest example with each of its top-level lists filled to `items` entries from the entries of all
+    examples, and the number of list entries in the result.
+    """
+    base = max(examples, key=lambda example: len(json.dumps(example)))
+    if not isinstance(base, dict):
+        return base, 1
+    payload = dict(base)
+    total = 0
+    for key, value in base.items():
+        if not isinstance(value, list):
+            continue
+        pool = [entry for example in examples if isinstance(example, dict) for entry in example.get(key) or []]
+        if pool:
+            payload[key] = list(itertools.islice(itertools.cycle(pool), items))
+        total += len(payload[key])
+    return payload, max(total, 1)
+
+
+def valid_examples(command_model: CommandModel, count: int) -> list[Any]:
+    """Examples of every schema of `command_model` that its pydantic model accepts."""
+    examples = []
+    for schema in command_model.schemas:
+        for example in draw_examples(schema, count):
+            try:
+                command_model.adapter.validate_python(example)
+            except ValueError:
+                continue
+            examples.append(example)
+    if not examples:
+        raise ValueError(f"None of the examples drawn from the schema of {command_model.name} are valid.")
+    return examples
+
+
+def bench_model(command_model: CommandModel, examples: int, items: int, repeats: int) -> dict[str, Any]:
+    payload, entries = scale(valid_examples(command_model, examples), items)
+    adapter = command_model.adapter
+    raw = json.dumps(payload).encode()
+    instance = adapter.validate_python(payload)
+
+    validate_python = measure(lambda: adapter.validate_python(payload), repeats)
+    return {
+        "entries": entries,
+        "payload_bytes": len(raw),
+        "validate_python": validate_python,
+        "validate_json": measure(lambda: adapter.validate_json(raw), repeats),
+        "dump_python": measure(
+            lambda: adapter.dump_python(instance, mode="json", by_alias=True, exclude_none=True), repeats
+        ),
+        "dump_json": measure(lambda: adapter.dump_json(instance, by_alias=True, exclude_none=True), repeats),
+        "microseconds_per_entry": validate_python["median"] / entries * 1e6,
+        "peak_memory_validate_bytes": peak_memory(lambda: adapter.validate_python(payload)),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark validation and dumping of the command models.")
+    parser.add_argument("--output", default="model_benchmark_results.json", help="Path of the JSON results.")
+    parser.add_argument("--compare", default=None, help="Results of an earlier run to compare with.")
+    parser.add_argument("--filter", default=None, help="Regular expression the result model names must match.")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="Comma separated kinds of models: Result, Parameters.")
+    parser.add_argument("--items", type=int, default=1000, help="Entries of the top-level lists of each payload.")
+    parser.add_argument("--examples", type=int, default=20, help="Hypothesis examples drawn per model.")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs of each benchmark.")
+    parser.add_argument("--top", type=int, default=15, help="Slowest models to print.")
+    args = parser.parse_args(argv)
+
+    results: dict[str, Any] = {
+        "environment": {
+            "multiconn_archicad": version("multiconn_archicad"),
+            "pydantic": version("pydantic"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "items": args.items,
+        },
+        "models": {},
+    }
+    failed: dict[str, str] = {}
+    for command_model in command_models(args.filter, tuple(args.kinds.split(","))):
+        print(f"{command_model.key}...", flush=True)
+        try:
+            results["models"][command_model.key] = bench_model(command_model, args.examples, args.items, args.repeats)
+        except Exception as e:
+            failed[command_model.key] = f"{type(e).__name__}: {e}"
+    results["failed"] = failed
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults of {len(results['models'])} models written to {args.output}, {len(failed)} failed.")
+
+    slowest = sorted(results["models"].items(), key=lambda item: item[1]["microseconds_per_entry"], reverse=True)
+    print(f"\n{'Slowest validation per list entry':<60} {'us/entry':>10} {'MB/s (JSON)':>12} {'peak MB':>9}")
+    for key, figures in slowest[: args.top]:
+        throughput = figures["payload_bytes"] / figures["validate_json"]["median"] / 1e6
+        peak = figures["peak_memory_validate_bytes"] / 1e6
+        print(f"{key:<60} {figures['microseconds_per_entry']:>10.2f} {throughput:>12.1f} {peak:>9.1f}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nMedians compared with {args.compare}:")
+        for line in compare(results["models"], baseline.get("models", {})):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+End-to-end benchmarks of MultiConn against simulated Archicad instances.
+
+The simulated instances run in a separate process (`python -m multiconn_archicad.simulation`), so their work
+does not compete with the measured client for the GIL and does not count towards its memory.
+
+Usage:
+    python scripts/benchmarks/run_benchmarks.py --output results.json
+    python scripts/benchmarks/run_benchmarks.py --output new.json --compare results.json
+    python scripts/benchmarks/run_benchmarks.py --memory-profile --sizes 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib.metadata import version
+from typing import Any, Callable, Iterator
+
+from multiconn_archicad import CoreConfig, MultiConn, Port, StageProfiler
+from multiconn_archicad.models.official.types import (
+    ElementPropertyValue,
+    NormalStringPropertyValue,
+)
+
+_SERVING = re.compile(r"at http://127\.0\.0\.1:(\d+)")
+
+
+@contextmanager
+def simulated_instances(count: int, elements: int, latency: float) -> Iterator[list[Port]]:
+    """Runs `count` simulated instances in a child process and yields their ports."""
+    command = [sys.executable, "-m", "multiconn_archicad.simulation"]
+    command += ["--instances", str(count), "--elements", str(elements), "--latency", str(latency)]
+    process = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+    try:
+        ports: list[Port] = []
+        while len(ports) < count:
+            line = process.stderr.readline()
+            if not line:
+                raise RuntimeError(f"The simulation process exited with code {process.wait()}.")
+            if match := _SERVING.search(line):
+                ports.append(Port(int(match.group(1))))
+        yield ports
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def measure(action: Callable[[], Any], repeats: int, setup: Callable[[], Any] | None = None) -> dict[str, float]:
+    """Seconds `action` takes over `repeats` runs, `setup` runs untimed before each."""
+    durations = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+    return _summary(durations)
+
+
+def _summary(durations: list[float]) -> dict[str, float]:
+    ordered = sorted(durations)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "max": ordered[-1],
+        "runs": len(ordered),
+    }
+
+
+def peak_memory(action: Callable[[], Any]) -> int:
+    """Peak bytes allocated by Python while `action` runs."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_discovery(ports: list[Port], repeats: int, config: CoreConfig) -> dict[str, Any]:
+    MultiConn._port_range = ports
+    conns: list[MultiConn] = []
+
+    def construct() -> None:
+        conns.append(MultiConn(core_config=config))
+
+    construction = measure(construct, repeats)
+    conn = conns[-1]
+    for other in conns[:-1]:
+        other.close()
+    refresh = measure(conn.refresh.all_ports, repeats)
+    connect = measure(conn.connect.all, repeats, setup=conn.disconnect.all)
+    found = len(conn.open_port_headers)
+    conn.close()
+    return {"instances": found, "construction": construction, "refresh_all_ports": refresh, "connect_all": connect}
+
+
+def bench_round_trip(port: Port, calls: int, config: CoreConfig) -> dict[str, Any]:
+    MultiConn._port_range = [port]
+    with MultiConn(core_config=config) as conn:
+        core = conn.primary.core
+        core.post_command("API.IsAlive")  # opens the connection outside of the measurement
+        durations = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            core.post_command("API.IsAlive")
+            durations.append(time.perf_counter() - start)
+    return _summary(durations)
+
+
+def bench_bulk_properties(port: Port, repeats: int, config: CoreConfig) -> dict[str, Any]:
+    MultiConn._port_range = [port]
+    with MultiConn(core_config=config) as conn:
+        official = conn.primary.unified.official
+        elements = official.element_listing.get_all_elements()
+        properties = official.property.get_all_property_ids()[:4]
+        string_property = properties[0]
+
+        def read() -> None:
+            official.property.get_property_values_of_elements(elements, properties)
+
+        values = [
+            ElementPropertyValue(
+                elementId=element.elementId,
+                propertyId=string_property.propertyId,
+                propertyValue=NormalStringPropertyValue(value=f"B-{index}"),
+            )
+            for index, element in enumerate(elements)
+        ]
+
+        def write() -> None:
+            official.property.set_property_values_of_elements(values)
+
+        read_times = measure(read, repeats)
+        write_times = measure(write, repeats)
+        return {
+            "elements": len(elements),
+            "properties_read": len(properties),
+            "read": read_times,
+            "read_values_per_second": len(elements) * len(properties) / read_times["median"],
+            "write": write_times,
+            "write_values_per_second": len(elements) / write_times["median"],
+            "peak_memory_read_bytes": peak_memory(read),
+            "peak_memory_write_bytes": peak_memory(write),
+        }
+
+
+def profile_memory(port: Port, config: CoreConfig) -> dict[str, Any]:
+    """
+    Where the memory of listing the elements and reading their properties goes, by stage and by the types of
+    the decoded responses and the validated results, e.g. ElementId and UUID objects against raw dictionaries.
+    """
+    MultiConn._port_range = [port]
+    with MultiConn(core_config=config) as conn:
+        official = conn.primary.unified.official
+        properties = official.property.get_all_property_ids()[:4]
+        with StageProfiler(memory=True) as profiler:
+            elements = official.element_listing.get_all_elements()
+            official.property.get_property_values_of_elements(elements, properties)
+        print(profiler.memory_report(by_command=True, top=20))
+    stages: dict[str, dict[str, int]] = {}
+    for stats in profiler.memory_summary(by_command=True):
+        stages.setdefault(stats.command, {})[f"{stats.stage}_bytes"] = (
+            stats.peak if stats.stage == "peak" else stats.total
+        )
+    objects: dict[str, dict[str, int]] = {}
+    for item in profiler.object_summary(by_command=True):
+        counted = objects.setdefault(f"{item.command}.{item.stage}", {})
+        counted[f"{item.type}_count"] = item.count
+        counted[f"{item.type}_bytes"] = item.size
+    return {"stages": stages, "objects": objects}
+
+
+def _max_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    config = CoreConfig()
+    results: dict[str, Any] = {
+        "environment": {
+            "multiconn_archicad": version("multiconn_archicad"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "latency": args.latency,
+        },
+    }
+    with simulated_instances(args.instances, 100, args.latency) as ports:
+        print(f"Discovery and connection over {len(ports)} instances...")
+        results["discovery"] = bench_discovery(ports, args.repeats, config)
+        print("Round-trip latency...")
+        results["round_trip"] = bench_round_trip(ports[0], args.calls, config)
+    results["bulk_properties"] = {}
+    for size in args.sizes:
+        print(f"Bulk property reads and writes of {size} elements...")
+        with simulated_instances(1, size, args.latency) as ports:
+            results["bulk_properties"][str(size)] = bench_bulk_properties(ports[0], args.repeats, config)
+            if args.memory_profile:
+                results["bulk_properties"][str(size)]["memory_profile"] = profile_memory(ports[0], config)
+    results["max_rss_bytes"] = _max_rss_bytes()
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], prefix: str = "") -> Iterator[str]:
+    """Lines of the median timings and memory figures that exist in both results, with the change."""
+    for key, value in current.items():
+        name = f"{prefix}{key}"
+        old = baseline.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            if "median" in value and "median" in old:
+                yield _change(name, old["median"], value["median"], "s")
+            else:
+                yield from compare(value, old, f"{name}.")
+        elif key.endswith("bytes") and isinstance(value, int) and isinstance(old, int):
+            yield _change(name, old, value, "B")
+
+
+def _change(name: str, old: float, new: float, unit: str) -> str:
+    ratio = f"{(new - old) / old:+.1%}" if old else "n/a"
+    return f"{name:<55} {old:>14.6g}{unit} -> {new:>14.6g}{unit}  {ratio}"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MultiConn against simulated Archicad instances.")
+    parser.add_argument("--output", default="benchmark_results.json", help="Path of the JSON results.")
+    parser.add_argument("--compare", default=None, help="Results of an earlier run to compare with.")
+    parser.add_argument("--instances", type=int, default=4, help="Instances for the discovery benchmarks.")
+    parser.add_argument(
+        "--sizes", default="1000,10000,100000", help="Comma separated element counts of the bulk benchmarks."
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs of each benchmark.")
+    parser.add_argument("--calls", type=int, default=500, help="Commands of the round-trip benchmark.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated processing seconds per command.")
+    parser.add_argument(
+        "--memory-profile", action="store_true", help="Attribute the memory of a bulk read to stages and types."
+    )
+    args = parser.parse_args(argv)
+    args.sizes = [int(size) for size in args.sizes.split(",")]
+
+    results = run(args)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nMedians compared with {args.compare}:")
+        for line in compare(results, baseline):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
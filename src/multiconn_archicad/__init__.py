@@ -1,6 +1,7 @@
 import logging
 
 from .multi_conn import MultiConn
+from .metadata_cache import MetadataCache
 from .conn_header import (
     ConnHeader,
     ValidatedHeader,
@@ -22,7 +23,32 @@ from .basic_types import (
     FromAPIResponse,
 )
 from .standard_connection import StandardConnection
+from .actions import WatchPolicy, InstanceEvent, InstanceEventKind
 from .core.core_commands import CoreCommands
+from .core.config import (
+    CoreConfig,
+    AdaptiveConcurrency,
+    RetryPolicy,
+    CircuitBreakerPolicy,
+    ResponseCachePolicy,
+    ChunkingPolicy,
+    MetricsPolicy,
+    SlowCommandPolicy,
+)
+from .core.metrics import MetricsSnapshot, CommandMetrics, Histogram, MetricsSink, OpenTelemetrySink
+from .core.codec import JsonCodec, StdlibJsonCodec, OrjsonCodec
+from .core.profiling import StageProfiler
+from .core.slow_log import SlowCommand, SlowCommandLog
+from .core.recording import Recording, RecordedExchange, Recorder, Replayer, TransportMode
+from .core.tracing import (
+    Tracer,
+    Span,
+    SpanExporter,
+    InMemorySpanExporter,
+    LoggingSpanExporter,
+    TraceContextFilter,
+    current_trace_id,
+)
 from .dialog_handlers import (
     DialogHandlerBase,
     UnhandledDialogError,
@@ -34,6 +60,7 @@ from .errors import (
     APIErrorBase,
     RequestError,
     APIConnectionError,
+    CircuitOpenError,
     CommandTimeoutError,
     InvalidResponseFormatError,
     ArchicadAPIError,
@@ -48,6 +75,7 @@ from .unified_api.api import UnifiedApi
 
 __all__ = [
     "MultiConn",
+    "MetadataCache",
     "ConnHeader",
     "ArchiCadID",
     "APIResponseError",
@@ -55,7 +83,41 @@ __all__ = [
     "ProductInfo",
     "Port",
     "StandardConnection",
+    "WatchPolicy",
+    "InstanceEvent",
+    "InstanceEventKind",
     "CoreCommands",
+    "CoreConfig",
+    "AdaptiveConcurrency",
+    "RetryPolicy",
+    "CircuitBreakerPolicy",
+    "ResponseCachePolicy",
+    "ChunkingPolicy",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonCodec",
+    "MetricsPolicy",
+    "MetricsSnapshot",
+    "CommandMetrics",
+    "Histogram",
+    "MetricsSink",
+    "OpenTelemetrySink",
+    "StageProfiler",
+    "SlowCommandPolicy",
+    "SlowCommand",
+    "SlowCommandLog",
+    "TransportMode",
+    "Recorder",
+    "Replayer",
+    "Recording",
+    "RecordedExchange",
+    "Tracer",
+    "Span",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "LoggingSpanExporter",
+    "TraceContextFilter",
+    "current_trace_id",
     "TeamworkCredentials",
     "DialogHandlerBase",
     "UnhandledDialogError",
@@ -70,6 +132,7 @@ __all__ = [
     "RequestError",
     "ArchicadAPIError",
     "APIConnectionError",
+    "CircuitOpenError",
     "CommandTimeoutError",
     "InvalidResponseFormatError",
     "StandardAPIError",
@@ -2,6 +2,7 @@ from .connection_manager import Connect, Disconnect
 from .project_handler import FindArchicad, OpenProject, SwitchProject
 from .refresh import Refresh
 from .quit import QuitAndDisconnect
+from .watch import Watch, WatchPolicy, InstanceEvent, InstanceEventKind
 
 __all__: tuple[str, ...] = (
     "Connect",
@@ -11,4 +12,8 @@ __all__: tuple[str, ...] = (
     "FindArchicad",
     "OpenProject",
     "SwitchProject",
+    "Watch",
+    "WatchPolicy",
+    "InstanceEvent",
+    "InstanceEventKind",
 )
@@ -68,8 +68,10 @@ class SwitchProject:
         original_header = self.multi_conn.open_port_headers[original_port]
         original_header.core.post_tapir_command("OpenProject", {"projectFilePath": new_path})
         self._wait_until_alive(original_header)
-        self.multi_conn.open_port_headers[original_port] = ConnHeader(original_port)
-        return self.multi_conn.open_port_headers[original_port]
+        original_header.close()
+        new_header = ConnHeader(original_port, config=self.multi_conn.core_config)
+        self.multi_conn._put_header(original_port, new_header)
+        return new_header
 
     def _find_duplicate_path(self, new_path: str) -> Port | None:
         for port, header in self.multi_conn.open_port_headers.items():
@@ -113,7 +115,7 @@ class OpenProject:
         self._check_input(project_params)
         self._open_project(project_params)
         port = Port(self._find_archicad_port())
-        self.multi_conn.open_port_headers.update({port: ConnHeader(port)})
+        self.multi_conn._put_header(port, ConnHeader(port, config=self.multi_conn.core_config))
         log.info(
             f"Successfully opened project '{project_params.conn_header.archicad_id.projectName}' "
             f"on port {port} (Process PID: {self.process.pid})"
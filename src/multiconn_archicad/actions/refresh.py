@@ -32,7 +32,6 @@ class Refresh:
 
     def execute_action(self, ports: list[Port]) -> None:
         self.multi_conn.scan_ports(ports)
-        self.multi_conn.open_port_headers = dict(sorted(self.multi_conn.open_port_headers.items()))
         log.info(
             f"Refreshing - Open ports: {len(self.multi_conn.open_port_headers)}, "
             f"Closed ports: {len(self.multi_conn.closed_ports)}"
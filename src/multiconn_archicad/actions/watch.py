@@ -0,0 +1,225 @@
+from __future__ import annotations
+import asyncio
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
+
+from multiconn_archicad.basic_types import ArchiCadID
+from multiconn_archicad.conn_header import Status, is_id_initialized
+from multiconn_archicad.utilities.network_utils import listening_ports
+
+if TYPE_CHECKING:
+    from multiconn_archicad.conn_header import ConnHeader
+    from multiconn_archicad.multi_conn import MultiConn
+    from multiconn_archicad.basic_types import Port
+
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class InstanceEventKind(Enum):
+    """
+    APPEARED and GONE follow the instances that start and quit. PROJECT_SWITCHED needs
+    `WatchPolicy.refresh_metadata`. STATUS_CHANGED reports connects, disconnects and failures of known headers;
+    the headers the watch adds are not connected, so they stay PENDING until they are connected.
+    """
+
+    APPEARED = "appeared"
+    GONE = "gone"
+    PROJECT_SWITCHED = "project_switched"
+    STATUS_CHANGED = "status_changed"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}.{self.name}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+@dataclass(frozen=True)
+class InstanceEvent:
+    """
+    A change of the Archicad instances seen by a watching MultiConn.
+
+    Attributes:
+        kind: What changed.
+        port: The port of the instance.
+        header: The instance's header in `open_port_headers`; for GONE, the header that was removed.
+        previous: The status or ArchiCadID before the change, for STATUS_CHANGED and PROJECT_SWITCHED.
+        current: The status or ArchiCadID after the change, for STATUS_CHANGED and PROJECT_SWITCHED.
+    """
+
+    kind: InstanceEventKind
+    port: Port
+    header: ConnHeader
+    previous: Status | ArchiCadID | None = None
+    current: Status | ArchiCadID | None = None
+
+
+@dataclass(frozen=True)
+class WatchPolicy:
+    """
+    How often a watching MultiConn looks for changes.
+
+    Attributes:
+        interval: Seconds between two scans while the instances keep changing.
+        max_interval: The longest wait between two scans.
+        backoff_factor: The wait grows by this factor after each scan that found nothing new, up to
+            `max_interval`, and returns to `interval` after a change.
+        refresh_metadata: Fetch the metadata of the known instances again after every scan, so project
+            switches are noticed. This sends three commands to every instance per scan. Without it, the
+            watch sends no commands: only appearing and disappearing instances and status changes made
+            through the MultiConn are reported.
+    """
+
+    interval: float = 2.0
+    max_interval: float = 30.0
+    backoff_factor: float = 1.5
+    refresh_metadata: bool = False
+
+    def __post_init__(self) -> None:
+        if self.interval <= 0:
+            raise ValueError(f"interval must be positive, got {self.interval}.")
+        if self.max_interval < self.interval:
+            raise ValueError(f"max_interval must be at least interval, got {self.max_interval} < {self.interval}.")
+        if self.backoff_factor < 1:
+            raise ValueError(f"backoff_factor must be at least 1, got {self.backoff_factor}.")
+
+
+class Watch:
+    """
+    Keeps discovering Archicad instances on a background thread and reports the changes to the subscribers.
+
+    Usage:
+        conn.watch.subscribe(lambda event: print(event.kind, event.port))
+        conn.watch.start(WatchPolicy(interval=1.0))
+        ...
+        conn.watch.stop()
+    """
+
+    def __init__(self, multi_conn: MultiConn) -> None:
+        self.multi_conn: MultiConn = multi_conn
+        self.policy: WatchPolicy = WatchPolicy()
+        self._subscribers: list[Callable[[InstanceEvent], Any]] = []
+        self._seen: dict[Port, tuple[Status, ArchiCadID | None]] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, policy: WatchPolicy | None = None) -> None:
+        """Starts watching in the background. Does nothing if the watch is already running."""
+        if self.running:
+            return
+        self.policy = policy or self.policy
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="MultiConnWatcher", daemon=True)
+        self._thread.start()
+        log.info(f"Watching ports {self.multi_conn.port_range[0]}-{self.multi_conn.port_range[-1]}")
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stopping.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def subscribe(self, callback: Callable[[InstanceEvent], Any]) -> Callable[[], None]:
+        """
+        Calls `callback` with every event, on the watching thread. Returns a function that unsubscribes it.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def events(self) -> AsyncIterator[InstanceEvent]:
+        """
+        The events as an async iterator on the running event loop. Events are collected from the first
+        iteration until the iterator is closed.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[InstanceEvent] = asyncio.Queue()
+        unsubscribe = self.subscribe(lambda event: loop.call_soon_threadsafe(queue.put_nowait, event))
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def poll(self) -> list[InstanceEvent]:
+        """Scans once, updates `open_port_headers`, notifies the subscribers and returns the events."""
+        multi_conn = self.multi_conn
+        listening = listening_ports(multi_conn._base_url, multi_conn.port_range, multi_conn.scan_timeout)
+        events: list[InstanceEvent] = []
+        # The headers are changed under the MultiConn's lock, like the user's refreshes and background discovery
+        with multi_conn._headers_lock:
+            for port in multi_conn.port_range:
+                if port not in listening:
+                    header = multi_conn.close_if_open(port)
+                    self._seen.pop(port, None)
+                    if header is not None:
+                        events.append(InstanceEvent(InstanceEventKind.GONE, port, header))
+                elif port not in multi_conn.open_port_headers:
+                    multi_conn.create_or_refresh_connection(port)
+                    self._seen[port] = (Status.PENDING, None)
+                    events.append(InstanceEvent(InstanceEventKind.APPEARED, port, multi_conn.open_port_headers[port]))
+                else:
+                    events += self._changes(port, multi_conn.open_port_headers[port])
+        for event in events:
+            self._notify(event)
+        return events
+
+    def _changes(self, port: Port, header: ConnHeader) -> list[InstanceEvent]:
+        """The changes of a known header since the previous scan, once its latest metadata fetch is done."""
+        if header.init_future is not None and not header.init_future.done():
+            return []
+        current_status = header.status
+        current_project = header.archicad_id if is_id_initialized(header.archicad_id) else None
+        # Headers that existed before the watch started are taken as they are
+        status, project = self._seen.get(port, (current_status, current_project))
+        current_project = current_project or project
+        self._seen[port] = (current_status, current_project)
+        events = []
+        if project is not None and current_project != project:
+            events.append(InstanceEvent(InstanceEventKind.PROJECT_SWITCHED, port, header, project, current_project))
+        if current_status is not status:
+            events.append(InstanceEvent(InstanceEventKind.STATUS_CHANGED, port, header, status, current_status))
+        if self.policy.refresh_metadata:
+            header.refresh_metadata()
+        return events
+
+    def _notify(self, event: InstanceEvent) -> None:
+        log.info(f"Instance event {event.kind} on port {event.port}")
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                log.exception(f"Watch subscriber {callback!r} failed on {event}")
+
+    def _run(self) -> None:
+        wait: float | None = None
+        while not self._stopping.is_set():
+            try:
+                changed = bool(self.poll())
+            except Exception:
+                log.exception("Watching for Archicad instances failed")
+                changed = False
+            if changed or wait is None:
+                wait = self.policy.interval
+            else:
+                wait = min(wait * self.policy.backoff_factor, self.policy.max_interval)
+            self._stopping.wait(wait)
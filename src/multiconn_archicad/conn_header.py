@@ -1,12 +1,17 @@
 from __future__ import annotations
+import asyncio
 from concurrent.futures import Future, CancelledError
 import threading
+import time
 from enum import Enum
-from typing import Self, Any, TypeGuard
+from typing import Self, Any, TypeGuard, Callable
 from pprint import pformat
 import logging
 
 from multiconn_archicad.core.core_commands import CoreCommands
+from multiconn_archicad.core.config import CoreConfig
+from multiconn_archicad.core.metrics import MetricsSnapshot
+from multiconn_archicad.core.slow_log import SlowCommand
 from multiconn_archicad.basic_types import (
     ArchiCadID,
     APIResponseError,
@@ -23,6 +28,9 @@ from multiconn_archicad.utilities.thread_utils import EXECUTOR
 
 log = logging.getLogger(__name__)
 
+# Seconds an instance has to answer all of its metadata requests
+METADATA_TIMEOUT = 5.0
+
 
 class Status(Enum):
     PENDING = "pending"
@@ -38,11 +46,14 @@ class Status(Enum):
 
 
 class ConnHeader:
-    def __init__(self, port: Port, initialize: bool = True, ui_mode: bool = False):
+    def __init__(
+        self, port: Port, initialize: bool = True, ui_mode: bool = False, config: CoreConfig | None = None
+    ):
 
         self._port: Port | None = port
         self._status: Status = Status.PENDING
         self._ui_mode: bool = ui_mode
+        self._config: CoreConfig | None = config
         self._is_cancelled: bool = False
 
         self._fetch_token: object | None = None
@@ -50,7 +61,7 @@ class ConnHeader:
         self._unpacked_future: Future | None = None
         self._auto_connect: bool = False
 
-        self._core: CoreCommands | None = CoreCommands(port)
+        self._core: CoreCommands | None = CoreCommands(port, config=config)
         self._standard: StandardConnection | None = StandardConnection(port)
         self._unified: UnifiedApi | None = UnifiedApi(self.core)
 
@@ -62,7 +73,10 @@ class ConnHeader:
 
     @property
     def status(self) -> Status:
+        """The connection status. An active header reports FAILED while the circuit breaker of its port is open."""
         self._sync_if_needed()
+        if self._status is Status.ACTIVE and self._core is not None and not self._core.is_available():
+            return Status.FAILED
         return self._status
 
     @property
@@ -73,7 +87,8 @@ class ConnHeader:
     def port(self, port: Port | None) -> None:
         self._port = port
         if port:
-            self._core = CoreCommands(port)
+            self.close()
+            self._core = CoreCommands(port, config=self._config)
             self._standard = StandardConnection(port)
             self._unified = UnifiedApi(self.core)
             match self.status:
@@ -122,6 +137,21 @@ class ConnHeader:
         self._sync_if_needed()
         return self._archicad_location
 
+    @property
+    def concurrency_limit(self) -> int | None:
+        """Requests this instance may have in flight. Learned over time when adaptive concurrency is enabled."""
+        return self._core.admission.limit if self._core else None
+
+    def metrics(self) -> MetricsSnapshot:
+        """Command metrics of this instance. Empty unless metrics are enabled in the CoreConfig."""
+        recorder = self._core.metrics if self._core else None
+        return MetricsSnapshot(recorder.snapshot() if recorder else ())
+
+    def slow_commands(self) -> list[SlowCommand]:
+        """The slow calls to this instance, oldest first. Empty unless the slow-command log is enabled."""
+        slow_log = self._core.slow_log if self._core else None
+        return slow_log.entries() if slow_log else []
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "port": self.port,
@@ -131,8 +161,8 @@ class ConnHeader:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        instance = cls(initialize=False, port=Port(data["port"]))
+    def from_dict(cls, data: dict[str, Any], config: CoreConfig | None = None) -> Self:
+        instance = cls(initialize=False, port=Port(data["port"]), config=config)
         instance._status = Status.UNASSIGNED
         instance._product_info = ProductInfo.from_dict(data["productInfo"])
         instance._archicad_id = ArchiCadID.from_dict(data["archicadId"])
@@ -170,22 +200,66 @@ class ConnHeader:
         """Starts a new fetch, superseding any currently running fetch."""
         self._is_cancelled = False
         self._fetch_token = object()
-        self.init_future = EXECUTOR.submit(self._fetch_worker, self._fetch_token)
+        self.init_future = self._fetch_metadata(self._fetch_token, METADATA_TIMEOUT)
 
-    def _fetch_worker(self,  my_token: object) -> None | tuple[
+    def preload_metadata(
+        self, product_info: ProductInfo, archicad_id: ArchiCadID, archicad_location: ArchicadLocation
+    ) -> None:
+        """Takes metadata known from elsewhere, like a MetadataCache, instead of fetching it from the instance."""
+        self._is_cancelled = False
+        self._fetch_token = object()
+        self.init_future = Future()
+        self.init_future.set_result((product_info, archicad_id, archicad_location))
+
+    def _fetch_metadata(self, my_token: object, timeout: float) -> Future[None | tuple[
         ProductInfo | APIResponseError,
         ArchiCadID | APIResponseError,
         ArchicadLocation | APIResponseError
-    ]:
-        product_info = self.get_product_info(timeout=5.0)
-        archicad_id = self.get_archicad_id(timeout=5.0)
-        archicad_location = self.get_archicad_location(timeout=5.0)
-
-        if self._fetch_token is not my_token or self._is_cancelled:
-            return None
-
-        self._assign_metadata(product_info, archicad_id, archicad_location)
-        return product_info, archicad_id, archicad_location
+    ]]:
+        """
+        Sends the three metadata requests at once on worker threads, through the pooled keep-alive connections and
+        the request budget of the port, so identifying an instance takes one round trip. They all share the same
+        deadline of `timeout` seconds. No worker waits for the others: the returned future is resolved by
+        whichever request finishes last.
+        """
+        deadline = time.monotonic() + timeout
+        requests = [
+            EXECUTOR.submit(self._fetch_before, getter, command, deadline, timeout)
+            for getter, command in (
+                (self.get_product_info, "API.GetProductInfo"),
+                (self.get_archicad_id, "GetProjectInfo"),
+                (self.get_archicad_location, "GetArchicadLocation"),
+            )
+        ]
+        result: Future = Future()
+        lock = threading.Lock()
+
+        def on_done(_: Future) -> None:
+            with lock:
+                if result.done() or not all(request.done() for request in requests):
+                    return
+                if not result.set_running_or_notify_cancel():
+                    return
+            try:
+                product_info, archicad_id, archicad_location = (request.result() for request in requests)
+                if self._fetch_token is not my_token or self._is_cancelled:
+                    result.set_result(None)
+                    return
+                self._assign_metadata(product_info, archicad_id, archicad_location)
+                result.set_result((product_info, archicad_id, archicad_location))
+            except BaseException as e:
+                result.set_exception(e)
+
+        for request in requests:
+            request.add_done_callback(on_done)
+        return result
+
+    @staticmethod
+    def _fetch_before(getter: Callable[[float], Any], command: str, deadline: float, timeout: float) -> Any:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return _timed_out(command, timeout)
+        return getter(remaining)
 
     def _assign_metadata(self,
                         product_info: ProductInfo | APIResponseError,
@@ -195,6 +269,8 @@ class ConnHeader:
             self._product_info = product_info
         if isinstance(self._archicad_id, APIResponseError) or isinstance(archicad_id, ArchiCadID):
             self._archicad_id = archicad_id
+            if isinstance(archicad_id, ArchiCadID) and self._core is not None:
+                self._core.span_attributes["project"] = archicad_id.projectName
         if isinstance(self._archicad_location, APIResponseError) or isinstance(archicad_location, ArchicadLocation):
             self._archicad_location = archicad_location
 
@@ -209,6 +285,7 @@ class ConnHeader:
 
     def unassign(self) -> None:
         self.cancel()
+        self.close()
         self._status = Status.UNASSIGNED
         self._port = None
         self._core = None
@@ -218,6 +295,11 @@ class ConnHeader:
     def cancel(self):
         self._is_cancelled = True
 
+    def close(self) -> None:
+        """Releases the pooled connections held by the header's CoreCommands."""
+        if self._core is not None:
+            self._core.close()
+
     def sync_from_master_future(self, master_future: Future) -> None:
         """ Links this header to a master future."""
         self.init_future = master_future
@@ -292,6 +374,46 @@ class ConnHeader:
         except (KeyError, TypeError) as e:
             return APIResponseError(code=None, message=f"Malformed API response: missing key {e}")
 
+    async def get_product_info_async(self, timeout: float) -> ProductInfo | APIResponseError:
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self.core.post_command_async(command="API.GetProductInfo", timeout=timeout)
+            return ProductInfo.from_api_response(result)
+        except (RequestError, ArchicadAPIError) as e:
+            return APIResponseError.from_exception(e)
+        except TimeoutError:
+            return _timed_out("API.GetProductInfo", timeout)
+        except (KeyError, TypeError) as e:
+            return APIResponseError(code=None, message=f"Malformed API response: missing key {e}")
+
+    async def get_archicad_id_async(self, timeout: float) -> ArchiCadID | APIResponseError:
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self.core.post_tapir_command_async(command="GetProjectInfo", timeout=timeout)
+            return ArchiCadID.from_api_response(result)
+        except (RequestError, ArchicadAPIError) as e:
+            return APIResponseError.from_exception(e)
+        except TimeoutError:
+            return _timed_out("GetProjectInfo", timeout)
+        except (KeyError, TypeError) as e:
+            return APIResponseError(code=None, message=f"Malformed API response: missing key {e}")
+
+    async def get_archicad_location_async(self, timeout: float) -> ArchicadLocation | APIResponseError:
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self.core.post_tapir_command_async(command="GetArchicadLocation", timeout=timeout)
+            return ArchicadLocation.from_api_response(result)
+        except (RequestError, ArchicadAPIError) as e:
+            return APIResponseError.from_exception(e)
+        except TimeoutError:
+            return _timed_out("GetArchicadLocation", timeout)
+        except (KeyError, TypeError) as e:
+            return APIResponseError(code=None, message=f"Malformed API response: missing key {e}")
+
+
+def _timed_out(command: str, timeout: float) -> APIResponseError:
+    return APIResponseError(code=None, message=f"Command '{command}' did not finish within {timeout} seconds.")
+
 
 class ValidatedHeader(ConnHeader):
     product_info: ProductInfo
@@ -0,0 +1,72 @@
+from __future__ import annotations
+import math
+import threading
+
+from multiconn_archicad.core.admission import AdmissionController
+from multiconn_archicad.core.config import AdaptiveConcurrency
+
+
+class AIMDLimiter:
+    """
+    Learns how many requests in flight an Archicad instance sustains, by additive increase and
+    multiplicative decrease of the limit of its AdmissionController.
+
+    The limit grows by one after a full window of successful requests (as many as the current limit)
+    whose latency stayed within `latency_tolerance` times the baseline. It is cut by `backoff_factor`
+    when a request times out or its connection fails. Requests that were already in flight when the
+    limit was cut do not cut it again, so one overload burst backs off only once.
+    """
+
+    _BASELINE_DRIFT = 0.01
+
+    def __init__(self, admission: AdmissionController, settings: AdaptiveConcurrency) -> None:
+        self._lock = threading.Lock()
+        self._admission = admission
+        self._settings = settings
+        self._epoch: int = 0
+        self._window_successes: int = 0
+        self._baseline: float | None = None
+        self._admission.limit = settings.initial_limit
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(limit={self.limit}, baseline_latency={self.baseline_latency})"
+
+    @property
+    def limit(self) -> int:
+        limit = self._admission.limit
+        assert limit is not None, "Adaptive limiter requires a bounded AdmissionController"
+        return limit
+
+    @property
+    def baseline_latency(self) -> float | None:
+        """The round-trip latency the instance shows when it is not overloaded, in seconds."""
+        return self._baseline
+
+    def begin(self) -> int:
+        """Marks the start of a request. The returned token is passed back with the outcome."""
+        return self._epoch
+
+    def on_success(self, token: int, latency: float) -> None:
+        with self._lock:
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                # Creep upwards so a permanently slower instance does not look overloaded forever
+                self._baseline += (latency - self._baseline) * self._BASELINE_DRIFT
+            if token != self._epoch or latency > self._baseline * self._settings.latency_tolerance:
+                self._window_successes = 0
+                return
+            self._window_successes += 1
+            if self._window_successes >= self.limit and self.limit < self._settings.max_limit:
+                self._set_limit(self.limit + 1)
+
+    def on_overload(self, token: int) -> None:
+        with self._lock:
+            if token != self._epoch:
+                return
+            self._set_limit(max(self._settings.min_limit, math.floor(self.limit * self._settings.backoff_factor)))
+
+    def _set_limit(self, limit: int) -> None:
+        self._epoch += 1
+        self._window_successes = 0
+        self._admission.limit = limit
@@ -0,0 +1,214 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass
+from typing import Iterator, AsyncIterator
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    limit: int | None
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    queued: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.queued if self.queued else 0.0
+
+
+class _Waiter(ABC):
+    def __init__(self) -> None:
+        self.enqueued_at: float = time.perf_counter()
+        self.granted: bool = False
+        self.abandoned: bool = False
+
+    @abstractmethod
+    def wake(self) -> bool:
+        """Signals the waiting caller. Returns False if the caller can no longer be woken."""
+
+
+class _ThreadWaiter(_Waiter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.event = threading.Event()
+
+    def wake(self) -> bool:
+        self.event.set()
+        return True
+
+
+class _AsyncWaiter(_Waiter):
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__()
+        self.loop = loop
+        self.future: asyncio.Future[None] = loop.create_future()
+
+    def wake(self) -> bool:
+        try:
+            self.loop.call_soon_threadsafe(self._resolve)
+        except RuntimeError:  # the waiting loop has been closed
+            return False
+        return True
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class AdmissionController:
+    """
+    Caps the number of requests in flight to one Archicad instance.
+    Callers over the limit wait in a queue served by priority (higher first), then in arrival order.
+    Works for threads and asyncio tasks alike, so both kinds of fan-out share one budget.
+    """
+
+    def __init__(self, limit: int | None) -> None:
+        self._lock = threading.Lock()
+        self._limit: int | None = limit
+        self._in_flight: int = 0
+        self._queue: list[tuple[int, int, _Waiter]] = []
+        self._queue_depth: int = 0
+        self._sequence = itertools.count()
+        self._admitted: int = 0
+        self._queued: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.stats()})"
+
+    @property
+    def limit(self) -> int | None:
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int | None) -> None:
+        if value is not None and value < 1:
+            raise ValueError(f"The in-flight limit must be at least 1, got {value}.")
+        with self._lock:
+            self._limit = value
+            self._grant_waiters()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    def stats(self) -> AdmissionStats:
+        with self._lock:
+            return AdmissionStats(
+                limit=self._limit,
+                in_flight=self._in_flight,
+                queue_depth=self._queue_depth,
+                admitted=self._admitted,
+                queued=self._queued,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+    def acquire(self, priority: int = 0, timeout: float | None = None) -> float:
+        """
+        Blocks until a slot is free and returns the seconds spent queueing.
+        Raises TimeoutError if no slot frees up within `timeout` seconds.
+        """
+        with self._lock:
+            if self._try_admit_immediately():
+                return 0.0
+            waiter = _ThreadWaiter()
+            self._enqueue(waiter, priority)
+        if waiter.event.wait(timeout):
+            return time.perf_counter() - waiter.enqueued_at
+        with self._lock:
+            if waiter.granted:
+                return time.perf_counter() - waiter.enqueued_at
+            self._abandon(waiter)
+        raise TimeoutError(f"No request slot became free within {timeout} seconds.")
+
+    async def acquire_async(self, priority: int = 0, timeout: float | None = None) -> float:
+        """Awaitable counterpart of `acquire` that suspends the task instead of blocking the thread."""
+        with self._lock:
+            if self._try_admit_immediately():
+                return 0.0
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._enqueue(waiter, priority)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if not waiter.granted:
+                    self._abandon(waiter)
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise TimeoutError(f"No request slot became free within {timeout} seconds.") from e
+                    raise
+            if isinstance(e, asyncio.CancelledError):
+                self.release()
+                raise
+        return time.perf_counter() - waiter.enqueued_at
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._grant_waiters()
+
+    @contextmanager
+    def slot(self, priority: int = 0, timeout: float | None = None) -> Iterator[float]:
+        wait = self.acquire(priority, timeout)
+        try:
+            yield wait
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self, priority: int = 0, timeout: float | None = None) -> AsyncIterator[float]:
+        wait = await self.acquire_async(priority, timeout)
+        try:
+            yield wait
+        finally:
+            self.release()
+
+    def _has_capacity(self) -> bool:
+        return self._limit is None or self._in_flight < self._limit
+
+    def _try_admit_immediately(self) -> bool:
+        if self._queue_depth == 0 and self._has_capacity():
+            self._in_flight += 1
+            self._admitted += 1
+            return True
+        return False
+
+    def _enqueue(self, waiter: _Waiter, priority: int) -> None:
+        heapq.heappush(self._queue, (-priority, next(self._sequence), waiter))
+        self._queue_depth += 1
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        # Abandoned waiters stay in the heap and are skipped when they reach the front
+        waiter.abandoned = True
+        self._queue_depth -= 1
+
+    def _grant_waiters(self) -> None:
+        while self._queue and self._has_capacity():
+            _, _, waiter = heapq.heappop(self._queue)
+            if waiter.abandoned:
+                continue
+            self._queue_depth -= 1
+            if not waiter.wake():
+                continue
+            waiter.granted = True
+            wait = time.perf_counter() - waiter.enqueued_at
+            self._in_flight += 1
+            self._admitted += 1
+            self._queued += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from multiconn_archicad.core.command_kinds import command_name, is_read_only, payload_key
+from multiconn_archicad.core.config import ResponseCachePolicy
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    evictions: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    LRU cache of raw response bodies of one Archicad instance, with a TTL and a memory budget.
+
+    Entries are stored as the bytes received, so every hit decodes a fresh object the caller may mutate.
+    `invalidate` drops everything and bumps the generation; a `put` carrying the generation read before
+    its request was sent is ignored if the project may have changed in the meantime.
+    """
+
+    def __init__(self, policy: ResponseCachePolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._policy = policy
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size_bytes: int = 0
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.stats()})"
+
+    @property
+    def policy(self) -> ResponseCachePolicy:
+        return self._policy
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: str, content: bytes, generation: int) -> None:
+        if _entry_size(key, content) > self._policy.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock() + self._policy.ttl, content)
+            self._size_bytes += _entry_size(key, content)
+            while len(self._entries) > self._policy.max_entries or self._size_bytes > self._policy.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drops every entry, e.g. because a command that modifies the project was sent."""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def _remove(self, key: str) -> None:
+        _, content = self._entries.pop(key)
+        self._size_bytes -= _entry_size(key, content)
+
+
+class CacheTicket:
+    """
+    The cache's part in one command: the cached body if there was a hit, otherwise what to do once
+    the response arrived. Commands that modify the project empty the cache both before and after
+    they are sent, so a read running alongside cannot store the state from before the change.
+    """
+
+    def __init__(self, cache: ResponseCache | None, payload: dict[str, Any]) -> None:
+        self._cache = cache
+        self._key: str | None = None
+        self._mutating: bool = False
+        self._generation: int = 0
+        self.hit: bytes | None = None
+        if cache is None:
+            return
+        command = command_name(payload)
+        if command in cache.policy.commands:
+            self._key = payload_key(payload)
+            self._generation = cache.generation
+            self.hit = cache.get(self._key)
+        elif not is_read_only(command):
+            self._mutating = True
+            cache.invalidate()
+
+    def sent(self) -> None:
+        """Called after the request, whether it succeeded or not."""
+        if self._cache is not None and self._mutating:
+            self._cache.invalidate()
+
+    def store(self, content: bytes, response: dict[str, Any]) -> None:
+        if self._cache is not None and self._key is not None and _succeeded(response):
+            self._cache.put(self._key, content, self._generation)
+
+
+def _succeeded(response: dict[str, Any]) -> bool:
+    result = response.get("result")
+    add_on_response = result.get("addOnCommandResponse") if isinstance(result, dict) else None
+    return bool(response.get("succeeded")) and not (isinstance(add_on_response, dict) and add_on_response.get("error"))
+
+
+def _entry_size(key: str, content: bytes) -> int:
+    return len(key) + len(content)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+import concurrent.futures
+import threading
+from typing import Any, Callable
+
+from multiconn_archicad.utilities.thread_utils import EXECUTOR
+
+
+def split_parameters(parameters: dict[str, Any], chunked_parameter: str, chunk_size: int) -> list[dict[str, Any]]:
+    """Splits the list under `chunked_parameter` into parameter dicts of at most `chunk_size` items each."""
+    items = parameters[chunked_parameter]
+    return [
+        {**parameters, chunked_parameter: items[start : start + chunk_size]}
+        for start in range(0, len(items), chunk_size)
+    ]
+
+
+def merge_results(results: list[dict[str, Any]], chunked_result: str) -> dict[str, Any]:
+    """Concatenates the `chunked_result` lists of the chunks' responses, keeping the order of the chunks."""
+    merged = dict(results[0])
+    merged[chunked_result] = [item for result in results for item in result.get(chunked_result, [])]
+    return merged
+
+
+def run_chunks(
+    post: Callable[[dict[str, Any]], dict[str, Any]], chunks: list[dict[str, Any]], max_parallel: int
+) -> list[dict[str, Any]]:
+    """
+    Posts the chunks with at most `max_parallel` of them in flight, returning the responses in chunk order.
+    The first failure cancels the chunks not yet sent and is raised.
+
+    On a MultiConn worker thread the chunks are posted one by one: waiting there for other
+    worker tasks could exhaust the shared pool.
+    """
+    if max_parallel <= 1 or len(chunks) == 1 or threading.current_thread().name.startswith("MultiConnWorker"):
+        return [post(chunk) for chunk in chunks]
+
+    results: list[dict[str, Any] | None] = [None] * len(chunks)
+    pending: dict[concurrent.futures.Future, int] = {}
+    next_index = 0
+    try:
+        while next_index < len(chunks) or pending:
+            while next_index < len(chunks) and len(pending) < max_parallel:
+                pending[EXECUTOR.submit(post, chunks[next_index])] = next_index
+                next_index += 1
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+    return results  # type: ignore[return-value]
@@ -0,0 +1,71 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request payloads and decodes response bodies of CoreCommands.
+    `loads` must raise a ValueError (json.JSONDecodeError is one) for malformed input.
+    """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes: ...
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any: ...
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+
+class StdlibJsonCodec(JsonCodec):
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Several times faster than the standard library on large payloads. Requires the 'orjson' package."""
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "The 'fast-json' feature is not installed. Please install it with: pip install multiconn_archicad[fast-json]"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """orjson when it is installed, the standard library otherwise."""
+    return OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+
+
+class PrettyJson:
+    """Renders an object as indented JSON only when a log record that holds it is actually emitted."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self._obj, indent=4, default=str)
@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+
+# Commands that only read the model but do not follow the Get*/Is* naming
+_READ_ONLY_EXCEPTIONS: frozenset[str] = frozenset({"FilterElements"})
+
+
+def command_name(payload: dict[str, Any]) -> str:
+    """
+    Returns the command a request payload executes. For Tapir commands this is the Add-On command
+    wrapped in API.ExecuteAddOnCommand (e.g. "GetProjectInfo"), not the wrapper itself.
+    """
+    command = payload.get("command", "")
+    if command == "API.ExecuteAddOnCommand":
+        add_on_command_id = (payload.get("parameters") or {}).get("addOnCommandId") or {}
+        return add_on_command_id.get("commandName", command)
+    return command
+
+
+def is_read_only(command: str) -> bool:
+    """
+    Tells whether a command only reads the project, so repeating it is harmless.
+    Standard commands carry their "API." prefix, Tapir commands are bare names.
+    """
+    name = command.removeprefix("API.")
+    return name.startswith(("Get", "Is")) or name in _READ_ONLY_EXCEPTIONS
+
+
+def payload_key(payload: dict[str, Any]) -> str:
+    """A canonical form of a request payload: equal for requests that differ only in key order."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
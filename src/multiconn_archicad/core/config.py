@@ -0,0 +1,271 @@
+from dataclasses import dataclass, field
+from typing import Mapping
+import random
+
+import httpx
+
+from multiconn_archicad.core.codec import JsonCodec
+from multiconn_archicad.core.command_kinds import is_read_only
+from multiconn_archicad.core.metrics import DEFAULT_LATENCY_BUCKETS, MetricsSink
+from multiconn_archicad.core.recording import TransportMode
+from multiconn_archicad.core.tracing import Tracer
+
+DEFAULT_CACHED_COMMANDS: frozenset[str] = frozenset(
+    {
+        "API.GetAllPropertyNames",
+        "API.GetAllPropertyIds",
+        "API.GetPropertyGroups",
+        "API.GetDetailsOfProperties",
+        "API.GetAttributesByType",
+        "API.GetAllClassificationSystems",
+        "API.GetAllClassificationsInSystem",
+        "GetAttributesByType",
+        "GetStories",
+        "GetLibraries",
+    }
+)
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """
+    Settings of adaptive request budgets, which learn how many requests in flight each Archicad instance
+    sustains instead of using a fixed max_in_flight_per_port.
+
+    Attributes:
+        initial_limit: Requests allowed in flight before anything has been learned.
+        min_limit: The limit is never cut below this.
+        max_limit: The limit never grows beyond this. Parallelism is also capped by max_connections_per_port.
+        backoff_factor: The limit is multiplied by this when a request times out or its connection fails.
+        latency_tolerance: The limit only grows while round trips stay within this multiple of the
+            instance's unloaded latency.
+    """
+
+    initial_limit: int = 2
+    min_limit: int = 1
+    max_limit: int = 8
+    backoff_factor: float = 0.5
+    latency_tolerance: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.min_limit < 1:
+            raise ValueError(f"min_limit must be at least 1, got {self.min_limit}.")
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                f"Expected min_limit <= initial_limit <= max_limit, got {self.min_limit}, "
+                f"{self.initial_limit}, {self.max_limit}."
+            )
+        if not 0 < self.backoff_factor < 1:
+            raise ValueError(f"backoff_factor must be between 0 and 1, got {self.backoff_factor}.")
+        if self.latency_tolerance < 1:
+            raise ValueError(f"latency_tolerance must be at least 1, got {self.latency_tolerance}.")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Settings for retrying read-only commands that failed in transit (timeout, refused or reset connection).
+    Commands that modify the project are never retried, and errors reported by Archicad are never retried.
+
+    Attributes:
+        max_retries: Retries after the first attempt. Each attempt gets the full command timeout.
+        base_delay: Upper bound of the delay before the first retry, in seconds. Doubles with each retry.
+        max_delay: Cap of the delay between attempts, in seconds.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must not be negative, got {self.max_retries}.")
+        if self.base_delay < 0 or self.max_delay < self.base_delay:
+            raise ValueError(f"Expected 0 <= base_delay <= max_delay, got {self.base_delay}, {self.max_delay}.")
+
+    def delay(self, attempt: int) -> float:
+        """Jittered exponential backoff before retry number `attempt` (counting from 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """
+    Settings of the per-port circuit breaker, which stops sending commands to an unresponsive instance.
+
+    Attributes:
+        failure_threshold: Consecutive transport failures that open the breaker.
+        reset_timeout: Seconds the breaker stays open before an API.IsAlive probe may close it again.
+        probe_timeout: Timeout of the API.IsAlive probe, in seconds.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 5.0
+    probe_timeout: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {self.failure_threshold}.")
+        if self.reset_timeout < 0 or self.probe_timeout <= 0:
+            raise ValueError(
+                f"Expected reset_timeout >= 0 and probe_timeout > 0, got {self.reset_timeout}, {self.probe_timeout}."
+            )
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """
+    Settings of the per-port cache of read-only command responses. Any command that is not read-only
+    sent to the same port empties the cache, changes made in Archicad's UI are only picked up after `ttl`.
+
+    Attributes:
+        ttl: Seconds a cached response stays valid.
+        max_entries: Maximum number of cached responses per port; the least recently used go first.
+        max_bytes: Memory budget per port, measured as the size of the raw response bodies.
+        commands: Commands whose responses are cached. Standard commands carry their "API." prefix,
+            Tapir commands are bare names. All of them must be read-only.
+    """
+
+    ttl: float = 30.0
+    max_entries: int = 256
+    max_bytes: int = 16 * 1024 * 1024
+    commands: frozenset[str] = DEFAULT_CACHED_COMMANDS
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0 or self.max_entries < 1 or self.max_bytes < 1:
+            raise ValueError(
+                "Expected positive ttl, max_entries and max_bytes, "
+                f"got {self.ttl}, {self.max_entries}, {self.max_bytes}."
+            )
+        if mutating := sorted(command for command in self.commands if not is_read_only(command)):
+            raise ValueError(f"Only read-only commands can be cached, got {mutating}.")
+
+
+@dataclass(frozen=True)
+class ChunkingPolicy:
+    """
+    Settings for splitting the element lists of large read-only UnifiedApi calls into several requests.
+
+    Attributes:
+        chunk_size: Maximum number of elements per request.
+        max_parallel: Maximum number of chunks in flight at once. None uses the port's request budget.
+    """
+
+    chunk_size: int = 2000
+    max_parallel: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {self.chunk_size}.")
+        if self.max_parallel is not None and self.max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1 or None, got {self.max_parallel}.")
+
+
+@dataclass(frozen=True)
+class MetricsPolicy:
+    """
+    Settings of the per-port command metrics: call counts, latencies, errors, queue waits and payload sizes.
+
+    Attributes:
+        latency_buckets: Upper bounds of the histogram buckets of latencies and queue waits, in seconds.
+        sinks: Receivers of every observation besides the in-memory snapshot, e.g. an OpenTelemetrySink.
+    """
+
+    latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    sinks: tuple[MetricsSink, ...] = ()
+
+    def __post_init__(self) -> None:
+        bounds = self.latency_buckets
+        if not bounds or bounds[0] <= 0 or any(lower >= upper for lower, upper in zip(bounds, bounds[1:])):
+            raise ValueError(f"latency_buckets must be positive and strictly increasing, got {bounds}.")
+
+
+@dataclass(frozen=True)
+class SlowCommandPolicy:
+    """
+    Settings of the per-port slow-command log, which keeps the calls that took longer than a threshold.
+
+    Attributes:
+        threshold: Seconds a call may take before it is logged.
+        thresholds: Thresholds of individual commands, overriding `threshold`. Standard commands carry
+            their "API." prefix, Tapir commands are bare names.
+        capacity: Number of slow calls kept per port; the oldest go first.
+        max_parameter_chars: The parameters of a logged call are cut to this many characters of JSON.
+    """
+
+    threshold: float = 5.0
+    thresholds: Mapping[str, float] = field(default_factory=dict)
+    capacity: int = 100
+    max_parameter_chars: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.threshold < 0 or any(value < 0 for value in self.thresholds.values()):
+            raise ValueError(f"Thresholds must not be negative, got {self.threshold}, {dict(self.thresholds)}.")
+        if self.capacity < 1 or self.max_parameter_chars < 0:
+            raise ValueError(
+                "Expected capacity >= 1 and max_parameter_chars >= 0, "
+                f"got {self.capacity}, {self.max_parameter_chars}."
+            )
+
+
+@dataclass(frozen=True)
+class CoreConfig:
+    """
+    Transport settings of CoreCommands. A MultiConn hands the same instance to every header it creates.
+
+    Attributes:
+        max_connections_per_port: Maximum number of simultaneous keep-alive connections a CoreCommands
+            opens to its Archicad instance. Archicad's C++ HTTP server resets connections (WinError 10054)
+            or crashes under heavy parallel load, so this is deliberately low.
+        keepalive_expiry: Seconds an idle pooled connection is kept open before it is evicted.
+        max_in_flight_per_port: Maximum number of requests in flight to one Archicad instance across all
+            CoreCommands of the process with an equal config, sync and async alike. Further requests queue
+            until a slot frees up. None disables the limit.
+        adaptive_concurrency: When set, the limit of requests in flight is learned per instance and
+            max_in_flight_per_port is ignored.
+        retry: Retry policy of read-only commands. None disables retries.
+        circuit_breaker: Settings of the per-port circuit breaker. None disables it.
+        response_cache: Settings of the per-port response cache. None disables it.
+        coalesce_reads: Collapse identical read-only requests that are in flight to the same port at
+            the same time into one HTTP call, whose response is shared by all callers.
+        chunking: Settings for splitting large element lists of UnifiedApi calls. None sends them whole.
+        codec: Encoder of request payloads and decoder of response bodies. None uses orjson when it is
+            installed and the standard library otherwise.
+        metrics: Settings of the per-port command metrics. None disables them, but never drops the metrics a
+            port already records.
+        tracer: Records every command as a span of the current trace. None disables tracing.
+        slow_commands: Settings of the per-port log of slow calls. None disables it, but never drops the log a
+            port already keeps.
+        transport_mode: Wraps the HTTP transport, e.g. a Recorder that records the session to disk or a
+            Replayer that answers from a recording without Archicad. None sends requests as they are.
+    """
+
+    max_connections_per_port: int = 4
+    keepalive_expiry: float = 2.0
+    max_in_flight_per_port: int | None = 4
+    adaptive_concurrency: AdaptiveConcurrency | None = None
+    retry: RetryPolicy | None = None
+    circuit_breaker: CircuitBreakerPolicy | None = None
+    response_cache: ResponseCachePolicy | None = None
+    coalesce_reads: bool = False
+    chunking: ChunkingPolicy | None = None
+    codec: JsonCodec | None = None
+    metrics: MetricsPolicy | None = None
+    tracer: Tracer | None = None
+    slow_commands: SlowCommandPolicy | None = None
+    transport_mode: TransportMode | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_connections_per_port < 1:
+            raise ValueError(f"max_connections_per_port must be at least 1, got {self.max_connections_per_port}.")
+        if self.max_in_flight_per_port is not None and self.max_in_flight_per_port < 1:
+            raise ValueError(f"max_in_flight_per_port must be at least 1 or None, got {self.max_in_flight_per_port}.")
+        if self.keepalive_expiry < 0:
+            raise ValueError(f"keepalive_expiry must not be negative, got {self.keepalive_expiry}.")
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections_per_port,
+            max_keepalive_connections=self.max_connections_per_port,
+            keepalive_expiry=self.keepalive_expiry,
+        )
@@ -1,19 +1,41 @@
 from __future__ import annotations
-import json
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Iterator, Sequence, TYPE_CHECKING
+from contextlib import AsyncExitStack, ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass
 import httpx
 import logging
 import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+import weakref
 
 from multiconn_archicad.errors import (
     CommandTimeoutError,
     APIConnectionError,
+    CircuitOpenError,
     InvalidResponseFormatError,
     RequestError,
     StandardAPIError,
     TapirCommandError,
 )
 from multiconn_archicad.basic_types import Port
+from multiconn_archicad.core.config import CoreConfig, RetryPolicy
+from multiconn_archicad.core.admission import AdmissionController
+from multiconn_archicad.core.cache import CacheTicket, ResponseCache
+from multiconn_archicad.core.codec import JsonCodec, PrettyJson, default_codec
+from multiconn_archicad.core.chunking import merge_results, run_chunks, split_parameters
+from multiconn_archicad.core.command_kinds import command_name, is_read_only, payload_key
+from multiconn_archicad.core.metrics import MetricsRecorder
+from multiconn_archicad.core.profiling import current_profile, profiled_call
+from multiconn_archicad.core.port_state import get_port_state, reconfigure_port_state
+from multiconn_archicad.core.resilience import BreakerState, CircuitBreaker
+from multiconn_archicad.core.single_flight import FlightAbandoned, SingleFlight
+from multiconn_archicad.core.streaming import ItemStreamParser
+from multiconn_archicad.core.slow_log import SlowCommand, SlowCommandLog, parameters_preview
+from multiconn_archicad.core.tracing import use_span
+from multiconn_archicad.utilities.thread_utils import EXECUTOR
 from multiconn_archicad.utilities.cli_parser import get_cli_args_once
 
 if TYPE_CHECKING:
@@ -22,32 +44,270 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_NOT_TRACED = nullcontext()
+_END = object()
+
 
 class CoreCommands:
-    def __init__(self, port: Port | None = None, host: str = "http://127.0.0.1"):
+    def __init__(self, port: Port | None = None, host: str = "http://127.0.0.1", config: CoreConfig | None = None):
         cli_args = get_cli_args_once()
         self.port: Port | None = port if port else (Port(cli_args.port)) if cli_args.port else None
         self.url: str = f"{cli_args.host if cli_args.host else host}:{self.port}"
+        self.config: CoreConfig = config if config else CoreConfig()
+        self._client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+        ] = weakref.WeakKeyDictionary()
+        self._client_lock = threading.Lock()
+        self._port_state = get_port_state(self.url, self.config, self.port)
+        self._codec: JsonCodec = self.config.codec or default_codec()
+        self.span_attributes: dict[str, Any] = {"port": self.port}
 
     def __repr__(self) -> str:
-        attrs = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        attrs = ", ".join(f"{k}={v!r}" for k, v in vars(self).items() if not k.startswith("_"))
         return f"{self.__class__.__name__}({attrs})"
 
     def __str__(self) -> str:
         return self.__repr__()
 
+    def __enter__(self) -> CoreCommands:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> CoreCommands:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Closes the pooled keep-alive connections. A new pool is opened lazily by the next command."""
+        with self._client_lock:
+            client, self._client = self._client, None
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+        if client is not None:
+            client.close()
+        for loop, (async_client, _) in async_clients:
+            _close_async_client_on_loop(async_client, loop)
+
+    def reconfigure(self, config: CoreConfig) -> None:
+        """
+        Replaces the config of this CoreCommands and applies its per-port settings (request budget, circuit
+        breaker, response cache, coalescing, metrics and slow-command log) to every CoreCommands that shares
+        its state, i.e. that was built for the same port with an equal config.
+        """
+        self.close()  # the pools are rebuilt with the new connection limits and transport mode
+        self.config = config
+        self._codec = config.codec or default_codec()
+        reconfigure_port_state(self._port_state, config)
+
+    @property
+    def admission(self) -> AdmissionController:
+        """The request budget of this Archicad instance, shared with every other CoreCommands of the same port."""
+        return self._port_state.admission
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache of this Archicad instance, or None if caching is not enabled."""
+        return self._port_state.cache
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """The coalescing of identical reads to this Archicad instance, or None if it is not enabled."""
+        return self._port_state.single_flight
+
+    @property
+    def metrics(self) -> MetricsRecorder | None:
+        """The command metrics of this Archicad instance, or None if metrics are not enabled."""
+        return self._port_state.metrics
+
+    @property
+    def slow_log(self) -> SlowCommandLog | None:
+        """The slow calls to this Archicad instance, or None if the slow-command log is not enabled."""
+        return self._port_state.slow_log
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections, awaiting the pool that belongs to the running event loop."""
+        with self._client_lock:
+            entry = self._async_clients.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+        self.close()
+
     def post_command(
-        self, command: AddonCommandType, parameters: dict | None = None, timeout: float | None = None
+        self,
+        command: AddonCommandType,
+        parameters: dict | None = None,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Posts a standard Archicad JSON command.
+        When the port's request budget is used up, the command queues; higher `priority` is served first.
+        """
+        payload = {"command": command, "parameters": parameters}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._post_command(payload, timeout, priority)
+
+    def post_tapir_command(
+        self,
+        command: TapirCommandType,
+        parameters: dict | None = None,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """Posts a Tapir Add-On command"""
+        payload = {"command": "API.ExecuteAddOnCommand", "parameters": _tapir_parameters(command, parameters)}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._post_command(payload, timeout, priority, tapir=True)
+
+    async def post_command_async(
+        self,
+        command: AddonCommandType,
+        parameters: dict | None = None,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """Posts a standard Archicad JSON command without blocking the running event loop."""
+        payload = {"command": command, "parameters": parameters}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return await self._post_command_async(payload, timeout, priority)
+
+    async def post_tapir_command_async(
+        self,
+        command: TapirCommandType,
+        parameters: dict | None = None,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """Posts a Tapir Add-On command without blocking the running event loop."""
+        payload = {"command": "API.ExecuteAddOnCommand", "parameters": _tapir_parameters(command, parameters)}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return await self._post_command_async(payload, timeout, priority, tapir=True)
+
+    def post_command_chunked(
+        self,
+        command: AddonCommandType,
+        parameters: dict,
+        chunked_parameter: str,
+        chunked_result: str,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Posts a read-only standard command whose `chunked_parameter` list may be split into several requests
+        according to the config's ChunkingPolicy. The `chunked_result` lists of the responses are
+        concatenated in the original order. `timeout` applies to each chunk.
+        """
+        return self._post_chunked(
+            lambda chunk: self.post_command(command, chunk, timeout, priority),
+            parameters,
+            chunked_parameter,
+            chunked_result,
+        )
+
+    def post_tapir_command_chunked(
+        self,
+        command: TapirCommandType,
+        parameters: dict,
+        chunked_parameter: str,
+        chunked_result: str,
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> dict[str, Any]:
+        """Posts a read-only Tapir Add-On command whose `chunked_parameter` list may be split into chunks."""
+        return self._post_chunked(
+            lambda chunk: self.post_tapir_command(command, chunk, timeout, priority),
+            parameters,
+            chunked_parameter,
+            chunked_result,
+        )
+
+    def _post_chunked(
+        self,
+        post: Callable[[dict], dict[str, Any]],
+        parameters: dict,
+        chunked_parameter: str,
+        chunked_result: str,
     ) -> dict[str, Any]:
-        """Posts a standard Archicad JSON command"""
+        policy = self.config.chunking
+        if policy is None or len(parameters[chunked_parameter]) <= policy.chunk_size:
+            return post(parameters)
+        chunks = split_parameters(parameters, chunked_parameter, policy.chunk_size)
+        max_parallel = policy.max_parallel or self.admission.limit or self.config.max_connections_per_port
+        return merge_results(run_chunks(post, chunks, max_parallel), chunked_result)
+
+    def stream_command(
+        self,
+        command: AddonCommandType,
+        parameters: dict | None = None,
+        items: str = "elements",
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> Iterator[Any]:
+        """
+        Posts a standard command and yields the items of the `items` list of its result as they are parsed
+        from the response, instead of building the whole response first. The request slot of the port is
+        held until the iterator is exhausted or closed, and `timeout` applies to each read of the body.
+        Streamed commands bypass the response cache, coalescing and retries.
+        """
         payload = {"command": command, "parameters": parameters}
-        log.debug(f"command: {command} parameters:\n {json.dumps(parameters, indent=4)}")
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._stream(payload, ("result", items), timeout, priority)
+
+    def stream_tapir_command(
+        self,
+        command: TapirCommandType,
+        parameters: dict | None = None,
+        items: str = "elements",
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> Iterator[Any]:
+        """Posts a Tapir Add-On command and yields the items of the `items` list of its result one by one."""
+        payload = {"command": "API.ExecuteAddOnCommand", "parameters": _tapir_parameters(command, parameters)}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._stream(payload, ("result", "addOnCommandResponse", items), timeout, priority)
+
+    def stream_command_async(
+        self,
+        command: AddonCommandType,
+        parameters: dict | None = None,
+        items: str = "elements",
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Posts a standard command and asynchronously yields the items of the `items` list of its result."""
+        payload = {"command": command, "parameters": parameters}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._stream_async(payload, ("result", items), timeout, priority)
+
+    def stream_tapir_command_async(
+        self,
+        command: TapirCommandType,
+        parameters: dict | None = None,
+        items: str = "elements",
+        timeout: float | None = None,
+        priority: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Posts a Tapir Add-On command and asynchronously yields the items of the `items` list of its result."""
+        payload = {"command": "API.ExecuteAddOnCommand", "parameters": _tapir_parameters(command, parameters)}
+        log.debug("command: %s parameters:\n %s", command, PrettyJson(parameters))
+        return self._stream_async(payload, ("result", "addOnCommandResponse", items), timeout, priority)
 
-        response = self._post_command(payload, timeout)
+    @classmethod
+    def _unpack(cls, response: dict[str, Any], tapir: bool) -> dict[str, Any]:
+        response = cls._unpack_standard_response(response)
+        return cls._unpack_tapir_response(response) if tapir else response
 
+    @staticmethod
+    def _unpack_standard_response(response: dict[str, Any]) -> dict[str, Any]:
         if response.get("succeeded"):
             response = response.get("result", {})
-            log.debug(f"response: {json.dumps(response, indent=4)}")
+            log.debug("response: %s", PrettyJson(response))
         else:
             log.warning(f"response: {response}")
             raise StandardAPIError(
@@ -56,22 +316,8 @@ class CoreCommands:
             )
         return response
 
-    def post_tapir_command(
-        self, command: TapirCommandType, parameters: dict | None = None, timeout: float | None = None
-    ) -> dict[str, Any]:
-        """Posts a Tapir Add-On command"""
-        response = self.post_command(
-            command="API.ExecuteAddOnCommand",
-            parameters={
-                "addOnCommandId": {
-                    "commandNamespace": "TapirCommand",
-                    "commandName": command,
-                },
-                "addOnCommandParameters": parameters,
-            },
-            timeout=timeout,
-        )
-
+    @staticmethod
+    def _unpack_tapir_response(response: dict[str, Any]) -> dict[str, Any]:
         response = response.get("addOnCommandResponse", {})
         if response.get("error"):
             log.warning(f"response: {response}")
@@ -81,39 +327,618 @@ class CoreCommands:
             )
         return response
 
-    async def post_command_async(
-        self, command: AddonCommandType, parameters: dict | None = None, timeout: float | None = None
+    def _get_client(self) -> httpx.Client:
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=None, transport=self._transport())
+                client = self._client
+        return client
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Async clients are bound to the event loop that created them, so each running loop gets its own pool.
+        The pool is closed when its loop shuts down, e.g. at the end of `asyncio.run`.
+        """
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                client = httpx.AsyncClient(timeout=None, transport=self._async_transport())
+                entry = self._async_clients[loop] = (client, self._close_with_loop(loop, client))
+                started = False
+            else:
+                started = True
+        if not started:
+            await anext(entry[1])
+        return entry[0]
+
+    async def _close_with_loop(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> AsyncGenerator[None, None]:
+        """
+        Keeps the pool of `loop` until the loop finalizes its async generators on shutdown, which runs the
+        `finally` clause and closes the pool on the loop that owns its connections.
+        """
+        try:
+            yield
+        finally:
+            with self._client_lock:
+                if (entry := self._async_clients.get(loop)) is not None and entry[0] is client:
+                    del self._async_clients[loop]
+            await client.aclose()
+
+    def _transport(self) -> httpx.BaseTransport:
+        transport = httpx.HTTPTransport(limits=self.config.limits())
+        mode = self.config.transport_mode
+        return mode.wrap(transport) if mode else transport
+
+    def _async_transport(self) -> httpx.AsyncBaseTransport:
+        transport = httpx.AsyncHTTPTransport(limits=self.config.limits())
+        mode = self.config.transport_mode
+        return mode.wrap_async(transport) if mode else transport
+
+    def is_available(self) -> bool:
+        """
+        False while the circuit breaker of the port is open. Once a probe is due, it is sent in the
+        background, so the instance becomes available again without any command being routed to it.
+        """
+        breaker = self._port_state.breaker
+        if breaker is None or breaker.state is BreakerState.CLOSED:
+            return True
+        if breaker.try_begin_probe():
+            EXECUTOR.submit(self._probe, breaker)
+        return False
+
+    def _probe(self, breaker: CircuitBreaker) -> None:
+        try:
+            self._exchange({"command": "API.IsAlive", "parameters": None}, breaker.policy.probe_timeout)
+        except RequestError as e:
+            log.info(f"Circuit breaker probe of {self.url} failed: {e.message}")
+        finally:
+            if breaker.state is BreakerState.HALF_OPEN:
+                breaker.record_failure()
+
+    async def _probe_async(self, breaker: CircuitBreaker) -> None:
+        try:
+            await self._exchange_async({"command": "API.IsAlive", "parameters": None}, breaker.policy.probe_timeout)
+        except RequestError as e:
+            log.info(f"Circuit breaker probe of {self.url} failed: {e.message}")
+        finally:
+            if breaker.state is BreakerState.HALF_OPEN:
+                breaker.record_failure()
+
+    def _check_circuit(self, payload: dict) -> None:
+        breaker = self._port_state.breaker
+        if breaker is None or breaker.state is BreakerState.CLOSED:
+            return
+        if breaker.try_begin_probe():
+            self._probe(breaker)
+        self._raise_if_open(breaker, payload)
+
+    async def _check_circuit_async(self, payload: dict) -> None:
+        breaker = self._port_state.breaker
+        if breaker is None or breaker.state is BreakerState.CLOSED:
+            return
+        if breaker.try_begin_probe():
+            await self._probe_async(breaker)
+        self._raise_if_open(breaker, payload)
+
+    def _raise_if_open(self, breaker: CircuitBreaker, payload: dict) -> None:
+        if breaker.state is not BreakerState.CLOSED:
+            raise CircuitOpenError(
+                f"Command '{command_name(payload)}' to {self.url} rejected: circuit breaker is open."
+            )
+
+    def _retry_policy(self, payload: dict) -> RetryPolicy | None:
+        if self.config.retry is None or not is_read_only(command_name(payload)):
+            return None
+        return self.config.retry
+
+    def _retry_delay(
+        self, policy: RetryPolicy | None, error: RequestError, attempt: int, payload: dict
+    ) -> float | None:
+        """The backoff before the next attempt, or None if the failure must be raised."""
+        # Only failures in transit are retried; queue-wait timeouts and open breakers are not
+        if policy is None or attempt >= policy.max_retries or not isinstance(error.__cause__, httpx.TransportError):
+            return None
+        delay = policy.delay(attempt)
+        log.info(f"Retrying command '{command_name(payload)}' to {self.url} in {delay:.3f} seconds: {error.message}")
+        return delay
+
+    @contextmanager
+    def _observe_round_trip(self) -> Iterator[None]:
+        """Reports the outcome of one HTTP exchange to the adaptive limiter and the circuit breaker, if any."""
+        limiter = self._port_state.limiter
+        breaker = self._port_state.breaker
+        if limiter is None and breaker is None:
+            yield
+            return
+        token = limiter.begin() if limiter else 0
+        start = time.perf_counter()
+        try:
+            yield
+        except httpx.TransportError:
+            if limiter:
+                limiter.on_overload(token)
+            if breaker:
+                breaker.record_failure()
+            raise
+        if limiter:
+            limiter.on_success(token, time.perf_counter() - start)
+        if breaker:
+            breaker.record_success()
+
+    def _post_command(
+        self, payload: dict, timeout: float | int | None, priority: int = 0, tapir: bool = False
     ) -> dict[str, Any]:
-        """Asynchronous wrapper for post_command."""
-        return await asyncio.to_thread(self.post_command, command, parameters, timeout)
+        if not self._is_observed():
+            return self._unpack(self._fetch(payload, timeout, priority), tapir)
+        with self._observed_call(payload):
+            return self._unpack(self._fetch(payload, timeout, priority), tapir)
 
-    async def post_tapir_command_async(
-        self, command: TapirCommandType, parameters: dict | None = None, timeout: float | None = None
+    async def _post_command_async(
+        self, payload: dict, timeout: float | int | None, priority: int = 0, tapir: bool = False
     ) -> dict[str, Any]:
-        """Asynchronous wrapper for post_tapir_command."""
-        return await asyncio.to_thread(self.post_tapir_command, command, parameters, timeout)
+        if not self._is_observed():
+            return self._unpack(await self._fetch_async(payload, timeout, priority), tapir)
+        with self._observed_call(payload):
+            return self._unpack(await self._fetch_async(payload, timeout, priority), tapir)
+
+    def _is_observed(self) -> bool:
+        state = self._port_state
+        return state.metrics is not None or state.slow_log is not None or self.config.tracer is not None
+
+    @contextmanager
+    def _observed_call(self, payload: dict) -> Iterator[None]:
+        """Records one call in the metrics, the trace and the slow-command log, whichever is enabled."""
+        call = _ObservedCall(self, payload)
+        try:
+            with call.scope():
+                yield
+        except Exception as e:
+            call.finish(e)
+            raise
+        call.finish()
+
+    def _fetch(self, payload: dict, timeout: float | int | None, priority: int) -> dict[str, Any]:
+        """Answers from the cache, an identical request in flight or a new request, in that order."""
+        with profiled_call(command_name(payload)):
+            ticket = CacheTicket(self._port_state.cache, payload)
+            if ticket.hit is not None:
+                return self._decode(ticket.hit, payload)
+            try:
+                content = self._send_coalesced(payload, timeout, priority)
+            finally:
+                ticket.sent()
+            response = self._decode(content, payload)
+            ticket.store(content, response)
+            return response
 
-    def _post_command(self, payload: dict, timeout: float | int | None) -> dict[str, Any]:
-        command_name = payload.get("command")
+    async def _fetch_async(self, payload: dict, timeout: float | int | None, priority: int) -> dict[str, Any]:
+        with profiled_call(command_name(payload)):
+            ticket = CacheTicket(self._port_state.cache, payload)
+            if ticket.hit is not None:
+                return self._decode(ticket.hit, payload)
+            try:
+                content = await self._send_coalesced_async(payload, timeout, priority)
+            finally:
+                ticket.sent()
+            response = self._decode(content, payload)
+            ticket.store(content, response)
+            return response
+
+    def _send_coalesced(self, payload: dict, timeout: float | int | None, priority: int) -> bytes:
+        flights = self._port_state.single_flight
+        # A blocking call on an event loop thread must not wait for a flight led by a task of that loop
+        if flights is None or not is_read_only(command_name(payload)) or _in_event_loop():
+            return self._send(payload, timeout, priority)
+        key = payload_key(payload)
+        while True:
+            future, is_leader = flights.join(key)
+            if is_leader:
+                break
+            concurrent.futures.wait([future], timeout)
+            if not future.done():
+                raise self._coalesced_timeout(payload, timeout)
+            try:
+                return future.result()
+            except FlightAbandoned:
+                continue
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(self.url, json=payload, timeout=timeout)
+            content = self._send(payload, timeout, priority)
+        except Exception as e:
+            flights.land(key, future, error=e)
+            raise
+        except BaseException:
+            flights.land(key, future, error=FlightAbandoned())
+            raise
+        flights.land(key, future, content=content)
+        return content
+
+    async def _send_coalesced_async(self, payload: dict, timeout: float | int | None, priority: int) -> bytes:
+        flights = self._port_state.single_flight
+        if flights is None or not is_read_only(command_name(payload)):
+            return await self._send_async(payload, timeout, priority)
+        key = payload_key(payload)
+        while True:
+            future, is_leader = flights.join(key)
+            if is_leader:
+                break
+            # Never cancel the wrapper: that would cancel the flight of every other follower
+            followed = asyncio.wrap_future(future)
+            await asyncio.wait([followed], timeout=timeout)
+            if not followed.done():
+                raise self._coalesced_timeout(payload, timeout)
+            try:
+                return followed.result()
+            except FlightAbandoned:
+                continue
+        try:
+            content = await self._send_async(payload, timeout, priority)
+        except Exception as e:
+            flights.land(key, future, error=e)
+            raise
+        except BaseException:
+            flights.land(key, future, error=FlightAbandoned())
+            raise
+        flights.land(key, future, content=content)
+        return content
+
+    def _coalesced_timeout(self, payload: dict, timeout: float | int | None) -> CommandTimeoutError:
+        message = f"Command '{command_name(payload)}' to {self.url} timed out after {timeout} seconds waiting for an identical request."
+        log.info(message)
+        return CommandTimeoutError(message)
+
+    def _send(self, payload: dict, timeout: float | int | None, priority: int) -> bytes:
+        retry = self._retry_policy(payload)
+        attempt = 0
+        while True:
+            self._check_circuit(payload)
+            try:
+                return self._exchange(payload, timeout, priority)
+            except RequestError as e:
+                delay = self._retry_delay(retry, e, attempt, payload)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def _send_async(self, payload: dict, timeout: float | int | None, priority: int) -> bytes:
+        retry = self._retry_policy(payload)
+        attempt = 0
+        while True:
+            await self._check_circuit_async(payload)
+            try:
+                return await self._exchange_async(payload, timeout, priority)
+            except RequestError as e:
+                delay = self._retry_delay(retry, e, attempt, payload)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _exchange(self, payload: dict, timeout: float | int | None, priority: int = 0) -> bytes:
+        profile = current_profile()
+        try:
+            start = time.perf_counter()
+            body = self._codec.dumps(payload)
+            profile.add("encode", time.perf_counter() - start)
+            with self.admission.slot(priority, timeout) as wait, self._observe_round_trip():
+                start = time.perf_counter()
+                response = self._get_client().post(self.url, content=body, headers=_JSON_HEADERS, timeout=timeout)
+            # The round trip goes first, so it is charged with the memory of the response
+            profile.add("round_trip", time.perf_counter() - start)
+            profile.add("queue_wait", wait)
+            self._record_request(payload, wait, len(body), len(response.content))
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            raise self._to_request_error(e, command_name(payload), timeout) from e
+
+    async def _exchange_async(self, payload: dict, timeout: float | int | None, priority: int = 0) -> bytes:
+        profile = current_profile()
+        try:
+            start = time.perf_counter()
+            body = self._codec.dumps(payload)
+            profile.add("encode", time.perf_counter() - start)
+            async with self.admission.slot_async(priority, timeout) as wait:
+                with self._observe_round_trip():
+                    start = time.perf_counter()
+                    client = await self._get_async_client()
+                    response = await client.post(
+                        self.url, content=body, headers=_JSON_HEADERS, timeout=timeout
+                    )
+            # The round trip goes first, so it is charged with the memory of the response
+            profile.add("round_trip", time.perf_counter() - start)
+            profile.add("queue_wait", wait)
+            self._record_request(payload, wait, len(body), len(response.content))
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            raise self._to_request_error(e, command_name(payload), timeout) from e
+
+    def _stream(self, payload: dict, path: Sequence[str], timeout: float | int | None, priority: int) -> Iterator[Any]:
+        items = self._stream_items(payload, path, timeout, priority)
+        return self._observed_stream(payload, items) if self._is_observed() else items
+
+    def _stream_async(
+        self, payload: dict, path: Sequence[str], timeout: float | int | None, priority: int
+    ) -> AsyncIterator[Any]:
+        items = self._stream_items_async(payload, path, timeout, priority)
+        return self._observed_stream_async(payload, items) if self._is_observed() else items
+
+    def _observed_stream(self, payload: dict, items: Iterator[Any]) -> Iterator[Any]:
+        """
+        Records a stream as one call that lasts until its last item (or its failure). The call is only in
+        scope while the next item is produced, so its span does not leak into the consumer's code.
+        """
+        call = _ObservedCall(self, payload)
+        try:
+            while True:
+                with call.scope():
+                    item = next(items, _END)
+                if item is _END:
+                    break
+                yield item
+        except Exception as e:
+            call.finish(e)
+            raise
+        except GeneratorExit:
+            items.close()  # type: ignore[attr-defined]
+            call.abandon()
+            raise
+        call.finish()
+
+    async def _observed_stream_async(self, payload: dict, items: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        call = _ObservedCall(self, payload)
+        try:
+            while True:
+                with call.scope():
+                    item = await anext(items, _END)
+                if item is _END:
+                    break
+                yield item
+        except Exception as e:
+            call.finish(e)
+            raise
+        except GeneratorExit:
+            call.abandon()
+            raise
+        finally:
+            # A closed async generator does not close the stream it iterates over
+            await items.aclose()  # type: ignore[attr-defined]
+        call.finish()
+
+    def _stream_items(
+        self, payload: dict, path: Sequence[str], timeout: float | int | None, priority: int
+    ) -> Iterator[Any]:
+        self._check_circuit(payload)
+        parser = ItemStreamParser(path)
+        with ExitStack() as stack:
+            try:
+                body = self._codec.dumps(payload)
+                wait = stack.enter_context(self.admission.slot(priority, timeout))
+                with self._observe_round_trip():
+                    response = stack.enter_context(
+                        self._get_client().stream(
+                            "POST", self.url, content=body, headers=_JSON_HEADERS, timeout=timeout
+                        )
+                    )
                 response.raise_for_status()
-                result = response.json()
-        except httpx.TimeoutException as e:
-            message = f"Command '{command_name}' to {self.url} timed out after {timeout} seconds."
-            log.info(message)
-            raise CommandTimeoutError(message) from e
-        except httpx.RequestError as e:
-            message = f"HTTP error for command '{command_name}' to {self.url}: {e}"
+                chunks = response.iter_bytes()
+            except Exception as e:
+                raise self._to_request_error(e, command_name(payload), timeout) from e
+            while not parser.done:
+                try:
+                    chunk = next(chunks, None)
+                except Exception as e:
+                    raise self._to_request_error(e, command_name(payload), timeout) from e
+                yield from self._parse_chunk(parser, chunk, payload)
+            # Reading the rest of the body lets the connection go back to the pool
+            for _ in chunks:
+                pass
+            self._record_request(payload, wait, len(body), response.num_bytes_downloaded)
+        self._check_streamed(parser, payload)
+
+    async def _stream_items_async(
+        self, payload: dict, path: Sequence[str], timeout: float | int | None, priority: int
+    ) -> AsyncIterator[Any]:
+        await self._check_circuit_async(payload)
+        parser = ItemStreamParser(path)
+        async with AsyncExitStack() as stack:
+            try:
+                body = self._codec.dumps(payload)
+                wait = await stack.enter_async_context(self.admission.slot_async(priority, timeout))
+                client = await self._get_async_client()
+                with self._observe_round_trip():
+                    response = await stack.enter_async_context(
+                        client.stream(
+                            "POST", self.url, content=body, headers=_JSON_HEADERS, timeout=timeout
+                        )
+                    )
+                response.raise_for_status()
+                chunks = response.aiter_bytes()
+            except Exception as e:
+                raise self._to_request_error(e, command_name(payload), timeout) from e
+            while not parser.done:
+                try:
+                    chunk = await anext(chunks, None)
+                except Exception as e:
+                    raise self._to_request_error(e, command_name(payload), timeout) from e
+                for item in self._parse_chunk(parser, chunk, payload):
+                    yield item
+            async for _ in chunks:
+                pass
+            self._record_request(payload, wait, len(body), response.num_bytes_downloaded)
+        self._check_streamed(parser, payload)
+
+    @staticmethod
+    def _parse_chunk(parser: ItemStreamParser, chunk: bytes | None, payload: dict) -> list[Any]:
+        """Feeds one chunk of the body to the parser; None marks the end of the body."""
+        try:
+            return parser.feed(chunk) if chunk is not None else parser.close()
+        except ValueError as e:
+            message = f"Failed to decode JSON response of command '{command_name(payload)}': {e}"
             log.error(message)
-            raise APIConnectionError(message) from e
-        except json.JSONDecodeError as e:
-            message = "Failed to decode JSON response."
+            raise InvalidResponseFormatError(message) from e
+
+    def _check_streamed(self, parser: ItemStreamParser, payload: dict) -> None:
+        """Raises the error reported in place of the streamed list, if the list was not found."""
+        if parser.found:
+            return
+        response = self._unpack_standard_response(parser.envelope)
+        if payload["command"] == "API.ExecuteAddOnCommand":
+            self._unpack_tapir_response(response)
+        message = f"Response of command '{command_name(payload)}' has no '{parser.path[-1]}' list."
+        log.error(message)
+        raise InvalidResponseFormatError(message)
+
+    def _record_request(self, payload: dict, queue_wait: float, request_bytes: int, response_bytes: int) -> None:
+        if self._port_state.metrics is not None:
+            self._port_state.metrics.record_request(command_name(payload), queue_wait, request_bytes, response_bytes)
+        stats = _current_call_stats.get()
+        if stats is not None:
+            stats.requests += 1
+            stats.queue_wait += queue_wait
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def _decode(self, content: bytes, payload: dict) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            response = self._codec.loads(content)
+        except ValueError as e:
+            message = f"Failed to decode JSON response of command '{command_name(payload)}'."
             log.error(message)
             raise InvalidResponseFormatError(message) from e
-        except Exception as e:
-            message = f"Unexpected error during post_command '{command_name}': {type(e).__name__} - {e}"
-            log.exception(message)
-            raise RequestError(message) from e
-        return result
+        current_profile().add("decode", time.perf_counter() - start, response)
+        return response
+
+    def _to_request_error(
+        self, error: Exception, command_name: str | None, timeout: float | int | None
+    ) -> RequestError:
+        """Maps transport and decoding failures of the sync and async paths to the package's exceptions."""
+        if isinstance(error, httpx.TimeoutException):
+            message = f"Command '{command_name}' to {self.url} timed out after {timeout} seconds."
+            log.info(message)
+            return CommandTimeoutError(message)
+        if isinstance(error, TimeoutError):
+            message = f"Command '{command_name}' to {self.url} waited more than {timeout} seconds for a request slot."
+            log.info(message)
+            return CommandTimeoutError(message)
+        if isinstance(error, httpx.RequestError):
+            message = f"HTTP error for command '{command_name}' to {self.url}: {error}"
+            log.error(message)
+            return APIConnectionError(message)
+        message = f"Unexpected error during post_command '{command_name}': {type(error).__name__} - {error}"
+        log.error(message, exc_info=error)
+        return RequestError(message)
+
+
+def _tapir_parameters(command: TapirCommandType, parameters: dict | None) -> dict[str, Any]:
+    return {
+        "addOnCommandId": {
+            "commandNamespace": "TapirCommand",
+            "commandName": command,
+        },
+        "addOnCommandParameters": parameters,
+    }
+
+
+@dataclass
+class _CallStats:
+    """What the requests of one observed call sent and received. A retried call sends several."""
+
+    requests: int = 0
+    queue_wait: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+_current_call_stats: contextvars.ContextVar[_CallStats | None] = contextvars.ContextVar(
+    "current_call_stats", default=None
+)
+
+
+class _ObservedCall:
+    """One call as seen by the metrics, the tracer and the slow-command log of its CoreCommands."""
+
+    def __init__(self, core: CoreCommands, payload: dict) -> None:
+        self.core = core
+        self.payload = payload
+        self.command = command_name(payload)
+        self.stats = _CallStats()
+        tracer = core.config.tracer
+        self.span = (
+            tracer.start_span(self.command, {**core.span_attributes, "command": self.command}) if tracer else None
+        )
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Makes the call current, so its requests are added to it and its span is the parent of nested spans."""
+        token = _current_call_stats.set(self.stats)
+        try:
+            with use_span(self.span) if self.span else _NOT_TRACED:
+                yield
+        finally:
+            _current_call_stats.reset(token)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        latency = time.perf_counter() - self.start
+        state = self.core._port_state
+        if state.metrics is not None:
+            state.metrics.record_call(self.command, latency, error)
+        if state.slow_log is not None and state.slow_log.is_slow(self.command, latency):
+            state.slow_log.record(self._slow_command(state.slow_log, latency, error))
+        self.abandon(error)
+
+    def abandon(self, error: BaseException | None = None) -> None:
+        """Ends the span of the call. On its own, for calls that did not complete and are not counted."""
+        tracer = self.core.config.tracer
+        if tracer is None or self.span is None:
+            return
+        if self.stats.requests:
+            self.span.attributes.update(vars(self.stats))
+        tracer.end_span(self.span, error)
+
+    def _slow_command(self, slow_log: SlowCommandLog, latency: float, error: BaseException | None) -> SlowCommand:
+        parameters = self.payload.get("parameters")
+        if self.payload["command"] == "API.ExecuteAddOnCommand":
+            parameters = parameters.get("addOnCommandParameters")
+        return SlowCommand(
+            command=self.command,
+            port=self.core.port,
+            project=self.core.span_attributes.get("project"),
+            latency=latency,
+            parameters=parameters_preview(parameters, slow_log.policy.max_parameter_chars),
+            request_bytes=self.stats.request_bytes,
+            response_bytes=self.stats.response_bytes,
+            error=type(error).__name__ if error is not None else None,
+        )
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _close_async_client_on_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Closes an async client from synchronous code, on the event loop that owns its connections."""
+    if loop.is_closed():
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if loop is running_loop:
+        loop.create_task(client.aclose())
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        loop.run_until_complete(client.aclose())
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from multiconn_archicad.core.config import MetricsPolicy
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(frozen=True)
+class Histogram:
+    """
+    Observations counted into buckets. `counts[i]` holds the observations up to `bounds[i]`
+    (and above `bounds[i - 1]`), the last count holds everything above the last bound.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    total: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """The upper bound of the bucket that holds the `q` quantile; inf if it is above the last bound."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}.")
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip((*self.bounds, math.inf), self.counts):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return 0.0
+
+
+@dataclass(frozen=True)
+class CommandMetrics:
+    """
+    What happened to one command on one port since metrics were enabled.
+
+    Attributes:
+        calls: Completed calls, cache hits and coalesced calls included.
+        errors: Failed calls per exception class name.
+        latency: Seconds from the call until its response was decoded (or it failed).
+        requests: HTTP requests actually sent. Differs from calls with caching, coalescing and retries.
+        queue_wait: Seconds the requests waited for a slot of the port's request budget.
+        request_bytes: Encoded size of the request bodies sent.
+        response_bytes: Size of the response bodies received.
+    """
+
+    port: int | None
+    command: str
+    calls: int
+    errors: dict[str, int]
+    latency: Histogram
+    requests: int
+    queue_wait: Histogram
+    request_bytes: int
+    response_bytes: int
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    commands: tuple[CommandMetrics, ...] = ()
+
+    def get(self, command: str, port: int | None = None) -> CommandMetrics | None:
+        """The metrics of `command`, on `port` if one is given, otherwise on the first port that has any."""
+        for metrics in self.commands:
+            if metrics.command == command and (port is None or metrics.port == port):
+                return metrics
+        return None
+
+    def to_prometheus(self, prefix: str = "multiconn_archicad") -> str:
+        """Renders the snapshot in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        def histogram(metric: str, labels: str, value: Histogram) -> None:
+            cumulative = 0
+            for bound, count in zip((*value.bounds, math.inf), value.counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{metric}_sum{{{labels}}} {value.total!r}")
+            lines.append(f"{metric}_count{{{labels}}} {cumulative}")
+
+        metric = family("command_calls_total", "counter", "Completed command calls.")
+        for m in self.commands:
+            lines.append(f"{metric}{{{_labels(m)}}} {m.calls}")
+        metric = family("command_errors_total", "counter", "Failed command calls by exception class.")
+        for m in self.commands:
+            for error, count in sorted(m.errors.items()):
+                lines.append(f'{metric}{{{_labels(m)},error="{_escape(error)}"}} {count}')
+        metric = family("command_latency_seconds", "histogram", "Seconds from call to decoded response.")
+        for m in self.commands:
+            histogram(metric, _labels(m), m.latency)
+        metric = family("command_requests_total", "counter", "HTTP requests sent.")
+        for m in self.commands:
+            lines.append(f"{metric}{{{_labels(m)}}} {m.requests}")
+        metric = family("command_queue_wait_seconds", "histogram", "Seconds spent waiting for a request slot.")
+        for m in self.commands:
+            histogram(metric, _labels(m), m.queue_wait)
+        metric = family("command_request_bytes_total", "counter", "Bytes of request bodies sent.")
+        for m in self.commands:
+            lines.append(f"{metric}{{{_labels(m)}}} {m.request_bytes}")
+        metric = family("command_response_bytes_total", "counter", "Bytes of response bodies received.")
+        for m in self.commands:
+            lines.append(f"{metric}{{{_labels(m)}}} {m.response_bytes}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(metrics: CommandMetrics) -> str:
+    return f'port="{metrics.port}",command="{_escape(metrics.command)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsSink(ABC):
+    """Receives every observation as it is recorded, e.g. to forward it to a monitoring system."""
+
+    @abstractmethod
+    def record_call(self, port: int | None, command: str, latency: float, error: str | None) -> None: ...
+
+    @abstractmethod
+    def record_request(
+        self, port: int | None, command: str, queue_wait: float, request_bytes: int, response_bytes: int
+    ) -> None: ...
+
+
+class OpenTelemetrySink(MetricsSink):
+    """
+    Forwards the observations to OpenTelemetry instruments created on `meter`, e.g.
+    `opentelemetry.metrics.get_meter("multiconn_archicad")`.
+    """
+
+    def __init__(self, meter: Any, prefix: str = "multiconn_archicad") -> None:
+        self._calls = meter.create_counter(f"{prefix}.command.calls", description="Completed command calls.")
+        self._errors = meter.create_counter(f"{prefix}.command.errors", description="Failed command calls.")
+        self._latency = meter.create_histogram(
+            f"{prefix}.command.duration", unit="s", description="Seconds from call to decoded response."
+        )
+        self._queue_wait = meter.create_histogram(
+            f"{prefix}.command.queue_wait", unit="s", description="Seconds spent waiting for a request slot."
+        )
+        self._request_bytes = meter.create_counter(f"{prefix}.command.request_size", unit="By")
+        self._response_bytes = meter.create_counter(f"{prefix}.command.response_size", unit="By")
+
+    def record_call(self, port: int | None, command: str, latency: float, error: str | None) -> None:
+        attributes = {"port": str(port), "command": command}
+        self._calls.add(1, attributes)
+        self._latency.record(latency, attributes)
+        if error is not None:
+            self._errors.add(1, {**attributes, "error.type": error})
+
+    def record_request(
+        self, port: int | None, command: str, queue_wait: float, request_bytes: int, response_bytes: int
+    ) -> None:
+        attributes = {"port": str(port), "command": command}
+        self._queue_wait.record(queue_wait, attributes)
+        self._request_bytes.add(request_bytes, attributes)
+        self._response_bytes.add(response_bytes, attributes)
+
+
+@dataclass
+class _Series:
+    latency_counts: list[int]
+    queue_wait_counts: list[int]
+    calls: int = 0
+    latency_total: float = 0.0
+    errors: dict[str, int] = field(default_factory=dict)
+    requests: int = 0
+    queue_wait_total: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+class MetricsRecorder:
+    """Aggregates the observations of one Archicad instance per command and passes them on to the sinks."""
+
+    def __init__(self, port: int | None, policy: MetricsPolicy) -> None:
+        self.port = port
+        self.policy = policy
+        self._bounds = policy.latency_buckets
+        self._lock = threading.Lock()
+        self._series: dict[str, _Series] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(port={self.port}, commands={len(self._series)})"
+
+    def record_call(self, command: str, latency: float, error: BaseException | None = None) -> None:
+        error_name = type(error).__name__ if error is not None else None
+        with self._lock:
+            series = self._get_series(command)
+            series.calls += 1
+            series.latency_counts[bisect.bisect_left(self._bounds, latency)] += 1
+            series.latency_total += latency
+            if error_name is not None:
+                series.errors[error_name] = series.errors.get(error_name, 0) + 1
+        self._forward(lambda sink: sink.record_call(self.port, command, latency, error_name))
+
+    def record_request(self, command: str, queue_wait: float, request_bytes: int, response_bytes: int) -> None:
+        with self._lock:
+            series = self._get_series(command)
+            series.requests += 1
+            series.queue_wait_counts[bisect.bisect_left(self._bounds, queue_wait)] += 1
+            series.queue_wait_total += queue_wait
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+        self._forward(lambda sink: sink.record_request(self.port, command, queue_wait, request_bytes, response_bytes))
+
+    def snapshot(self) -> tuple[CommandMetrics, ...]:
+        with self._lock:
+            return tuple(
+                CommandMetrics(
+                    port=self.port,
+                    command=command,
+                    calls=series.calls,
+                    errors=dict(series.errors),
+                    latency=Histogram(self._bounds, tuple(series.latency_counts), series.latency_total),
+                    requests=series.requests,
+                    queue_wait=Histogram(self._bounds, tuple(series.queue_wait_counts), series.queue_wait_total),
+                    request_bytes=series.request_bytes,
+                    response_bytes=series.response_bytes,
+                )
+                for command, series in sorted(self._series.items())
+            )
+
+    def _get_series(self, command: str) -> _Series:
+        series = self._series.get(command)
+        if series is None:
+            buckets = len(self._bounds) + 1
+            series = self._series[command] = _Series([0] * buckets, [0] * buckets)
+        return series
+
+    def _forward(self, record: Callable[[MetricsSink], None]) -> None:
+        for sink in self.policy.sinks:
+            try:
+                record(sink)
+            except Exception:
+                log.warning(f"Metrics sink {sink!r} failed.", exc_info=True)
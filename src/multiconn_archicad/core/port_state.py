@@ -0,0 +1,118 @@
+from __future__ import annotations
+import threading
+from dataclasses import dataclass
+
+from multiconn_archicad.core.admission import AdmissionController
+from multiconn_archicad.core.adaptive import AIMDLimiter
+from multiconn_archicad.core.resilience import CircuitBreaker
+from multiconn_archicad.core.cache import ResponseCache
+from multiconn_archicad.core.single_flight import SingleFlight
+from multiconn_archicad.core.metrics import MetricsRecorder
+from multiconn_archicad.core.slow_log import SlowCommandLog
+from multiconn_archicad.core.config import (
+    CoreConfig,
+    AdaptiveConcurrency,
+    CircuitBreakerPolicy,
+    ResponseCachePolicy,
+    MetricsPolicy,
+    SlowCommandPolicy,
+)
+
+
+@dataclass
+class PortState:
+    """
+    Runtime state shared by every CoreCommands that talks to the same Archicad instance with the same config.
+    The primary header and the pooled header of a port are separate objects, but they
+    must draw from one request budget to protect the instance.
+    """
+
+    config: CoreConfig
+    admission: AdmissionController
+    configured_limit: int | None
+    configured_adaptive: AdaptiveConcurrency | None = None
+    limiter: AIMDLimiter | None = None
+    breaker: CircuitBreaker | None = None
+    cache: ResponseCache | None = None
+    single_flight: SingleFlight | None = None
+    metrics: MetricsRecorder | None = None
+    slow_log: SlowCommandLog | None = None
+    port: int | None = None
+
+    def configure(self, config: CoreConfig) -> None:
+        """
+        Applies the per-port settings of `config`. Parts whose policy is unchanged are kept as they are, and the
+        metrics and slow-command log are kept when `config` does not set them, so collected data is not lost.
+        """
+        if (
+            self.configured_limit != config.max_in_flight_per_port
+            or self.configured_adaptive != config.adaptive_concurrency
+        ):
+            self.configured_limit = config.max_in_flight_per_port
+            self.configured_adaptive = config.adaptive_concurrency
+            if config.adaptive_concurrency is None:
+                self.limiter = None
+                self.admission.limit = config.max_in_flight_per_port
+            else:
+                self.limiter = AIMDLimiter(self.admission, config.adaptive_concurrency)
+        if self._breaker_policy() != config.circuit_breaker:
+            self.breaker = CircuitBreaker(config.circuit_breaker) if config.circuit_breaker else None
+        if self._cache_policy() != config.response_cache:
+            self.cache = ResponseCache(config.response_cache) if config.response_cache else None
+        if (self.single_flight is not None) != config.coalesce_reads:
+            self.single_flight = SingleFlight() if config.coalesce_reads else None
+        if config.metrics is not None and self._metrics_policy() != config.metrics:
+            self.metrics = MetricsRecorder(self.port, config.metrics)
+        if config.slow_commands is not None and self._slow_log_policy() != config.slow_commands:
+            self.slow_log = SlowCommandLog(config.slow_commands)
+
+    def _breaker_policy(self) -> CircuitBreakerPolicy | None:
+        return self.breaker.policy if self.breaker else None
+
+    def _cache_policy(self) -> ResponseCachePolicy | None:
+        return self.cache.policy if self.cache else None
+
+    def _metrics_policy(self) -> MetricsPolicy | None:
+        return self.metrics.policy if self.metrics else None
+
+    def _slow_log_policy(self) -> SlowCommandPolicy | None:
+        return self.slow_log.policy if self.slow_log else None
+
+
+_registry: dict[str, list[PortState]] = {}
+_registry_lock = threading.Lock()
+
+
+def get_port_state(url: str, config: CoreConfig, port: int | None = None) -> PortState:
+    """
+    Returns the state shared by every CoreCommands of the instance at `url` with an equal `config`, such as all
+    headers of one MultiConn. A CoreCommands with another config gets a state of its own, so neither one changes
+    the limits, cache or metrics of the other.
+    """
+    with _registry_lock:
+        states = _registry.setdefault(url, [])
+        for state in states:
+            if state.config == config:
+                return state
+        state = PortState(
+            config=config,
+            admission=AdmissionController(config.max_in_flight_per_port),
+            configured_limit=config.max_in_flight_per_port,
+            port=port,
+        )
+        state.configure(config)
+        states.append(state)
+        return state
+
+
+def reconfigure_port_state(state: PortState, config: CoreConfig) -> None:
+    """Applies `config` to `state`, for every CoreCommands that shares it."""
+    with _registry_lock:
+        state.configure(config)
+        state.config = config
+
+
+def reset_port_states() -> None:
+    """Forgets all shared per-port state. Meant for tests and long-running processes that recycle ports."""
+    with _registry_lock:
+        _registry.clear()
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import contextvars
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+# The stages of a call in the order they happen. Whatever is not covered by them is reported as "other".
+STAGES: tuple[str, ...] = (
+    "validate_parameters",
+    "dump_parameters",
+    "encode",
+    "queue_wait",
+    "round_trip",
+    "decode",
+    "validate_result",
+)
+OTHER_STAGE = "other"
+# The memory summary entry of the highest peak of a call
+PEAK = "peak"
+
+_active_profiler: StageProfiler | None = None
+_current_call: contextvars.ContextVar[CallProfile | None] = contextvars.ContextVar("current_call", default=None)
+
+
+@dataclass
+class CallProfile:
+    """
+    Seconds spent in each stage of one call. Chunks of a chunked call run on several threads and all add
+    their stages to the same profile, so stage times may add up to more than `total`.
+
+    When memory is profiled, `memory` holds the bytes each stage left allocated, measured by tracemalloc
+    between the stage boundaries, and `objects` the census of the objects a stage produced (the decoded
+    response, the validated result) by type. tracemalloc sees the whole process, so the figures are exact
+    only while one call runs at a time.
+    """
+
+    command: str
+    stages: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    memory: dict[str, int] | None = None
+    memory_total: int = 0
+    memory_peak: int = 0
+    objects: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _lap_started: float = field(default=0.0, repr=False)
+    _memory_started: int = field(default=0, repr=False)
+    _memory_mark: int = field(default=0, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._lap_started = self._started
+
+    @property
+    def other(self) -> float:
+        """Time of the call not covered by any stage, e.g. cache lookups or merging chunks."""
+        return max(0.0, self.total - sum(self.stages.values()))
+
+    @property
+    def memory_other(self) -> int:
+        """Bytes the call left allocated outside of any stage."""
+        return self.memory_total - sum((self.memory or {}).values())
+
+    def add(self, stage: str, seconds: float, value: Any = None) -> None:
+        """
+        Adds `seconds` to `stage`. When memory is profiled, the allocations since the previous stage boundary
+        go to `stage` as well, and `value`, the object the stage produced, is counted by type.
+        """
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        if self.memory is not None:
+            self._memory_lap(stage, value)
+
+    def lap(self, stage: str | None = None, value: Any = None) -> None:
+        """Adds the time since the previous lap (or the start of the call) to `stage`; None just restarts the lap."""
+        now = time.perf_counter()
+        if stage is not None:
+            self.add(stage, now - self._lap_started, value)
+        elif self.memory is not None:
+            self._memory_lap(None, None)
+        self._lap_started = now
+
+    def start_memory(self) -> None:
+        self.memory = {}
+        self._memory_started = self._memory_mark = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def finish_memory(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.memory_total = current - self._memory_started
+        self.memory_peak = max(0, peak - self._memory_started)
+
+    def _memory_lap(self, stage: str | None, value: Any) -> None:
+        census = object_census(value) if value is not None else None
+        current = tracemalloc.get_traced_memory()[0]
+        with self._lock:
+            assert self.memory is not None
+            if stage is not None:
+                self.memory[stage] = self.memory.get(stage, 0) + current - self._memory_mark
+            self._memory_mark = current
+            if stage is not None and census:
+                counted = self.objects.setdefault(stage, {})
+                for type_name, (count, size) in census.items():
+                    entry = counted.setdefault(type_name, [0, 0])
+                    entry[0] += count
+                    entry[1] += size
+
+
+class _NullProfile:
+    """Stands in for a CallProfile while no profiler is running, so instrumented code needs no branches."""
+
+    __slots__ = ()
+
+    def add(self, stage: str, seconds: float, value: Any = None) -> None:
+        pass
+
+    def lap(self, stage: str | None = None, value: Any = None) -> None:
+        pass
+
+
+_NULL_PROFILE = _NullProfile()
+_NOT_PROFILED = nullcontext(_NULL_PROFILE)
+
+
+@dataclass(frozen=True)
+class StageStats:
+    command: str
+    stage: str
+    total: float
+    calls: int
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class MemoryStats:
+    """Bytes a stage left allocated over all its calls, and the highest peak of a single call."""
+
+    command: str
+    stage: str
+    total: int
+    calls: int
+    peak: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class ObjectStats:
+    """Objects of one type that a stage produced, over all its calls."""
+
+    command: str
+    stage: str
+    type: str
+    count: int
+    size: int
+
+
+def object_census(value: Any) -> dict[str, tuple[int, int]]:
+    """
+    Number and total size of the objects reachable from `value`, by type: pydantic models by class name,
+    everything else by builtin type. An object reachable several times is counted once, and the instance
+    dictionary of a model counts towards the model.
+    """
+    counts: dict[str, list[int]] = {}
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size = sys.getsizeof(item)
+        if isinstance(item, BaseModel):
+            size += sys.getsizeof(item.__dict__) + sys.getsizeof(item.__pydantic_fields_set__)
+            stack.extend(item.__dict__.values())
+            if item.__pydantic_extra__:
+                stack.extend(item.__pydantic_extra__.values())
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, uuid.UUID):
+            size += sys.getsizeof(item.int)
+        entry = counts.setdefault(type(item).__name__, [0, 0])
+        entry[0] += 1
+        entry[1] += size
+    return {type_name: (count, size) for type_name, (count, size) in counts.items()}
+
+
+class StageProfiler:
+    """
+    Records where the time of each UnifiedApi and CoreCommands call goes while it is running: parameter
+    validation, model_dump, JSON encoding, waiting for a request slot, the HTTP round trip, JSON decoding
+    and result validation. Profiling is process-wide and off until a profiler is started.
+
+    With `memory=True` the profiler also runs tracemalloc and records the bytes each stage leaves allocated,
+    the peak of each call, and the objects of the decoded responses and validated results by type, which
+    shows e.g. how much of a result is ElementId and UUID objects. Tracing allocations slows every
+    allocation in the process down, so memory profiling is meant for benchmarks and short diagnostic runs.
+
+    Usage:
+        with StageProfiler() as profiler:
+            conn.unified.tapir.element.get_details_of_elements(elements)
+        print(profiler.report())
+    """
+
+    def __init__(self, keep_calls: int = 1000, memory: bool = False) -> None:
+        self.calls: deque[CallProfile] = deque(maxlen=keep_calls)
+        self.memory = memory
+        self._lock = threading.Lock()
+        self._totals: dict[tuple[str, str], list[float]] = {}
+        self._memory_totals: dict[tuple[str, str], list[int]] = {}
+        self._objects: dict[tuple[str, str, str], list[int]] = {}
+        self._previous: StageProfiler | None = None
+        self._started_tracing = False
+
+    def __enter__(self) -> StageProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        global _active_profiler
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous, _active_profiler = _active_profiler, self
+
+    def stop(self) -> None:
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = self._previous
+        self._previous = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self._totals.clear()
+            self._memory_totals.clear()
+            self._objects.clear()
+
+    def record(self, profile: CallProfile) -> None:
+        with self._lock:
+            self.calls.append(profile)
+            for stage, seconds in (*profile.stages.items(), (OTHER_STAGE, profile.other)):
+                totals = self._totals.setdefault((profile.command, stage), [0.0, 0])
+                totals[0] += seconds
+                totals[1] += 1
+            if profile.memory is None:
+                return
+            for stage, size in (*profile.memory.items(), (OTHER_STAGE, profile.memory_other)):
+                totals = self._memory_totals.setdefault((profile.command, stage), [0, 0, 0])
+                totals[0] += size
+                totals[1] += 1
+            peak = self._memory_totals.setdefault((profile.command, PEAK), [0, 0, 0])
+            peak[0] += profile.memory_peak
+            peak[1] += 1
+            peak[2] = max(peak[2], profile.memory_peak)
+            for stage, counted in profile.objects.items():
+                for type_name, (count, size) in counted.items():
+                    entry = self._objects.setdefault((profile.command, stage, type_name), [0, 0])
+                    entry[0] += count
+                    entry[1] += size
+
+    def summary(self, by_command: bool = False) -> list[StageStats]:
+        """Time per stage (and per command, if `by_command`), the most expensive first."""
+        merged: dict[tuple[str, str], list[float]] = {}
+        with self._lock:
+            for (command, stage), (total, calls) in self._totals.items():
+                key = (command if by_command else "*", stage)
+                entry = merged.setdefault(key, [0.0, 0])
+                entry[0] += total
+                entry[1] += calls
+        stats = [StageStats(command, stage, total, int(calls)) for (command, stage), (total, calls) in merged.items()]
+        return sorted(stats, key=lambda s: s.total, reverse=True)
+
+    def memory_summary(self, by_command: bool = False) -> list[MemoryStats]:
+        """
+        Bytes left allocated per stage (and per command, if `by_command`), the largest first. The "peak"
+        entry comes first and sums the peaks of the calls above the memory in use when they started, its
+        `peak` is the highest of them.
+        """
+        merged: dict[tuple[str, str], list[int]] = {}
+        with self._lock:
+            for (command, stage), (total, calls, peak) in self._memory_totals.items():
+                entry = merged.setdefault((command if by_command else "*", stage), [0, 0, 0])
+                entry[0] += total
+                entry[1] += calls
+                entry[2] = max(entry[2], peak)
+        stats = [MemoryStats(command, stage, *totals) for (command, stage), totals in merged.items()]
+        return sorted(stats, key=lambda s: (s.stage != PEAK, -s.total))
+
+    def object_summary(self, by_command: bool = False) -> list[ObjectStats]:
+        """The objects the stages produced by type (and per command, if `by_command`), the largest first."""
+        merged: dict[tuple[str, str, str], list[int]] = {}
+        with self._lock:
+            for (command, stage, type_name), (count, size) in self._objects.items():
+                entry = merged.setdefault((command if by_command else "*", stage, type_name), [0, 0])
+                entry[0] += count
+                entry[1] += size
+        stats = [ObjectStats(*key, *totals) for key, totals in merged.items()]
+        return sorted(stats, key=lambda s: s.size, reverse=True)
+
+    def report(self, by_command: bool = False, top: int | None = None) -> str:
+        """A ranked text table of the summary, with each stage's share of the total time."""
+        stats = self.summary(by_command)
+        grand_total = sum(s.total for s in stats) or 1.0
+        rows = [("Command", "Stage", "Total (s)", "Share", "Calls", "Mean (ms)")]
+        rows += [
+            (s.command, s.stage, f"{s.total:.3f}", f"{s.total / grand_total:.1%}", str(s.calls), f"{s.mean * 1000:.2f}")
+            for s in stats[:top]
+        ]
+        return _table(rows, by_command, text_columns=2)
+
+    def memory_report(self, by_command: bool = False, top: int | None = None) -> str:
+        """Text tables of the memory summary and of the object summary, in megabytes."""
+        stats = self.memory_summary(by_command)
+        rows = [("Command", "Stage", "Total (MB)", "Calls", "Mean (MB)")]
+        rows += [
+            (s.command, s.stage, _megabytes(s.peak if s.stage == PEAK else s.total), str(s.calls), _megabytes(s.mean))
+            for s in stats[:top]
+        ]
+        objects = self.object_summary(by_command)
+        grand_total = sum(s.size for s in objects) or 1
+        object_rows = [("Command", "Stage", "Type", "Objects", "Size (MB)", "Share")]
+        object_rows += [
+            (s.command, s.stage, s.type, str(s.count), _megabytes(s.size), f"{s.size / grand_total:.1%}")
+            for s in objects[:top]
+        ]
+        return f"{_table(rows, by_command, text_columns=2)}\n\n{_table(object_rows, by_command, text_columns=3)}"
+
+
+def _megabytes(size: float) -> str:
+    return f"{size / 1_000_000:.3f}"
+
+
+def _table(rows: list[tuple[str, ...]], by_command: bool, text_columns: int) -> str:
+    """Aligns `rows` into columns, text left and figures right, without the command column unless `by_command`."""
+    if not by_command:
+        rows = [row[1:] for row in rows]
+        text_columns -= 1
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i < text_columns else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    )
+
+
+@contextmanager
+def _profiled(profiler: StageProfiler, command: str) -> Iterator[CallProfile]:
+    profile = CallProfile(command)
+    if profiler.memory and tracemalloc.is_tracing():
+        profile.start_memory()
+    token = _current_call.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_call.reset(token)
+        profile.total = time.perf_counter() - profile._started
+        if profile.memory is not None:
+            profile.finish_memory()
+        profiler.record(profile)
+
+
+def profiled_call(command: str) -> AbstractContextManager[CallProfile | _NullProfile]:
+    """
+    Context of one profiled call of `command`, yielding its CallProfile. Calls made inside it (e.g. the
+    CoreCommands request of a UnifiedApi method) add their stages to the same profile.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return _NOT_PROFILED
+    current = _current_call.get()
+    if current is not None:
+        return nullcontext(current)
+    return _profiled(profiler, command)
+
+
+def current_profile() -> CallProfile | _NullProfile:
+    """The profile of the call running in this context, or a no-op stand-in."""
+    return _current_call.get() or _NULL_PROFILE
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+import httpx
+
+from multiconn_archicad.core.command_kinds import payload_key
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Describe the body as it came over the wire, not the decoded body the recorder hands on
+_WIRE_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length"})
+
+
+@dataclass(frozen=True)
+class RecordedExchange:
+    """
+    One request/response pair of a recorded session.
+
+    Attributes:
+        request: The request payload.
+        status: HTTP status code of the response.
+        response: The raw response body.
+        duration: Seconds from sending the request until the whole response body was received.
+    """
+
+    request: Any
+    status: int
+    response: bytes
+    duration: float
+
+    @property
+    def key(self) -> str:
+        return payload_key(self.request)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "request": self.request,
+            "status": self.status,
+            "response": self.response.decode(),
+            "duration": round(self.duration, 6),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RecordedExchange:
+        return cls(data["request"], data["status"], data["response"].encode(), data["duration"])
+
+
+class Recording:
+    """
+    The exchanges of a recorded session, in the order they happened. On disk a recording is a JSON Lines
+    file with one exchange per line, gzip-compressed if the file name ends with ".gz".
+    """
+
+    def __init__(self, exchanges: Iterable[RecordedExchange] = ()) -> None:
+        self.exchanges: list[RecordedExchange] = list(exchanges)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(exchanges={len(self.exchanges)})"
+
+    def __len__(self) -> int:
+        return len(self.exchanges)
+
+    def __iter__(self) -> Iterator[RecordedExchange]:
+        return iter(self.exchanges)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Recording:
+        with _open(Path(path), "r") as file:
+            return cls(RecordedExchange.from_dict(json.loads(line)) for line in file if line.strip())
+
+    def save(self, path: str | Path) -> None:
+        with _open(Path(path), "w") as file:
+            for exchange in self.exchanges:
+                file.write(json.dumps(exchange.to_dict(), separators=(",", ":"), ensure_ascii=False) + "\n")
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class TransportMode(ABC):
+    """Replaces or wraps the HTTP transport of CoreCommands, e.g. to record or replay sessions."""
+
+    @abstractmethod
+    def wrap(self, transport: httpx.BaseTransport) -> httpx.BaseTransport: ...
+
+    @abstractmethod
+    def wrap_async(self, transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport: ...
+
+
+class Recorder(TransportMode):
+    """
+    Records every request/response pair sent through it. With a `path`, each exchange is appended to that
+    file as soon as it completes, so a crashed session keeps what it recorded; otherwise exchanges are kept
+    in `recording`.
+
+    Usage:
+        recorder = Recorder("session.jsonl.gz")
+        conn = MultiConn(core_config=CoreConfig(transport_mode=recorder))
+        ...
+        recorder.close()
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.recording = Recording()
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def record(self, exchange: RecordedExchange) -> None:
+        with self._lock:
+            if self.path is None:
+                self.recording.exchanges.append(exchange)
+                return
+            if self._file is None:
+                self._file = _open(self.path, "a")
+            self._file.write(json.dumps(exchange.to_dict(), separators=(",", ":"), ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def wrap(self, transport: httpx.BaseTransport) -> httpx.BaseTransport:
+        return _RecordingTransport(self, transport)
+
+    def wrap_async(self, transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        return _AsyncRecordingTransport(self, transport)
+
+
+class Replayer(TransportMode):
+    """
+    Answers requests from a recording instead of sending them. A request gets the responses recorded for
+    an identical payload in their original order, the last one is repeated once they run out.
+
+    Attributes:
+        timing: Delay each response by its recorded duration, multiplied by `time_scale`.
+        strict: Fail requests that were not recorded. Otherwise they are sent to the real transport.
+    """
+
+    def __init__(
+        self, recording: Recording | str | Path, timing: bool = False, time_scale: float = 1.0, strict: bool = True
+    ) -> None:
+        if time_scale < 0:
+            raise ValueError(f"time_scale must not be negative, got {time_scale}.")
+        self.recording = recording if isinstance(recording, Recording) else Recording.load(recording)
+        self.timing = timing
+        self.time_scale = time_scale
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._pending: dict[str, deque[RecordedExchange]] = {}
+        self.rewind()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.recording!r}, timing={self.timing}, strict={self.strict})"
+
+    def rewind(self) -> None:
+        """Starts serving every request's responses from the first one again."""
+        with self._lock:
+            self._pending.clear()
+            for exchange in self.recording:
+                self._pending.setdefault(exchange.key, deque()).append(exchange)
+
+    def lookup(self, body: bytes) -> RecordedExchange | None:
+        """The next recorded exchange of the request `body`, or None if it was never recorded."""
+        try:
+            key = payload_key(json.loads(body))
+        except ValueError:
+            return None
+        with self._lock:
+            pending = self._pending.get(key)
+            if not pending:
+                return None
+            return pending.popleft() if len(pending) > 1 else pending[0]
+
+    def delay(self, exchange: RecordedExchange) -> float:
+        return exchange.duration * self.time_scale if self.timing else 0.0
+
+    def wrap(self, transport: httpx.BaseTransport) -> httpx.BaseTransport:
+        return _ReplayTransport(self, transport)
+
+    def wrap_async(self, transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        return _AsyncReplayTransport(self, transport)
+
+    def _not_recorded(self, request: httpx.Request) -> httpx.ConnectError:
+        return httpx.ConnectError(f"No recorded response for request {request.content[:200]!r}.", request=request)
+
+
+class _RecordingTransport(httpx.BaseTransport):
+    def __init__(self, recorder: Recorder, transport: httpx.BaseTransport) -> None:
+        self._recorder = recorder
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        _record(self._recorder, request, response.status_code, body, time.perf_counter() - start)
+        return httpx.Response(response.status_code, headers=_decoded_headers(response.headers), content=body)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, recorder: Recorder, transport: httpx.AsyncBaseTransport) -> None:
+        self._recorder = recorder
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        _record(self._recorder, request, response.status_code, body, time.perf_counter() - start)
+        return httpx.Response(response.status_code, headers=_decoded_headers(response.headers), content=body)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _decoded_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    return [(name, value) for name, value in headers.multi_items() if name.lower() not in _WIRE_HEADERS]
+
+
+def _record(recorder: Recorder, request: httpx.Request, status: int, body: bytes, duration: float) -> None:
+    try:
+        payload = json.loads(request.content)
+    except ValueError:
+        payload = request.content.decode(errors="replace")
+    recorder.record(RecordedExchange(payload, status, body, duration))
+
+
+class _ReplayTransport(httpx.BaseTransport):
+    def __init__(self, replayer: Replayer, transport: httpx.BaseTransport) -> None:
+        self._replayer = replayer
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = self._replayer.lookup(request.read())
+        if exchange is None:
+            if self._replayer.strict:
+                raise self._replayer._not_recorded(request)
+            return self._transport.handle_request(request)
+        if delay := self._replayer.delay(exchange):
+            time.sleep(delay)
+        return httpx.Response(exchange.status, headers=_JSON_HEADERS, content=exchange.response)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, replayer: Replayer, transport: httpx.AsyncBaseTransport) -> None:
+        self._replayer = replayer
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = self._replayer.lookup(await request.aread())
+        if exchange is None:
+            if self._replayer.strict:
+                raise self._replayer._not_recorded(request)
+            return await self._transport.handle_async_request(request)
+        if delay := self._replayer.delay(exchange):
+            await asyncio.sleep(delay)
+        return httpx.Response(exchange.status, headers=_JSON_HEADERS, content=exchange.response)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import threading
+import time
+from enum import Enum
+from typing import Callable
+
+from multiconn_archicad.core.config import CircuitBreakerPolicy
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}.{self.name}"
+
+
+class CircuitBreaker:
+    """
+    Tracks whether an Archicad instance answers at all.
+
+    CLOSED: commands flow normally. After `failure_threshold` consecutive transport failures the breaker
+    OPENs and commands fail fast. Once `reset_timeout` has passed, exactly one caller wins `try_begin_probe`,
+    moving the breaker to HALF_OPEN while it sends an API.IsAlive probe; the probe's outcome closes the
+    breaker or opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._policy = policy
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures: int = 0
+        self._opened_at: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(state={self._state!r}, consecutive_failures={self._consecutive_failures})"
+
+    @property
+    def policy(self) -> CircuitBreakerPolicy:
+        return self._policy
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    @property
+    def probe_due(self) -> bool:
+        return self._state is BreakerState.OPEN and self._clock() - self._opened_at >= self._policy.reset_timeout
+
+    def try_begin_probe(self) -> bool:
+        """Returns True to exactly one caller once the breaker may be probed, moving it to HALF_OPEN."""
+        with self._lock:
+            if not self.probe_due:
+                return False
+            self._state = BreakerState.HALF_OPEN
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._state = BreakerState.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state is BreakerState.HALF_OPEN or self._consecutive_failures >= self._policy.failure_threshold:
+                self._state = BreakerState.OPEN
+                self._opened_at = self._clock()
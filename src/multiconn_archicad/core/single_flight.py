@@ -0,0 +1,61 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    flights: int
+    coalesced: int
+
+
+class FlightAbandoned(Exception):
+    """Set on a flight whose leader was cancelled; its followers start the request over."""
+
+
+class SingleFlight:
+    """
+    Collapses identical requests that are in flight at the same time into one.
+
+    The first caller of `join` for a key becomes the leader and must `land` the flight with the response
+    body or the error. Everyone who joins before that gets the same Future and shares the outcome. The
+    Future is a concurrent.futures.Future, so threads and asyncio tasks (via asyncio.wrap_future) can
+    follow the same flight.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, Future[bytes]] = {}
+        self._flight_count: int = 0
+        self._coalesced: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.stats()})"
+
+    def join(self, key: str) -> tuple[Future[bytes], bool]:
+        """Returns the flight of `key` and whether the caller is its leader."""
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+            future = Future()
+            self._flights[key] = future
+            self._flight_count += 1
+            return future, True
+
+    def land(
+        self, key: str, future: Future[bytes], content: bytes | None = None, error: BaseException | None = None
+    ) -> None:
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(content)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(flights=self._flight_count, coalesced=self._coalesced)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from multiconn_archicad.core.config import SlowCommandPolicy
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SlowCommand:
+    """
+    One call whose latency exceeded its threshold.
+
+    Attributes:
+        command: Standard commands carry their "API." prefix, Tapir commands are bare names.
+        latency: Seconds from the call until its response was decoded (or it failed).
+        parameters: The JSON of the command parameters, cut to the policy's max_parameter_chars.
+        request_bytes: Encoded size of the requests sent; 0 if the call was answered without one.
+        response_bytes: Size of the response bodies received.
+        error: Exception class name if the call failed.
+        timestamp: Wall-clock time the call finished, as returned by time.time().
+    """
+
+    command: str
+    port: int | None
+    project: str | None
+    latency: float
+    parameters: str
+    request_bytes: int = 0
+    response_bytes: int = 0
+    error: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class SlowCommandLog:
+    """The most recent slow calls to one Archicad instance, oldest first, in a ring buffer of fixed capacity."""
+
+    def __init__(self, policy: SlowCommandPolicy) -> None:
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._entries: deque[SlowCommand] = deque(maxlen=policy.capacity)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(entries={len(self._entries)}, capacity={self.policy.capacity})"
+
+    def is_slow(self, command: str, latency: float) -> bool:
+        return latency >= self.policy.thresholds.get(command, self.policy.threshold)
+
+    def record(self, entry: SlowCommand) -> None:
+        with self._lock:
+            self._entries.append(entry)
+        log.warning(
+            f"Slow command '{entry.command}' on port {entry.port} took {entry.latency:.3f}s "
+            f"({entry.response_bytes} response bytes)."
+        )
+
+    def entries(self) -> list[SlowCommand]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def parameters_preview(parameters: Any, max_chars: int) -> str:
+    """
+    The compact JSON of `parameters`, cut to `max_chars`. Encoding stops once the limit is passed, so a slow call
+    with a huge payload, like a list of 100k elements, is not encoded a second time for its log entry.
+    """
+    pieces: list[str] = []
+    size = 0
+    for piece in _json_pieces(parameters, max_chars):
+        pieces.append(piece)
+        size += len(piece)
+        if size > max_chars:
+            return f"{''.join(pieces)[:max_chars]}... (more chars)"
+    return "".join(pieces)
+
+
+def _json_pieces(value: Any, max_chars: int) -> Iterator[str]:
+    if isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield f"{',' if index else ''}{json.dumps(str(key), ensure_ascii=False)}:"
+            yield from _json_pieces(item, max_chars)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from _json_pieces(item, max_chars)
+        yield "]"
+    elif isinstance(value, str):
+        # Only the start of a long string can be shown
+        yield json.dumps(value[:max_chars], ensure_ascii=False)
+    else:
+        yield json.dumps(value, ensure_ascii=False, default=repr)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from enum import Enum, auto
+from typing import Any, Sequence
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_DECODER = json.JSONDecoder()
+# Characters that matter while looking for the end of a value, outside of and inside of strings
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+_STRING_END = re.compile(r'["\\]')
+# The consumed head of the buffer is dropped once it grows past this many characters
+_COMPACT_AFTER = 1 << 16
+
+
+class _State(Enum):
+    OBJECT_START = auto()
+    OBJECT_MEMBER = auto()
+    MEMBER_VALUE = auto()
+    ARRAY_START = auto()
+    ARRAY_ITEM = auto()
+    DONE = auto()
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+class ItemStreamParser:
+    """
+    Incrementally parses a JSON response and emits the items of the list found under `path`, e.g.
+    ("result", "detailsOfElements"), one by one as their bytes arrive. Only one item is held in memory
+    at a time, besides the not yet parsed tail of the received data.
+
+    Members on the way to the list are kept in `envelope` (the list itself is left out), so callers can
+    inspect error fields when the list is missing. Whatever follows the list is not parsed.
+    """
+
+    def __init__(self, path: Sequence[str]) -> None:
+        if not path:
+            raise ValueError("path must name at least one key.")
+        self.path = tuple(path)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._state = _State.OBJECT_START
+        self._depth = 0
+        self._key: str | None = None
+        self._first = True
+        self.envelope: dict[str, Any] = {}
+        self._objects: list[dict[str, Any]] = [self.envelope]
+        self.found = False
+        self.items_parsed = 0
+        # How far the value starting at _scan_start has been scanned, so each chunk only scans the new data
+        self._scan_start = -1
+        self._scan_pos = 0
+        self._scan_depth = 0
+        self._scan_in_string = False
+
+    @property
+    def done(self) -> bool:
+        return self._state is _State.DONE
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Consumes the next chunk of the response body and returns the items completed by it."""
+        if self.done:
+            return []
+        self._buffer += self._decoder.decode(data)
+        return self._advance()
+
+    def close(self) -> list[Any]:
+        """Marks the end of the body. Raises ValueError if it ended before the list (or the envelope) did."""
+        if self.done:
+            return []
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        items = self._advance()
+        if not self.done:
+            raise ValueError("Response ended before the JSON document was complete.")
+        return items
+
+    def _advance(self) -> list[Any]:
+        items: list[Any] = []
+        while self._state is not _State.DONE:
+            start = self._pos
+            try:
+                self._step(items)
+            except _NeedMoreData:
+                # Every step is redone from its start once more data has arrived
+                self._pos = start
+                break
+        if self._pos > _COMPACT_AFTER:
+            self._buffer = self._buffer[self._pos :]
+            self._scan_start -= self._pos
+            self._scan_pos -= self._pos
+            self._pos = 0
+        return items
+
+    def _step(self, items: list[Any]) -> None:
+        state = self._state
+        if state is _State.OBJECT_START:
+            if self._next_char() != "{":
+                raise ValueError(f"Expected a JSON object at position {self._pos}.")
+            self._pos += 1
+            self._first = True
+            self._state = _State.OBJECT_MEMBER
+        elif state is _State.OBJECT_MEMBER:
+            char = self._next_char()
+            if char == "}":
+                # The object ended without the key we were looking for
+                self._pos += 1
+                self._state = _State.DONE
+                return
+            if not self._first:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or '}}' at position {self._pos}.")
+                self._pos += 1
+                self._next_char()
+            key = self._value()
+            if not isinstance(key, str) or self._next_char() != ":":
+                raise ValueError(f"Expected an object key at position {self._pos}.")
+            self._pos += 1
+            self._key, self._first = key, False
+            self._state = _State.MEMBER_VALUE
+        elif state is _State.MEMBER_VALUE:
+            if self._key != self.path[self._depth]:
+                self._objects[self._depth][self._key] = self._value()
+                self._state = _State.OBJECT_MEMBER
+                return
+            char = self._next_char()
+            if self._depth + 1 == len(self.path) and char == "[":
+                self._state = _State.ARRAY_START
+            elif self._depth + 1 < len(self.path) and char == "{":
+                nested: dict[str, Any] = {}
+                self._objects[self._depth][self._key] = nested
+                self._objects.append(nested)
+                self._depth += 1
+                self._state = _State.OBJECT_START
+            else:
+                # e.g. "result": null - the list is not there
+                self._objects[self._depth][self._key] = self._value()
+                self._state = _State.DONE
+        elif state is _State.ARRAY_START:
+            self._pos += 1
+            self.found = True
+            self._first = True
+            self._state = _State.ARRAY_ITEM
+        elif state is _State.ARRAY_ITEM:
+            char = self._next_char()
+            if char == "]":
+                self._pos += 1
+                self._state = _State.DONE
+                return
+            if not self._first:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at position {self._pos}.")
+                self._pos += 1
+                self._next_char()
+            items.append(self._value())
+            self._first = False
+            self.items_parsed += 1
+
+    def _next_char(self) -> str:
+        """Skips whitespace and returns the next character without consuming it."""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        if pos == len(buffer):
+            if self._eof:
+                raise ValueError("Unexpected end of the JSON document.")
+            raise _NeedMoreData
+        return buffer[pos]
+
+    def _value(self) -> Any:
+        """Decodes the complete JSON value at the current position, or waits for more data."""
+        self._next_char()
+        start = self._pos
+        if self._scan_start != start:
+            # Most values arrive whole, so they are decoded right away; only a value cut by the end of the
+            # data is scanned for its end, and decoded once more when the scan has found it
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, start)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS):
+                    self._pos = end
+                    return value
+        end = self._value_end(start)
+        value, decoded_end = _DECODER.raw_decode(self._buffer, start)
+        if decoded_end != end:
+            raise ValueError(f"Invalid JSON value at position {start}.")
+        self._pos = end
+        return value
+
+    def _value_end(self, start: int) -> int:
+        """
+        The end of the value starting at `start`, found without decoding it. The scan goes on from where the
+        previous chunk left it, so a large item is scanned once and decoded once, whatever the chunk size.
+        """
+        buffer = self._buffer
+        if buffer[start] not in '{["':
+            # A number cut by the end of a chunk ("4." of "4.5") must be followed by a delimiter to be complete
+            end = start
+            while end < len(buffer) and buffer[end] not in _DELIMITERS:
+                end += 1
+            if end == len(buffer) and not self._eof:
+                raise _NeedMoreData
+            return end
+        if self._scan_start != start:
+            self._scan_start, self._scan_pos, self._scan_depth, self._scan_in_string = start, start, 0, False
+        pos, depth, in_string = self._scan_pos, self._scan_depth, self._scan_in_string
+        while True:
+            match = (_STRING_END if in_string else _STRUCTURE).search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char, pos = match.group(), match.end()
+            if in_string:
+                if char == "\\":
+                    if pos == len(buffer):
+                        pos -= 1  # the escaped character has not arrived yet
+                        break
+                    pos += 1
+                    continue
+                in_string = False
+            elif char == '"':
+                in_string = True
+                continue
+            elif char in "{[":
+                depth += 1
+                continue
+            else:
+                depth -= 1
+            if depth <= 0:
+                return pos
+        self._scan_pos, self._scan_depth, self._scan_in_string = pos, depth, in_string
+        if self._eof:
+            raise ValueError("Unexpected end of the JSON document.")
+        raise _NeedMoreData
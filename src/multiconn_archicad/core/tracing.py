@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+log = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """
+    One timed operation of a trace. All spans of a trace share its `trace_id`, which serves as the
+    correlation ID of one logical operation across threads, tasks and Archicad instances.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    end_time: float | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        return self.end_time - self.start_time if self.end_time is not None else None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class SpanExporter(ABC):
+    """Receives every span when it ends."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the ended spans in a list, e.g. for tests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class LoggingSpanExporter(SpanExporter):
+    """Logs every ended span with its trace and span IDs."""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        self.logger = logger or log
+        self.level = level
+
+    def export(self, span: Span) -> None:
+        self.logger.log(
+            self.level,
+            "span %s trace=%s span=%s parent=%s duration=%.3fs error=%s %s",
+            span.name,
+            span.trace_id,
+            span.span_id,
+            span.parent_id,
+            span.duration or 0.0,
+            span.error,
+            span.attributes,
+        )
+
+
+class Tracer:
+    """
+    Creates spans and hands them to `exporter` when they end. The current span is kept in a context
+    variable, so it follows asyncio tasks, and work submitted to the package's EXECUTOR.
+
+    Usage:
+        tracer = Tracer(InMemorySpanExporter())
+        conn = MultiConn(core_config=CoreConfig(tracer=tracer))
+        with tracer.span("export schedules"):
+            ...  # every command sent in here is a child span of "export schedules"
+    """
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.exporter!r})"
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None) -> Span:
+        """Starts a child of the current span (or a new trace) without making it current."""
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        span.end_time = time.time()
+        if error is not None:
+            span.error = type(error).__name__
+        try:
+            self.exporter.export(span)
+        except Exception:
+            log.warning(f"Span exporter {self.exporter!r} failed.", exc_info=True)
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any] | None = None) -> Iterator[Span]:
+        """A span that is current while the block runs and ends with it."""
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_span.reset(token)
+
+
+@contextmanager
+def use_span(span: Span | None) -> Iterator[Span | None]:
+    """Makes an already started span current while the block runs, without ending it."""
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    """The correlation ID of the operation running in this context, if it is traced."""
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+class TraceContextFilter(logging.Filter):
+    """
+    Adds `trace_id` and `span_id` to every log record ("-" outside of traces), so a format like
+    "%(trace_id)s %(message)s" correlates the log lines of one operation.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = _current_span.get()
+        record.trace_id = span.trace_id if span else "-"
+        record.span_id = span.span_id if span else "-"
+        return True
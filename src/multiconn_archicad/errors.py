@@ -41,6 +41,12 @@ class APIConnectionError(RequestError):
     pass
 
 
+class CircuitOpenError(APIConnectionError):
+    """Raised without contacting ArchiCAD while the circuit breaker of its port is open."""
+
+    pass
+
+
 class HeaderUnassignedError(RequestError, AttributeError):
     """Raised when a command is called on an unassigned ConnHeader"""
 
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from multiconn_archicad.basic_types import ArchiCadID, ArchicadLocation, Port, ProductInfo
+
+log = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+Metadata = tuple[ProductInfo, ArchiCadID, ArchicadLocation]
+
+
+def default_cache_path() -> Path:
+    """The cache file in the user's cache directory: %LOCALAPPDATA% on Windows, ~/.cache elsewhere."""
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "multiconn_archicad" / "metadata.json"
+
+
+def listening_pid(port: int) -> int | None:
+    """The PID of the local process listening on `port`, or None if it can not be found."""
+    try:
+        for conn in psutil.net_connections(kind="inet"):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                return conn.pid
+        return None
+    except psutil.AccessDenied:
+        # macOS only lists the connections of other processes to root, so look at the processes one by one
+        pass
+    for process in psutil.process_iter():
+        if _is_listening(process, port):
+            return process.pid
+    return None
+
+
+def _is_listening(process: psutil.Process, port: int) -> bool:
+    try:
+        return any(
+            conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN
+            for conn in process.net_connections(kind="inet")
+        )
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return False
+
+
+def _create_time(pid: int) -> float | None:
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+
+class MetadataCache:
+    """
+    Keeps the metadata of local Archicad instances on disk, so a new MultiConn does not have to ask every
+    running instance who it is. An entry is used only while the process that answered still listens on its
+    port: the PID, its start time and the listening socket are checked with psutil, which takes no request.
+    Entries of restarted or closed instances are dropped and fetched again.
+
+    A project opened in an instance that keeps running is not noticed from the process, so entries also
+    expire after `max_age` seconds. MultiConn replaces the entry whenever it fetches the metadata again.
+
+    Usage:
+        conn = MultiConn(metadata_cache=MetadataCache())
+    """
+
+    def __init__(self, path: str | Path | None = None, max_age: float | None = 3600.0) -> None:
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age must be positive or None, got {max_age}.")
+        self.path: Path = Path(path) if path is not None else default_cache_path()
+        self.max_age: float | None = max_age
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, max_age={self.max_age})"
+
+    def load(self, port: Port) -> Metadata | None:
+        """The cached metadata of the instance on `port`, or None if there is no valid entry."""
+        with self._lock:
+            entry = self._read().get(str(port))
+        if entry is None:
+            return None
+        if not self._is_valid(port, entry):
+            log.info(f"Cached metadata of port {port} is stale")
+            self.invalidate(port)
+            return None
+        try:
+            return (
+                ProductInfo.from_dict(entry["productInfo"]),
+                ArchiCadID.from_dict(entry["archicadId"]),
+                ArchicadLocation.from_dict(entry["archicadLocation"]),
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            log.warning(f"Dropping unreadable cached metadata of port {port}: {e}")
+            self.invalidate(port)
+            return None
+
+    def store(self, port: Port, metadata: Metadata) -> None:
+        """Saves the metadata of the instance on `port`, if the process listening on it can be found."""
+        pid = listening_pid(port)
+        created = _create_time(pid) if pid is not None else None
+        if created is None:
+            log.debug(f"Not caching the metadata of port {port}: its process was not found")
+            return
+        product_info, archicad_id, archicad_location = metadata
+        entry = {
+            "pid": pid,
+            "created": created,
+            "saved": time.time(),
+            "productInfo": product_info.to_dict(),
+            "archicadId": archicad_id.to_dict(),
+            "archicadLocation": archicad_location.to_dict(),
+        }
+        with self._lock:
+            self._write(self._read() | {str(port): entry})
+
+    def invalidate(self, port: Port | None = None) -> None:
+        """Drops the entry of `port`, or every entry without a port."""
+        with self._lock:
+            entries = self._read()
+            if port is not None and str(port) not in entries:
+                return
+            self._write({key: value for key, value in entries.items() if port is not None and key != str(port)})
+
+    def _is_valid(self, port: Port, entry: dict[str, Any]) -> bool:
+        if self.max_age is not None and time.time() - entry.get("saved", 0) > self.max_age:
+            return False
+        pid = entry.get("pid")
+        if not isinstance(pid, int):
+            return False
+        try:
+            process = psutil.Process(pid)
+            # A matching start time tells the same process apart from a new one that got its PID
+            if process.create_time() != entry.get("created"):
+                return False
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+        return _is_listening(process, port)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        # Read every time, other processes may have updated the file since
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == FORMAT_VERSION and isinstance(data.get("instances"), dict):
+                return data["instances"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            log.warning(f"Ignoring unreadable metadata cache {self.path}: {e}")
+        return {}
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        # Written to a temporary file and swapped in, so other processes never read a half written cache
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump({"version": FORMAT_VERSION, "instances": entries}, file, indent=2)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            log.warning(f"Could not write the metadata cache {self.path}: {e}")
+            temporary.unlink(missing_ok=True)
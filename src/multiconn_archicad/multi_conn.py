@@ -1,12 +1,19 @@
+import threading
+from concurrent.futures import Future
 from pprint import pformat
+from typing import Self
 
-from multiconn_archicad.utilities.network_utils import is_port_listening
+from multiconn_archicad.utilities.network_utils import is_port_listening, is_local_address, listening_ports
 from multiconn_archicad.utilities.thread_utils import EXECUTOR
 from multiconn_archicad.core.core_commands import CoreCommands
+from multiconn_archicad.core.config import CoreConfig
+from multiconn_archicad.core.metrics import MetricsSnapshot
+from multiconn_archicad.core.slow_log import SlowCommand
 from multiconn_archicad.standard_connection import StandardConnection
 from multiconn_archicad.unified_api.api import UnifiedApi
 from multiconn_archicad.conn_header import ConnHeader, Status
-from multiconn_archicad.basic_types import Port
+from multiconn_archicad.metadata_cache import MetadataCache
+from multiconn_archicad.basic_types import Port, APIResponseError
 from multiconn_archicad.actions import (
     Connect,
     Disconnect,
@@ -15,6 +22,7 @@ from multiconn_archicad.actions import (
     FindArchicad,
     OpenProject,
     SwitchProject,
+    Watch,
 )
 from multiconn_archicad.dialog_handlers import DialogHandlerBase, EmptyDialogHandler
 from multiconn_archicad.utilities.cli_parser import get_cli_args_once
@@ -33,13 +41,27 @@ class MultiConn:
         port: Port | None = None,
         host: str = "http://127.0.0.1",
         ui_mode: bool = False,
+        core_config: CoreConfig | None = None,
+        scan_timeout: float = 0.1,
+        lazy_discovery: bool = False,
+        metadata_cache: MetadataCache | None = None,
     ) -> None:
         cli_args = get_cli_args_once()
         self._base_url: str = cli_args.host if cli_args.host else host
         self.open_port_headers: dict[Port, ConnHeader] = {}
+        # Guards every change of open_port_headers: background discovery and watching run on other threads
+        self._headers_lock = threading.RLock()
+        self._header_changes: dict[Port, int] = {}
         self._primary: ConnHeader | None = None
         self.dialog_handler: DialogHandlerBase = dialog_handler
         self._ui_mode = ui_mode
+        self.core_config: CoreConfig = core_config if core_config else CoreConfig()
+        if scan_timeout <= 0:
+            raise ValueError(f"scan_timeout must be positive, got {scan_timeout}.")
+        self.scan_timeout: float = scan_timeout
+        self.discovery_future: Future | None = None
+        # The cache identifies local processes, so it can not vouch for instances on another host
+        self.metadata_cache: MetadataCache | None = metadata_cache if is_local_address(self._base_url) else None
 
         # load actions
         self.connect: Connect = Connect(self)
@@ -49,9 +71,17 @@ class MultiConn:
         self.find_archicad: FindArchicad = FindArchicad(self)
         self.open_project: OpenProject = OpenProject(self)
         self.switch_project: SwitchProject = SwitchProject(self)
+        self.watch: Watch = Watch(self)
 
-        self.refresh.all_ports()
         port = Port(cli_args.port) if cli_args.port else port
+        if lazy_discovery and port is not None:
+            # Only the requested instance is needed to start, the rest of the range is found in the background
+            self.refresh.from_ports(port)
+            self.discovery_future = EXECUTOR.submit(
+                self._add_listening_ports, [other for other in self.port_range if other != port]
+            )
+        else:
+            self.refresh.all_ports()
         self._set_primary(port)
 
     @property
@@ -106,6 +136,43 @@ class MultiConn:
         attrs = {name: getattr(self, name) for name in ["pending", "active", "failed", "primary", "dialog_handler"]}
         return f"{self.__class__.__name__}(\n{pformat(attrs, indent=4)})"
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops watching and closes the pooled connections of every header. Headers stay usable and reconnect
+        lazily.
+        """
+        self.watch.stop()
+        for header in list(self.open_port_headers.values()):
+            header.close()
+        if self._primary:
+            self._primary.close()
+
+    def metrics(self) -> MetricsSnapshot:
+        """
+        Command metrics of every open port, per port and command. Empty unless `core_config.metrics` is set.
+        The primary header shares the recorder of its port, so it is not counted twice.
+        """
+        return MetricsSnapshot(
+            tuple(
+                metrics
+                for port, header in sorted(self.open_port_headers.items())
+                for metrics in header.metrics().commands
+            )
+        )
+
+    def slow_commands(self) -> list[SlowCommand]:
+        """The slow calls to every open port, oldest first. Empty unless `core_config.slow_commands` is set."""
+        return sorted(
+            (entry for header in self.open_port_headers.values() for entry in header.slow_commands()),
+            key=lambda entry: entry.timestamp,
+        )
+
     def get_all_port_headers_with_status(self, status: Status) -> dict[Port, ConnHeader]:
         return {
             conn_header.port: conn_header
@@ -114,28 +181,104 @@ class MultiConn:
         }
 
     def scan_ports(self, ports: list[Port]) -> None:
-        list(EXECUTOR.map(self.check_port, ports))
+        """
+        Probes all `ports` at once from the calling thread, within one `scan_timeout`, then creates or
+        refreshes the headers of the listening ports and closes the others.
+        """
+        listening = listening_ports(self._base_url, ports, self.scan_timeout)
+        with self._headers_lock:
+            for port in ports:
+                if port in listening:
+                    self.create_or_refresh_connection(port)
+                else:
+                    self.close_if_open(port)
+
+    def _add_listening_ports(self, ports: list[Port]) -> None:
+        """
+        Adds headers for the listening `ports` that have none, without touching the existing headers. Ports
+        whose header was added or removed by another thread while they were probed are left as they are.
+        """
+        with self._headers_lock:
+            changes = dict(self._header_changes)
+        listening = listening_ports(self._base_url, ports, self.scan_timeout)
+        with self._headers_lock:
+            found = {
+                port: self._new_header(port)
+                for port in ports
+                if port in listening
+                and port not in self.open_port_headers
+                and self._header_changes.get(port) == changes.get(port)
+            }
+            self._set_headers(self.open_port_headers | found, *found)
+        log.info(f"Background discovery found {len(found)} more instances")
+
+    def _put_header(self, port: Port, header: ConnHeader) -> None:
+        with self._headers_lock:
+            self._set_headers(self.open_port_headers | {port: header}, port)
+
+    def _pop_header(self, port: Port) -> ConnHeader | None:
+        with self._headers_lock:
+            headers = dict(self.open_port_headers)
+            header = headers.pop(port, None)
+            self._set_headers(headers, port)
+            return header
+
+    def _set_headers(self, headers: dict[Port, ConnHeader], *changed: Port) -> None:
+        # A new dictionary is swapped in, so code iterating over the headers meanwhile is not disturbed
+        for port in changed:
+            self._header_changes[port] = self._header_changes.get(port, 0) + 1
+        self.open_port_headers = dict(sorted(headers.items()))
 
     def check_port(self, port: Port) -> None:
-        if is_port_listening(self._base_url, port):
+        if is_port_listening(self._base_url, port, self.scan_timeout):
             self.create_or_refresh_connection(port)
         else:
             self.close_if_open(port)
 
     def create_or_refresh_connection(self, port: Port) -> None:
-        if port not in self.open_port_headers.keys():
-            self.open_port_headers[port] = ConnHeader(port, ui_mode=self._ui_mode)
+        with self._headers_lock:
+            header = self.open_port_headers.get(port)
+            if header is None:
+                self._put_header(port, self._new_header(port))
+                return
+        header.refresh_metadata()
+        self._cache_when_fetched(header)
+
+    def _new_header(self, port: Port) -> ConnHeader:
+        """A header for `port`, with the metadata from the metadata cache if it has a valid entry."""
+        cached = self.metadata_cache.load(port) if self.metadata_cache else None
+        header = ConnHeader(port, initialize=cached is None, ui_mode=self._ui_mode, config=self.core_config)
+        if cached is not None:
+            header.preload_metadata(*cached)
+            log.info(f"Using cached metadata of the Archicad instance on port {port}")
         else:
-            self.open_port_headers[port].refresh_metadata()
+            self._cache_when_fetched(header)
+        return header
+
+    def _cache_when_fetched(self, header: ConnHeader) -> None:
+        if self.metadata_cache is None or header.init_future is None or header.port is None:
+            return
+        cache, port = self.metadata_cache, header.port
+
+        def store(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            metadata = future.result()
+            if metadata is not None and all(not isinstance(value, APIResponseError) for value in metadata):
+                cache.store(port, metadata)
+
+        header.init_future.add_done_callback(store)
 
     def close_if_open(self, port: Port) -> ConnHeader | None:
-        header = None
-        if port in self.open_port_headers.keys():
+        with self._headers_lock:
+            if port not in self.open_port_headers.keys():
+                return None
             log.info(f"Removing connection header for inactive/unresponsive port {port}.")
-            header = self.open_port_headers.pop(port)
-            header.cancel()
+            header = self._pop_header(port)
             if self._primary and self._primary.port == port:
                 self._set_primary()
+        header.cancel()
+        header.close()
         return header
 
     def _set_primary(self, new_value: None | Port | ConnHeader = None) -> None:
@@ -146,7 +289,7 @@ class MultiConn:
         elif self.open_ports:
             self._set_primary_from_port(sorted(self.open_ports)[0])
         else:
-            self._primary = None
+            self._replace_primary(None)
             log.info("Primary connection cleared")
 
     def _set_primary_from_port(self, port: Port) -> None:
@@ -165,10 +308,18 @@ class MultiConn:
 
     def _copy_header(self, master_header: ConnHeader) -> None:
         assert master_header.port, "Cannot copy unassigned header"
-        primary_header = ConnHeader(port=master_header.port, ui_mode=self._ui_mode, initialize=False)
+        primary_header = ConnHeader(
+            port=master_header.port, ui_mode=self._ui_mode, initialize=False, config=self.core_config
+        )
 
         if master_header.init_future:
             primary_header.sync_from_master_future(master_header.init_future)
 
-        self._primary = primary_header
+        self._replace_primary(primary_header)
+
+    def _replace_primary(self, new_primary: ConnHeader | None) -> None:
+        if self._primary:
+            self._primary.close()
+        self._primary = new_primary
+
 
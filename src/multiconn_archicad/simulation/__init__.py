@@ -0,0 +1,23 @@
+from .commands import SimulatedCommands, official_commands, tapir_commands
+from .project import (
+    SimulatedClassificationItem,
+    SimulatedElement,
+    SimulatedProperty,
+    SimulatedStory,
+    SyntheticProject,
+)
+from .server import SimulatedArchicad, SimulationSettings, start_instances
+
+__all__ = [
+    "SyntheticProject",
+    "SimulatedElement",
+    "SimulatedProperty",
+    "SimulatedStory",
+    "SimulatedClassificationItem",
+    "SimulatedCommands",
+    "official_commands",
+    "tapir_commands",
+    "SimulatedArchicad",
+    "SimulationSettings",
+    "start_instances",
+]
@@ -0,0 +1,44 @@
+"""Runs simulated Archicad instances until interrupted: python -m multiconn_archicad.simulation --instances 3"""
+
+import argparse
+import logging
+import threading
+
+from multiconn_archicad.simulation.server import PORT_RANGE, SimulationSettings, start_instances
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve simulated Archicad instances on the Archicad port range.")
+    parser.add_argument("--instances", type=int, default=1, help=f"Number of instances (1-{len(PORT_RANGE)}).")
+    parser.add_argument("--elements", type=int, default=1000, help="Elements per project.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds every command takes.")
+    parser.add_argument("--latency-per-element", type=float, default=0.0, help="Extra seconds per element.")
+    parser.add_argument("--max-concurrency", type=int, default=1, help="Commands processed at once, 0 for no limit.")
+    parser.add_argument("--max-rps", type=float, default=None, help="Requests accepted per second.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail.")
+    parser.add_argument("--failures", default="reset", help="Comma separated kinds of failures: reset, timeout, error.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the projects and failures.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    settings = SimulationSettings(
+        latency=args.latency,
+        latency_per_element=args.latency_per_element,
+        max_concurrency=args.max_concurrency or None,
+        max_requests_per_second=args.max_rps,
+        failure_rate=args.failure_rate,
+        failures=tuple(kind.strip() for kind in args.failures.split(",")),
+        seed=args.seed,
+    )
+    instances = start_instances(args.instances, args.elements, settings, seed=args.seed)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for instance in instances:
+            instance.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from multiconn_archicad.simulation.project import SimulatedElement, SimulatedProperty, SyntheticProject
+
+ERROR_UNKNOWN_COMMAND = 1
+ERROR_INVALID_PARAMETERS = 2
+ERROR_NOT_FOUND = 3
+
+_Handler = Callable[["SimulatedCommands", dict[str, Any]], dict[str, Any]]
+_OFFICIAL: dict[str, _Handler] = {}
+_TAPIR: dict[str, _Handler] = {}
+
+
+def _official(name: str) -> Callable[[_Handler], _Handler]:
+    def register(handler: _Handler) -> _Handler:
+        _OFFICIAL[name] = handler
+        return handler
+
+    return register
+
+
+def _tapir(name: str) -> Callable[[_Handler], _Handler]:
+    def register(handler: _Handler) -> _Handler:
+        _TAPIR[name] = handler
+        return handler
+
+    return register
+
+
+class CommandError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def official_commands() -> frozenset[str]:
+    return frozenset(f"API.{name}" for name in _OFFICIAL)
+
+
+def tapir_commands() -> frozenset[str]:
+    return frozenset(_TAPIR)
+
+
+class SimulatedCommands:
+    """Answers official and Tapir commands from a SyntheticProject, in the response format of Archicad."""
+
+    def __init__(
+        self,
+        project: SyntheticProject,
+        version: int = 27,
+        build_number: int = 3001,
+        language_code: str = "INT",
+        tapir_version: str = "1.2.0",
+    ) -> None:
+        self.project = project
+        self.version = version
+        self.build_number = build_number
+        self.language_code = language_code
+        self.tapir_version = tapir_version
+        self.selection: list[SimulatedElement] = project.elements[:10]
+
+    def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """The response envelope of the command `payload`."""
+        command = payload.get("command", "")
+        parameters = payload.get("parameters") or {}
+        try:
+            if command == "API.ExecuteAddOnCommand":
+                name = parameters.get("addOnCommandId", {}).get("commandName", "")
+                handler = _TAPIR.get(name)
+                if handler is None:
+                    raise CommandError(ERROR_UNKNOWN_COMMAND, f"Unknown add-on command '{name}'.")
+                result = handler(self, parameters.get("addOnCommandParameters") or {})
+                return {"succeeded": True, "result": {"addOnCommandResponse": result}}
+            handler = _OFFICIAL.get(command.removeprefix("API."))
+            if handler is None or not command.startswith("API."):
+                raise CommandError(ERROR_UNKNOWN_COMMAND, f"Unknown command '{command}'.")
+            return {"succeeded": True, "result": handler(self, parameters)}
+        except CommandError as e:
+            return {"succeeded": False, "error": {"code": e.code, "message": e.message}}
+        except (KeyError, TypeError, AttributeError) as e:
+            return {
+                "succeeded": False,
+                "error": {"code": ERROR_INVALID_PARAMETERS, "message": f"Invalid parameters: {e}"},
+            }
+
+    @staticmethod
+    def element_count(payload: dict[str, Any]) -> int:
+        """Number of elements a command works on, which its processing time scales with."""
+        parameters = payload.get("parameters") or {}
+        if payload.get("command") == "API.ExecuteAddOnCommand":
+            parameters = parameters.get("addOnCommandParameters") or {}
+        if not isinstance(parameters, dict):
+            return 0
+        items = parameters.get("elements") or parameters.get("elementPropertyValues") or ()
+        return len(items) if isinstance(items, list) else 0
+
+    def _element(self, item: dict[str, Any]) -> SimulatedElement | None:
+        return self.project.elements_by_guid.get(item["elementId"]["guid"].upper())
+
+    def _property(self, item: dict[str, Any]) -> SimulatedProperty | None:
+        return self.project.properties_by_guid.get(item["propertyId"]["guid"].upper())
+
+
+def _element_ids(elements: list[SimulatedElement]) -> list[dict[str, Any]]:
+    return [{"elementId": {"guid": element.guid}} for element in elements]
+
+
+def _not_found(what: str) -> dict[str, Any]:
+    return {"error": {"code": ERROR_NOT_FOUND, "message": f"{what} not found."}}
+
+
+def _official_value(prop: SimulatedProperty, value: Any) -> dict[str, Any]:
+    return {"type": prop.value_type, "status": "normal", "value": value}
+
+
+def _display_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return str(value)
+
+
+# Official JSON API
+
+
+@_official("IsAlive")
+def _is_alive(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"isAlive": True}
+
+
+@_official("GetProductInfo")
+def _get_product_info(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"version": commands.version, "buildNumber": commands.build_number, "languageCode": commands.language_code}
+
+
+@_official("IsAddOnCommandAvailable")
+def _is_add_on_command_available(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    command_id = parameters["addOnCommandId"]
+    available = command_id["commandNamespace"] == "TapirCommand" and command_id["commandName"] in _TAPIR
+    return {"available": available}
+
+
+@_official("GetAllElements")
+def _get_all_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"elements": _element_ids(commands.project.elements)}
+
+
+@_official("GetSelectedElements")
+def _get_selected_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"elements": _element_ids(commands.selection)}
+
+
+@_official("GetElementsByType")
+def _get_elements_by_type(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    element_type = parameters["elementType"]
+    return {"elements": _element_ids([e for e in commands.project.elements if e.type == element_type])}
+
+
+@_official("GetTypesOfElements")
+def _get_types_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    types = []
+    for item in parameters["elements"]:
+        element = commands._element(item)
+        if element is None:
+            types.append(_not_found("Element"))
+        else:
+            types.append({"typeOfElement": {"elementId": {"guid": element.guid}, "elementType": element.type}})
+    return {"typesOfElements": types}
+
+
+@_official("GetAllPropertyNames")
+def _get_all_property_names(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"properties": [prop.user_id for prop in commands.project.properties]}
+
+
+@_official("GetAllPropertyIds")
+def _get_all_property_ids(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"propertyIds": [{"propertyId": {"guid": prop.guid}} for prop in commands.project.properties]}
+
+
+@_official("GetPropertyIds")
+def _get_property_ids(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    by_user_id = {_user_id_key(prop.user_id): prop for prop in commands.project.properties}
+    ids = []
+    for user_id in parameters["properties"]:
+        prop = by_user_id.get(_user_id_key(user_id))
+        ids.append({"propertyId": {"guid": prop.guid}} if prop else _not_found("Property"))
+    return {"properties": ids}
+
+
+def _user_id_key(user_id: dict[str, Any]) -> tuple[str, ...]:
+    if user_id.get("type") == "BuiltIn":
+        return ("BuiltIn", user_id["nonLocalizedName"])
+    return ("UserDefined", *user_id["localizedName"])
+
+
+@_official("GetPropertyValuesOfElements")
+def _get_property_values_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    props = [commands._property(item) for item in parameters["properties"]]
+    values = []
+    for item in parameters["elements"]:
+        element = commands._element(item)
+        if element is None:
+            values.append(_not_found("Element"))
+            continue
+        values.append(
+            {
+                "propertyValues": [
+                    {"propertyValue": _official_value(prop, commands.project.value_of(element, prop))}
+                    if prop
+                    else _not_found("Property")
+                    for prop in props
+                ]
+            }
+        )
+    return {"propertyValuesForElements": values}
+
+
+@_official("SetPropertyValuesOfElements")
+def _set_property_values_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    results = []
+    for item in parameters["elementPropertyValues"]:
+        element, prop = commands._element(item), commands._property(item)
+        if element is None or prop is None:
+            results.append({"success": False, "error": _not_found("Element or property")["error"]})
+            continue
+        commands.project.set_value(element, prop, item["propertyValue"]["value"])
+        results.append({"success": True})
+    return {"executionResults": results}
+
+
+@_official("GetAllClassificationSystems")
+def _get_all_classification_systems(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "classificationSystems": [
+            {
+                "classificationSystemId": {"guid": commands.project.classification_system_guid},
+                "name": "Simulated Classification",
+                "description": "Element types of the simulated project.",
+                "source": "multiconn_archicad.simulation",
+                "version": "1.0",
+                "date": "2024-01-01",
+            }
+        ]
+    }
+
+
+@_official("GetAllClassificationsInSystem")
+def _get_all_classifications_in_system(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    if parameters["classificationSystemId"]["guid"].upper() != commands.project.classification_system_guid:
+        raise CommandError(ERROR_NOT_FOUND, "Classification system not found.")
+    return {
+        "classificationItems": [
+            {
+                "classificationItem": {
+                    "classificationItemId": {"guid": item.guid},
+                    "id": item.id,
+                    "name": item.name,
+                    "description": f"{item.name} elements.",
+                }
+            }
+            for item in commands.project.classification_items
+        ]
+    }
+
+
+@_official("GetClassificationsOfElements")
+def _get_classifications_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    system_guids = [item["classificationSystemId"]["guid"].upper() for item in parameters["classificationSystemIds"]]
+    classifications = []
+    for item in parameters["elements"]:
+        element = commands._element(item)
+        if element is None:
+            classifications.append(_not_found("Element"))
+            continue
+        classifications.append(
+            {"classificationIds": [_classification_id(commands.project, element, guid) for guid in system_guids]}
+        )
+    return {"elementClassifications": classifications}
+
+
+def _classification_id(project: SyntheticProject, element: SimulatedElement, system_guid: str) -> dict[str, Any]:
+    if system_guid != project.classification_system_guid:
+        return _not_found("Classification system")
+    return {
+        "classificationId": {
+            "classificationSystemId": {"guid": system_guid},
+            "classificationItemId": {"guid": project.classification_by_type[element.type].guid},
+        }
+    }
+
+
+@_official("GetNavigatorItemTree")
+def _get_navigator_item_tree(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    project = commands.project
+    tree_type = parameters["navigatorTreeId"]["type"]
+
+    def item(path: tuple[str, ...], name: str, item_type: str, children: list | None = None) -> dict[str, Any]:
+        navigator_item: dict[str, Any] = {
+            "navigatorItemId": {"guid": project.navigator_guid(tree_type, *path)},
+            "prefix": "",
+            "name": name,
+            "type": item_type,
+        }
+        if children is not None:
+            navigator_item["children"] = [{"navigatorItem": child} for child in children]
+        return navigator_item
+
+    match tree_type:
+        case "ProjectMap":
+            stories = [item(("story", s.name), s.name, "StoryItem") for s in reversed(project.stories)]
+            sections = [item(("section", str(n)), f"Section {n}", "SectionItem") for n in range(1, 4)]
+            root = item(
+                (),
+                project.name,
+                "ProjectMapRootItem",
+                [
+                    item(("stories",), "Stories", "FolderItem", stories),
+                    item(("sections",), "Sections", "FolderItem", sections),
+                ],
+            )
+        case "LayoutBook":
+            layouts = [item(("layout", str(n)), f"Layout {n}", "LayoutItem") for n in range(1, 6)]
+            root = item((), "Layout Book", "LayoutBookRootItem", [item(("subset",), "Subset", "SubsetItem", layouts)])
+        case _:
+            views = [item(("view", s.name), s.name, "StoryItem") for s in project.stories]
+            root = item((), tree_type, "FolderItem", views)
+    return {"navigatorTree": {"rootItem": root}}
+
+
+# Tapir Add-On
+
+
+@_tapir("GetAddOnVersion")
+def _tapir_get_add_on_version(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"version": commands.tapir_version}
+
+
+@_tapir("GetProjectInfo")
+def _tapir_get_project_info(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    path = f"C:\\Simulated\\{commands.project.name}"
+    return {
+        "projectName": commands.project.name,
+        "projectPath": path,
+        "projectLocation": path,
+        "isUntitled": False,
+        "isTeamwork": False,
+    }
+
+
+@_tapir("GetArchicadLocation")
+def _tapir_get_archicad_location(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {"archicadLocation": f"C:\\Program Files\\Graphisoft\\Archicad {commands.version}\\ARCHICAD.exe"}
+
+
+@_tapir("GetStories")
+def _tapir_get_stories(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    stories = commands.project.stories
+    return {
+        "firstStory": stories[0].index,
+        "lastStory": stories[-1].index,
+        "actStory": stories[0].index,
+        "skipNullFloor": False,
+        "stories": [
+            {"index": s.index, "floorId": s.floor_id, "dispOnSections": True, "level": s.level, "name": s.name}
+            for s in stories
+        ],
+    }
+
+
+@_tapir("GetAllElements")
+def _tapir_get_all_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return _get_all_elements(commands, parameters)
+
+
+@_tapir("GetSelectedElements")
+def _tapir_get_selected_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return _get_selected_elements(commands, parameters)
+
+
+@_tapir("GetElementsByType")
+def _tapir_get_elements_by_type(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return _get_elements_by_type(commands, parameters)
+
+
+@_tapir("GetDetailsOfElements")
+def _tapir_get_details_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    details = []
+    for item in parameters["elements"]:
+        element = commands._element(item)
+        if element is None:
+            raise CommandError(ERROR_NOT_FOUND, f"Element {item['elementId']['guid']} not found.")
+        details.append(
+            {
+                "type": element.type,
+                "id": element.element_id,
+                "floorIndex": element.floor_index,
+                "layerIndex": 1,
+                "drawIndex": 1,
+                # Type-specific geometry is not simulated
+                "details": {"error": "Not yet supported element type"},
+            }
+        )
+    return {"detailsOfElements": details}
+
+
+@_tapir("GetAllProperties")
+def _tapir_get_all_properties(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "properties": [
+            {
+                "propertyId": {"guid": prop.guid},
+                "propertyType": "StaticBuiltIn" if prop.is_built_in else "Custom",
+                "propertyGroupName": prop.group,
+                "propertyName": prop.name,
+                "propertyCollectionType": "Single",
+                "propertyValueType": _TAPIR_VALUE_TYPES.get(prop.value_type, "Real"),
+                "propertyMeasureType": _TAPIR_MEASURE_TYPES.get(prop.value_type, "Default"),
+                "propertyIsEditable": not prop.is_built_in,
+            }
+            for prop in commands.project.properties
+        ]
+    }
+
+
+_TAPIR_VALUE_TYPES = {"string": "String", "integer": "Integer", "boolean": "Boolean"}
+_TAPIR_MEASURE_TYPES = {"length": "Length", "area": "Area", "volume": "Volume"}
+
+
+@_tapir("GetPropertyValuesOfElements")
+def _tapir_get_property_values_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    props = [commands._property(item) for item in parameters["properties"]]
+    values = []
+    for item in parameters["elements"]:
+        element = commands._element(item)
+        if element is None:
+            values.append(_not_found("Element"))
+            continue
+        values.append(
+            {
+                "propertyValues": [
+                    {"propertyValue": {"value": _display_value(commands.project.value_of(element, prop))}}
+                    if prop
+                    else _not_found("Property")
+                    for prop in props
+                ]
+            }
+        )
+    return {"propertyValuesForElements": values}
+
+
+@_tapir("SetPropertyValuesOfElements")
+def _tapir_set_property_values_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return _set_property_values_of_elements(commands, parameters)
+
+
+@_tapir("GetClassificationsOfElements")
+def _tapir_get_classifications_of_elements(commands: SimulatedCommands, parameters: dict[str, Any]) -> dict[str, Any]:
+    return _get_classifications_of_elements(commands, parameters)
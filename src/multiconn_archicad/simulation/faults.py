@@ -0,0 +1,299 @@
+"""
+Load and fault-injection scenarios that drive CoreCommands against an Archicad JSON API server.
+
+Each scenario sends a load of commands from many threads while it injects faults, and reports the throughput,
+the latency distribution and the errors the client saw. The scenarios replace the stress-test scripts of the
+"WinError 10054" investigation. They run against a SimulatedArchicad by default, and can be pointed at a real
+instance, which they are likely to crash.
+
+Usage:
+    python -m multiconn_archicad.simulation.faults --output faults.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import struct
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from multiconn_archicad.basic_types import Port
+from multiconn_archicad.core.config import CoreConfig, RetryPolicy
+from multiconn_archicad.core.core_commands import CoreCommands
+from multiconn_archicad.simulation.project import SyntheticProject
+from multiconn_archicad.simulation.server import SimulatedArchicad, SimulationSettings
+
+HOST = "127.0.0.1"
+# A request that promises more body than it sends, like a client killed in the middle of a request
+_TRUNCATED_REQUEST = (
+    f"POST / HTTP/1.1\r\nHost: {HOST}\r\nContent-Type: application/json\r\nContent-Length: 65\r\n\r\n"
+    '{"command": "API.GetProductInfo", "parameters": {}}'
+).encode()
+
+
+@dataclass
+class FaultReport:
+    """
+    What the client saw during one scenario.
+
+    Attributes:
+        requests: Commands sent by the load.
+        errors: Failed commands by exception class name.
+        duration: Seconds from the first command until the last one finished.
+        latencies: Seconds each successful command took.
+        injected: Faults injected during the scenario (disconnects, knocks or outages).
+        recovery_time: Seconds from the end of an outage until the first successful command, if there was one.
+    """
+
+    scenario: str
+    requests: int
+    errors: dict[str, int]
+    duration: float
+    latencies: list[float] = field(default_factory=list, repr=False)
+    injected: int = 0
+    recovery_time: float | None = None
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        """Successful commands per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "requests": self.requests,
+            "errors": self.errors,
+            "duration": self.duration,
+            "throughput": self.throughput,
+            "latency": {
+                "p50": self.percentile(0.5),
+                "p95": self.percentile(0.95),
+                "p99": self.percentile(0.99),
+                "max": self.percentile(1.0),
+            },
+            "injected": self.injected,
+            "recovery_time": self.recovery_time,
+        }
+
+
+def dirty_disconnect(port: Port, host: str = HOST) -> None:
+    """Sends a truncated request and resets the connection without waiting for the response."""
+    with socket.create_connection((host, int(port)), timeout=1.0) as sock:
+        sock.sendall(_TRUNCATED_REQUEST)
+        # SO_LINGER with a zero timeout makes close() send RST instead of FIN
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+
+
+def tcp_knock(port: Port, host: str = HOST) -> None:
+    """Opens a connection and closes it without sending anything."""
+    with socket.create_connection((host, int(port)), timeout=1.0):
+        pass
+
+
+def drive(
+    scenario: str,
+    send: Callable[[int], Any],
+    requests: int,
+    threads: int,
+    inject: Callable[[], int] | None = None,
+) -> FaultReport:
+    """
+    Calls `send` with the numbers 0..`requests`-1 from `threads` threads while `inject` runs next to them,
+    and reports the outcome. `inject` returns the number of faults it injected.
+    """
+    latencies: list[float] = []
+    errors: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def timed(number: int) -> None:
+        start = time.perf_counter()
+        try:
+            send(number)
+        except Exception as e:
+            with lock:
+                errors[type(e).__name__] += 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+    injected = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads + 1, thread_name_prefix=f"fault-{scenario}") as executor:
+        injection = executor.submit(inject) if inject is not None else None
+        list(executor.map(timed, range(requests)))
+        duration = time.perf_counter() - start
+        if injection is not None:
+            injected = injection.result()
+    return FaultReport(scenario, requests, dict(errors), duration, latencies, injected)
+
+
+def _concurrently(action: Callable[[], None], count: int, threads: int) -> Callable[[], int]:
+    def attempt(_: int) -> bool:
+        try:
+            action()
+        except OSError:
+            return False
+        return True
+
+    def inject() -> int:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return sum(executor.map(attempt, range(count)))
+
+    return inject
+
+
+def dirty_disconnects(core: CoreCommands, requests: int = 200, threads: int = 8, disconnects: int = 50) -> FaultReport:
+    """Commands keep working while other clients reset their connections in the middle of requests."""
+    inject = _concurrently(lambda: dirty_disconnect(core.port), disconnects, threads=20)
+    return drive("dirty_disconnects", lambda _: core.post_command("API.GetProductInfo"), requests, threads, inject)
+
+
+def tcp_knocks(core: CoreCommands, requests: int = 200, threads: int = 8, knocks: int = 500) -> FaultReport:
+    """Commands keep working while other clients open and drop connections without a request."""
+    inject = _concurrently(lambda: tcp_knock(core.port), knocks, threads=4)
+    return drive("tcp_knocks", lambda _: core.post_command("API.IsAlive"), requests, threads, inject)
+
+
+def pool_exhaustion(core: CoreCommands, requests: int = 300, threads: int = 200) -> FaultReport:
+    """Far more threads than the port's connection pool and request budget send commands at once."""
+    return drive("pool_exhaustion", lambda _: core.post_command("API.IsAlive"), requests, threads)
+
+
+def heavy_payloads(core: CoreCommands, requests: int = 100, threads: int = 50, properties: int = 2000) -> FaultReport:
+    """Large GetPropertyIds requests alternate with small Tapir commands."""
+    user_ids = [{"type": "BuiltIn", "nonLocalizedName": f"FakeProperty_{i}"} for i in range(properties)]
+
+    def send(number: int) -> None:
+        if number % 2 == 0:
+            core.post_command("API.GetPropertyIds", {"properties": user_ids})
+        else:
+            core.post_tapir_command("GetProjectInfo")
+
+    return drive("heavy_payloads", send, requests, threads)
+
+
+def recovery(
+    server: SimulatedArchicad, core: CoreCommands, outage: float = 1.0, threads: int = 4, timeout: float = 30.0
+) -> FaultReport:
+    """
+    Stops the server for `outage` seconds while commands keep coming, then measures how long the client
+    takes to succeed again after the server is back on the same port. Every thread retries until then,
+    so the latencies are those of getting a command through.
+    """
+    if server.port != core.port:
+        raise ValueError(f"The server listens on port {server.port}, the client sends to port {core.port}.")
+    lock = threading.Lock()
+    restarted_at: list[float] = []
+    recovered_at: list[float] = []
+    outage_errors: Counter[str] = Counter()
+    sent = 0
+    deadline = time.monotonic() + outage + timeout
+
+    def send(_: int) -> None:
+        nonlocal sent
+        while time.monotonic() < deadline:
+            with lock:
+                if recovered_at:
+                    return
+                sent += 1
+            try:
+                core.post_command("API.IsAlive", timeout=1.0)
+            except Exception as e:
+                with lock:
+                    outage_errors[type(e).__name__] += 1
+                time.sleep(0.05)
+                continue
+            with lock:
+                if restarted_at:
+                    recovered_at.append(time.monotonic())
+                    return
+
+    def inject() -> int:
+        server.stop()
+        time.sleep(outage)
+        server.start()
+        with lock:
+            restarted_at.append(time.monotonic())
+        return 1
+
+    core.post_command("API.IsAlive")  # opens pooled connections that the outage leaves stale
+    report = drive("recovery", send, threads, threads, inject)
+    report.requests = sent
+    report.errors = dict(outage_errors + Counter(report.errors))
+    if restarted_at and recovered_at:
+        report.recovery_time = max(0.0, recovered_at[0] - restarted_at[0])
+    return report
+
+
+SCENARIOS: dict[str, Callable[..., FaultReport]] = {
+    "dirty_disconnects": dirty_disconnects,
+    "tcp_knocks": tcp_knocks,
+    "pool_exhaustion": pool_exhaustion,
+    "heavy_payloads": heavy_payloads,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Drive CoreCommands through load and fault-injection scenarios.")
+    parser.add_argument("--output", default="fault_injection_results.json", help="Path of the JSON results.")
+    parser.add_argument(
+        "--scenarios", default=",".join([*SCENARIOS, "recovery"]), help="Comma separated scenarios to run."
+    )
+    parser.add_argument("--port", type=int, default=None, help="Port of a running server instead of a simulated one.")
+    parser.add_argument("--latency", type=float, default=0.001, help="Simulated seconds per command.")
+    parser.add_argument("--max-concurrency", type=int, default=1, help="Commands the simulated server runs at once.")
+    parser.add_argument("--retries", type=int, default=3, help="Retries of read-only commands, 0 to disable.")
+    args = parser.parse_args(argv)
+
+    config = CoreConfig(retry=RetryPolicy(max_retries=args.retries) if args.retries else None)
+    names = [name.strip() for name in args.scenarios.split(",")]
+    server = None
+    if args.port is None:
+        settings = SimulationSettings(latency=args.latency, max_concurrency=args.max_concurrency or None)
+        server = SimulatedArchicad(SyntheticProject.generate(element_count=1000), settings)
+        server.start()
+    reports = []
+    try:
+        core = CoreCommands(Port(args.port or server.port), config=config)
+        for name in names:
+            print(f"{name}...", flush=True)
+            if name == "recovery":
+                if server is None:
+                    print("  skipped: needs a simulated server")
+                    continue
+                report = recovery(server, core)
+            else:
+                report = SCENARIOS[name](core)
+            summary = report.to_dict()
+            print(
+                f"  {summary['throughput']:.0f} commands/s, p99 {summary['latency']['p99'] or 0:.4f}s, "
+                f"errors {report.errors or 0}, recovery {summary['recovery_time']}"
+            )
+            reports.append(summary)
+        core.close()
+    finally:
+        if server is not None:
+            server.stop()
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(reports, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
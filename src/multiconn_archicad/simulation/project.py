@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import random
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+ELEMENT_TYPES: tuple[str, ...] = ("Wall", "Slab", "Column", "Beam", "Window", "Door", "Object", "Zone", "Roof")
+# Relative frequency of each element type, roughly that of a building model
+_TYPE_WEIGHTS: tuple[int, ...] = (30, 8, 12, 10, 12, 10, 10, 5, 3)
+
+
+@dataclass(frozen=True)
+class SimulatedElement:
+    guid: str
+    type: str
+    element_id: str
+    floor_index: int
+    index: int
+
+
+@dataclass(frozen=True)
+class SimulatedProperty:
+    """
+    A property of the synthetic project. Built-in properties have a `non_localized_name`, user-defined ones
+    a `group` and `name` only.
+    """
+
+    guid: str
+    group: str
+    name: str
+    value_type: str
+    non_localized_name: str | None = None
+    index: int = 0
+
+    @property
+    def is_built_in(self) -> bool:
+        return self.non_localized_name is not None
+
+    @property
+    def user_id(self) -> dict[str, Any]:
+        if self.non_localized_name is not None:
+            return {"type": "BuiltIn", "nonLocalizedName": self.non_localized_name}
+        return {"type": "UserDefined", "localizedName": [self.group, self.name]}
+
+
+@dataclass(frozen=True)
+class SimulatedStory:
+    index: int
+    floor_id: int
+    name: str
+    level: float
+
+
+@dataclass(frozen=True)
+class SimulatedClassificationItem:
+    guid: str
+    id: str
+    name: str
+    element_type: str
+
+
+_BUILT_IN_PROPERTIES: tuple[tuple[str, str, str], ...] = (
+    ("General_ElementID", "Element ID", "string"),
+    ("General_Width", "Width", "length"),
+    ("General_Height", "Height", "length"),
+    ("General_Thickness", "Thickness", "length"),
+    ("General_Area", "Area", "area"),
+    ("General_Volume", "Volume", "volume"),
+    ("ModelView_LayerName", "Layer", "string"),
+    ("General_IsLoadBearing", "Load Bearing", "boolean"),
+)
+_USER_VALUE_TYPES: tuple[str, ...] = ("string", "number", "integer", "boolean")
+
+
+class SyntheticProject:
+    """
+    A generated Archicad project: elements, properties with deterministic values, a classification
+    system, stories and navigator trees. The same `seed` always generates the same project, GUIDs included.
+    Property values that are set through the API are kept, everything else is computed on demand, so
+    a project of 100k elements stays small in memory.
+
+    Usage:
+        project = SyntheticProject.generate(element_count=100_000, name="Tower.pln")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        elements: list[SimulatedElement],
+        properties: list[SimulatedProperty],
+        stories: list[SimulatedStory],
+        classification_system_guid: str,
+        classification_items: list[SimulatedClassificationItem],
+        seed: int,
+    ) -> None:
+        self.name = name
+        self.elements = elements
+        self.properties = properties
+        self.stories = stories
+        self.classification_system_guid = classification_system_guid
+        self.classification_items = classification_items
+        self.seed = seed
+        self.elements_by_guid: dict[str, SimulatedElement] = {element.guid: element for element in elements}
+        self.properties_by_guid: dict[str, SimulatedProperty] = {prop.guid: prop for prop in properties}
+        self.classification_by_type: dict[str, SimulatedClassificationItem] = {
+            item.element_type: item for item in classification_items
+        }
+        self._lock = threading.Lock()
+        self._values: dict[tuple[int, int], Any] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, elements={len(self.elements)}, "
+            f"properties={len(self.properties)}, stories={len(self.stories)})"
+        )
+
+    @classmethod
+    def generate(
+        cls,
+        element_count: int = 1000,
+        name: str = "Simulated Project.pln",
+        story_count: int = 5,
+        user_property_count: int = 8,
+        seed: int = 0,
+    ) -> SyntheticProject:
+        if element_count < 0 or story_count < 1 or user_property_count < 0:
+            raise ValueError(
+                "Expected element_count >= 0, story_count >= 1 and user_property_count >= 0, "
+                f"got {element_count}, {story_count}, {user_property_count}."
+            )
+        rng = random.Random(seed)
+        guids = _GuidSource(rng)
+        types = rng.choices(ELEMENT_TYPES, weights=_TYPE_WEIGHTS, k=element_count)
+        elements = [
+            SimulatedElement(
+                guid=guids.next(),
+                type=element_type,
+                element_id=f"{element_type[:2].upper()}-{index:06d}",
+                floor_index=index % story_count,
+                index=index,
+            )
+            for index, element_type in enumerate(types)
+        ]
+        properties = [
+            SimulatedProperty(guids.next(), "General", label, value_type, non_localized_name, index)
+            for index, (non_localized_name, label, value_type) in enumerate(_BUILT_IN_PROPERTIES)
+        ]
+        properties += [
+            SimulatedProperty(
+                guids.next(),
+                "Simulation",
+                f"Parameter {number:02d}",
+                _USER_VALUE_TYPES[number % len(_USER_VALUE_TYPES)],
+                index=len(_BUILT_IN_PROPERTIES) + number,
+            )
+            for number in range(user_property_count)
+        ]
+        stories = [
+            SimulatedStory(index=index, floor_id=index + 1, name=f"Story {index}", level=index * 3.0)
+            for index in range(story_count)
+        ]
+        classification_system_guid = guids.next()
+        classification_items = [
+            SimulatedClassificationItem(guids.next(), f"SIM-{number:02d}", element_type, element_type)
+            for number, element_type in enumerate(ELEMENT_TYPES)
+        ]
+        return cls(name, elements, properties, stories, classification_system_guid, classification_items, seed)
+
+    def value_of(self, element: SimulatedElement, prop: SimulatedProperty) -> Any:
+        """The value of `prop` on `element`: the value set through the API, or a computed one."""
+        with self._lock:
+            value = self._values.get((element.index, prop.index), _UNSET)
+        if value is not _UNSET:
+            return value
+        return self._computed_value(element, prop)
+
+    def set_value(self, element: SimulatedElement, prop: SimulatedProperty, value: Any) -> None:
+        with self._lock:
+            self._values[(element.index, prop.index)] = value
+
+    def _computed_value(self, element: SimulatedElement, prop: SimulatedProperty) -> Any:
+        if prop.non_localized_name == "General_ElementID":
+            return element.element_id
+        if prop.non_localized_name == "ModelView_LayerName":
+            return f"Simulated - {element.type}"
+        # A cheap deterministic mix of the element and property indices
+        mixed = (element.index * 2654435761 + prop.index * 40503 + self.seed) % 1_000_003
+        match prop.value_type:
+            case "boolean":
+                return mixed % 2 == 0
+            case "integer":
+                return mixed % 100
+            case "string":
+                return f"{prop.name} {mixed % 50}"
+            case "area":
+                return round(1 + mixed % 5000 / 100, 2)
+            case "volume":
+                return round(0.1 + mixed % 2000 / 100, 2)
+            case _:
+                return round(0.1 + mixed % 1000 / 100, 2)
+
+    def navigator_guid(self, *path: str) -> str:
+        """A stable GUID for the navigator item at `path`."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"simulated:{self.seed}:" + "/".join(path)))
+
+
+class _Unset:
+    pass
+
+
+_UNSET = _Unset()
+
+
+class _GuidSource:
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def next(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4)).upper()
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import logging
+import random
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping
+
+from multiconn_archicad.core.codec import JsonCodec, default_codec
+from multiconn_archicad.simulation.commands import SimulatedCommands
+from multiconn_archicad.simulation.project import SyntheticProject
+from multiconn_archicad.utilities.platform_utils import is_using_windows
+
+log = logging.getLogger(__name__)
+
+PORT_RANGE = range(19723, 19744)
+FAILURE_KINDS: frozenset[str] = frozenset({"reset", "timeout", "error"})
+
+
+@dataclass(frozen=True)
+class SimulationSettings:
+    """
+    How a simulated Archicad instance behaves under load.
+
+    Attributes:
+        latency: Seconds every command takes to process.
+        latencies: Processing seconds of individual commands, overriding `latency`. Standard commands carry
+            their "API." prefix, Tapir commands are bare names.
+        latency_per_element: Extra seconds per element in the parameters of a command.
+        max_concurrency: Commands processed at the same time. Archicad runs commands on its main thread,
+            so the default is 1. None processes every request as soon as it arrives.
+        max_requests_per_second: Requests accepted per second; further requests wait. None for no limit.
+        failure_rate: Share of requests that fail, between 0 and 1.
+        failures: The ways failing requests fail, picked at random: "reset" drops the connection, "timeout"
+            never answers (until `hang_seconds` pass), "error" answers with a standard API error.
+        hang_seconds: How long a "timeout" failure holds the request.
+        seed: Seed of the random failures. None seeds them randomly.
+    """
+
+    latency: float = 0.0
+    latencies: Mapping[str, float] = field(default_factory=dict)
+    latency_per_element: float = 0.0
+    max_concurrency: int | None = 1
+    max_requests_per_second: float | None = None
+    failure_rate: float = 0.0
+    failures: tuple[str, ...] = ("reset",)
+    hang_seconds: float = 30.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency < 0 or self.latency_per_element < 0 or any(v < 0 for v in self.latencies.values()):
+            raise ValueError("Latencies must not be negative.")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1 or None, got {self.max_concurrency}.")
+        if self.max_requests_per_second is not None and self.max_requests_per_second <= 0:
+            raise ValueError(f"max_requests_per_second must be positive or None, got {self.max_requests_per_second}.")
+        if not 0 <= self.failure_rate <= 1:
+            raise ValueError(f"failure_rate must be between 0 and 1, got {self.failure_rate}.")
+        if not self.failures or not set(self.failures) <= FAILURE_KINDS:
+            raise ValueError(f"failures must be a non-empty subset of {sorted(FAILURE_KINDS)}, got {self.failures}.")
+
+    def latency_of(self, command: str, element_count: int) -> float:
+        return self.latencies.get(command, self.latency) + self.latency_per_element * element_count
+
+
+class SimulatedArchicad:
+    """
+    An HTTP server that answers the JSON API and Tapir commands of Archicad from a SyntheticProject.
+    Without a `port` it takes the first free port of the Archicad port range, so MultiConn finds it.
+    A stopped server starts again on the same port, like an Archicad instance that was restarted.
+
+    Usage:
+        with SimulatedArchicad(SyntheticProject.generate(100_000), SimulationSettings(latency=0.01)) as server:
+            conn = MultiConn()
+            ...
+    """
+
+    def __init__(
+        self,
+        project: SyntheticProject | None = None,
+        settings: SimulationSettings | None = None,
+        port: int | None = None,
+        host: str = "127.0.0.1",
+        codec: JsonCodec | None = None,
+    ) -> None:
+        self.project = project or SyntheticProject.generate()
+        self.settings = settings or SimulationSettings()
+        self.commands = SimulatedCommands(self.project)
+        self.host = host
+        self.requested_port = port
+        self.port: int | None = None
+        self.requests_served = 0
+        self.failures_injected = 0
+        self._codec = codec or default_codec()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._counter_lock = threading.Lock()
+        self._random = random.Random(self.settings.seed)
+        self._concurrency = (
+            threading.BoundedSemaphore(self.settings.max_concurrency) if self.settings.max_concurrency else None
+        )
+        self._rate_lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url={self.url!r}, project={self.project!r})"
+
+    def __enter__(self) -> SimulatedArchicad:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        self._stopping.clear()
+        self._server = self._bind()
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=f"SimulatedArchicad-{self.port}", daemon=True
+        )
+        self._thread.start()
+        log.info(f"Simulated Archicad serving {self.project!r} at {self.url}")
+
+    def stop(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        self._stopping.set()
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _bind(self) -> ThreadingHTTPServer:
+        handler = _handler_class(self)
+        if self.requested_port is not None or self.port is not None:
+            return _Server((self.host, self.requested_port or self.port), handler)
+        for port in PORT_RANGE:
+            try:
+                return _Server((self.host, port), handler)
+            except OSError:
+                continue
+        raise OSError(f"No free port in the Archicad port range {PORT_RANGE.start}-{PORT_RANGE.stop - 1}.")
+
+    def handle(self, body: bytes) -> tuple[bytes | None, str | None]:
+        """The response body of a request, or None and the kind of failure to inject."""
+        self._wait_for_rate_limit()
+        with self._counter_lock:
+            self.requests_served += 1
+            failure = self._pick_failure()
+            if failure is not None:
+                self.failures_injected += 1
+        if failure in ("reset", "timeout"):
+            return None, failure
+        try:
+            payload = self._codec.loads(body)
+        except ValueError as e:
+            return self._codec.dumps({"succeeded": False, "error": {"code": 400, "message": str(e)}}), None
+        if failure == "error":
+            message = "Simulated failure."
+            return self._codec.dumps({"succeeded": False, "error": {"code": 500, "message": message}}), None
+        command = self._command_name(payload)
+        work = self.settings.latency_of(command, SimulatedCommands.element_count(payload))
+        if self._concurrency is None:
+            return self._process(payload, work), None
+        with self._concurrency:
+            return self._process(payload, work), None
+
+    def _process(self, payload: dict[str, Any], work: float) -> bytes:
+        if work:
+            self._stopping.wait(work)
+        return self._codec.dumps(self.commands.execute(payload))
+
+    def _pick_failure(self) -> str | None:
+        if not self.settings.failure_rate or self._random.random() >= self.settings.failure_rate:
+            return None
+        return self._random.choice(self.settings.failures)
+
+    def _wait_for_rate_limit(self) -> None:
+        rate = self.settings.max_requests_per_second
+        if rate is None:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1 / rate
+        if slot > now:
+            self._stopping.wait(slot - now)
+
+    @staticmethod
+    def _command_name(payload: dict[str, Any]) -> str:
+        if payload.get("command") == "API.ExecuteAddOnCommand":
+            return (payload.get("parameters") or {}).get("addOnCommandId", {}).get("commandName", "")
+        return payload.get("command", "")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under fault injection before they reach a handler
+    request_queue_size = 128
+    # On Windows SO_REUSEADDR lets a socket bind a port that a running Archicad listens on, so the simulator
+    # could take a port that is not free. Elsewhere it only allows rebinding a port after a restart.
+    allow_reuse_address = not is_using_windows()
+
+    def server_bind(self) -> None:
+        if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        super().server_bind()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Dropped and reset connections are expected, failure injection causes them on purpose
+        log.debug(f"Simulated Archicad connection from {client_address} failed.", exc_info=True)
+
+
+def _handler_class(simulator: SimulatedArchicad) -> type[BaseHTTPRequestHandler]:
+    class SimulatedArchicadHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            response, failure = simulator.handle(body)
+            if failure == "timeout":
+                simulator._stopping.wait(simulator.settings.hang_seconds)
+            if response is None:
+                self._reset()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def _reset(self) -> None:
+            # SO_LINGER with a zero timeout makes close() send RST, like Archicad's WinError 10054
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.close_connection = True
+
+    return SimulatedArchicadHandler
+
+
+def start_instances(
+    count: int,
+    element_count: int = 1000,
+    settings: SimulationSettings | None = None,
+    seed: int = 0,
+) -> list[SimulatedArchicad]:
+    """
+    Starts `count` simulated instances on free ports of the Archicad port range, each with its own project.
+    Stop them with `stop()` when done.
+    """
+    if not 1 <= count <= len(PORT_RANGE):
+        raise ValueError(f"count must be between 1 and {len(PORT_RANGE)}, got {count}.")
+    instances: list[SimulatedArchicad] = []
+    try:
+        for number in range(count):
+            project = SyntheticProject.generate(
+                element_count, name=f"Simulated Project {number + 1}.pln", seed=seed + number
+            )
+            instance = SimulatedArchicad(project, settings)
+            instance.start()
+            instances.append(instance)
+    except Exception:
+        for instance in instances:
+            instance.stop()
+        raise
+    return instances
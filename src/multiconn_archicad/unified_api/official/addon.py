@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     ExecuteAddOnCommandParameters,
     ExecuteAddOnCommandResult,
@@ -43,11 +44,15 @@ class AddonCommands:
             "addOnCommandId": add_on_command_id,
             "addOnCommandParameters": add_on_command_parameters,
         }
-        validated_params = ExecuteAddOnCommandParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.ExecuteAddOnCommand", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ExecuteAddOnCommandResult.model_validate(response_dict)
+        with profiled_call("API.ExecuteAddOnCommand") as profile:
+            validated_params = ExecuteAddOnCommandParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.ExecuteAddOnCommand", dumped_params)
+            profile.lap()
+            validated_response = ExecuteAddOnCommandResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.addOnCommandResponse
 
     def is_add_on_command_available(self, add_on_command_id: AddOnCommandId) -> bool:
@@ -68,9 +73,13 @@ class AddonCommands:
         params_dict = {
             "addOnCommandId": add_on_command_id,
         }
-        validated_params = IsAddOnCommandAvailableParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.IsAddOnCommandAvailable", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = IsAddOnCommandAvailableResult.model_validate(response_dict)
+        with profiled_call("API.IsAddOnCommandAvailable") as profile:
+            validated_params = IsAddOnCommandAvailableParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.IsAddOnCommandAvailable", dumped_params)
+            profile.lap()
+            validated_response = IsAddOnCommandAvailableResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.available
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     CreateAttributeFoldersParameters,
     CreateAttributeFoldersResult,
@@ -104,11 +105,15 @@ class AttributeCommands:
         params_dict = {
             "attributeFolders": attribute_folders,
         }
-        validated_params = CreateAttributeFoldersParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.CreateAttributeFolders", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateAttributeFoldersResult.model_validate(response_dict)
+        with profiled_call("API.CreateAttributeFolders") as profile:
+            validated_params = CreateAttributeFoldersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.CreateAttributeFolders", dumped_params)
+            profile.lap()
+            validated_response = CreateAttributeFoldersResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def delete_attribute_folders(
@@ -134,11 +139,15 @@ class AttributeCommands:
         params_dict = {
             "attributeFolderIds": attribute_folder_ids,
         }
-        validated_params = DeleteAttributeFoldersParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.DeleteAttributeFolders", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeleteAttributeFoldersResult.model_validate(response_dict)
+        with profiled_call("API.DeleteAttributeFolders") as profile:
+            validated_params = DeleteAttributeFoldersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.DeleteAttributeFolders", dumped_params)
+            profile.lap()
+            validated_response = DeleteAttributeFoldersResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def delete_attributes(
@@ -162,11 +171,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = DeleteAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.DeleteAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeleteAttributesResult.model_validate(response_dict)
+        with profiled_call("API.DeleteAttributes") as profile:
+            validated_params = DeleteAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.DeleteAttributes", dumped_params)
+            profile.lap()
+            validated_response = DeleteAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def get_active_pen_tables(self) -> GetActivePenTablesResult:
@@ -181,8 +194,11 @@ class AttributeCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetActivePenTables")
-        validated_response = GetActivePenTablesResult.model_validate(response_dict)
+        with profiled_call("API.GetActivePenTables") as profile:
+            response_dict = self._core.post_command("API.GetActivePenTables")
+            profile.lap()
+            validated_response = GetActivePenTablesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_attribute_folder_structure(
@@ -208,12 +224,15 @@ class AttributeCommands:
             "attributeType": attribute_type,
             "path": path,
         }
-        validated_params = GetAttributeFolderStructureParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAttributeFolderStructure",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetAttributeFolderStructureResult.model_validate(response_dict)
+        with profiled_call("API.GetAttributeFolderStructure") as profile:
+            validated_params = GetAttributeFolderStructureParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAttributeFolderStructure", dumped_params)
+            profile.lap()
+            validated_response = GetAttributeFolderStructureResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeFolder
 
     def get_attribute_folders(
@@ -237,11 +256,15 @@ class AttributeCommands:
         params_dict = {
             "attributeFolderIds": attribute_folder_ids,
         }
-        validated_params = GetAttributeFoldersParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAttributeFolders", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAttributeFoldersResult.model_validate(response_dict)
+        with profiled_call("API.GetAttributeFolders") as profile:
+            validated_params = GetAttributeFoldersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAttributeFolders", dumped_params)
+            profile.lap()
+            validated_response = GetAttributeFoldersResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeFolders
 
     def get_attributes_by_type(self, attribute_type: AttributeType) -> list[AttributeIdWrapperItem]:
@@ -262,11 +285,15 @@ class AttributeCommands:
         params_dict = {
             "attributeType": attribute_type,
         }
-        validated_params = GetAttributesByTypeParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAttributesByType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAttributesByTypeResult.model_validate(response_dict)
+        with profiled_call("API.GetAttributesByType") as profile:
+            validated_params = GetAttributesByTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAttributesByType", dumped_params)
+            profile.lap()
+            validated_response = GetAttributesByTypeResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def get_attributes_indices(
@@ -290,11 +317,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetAttributesIndicesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAttributesIndices", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAttributesIndicesResult.model_validate(response_dict)
+        with profiled_call("API.GetAttributesIndices") as profile:
+            validated_params = GetAttributesIndicesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAttributesIndices", dumped_params)
+            profile.lap()
+            validated_response = GetAttributesIndicesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIndicesAndGuids
 
     def get_building_material_attributes(
@@ -318,12 +349,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetBuildingMaterialAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetBuildingMaterialAttributes",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetBuildingMaterialAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetBuildingMaterialAttributes") as profile:
+            validated_params = GetBuildingMaterialAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetBuildingMaterialAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetBuildingMaterialAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_composite_attributes(
@@ -347,11 +381,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetCompositeAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetCompositeAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetCompositeAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetCompositeAttributes") as profile:
+            validated_params = GetCompositeAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetCompositeAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetCompositeAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_fill_attributes(
@@ -375,11 +413,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetFillAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetFillAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetFillAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetFillAttributes") as profile:
+            validated_params = GetFillAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetFillAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetFillAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_layer_attributes(
@@ -403,11 +445,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetLayerAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetLayerAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetLayerAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetLayerAttributes") as profile:
+            validated_params = GetLayerAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetLayerAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetLayerAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_layer_combination_attributes(
@@ -431,12 +477,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetLayerCombinationAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetLayerCombinationAttributes",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetLayerCombinationAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetLayerCombinationAttributes") as profile:
+            validated_params = GetLayerCombinationAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetLayerCombinationAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetLayerCombinationAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_line_attributes(
@@ -460,11 +509,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetLineAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetLineAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetLineAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetLineAttributes") as profile:
+            validated_params = GetLineAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetLineAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetLineAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_pen_table_attributes(
@@ -489,11 +542,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetPenTableAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPenTableAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetPenTableAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetPenTableAttributes") as profile:
+            validated_params = GetPenTableAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetPenTableAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetPenTableAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_profile_attribute_preview(
@@ -526,11 +583,15 @@ class AttributeCommands:
             "imageHeight": image_height,
             "backgroundColor": background_color,
         }
-        validated_params = GetProfileAttributePreviewParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetProfileAttributePreview", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetProfileAttributePreviewResult.model_validate(response_dict)
+        with profiled_call("API.GetProfileAttributePreview") as profile:
+            validated_params = GetProfileAttributePreviewParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetProfileAttributePreview", dumped_params)
+            profile.lap()
+            validated_response = GetProfileAttributePreviewResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.previewImages
 
     def get_profile_attributes(
@@ -554,11 +615,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetProfileAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetProfileAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetProfileAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetProfileAttributes") as profile:
+            validated_params = GetProfileAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetProfileAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetProfileAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_surface_attributes(
@@ -582,11 +647,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetSurfaceAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetSurfaceAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetSurfaceAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetSurfaceAttributes") as profile:
+            validated_params = GetSurfaceAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetSurfaceAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetSurfaceAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def get_zone_category_attributes(
@@ -610,11 +679,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetZoneCategoryAttributesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetZoneCategoryAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetZoneCategoryAttributesResult.model_validate(response_dict)
+        with profiled_call("API.GetZoneCategoryAttributes") as profile:
+            validated_params = GetZoneCategoryAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetZoneCategoryAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetZoneCategoryAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributes
 
     def move_attributes_and_folders(
@@ -642,10 +715,12 @@ class AttributeCommands:
             "attributeIds": attribute_ids,
             "targetFolderId": target_folder_id,
         }
-        validated_params = MoveAttributesAndFoldersParameters(**params_dict)
-        self._core.post_command(
-            "API.MoveAttributesAndFolders", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("API.MoveAttributesAndFolders") as profile:
+            validated_params = MoveAttributesAndFoldersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_command("API.MoveAttributesAndFolders", dumped_params)
         return None
 
     def rename_attribute_folders(
@@ -669,9 +744,13 @@ class AttributeCommands:
         params_dict = {
             "attributeFolderParametersList": attribute_folder_parameters_list,
         }
-        validated_params = RenameAttributeFoldersParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.RenameAttributeFolders", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = RenameAttributeFoldersResult.model_validate(response_dict)
+        with profiled_call("API.RenameAttributeFolders") as profile:
+            validated_params = RenameAttributeFoldersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.RenameAttributeFolders", dumped_params)
+            profile.lap()
+            validated_response = RenameAttributeFoldersResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import GetProductInfoResult, IsAliveResult
 
 if TYPE_CHECKING:
@@ -27,8 +28,11 @@ class BasicCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetProductInfo")
-        validated_response = GetProductInfoResult.model_validate(response_dict)
+        with profiled_call("API.GetProductInfo") as profile:
+            response_dict = self._core.post_command("API.GetProductInfo")
+            profile.lap()
+            validated_response = GetProductInfoResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def is_alive(self) -> bool:
@@ -43,6 +47,9 @@ class BasicCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.IsAlive")
-        validated_response = IsAliveResult.model_validate(response_dict)
+        with profiled_call("API.IsAlive") as profile:
+            response_dict = self._core.post_command("API.IsAlive")
+            profile.lap()
+            validated_response = IsAliveResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.isAlive
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     GetAllClassificationSystemsResult,
     GetAllClassificationsInSystemParameters,
@@ -58,8 +59,11 @@ class ClassificationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetAllClassificationSystems")
-        validated_response = GetAllClassificationSystemsResult.model_validate(response_dict)
+        with profiled_call("API.GetAllClassificationSystems") as profile:
+            response_dict = self._core.post_command("API.GetAllClassificationSystems")
+            profile.lap()
+            validated_response = GetAllClassificationSystemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationSystems
 
     def get_all_classifications_in_system(
@@ -82,12 +86,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationSystemId": classification_system_id,
         }
-        validated_params = GetAllClassificationsInSystemParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAllClassificationsInSystem",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetAllClassificationsInSystemResult.model_validate(response_dict)
+        with profiled_call("API.GetAllClassificationsInSystem") as profile:
+            validated_params = GetAllClassificationsInSystemParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAllClassificationsInSystem", dumped_params)
+            profile.lap()
+            validated_response = GetAllClassificationsInSystemResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationItems
 
     def get_classification_item_availability(
@@ -112,12 +119,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationItemIds": classification_item_ids,
         }
-        validated_params = GetClassificationItemAvailabilityParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetClassificationItemAvailability",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetClassificationItemAvailabilityResult.model_validate(response_dict)
+        with profiled_call("API.GetClassificationItemAvailability") as profile:
+            validated_params = GetClassificationItemAvailabilityParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetClassificationItemAvailability", dumped_params)
+            profile.lap()
+            validated_response = GetClassificationItemAvailabilityResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationItemAvailabilityList
 
     def get_classification_system_ids(self) -> list[ClassificationSystemIdArrayItem]:
@@ -132,8 +142,11 @@ class ClassificationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetClassificationSystemIds")
-        validated_response = GetClassificationSystemIdsResult.model_validate(response_dict)
+        with profiled_call("API.GetClassificationSystemIds") as profile:
+            response_dict = self._core.post_command("API.GetClassificationSystemIds")
+            profile.lap()
+            validated_response = GetClassificationSystemIdsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationSystemIds
 
     def get_classification_systems(
@@ -158,11 +171,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationSystemIds": classification_system_ids,
         }
-        validated_params = GetClassificationSystemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetClassificationSystems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetClassificationSystemsResult.model_validate(response_dict)
+        with profiled_call("API.GetClassificationSystems") as profile:
+            validated_params = GetClassificationSystemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetClassificationSystems", dumped_params)
+            profile.lap()
+            validated_response = GetClassificationSystemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationSystems
 
     def get_classifications_of_elements(
@@ -191,12 +208,20 @@ class ClassificationCommands:
             "elements": elements,
             "classificationSystemIds": classification_system_ids,
         }
-        validated_params = GetClassificationsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetClassificationsOfElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetClassificationsOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetClassificationsOfElements") as profile:
+            validated_params = GetClassificationsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.GetClassificationsOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="elementClassifications",
+            )
+            profile.lap()
+            validated_response = GetClassificationsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementClassifications
 
     def get_details_of_classification_items(
@@ -221,12 +246,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationItemIds": classification_item_ids,
         }
-        validated_params = GetDetailsOfClassificationItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetDetailsOfClassificationItems",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetDetailsOfClassificationItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetDetailsOfClassificationItems") as profile:
+            validated_params = GetDetailsOfClassificationItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetDetailsOfClassificationItems", dumped_params)
+            profile.lap()
+            validated_response = GetDetailsOfClassificationItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.classificationItems
 
     def set_classifications_of_elements(
@@ -252,10 +280,13 @@ class ClassificationCommands:
         params_dict = {
             "elementClassifications": element_classifications,
         }
-        validated_params = SetClassificationsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.SetClassificationsOfElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = SetClassificationsOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.SetClassificationsOfElements") as profile:
+            validated_params = SetClassificationsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.SetClassificationsOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetClassificationsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
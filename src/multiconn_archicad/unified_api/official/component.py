@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     GetComponentsOfElementsParameters,
     GetComponentsOfElementsResult,
@@ -49,11 +50,20 @@ class ComponentCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetComponentsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetComponentsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetComponentsOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetComponentsOfElements") as profile:
+            validated_params = GetComponentsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.GetComponentsOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="componentsOfElements",
+            )
+            profile.lap()
+            validated_response = GetComponentsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.componentsOfElements
 
     def get_property_values_of_element_components(
@@ -81,10 +91,13 @@ class ComponentCommands:
             "elementComponents": element_components,
             "properties": properties,
         }
-        validated_params = GetPropertyValuesOfElementComponentsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPropertyValuesOfElementComponents",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetPropertyValuesOfElementComponentsResult.model_validate(response_dict)
+        with profiled_call("API.GetPropertyValuesOfElementComponents") as profile:
+            validated_params = GetPropertyValuesOfElementComponentsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetPropertyValuesOfElementComponents", dumped_params)
+            profile.lap()
+            validated_response = GetPropertyValuesOfElementComponentsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyValuesForElementComponents
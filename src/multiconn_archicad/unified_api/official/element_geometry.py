@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     Get2DBoundingBoxesParameters,
     Get2DBoundingBoxesResult,
@@ -47,11 +48,17 @@ class ElementGeometryCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = Get2DBoundingBoxesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.Get2DBoundingBoxes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = Get2DBoundingBoxesResult.model_validate(response_dict)
+        with profiled_call("API.Get2DBoundingBoxes") as profile:
+            validated_params = Get2DBoundingBoxesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.Get2DBoundingBoxes", dumped_params, chunked_parameter="elements", chunked_result="boundingBoxes2D"
+            )
+            profile.lap()
+            validated_response = Get2DBoundingBoxesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.boundingBoxes2D
 
     def get_3d_bounding_boxes(self, elements: list[ElementIdArrayItem]) -> list[BoundingBox3DWrapperItem | ErrorItem]:
@@ -75,9 +82,15 @@ class ElementGeometryCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = Get3DBoundingBoxesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.Get3DBoundingBoxes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = Get3DBoundingBoxesResult.model_validate(response_dict)
+        with profiled_call("API.Get3DBoundingBoxes") as profile:
+            validated_params = Get3DBoundingBoxesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.Get3DBoundingBoxes", dumped_params, chunked_parameter="elements", chunked_result="boundingBoxes3D"
+            )
+            profile.lap()
+            validated_response = Get3DBoundingBoxesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.boundingBoxes3D
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     GetAllElementsResult,
     GetElementsByClassificationParameters,
@@ -44,8 +45,11 @@ class ElementListingCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetAllElements")
-        validated_response = GetAllElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetAllElements") as profile:
+            response_dict = self._core.post_command("API.GetAllElements")
+            profile.lap()
+            validated_response = GetAllElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_elements_by_classification(self, classification_item_id: ClassificationItemId) -> list[ElementIdArrayItem]:
@@ -66,12 +70,15 @@ class ElementListingCommands:
         params_dict = {
             "classificationItemId": classification_item_id,
         }
-        validated_params = GetElementsByClassificationParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetElementsByClassification",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetElementsByClassificationResult.model_validate(response_dict)
+        with profiled_call("API.GetElementsByClassification") as profile:
+            validated_params = GetElementsByClassificationParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetElementsByClassification", dumped_params)
+            profile.lap()
+            validated_response = GetElementsByClassificationResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_elements_by_type(self, element_type: ElementType) -> list[ElementIdArrayItem]:
@@ -92,11 +99,15 @@ class ElementListingCommands:
         params_dict = {
             "elementType": element_type,
         }
-        validated_params = GetElementsByTypeParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetElementsByType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementsByTypeResult.model_validate(response_dict)
+        with profiled_call("API.GetElementsByType") as profile:
+            validated_params = GetElementsByTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetElementsByType", dumped_params)
+            profile.lap()
+            validated_response = GetElementsByTypeResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_selected_elements(
@@ -125,11 +136,15 @@ class ElementListingCommands:
             "onlyEditable": only_editable,
             "onlySupportedTypes": only_supported_types,
         }
-        validated_params = GetSelectedElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetSelectedElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetSelectedElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetSelectedElements") as profile:
+            validated_params = GetSelectedElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetSelectedElements", dumped_params)
+            profile.lap()
+            validated_response = GetSelectedElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_types_of_elements(self, elements: list[ElementIdArrayItem]) -> list[ErrorItem | TypeOfElementWrapperItem]:
@@ -150,9 +165,15 @@ class ElementListingCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetTypesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetTypesOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetTypesOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetTypesOfElements") as profile:
+            validated_params = GetTypesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.GetTypesOfElements", dumped_params, chunked_parameter="elements", chunked_result="typesOfElements"
+            )
+            profile.lap()
+            validated_response = GetTypesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.typesOfElements
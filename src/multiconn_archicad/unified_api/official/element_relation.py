@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     GetElementsRelatedToZonesParameters,
     GetElementsRelatedToZonesResult,
@@ -44,9 +45,13 @@ class ElementRelationCommands:
             "zones": zones,
             "elementTypes": element_types,
         }
-        validated_params = GetElementsRelatedToZonesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetElementsRelatedToZones", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementsRelatedToZonesResult.model_validate(response_dict)
+        with profiled_call("API.GetElementsRelatedToZones") as profile:
+            validated_params = GetElementsRelatedToZonesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetElementsRelatedToZones", dumped_params)
+            profile.lap()
+            validated_response = GetElementsRelatedToZonesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementsRelatedToZones
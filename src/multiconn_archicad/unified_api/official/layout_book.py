@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     CreateLayoutParameters,
     CreateLayoutResult,
@@ -54,11 +55,15 @@ class LayoutBookCommands:
             "masterNavigatorItemId": master_navigator_item_id,
             "parentNavigatorItemId": parent_navigator_item_id,
         }
-        validated_params = CreateLayoutParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.CreateLayout", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLayoutResult.model_validate(response_dict)
+        with profiled_call("API.CreateLayout") as profile:
+            validated_params = CreateLayoutParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.CreateLayout", dumped_params)
+            profile.lap()
+            validated_response = CreateLayoutResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.createdNavigatorItemId
 
     def create_layout_subset(
@@ -83,11 +88,15 @@ class LayoutBookCommands:
             "subsetParameters": subset_parameters,
             "parentNavigatorItemId": parent_navigator_item_id,
         }
-        validated_params = CreateLayoutSubsetParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.CreateLayoutSubset", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLayoutSubsetResult.model_validate(response_dict)
+        with profiled_call("API.CreateLayoutSubset") as profile:
+            validated_params = CreateLayoutSubsetParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.CreateLayoutSubset", dumped_params)
+            profile.lap()
+            validated_response = CreateLayoutSubsetResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.createdSubsetId
 
     def get_layout_settings(self, layout_navigator_item_id: NavigatorItemId) -> LayoutParameters:
@@ -108,11 +117,15 @@ class LayoutBookCommands:
         params_dict = {
             "layoutNavigatorItemId": layout_navigator_item_id,
         }
-        validated_params = GetLayoutSettingsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetLayoutSettings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetLayoutSettingsResult.model_validate(response_dict)
+        with profiled_call("API.GetLayoutSettings") as profile:
+            validated_params = GetLayoutSettingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetLayoutSettings", dumped_params)
+            profile.lap()
+            validated_response = GetLayoutSettingsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.layoutParameters
 
     def set_layout_settings(
@@ -134,8 +147,10 @@ class LayoutBookCommands:
             "layoutParameters": layout_parameters,
             "layoutNavigatorItemId": layout_navigator_item_id,
         }
-        validated_params = SetLayoutSettingsParameters(**params_dict)
-        self._core.post_command(
-            "API.SetLayoutSettings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("API.SetLayoutSettings") as profile:
+            validated_params = SetLayoutSettingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_command("API.SetLayoutSettings", dumped_params)
         return None
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     DeleteNavigatorItemsParameters,
     DeleteNavigatorItemsResult,
@@ -85,11 +86,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = DeleteNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.DeleteNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeleteNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.DeleteNavigatorItems") as profile:
+            validated_params = DeleteNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.DeleteNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = DeleteNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def get_built_in_container_navigator_items(
@@ -114,12 +119,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetBuiltInContainerNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetBuiltInContainerNavigatorItems",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetBuiltInContainerNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetBuiltInContainerNavigatorItems") as profile:
+            validated_params = GetBuiltInContainerNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetBuiltInContainerNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetBuiltInContainerNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_detail_navigator_items(
@@ -143,11 +151,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetDetailNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetDetailNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetDetailNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetDetailNavigatorItems") as profile:
+            validated_params = GetDetailNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetDetailNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetDetailNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_document_3d_navigator_items(
@@ -172,12 +184,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetDocument3DNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetDocument3DNavigatorItems",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetDocument3DNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetDocument3DNavigatorItems") as profile:
+            validated_params = GetDocument3DNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetDocument3DNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetDocument3DNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_elevation_navigator_items(
@@ -202,11 +217,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetElevationNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetElevationNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElevationNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetElevationNavigatorItems") as profile:
+            validated_params = GetElevationNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetElevationNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetElevationNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_interior_elevation_navigator_items(
@@ -231,12 +250,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetInteriorElevationNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetInteriorElevationNavigatorItems",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetInteriorElevationNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetInteriorElevationNavigatorItems") as profile:
+            validated_params = GetInteriorElevationNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetInteriorElevationNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetInteriorElevationNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_navigator_item_tree(self, navigator_tree_id: OtherNavigatorTreeId | PublisherSetId) -> NavigatorTree:
@@ -258,11 +280,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorTreeId": navigator_tree_id,
         }
-        validated_params = GetNavigatorItemTreeParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetNavigatorItemTree", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetNavigatorItemTreeResult.model_validate(response_dict)
+        with profiled_call("API.GetNavigatorItemTree") as profile:
+            validated_params = GetNavigatorItemTreeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetNavigatorItemTree", dumped_params)
+            profile.lap()
+            validated_response = GetNavigatorItemTreeResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorTree
 
     def get_navigator_items_type(
@@ -288,11 +314,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetNavigatorItemsTypeParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetNavigatorItemsType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetNavigatorItemsTypeResult.model_validate(response_dict)
+        with profiled_call("API.GetNavigatorItemsType") as profile:
+            validated_params = GetNavigatorItemsTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetNavigatorItemsType", dumped_params)
+            profile.lap()
+            validated_response = GetNavigatorItemsTypeResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItemIdAndTypeList
 
     def get_publisher_set_names(self) -> list[str]:
@@ -307,8 +337,11 @@ class NavigatorTreeCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetPublisherSetNames")
-        validated_response = GetPublisherSetNamesResult.model_validate(response_dict)
+        with profiled_call("API.GetPublisherSetNames") as profile:
+            response_dict = self._core.post_command("API.GetPublisherSetNames")
+            profile.lap()
+            validated_response = GetPublisherSetNamesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.publisherSetNames
 
     def get_section_navigator_items(
@@ -333,11 +366,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetSectionNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetSectionNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetSectionNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetSectionNavigatorItems") as profile:
+            validated_params = GetSectionNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetSectionNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetSectionNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_story_navigator_items(
@@ -361,11 +398,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetStoryNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetStoryNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetStoryNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetStoryNavigatorItems") as profile:
+            validated_params = GetStoryNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetStoryNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetStoryNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def get_worksheet_navigator_items(
@@ -390,11 +431,15 @@ class NavigatorTreeCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetWorksheetNavigatorItemsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetWorksheetNavigatorItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetWorksheetNavigatorItemsResult.model_validate(response_dict)
+        with profiled_call("API.GetWorksheetNavigatorItems") as profile:
+            validated_params = GetWorksheetNavigatorItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetWorksheetNavigatorItems", dumped_params)
+            profile.lap()
+            validated_response = GetWorksheetNavigatorItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.navigatorItems
 
     def move_navigator_item(
@@ -423,10 +468,12 @@ class NavigatorTreeCommands:
             "parentNavigatorItemId": parent_navigator_item_id,
             "previousNavigatorItemId": previous_navigator_item_id,
         }
-        validated_params = MoveNavigatorItemParameters(**params_dict)
-        self._core.post_command(
-            "API.MoveNavigatorItem", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("API.MoveNavigatorItem") as profile:
+            validated_params = MoveNavigatorItemParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_command("API.MoveNavigatorItem", dumped_params)
         return None
 
     def rename_navigator_item(
@@ -457,8 +504,10 @@ class NavigatorTreeCommands:
         else:
             inner_model = RenameNavigatorItemById(navigatorItemId=navigator_item_id, newId=new_id)
 
-        validated_params = RenameNavigatorItemParameters(root=inner_model)
-        self._core.post_command(
-            "API.RenameNavigatorItem", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("API.RenameNavigatorItem") as profile:
+            validated_params = RenameNavigatorItemParameters(root=inner_model)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_command("API.RenameNavigatorItem", dumped_params)
         return None
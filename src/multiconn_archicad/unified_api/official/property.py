@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     GetAllPropertyGroupIdsParameters,
     GetAllPropertyGroupIdsResult,
@@ -72,11 +73,15 @@ class PropertyCommands:
         params_dict = {
             "propertyType": property_type,
         }
-        validated_params = GetAllPropertyGroupIdsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAllPropertyGroupIds", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAllPropertyGroupIdsResult.model_validate(response_dict)
+        with profiled_call("API.GetAllPropertyGroupIds") as profile:
+            validated_params = GetAllPropertyGroupIdsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAllPropertyGroupIds", dumped_params)
+            profile.lap()
+            validated_response = GetAllPropertyGroupIdsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyGroupIds
 
     def get_all_property_ids(self, property_type: None | PropertyType = None) -> list[PropertyIdArrayItem]:
@@ -99,11 +104,15 @@ class PropertyCommands:
         params_dict = {
             "propertyType": property_type,
         }
-        validated_params = GetAllPropertyIdsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAllPropertyIds", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAllPropertyIdsResult.model_validate(response_dict)
+        with profiled_call("API.GetAllPropertyIds") as profile:
+            validated_params = GetAllPropertyIdsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetAllPropertyIds", dumped_params)
+            profile.lap()
+            validated_response = GetAllPropertyIdsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyIds
 
     def get_all_property_ids_of_elements(
@@ -131,12 +140,20 @@ class PropertyCommands:
             "elements": elements,
             "propertyType": property_type,
         }
-        validated_params = GetAllPropertyIdsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetAllPropertyIdsOfElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetAllPropertyIdsOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetAllPropertyIdsOfElements") as profile:
+            validated_params = GetAllPropertyIdsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.GetAllPropertyIdsOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="propertyIdsOfElements",
+            )
+            profile.lap()
+            validated_response = GetAllPropertyIdsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyIdsOfElements
 
     def get_all_property_names(self) -> list[BuiltInPropertyUserId | UserDefinedPropertyUserId]:
@@ -153,8 +170,11 @@ class PropertyCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_command("API.GetAllPropertyNames")
-        validated_response = GetAllPropertyNamesResult.model_validate(response_dict)
+        with profiled_call("API.GetAllPropertyNames") as profile:
+            response_dict = self._core.post_command("API.GetAllPropertyNames")
+            profile.lap()
+            validated_response = GetAllPropertyNamesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.properties
 
     def get_details_of_properties(
@@ -178,11 +198,15 @@ class PropertyCommands:
         params_dict = {
             "properties": properties,
         }
-        validated_params = GetDetailsOfPropertiesParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetDetailsOfProperties", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetDetailsOfPropertiesResult.model_validate(response_dict)
+        with profiled_call("API.GetDetailsOfProperties") as profile:
+            validated_params = GetDetailsOfPropertiesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetDetailsOfProperties", dumped_params)
+            profile.lap()
+            validated_response = GetDetailsOfPropertiesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyDefinitions
 
     def get_property_definition_availability(
@@ -206,12 +230,15 @@ class PropertyCommands:
         params_dict = {
             "propertyIds": property_ids,
         }
-        validated_params = GetPropertyDefinitionAvailabilityParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPropertyDefinitionAvailability",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetPropertyDefinitionAvailabilityResult.model_validate(response_dict)
+        with profiled_call("API.GetPropertyDefinitionAvailability") as profile:
+            validated_params = GetPropertyDefinitionAvailabilityParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetPropertyDefinitionAvailability", dumped_params)
+            profile.lap()
+            validated_response = GetPropertyDefinitionAvailabilityResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyDefinitionAvailabilityList
 
     def get_property_groups(
@@ -235,11 +262,15 @@ class PropertyCommands:
         params_dict = {
             "propertyGroupIds": property_group_ids,
         }
-        validated_params = GetPropertyGroupsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPropertyGroups", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetPropertyGroupsResult.model_validate(response_dict)
+        with profiled_call("API.GetPropertyGroups") as profile:
+            validated_params = GetPropertyGroupsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetPropertyGroups", dumped_params)
+            profile.lap()
+            validated_response = GetPropertyGroupsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyGroups
 
     def get_property_ids(
@@ -266,11 +297,15 @@ class PropertyCommands:
         params_dict = {
             "properties": properties,
         }
-        validated_params = GetPropertyIdsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPropertyIds", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetPropertyIdsResult.model_validate(response_dict)
+        with profiled_call("API.GetPropertyIds") as profile:
+            validated_params = GetPropertyIdsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.GetPropertyIds", dumped_params)
+            profile.lap()
+            validated_response = GetPropertyIdsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.properties
 
     def get_property_values_of_elements(
@@ -297,12 +332,20 @@ class PropertyCommands:
             "elements": elements,
             "properties": properties,
         }
-        validated_params = GetPropertyValuesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.GetPropertyValuesOfElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetPropertyValuesOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.GetPropertyValuesOfElements") as profile:
+            validated_params = GetPropertyValuesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command_chunked(
+                "API.GetPropertyValuesOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="propertyValuesForElements",
+            )
+            profile.lap()
+            validated_response = GetPropertyValuesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyValuesForElements
 
     def set_property_values_of_elements(
@@ -327,10 +370,13 @@ class PropertyCommands:
         params_dict = {
             "elementPropertyValues": element_property_values,
         }
-        validated_params = SetPropertyValuesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.SetPropertyValuesOfElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = SetPropertyValuesOfElementsResult.model_validate(response_dict)
+        with profiled_call("API.SetPropertyValuesOfElements") as profile:
+            validated_params = SetPropertyValuesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.SetPropertyValuesOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetPropertyValuesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
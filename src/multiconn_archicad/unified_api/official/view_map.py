@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.official.commands import (
     CloneProjectMapItemToViewMapParameters,
     CloneProjectMapItemToViewMapResult,
@@ -46,12 +47,15 @@ class ViewMapCommands:
             "projectMapNavigatorItemId": project_map_navigator_item_id,
             "parentNavigatorItemId": parent_navigator_item_id,
         }
-        validated_params = CloneProjectMapItemToViewMapParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.CloneProjectMapItemToViewMap",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = CloneProjectMapItemToViewMapResult.model_validate(response_dict)
+        with profiled_call("API.CloneProjectMapItemToViewMap") as profile:
+            validated_params = CloneProjectMapItemToViewMapParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.CloneProjectMapItemToViewMap", dumped_params)
+            profile.lap()
+            validated_response = CloneProjectMapItemToViewMapResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.createdNavigatorItemId
 
     def create_view_map_folder(
@@ -85,9 +89,13 @@ class ViewMapCommands:
             "parentNavigatorItemId": parent_navigator_item_id,
             "previousNavigatorItemId": previous_navigator_item_id,
         }
-        validated_params = CreateViewMapFolderParameters(**params_dict)
-        response_dict = self._core.post_command(
-            "API.CreateViewMapFolder", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateViewMapFolderResult.model_validate(response_dict)
+        with profiled_call("API.CreateViewMapFolder") as profile:
+            validated_params = CreateViewMapFolderParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_command("API.CreateViewMapFolder", dumped_params)
+            profile.lap()
+            validated_response = CreateViewMapFolderResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.createdFolderNavigatorItemId
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     ChangeWindowParameters,
     ChangeWindowResult,
@@ -47,11 +48,15 @@ class ApplicationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        validated_params = TypeAdapter(ChangeWindowParameters).validate_python(parameters)
-        response_dict = self._core.post_tapir_command(
-            "ChangeWindow", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(ChangeWindowResult).validate_python(response_dict)
+        with profiled_call("ChangeWindow") as profile:
+            validated_params = TypeAdapter(ChangeWindowParameters).validate_python(parameters)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ChangeWindow", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(ChangeWindowResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_add_on_version(self) -> str:
@@ -66,8 +71,11 @@ class ApplicationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetAddOnVersion")
-        validated_response = GetAddOnVersionResult.model_validate(response_dict)
+        with profiled_call("GetAddOnVersion") as profile:
+            response_dict = self._core.post_tapir_command("GetAddOnVersion")
+            profile.lap()
+            validated_response = GetAddOnVersionResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.version
 
     def get_archicad_location(self) -> str:
@@ -82,8 +90,11 @@ class ApplicationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetArchicadLocation")
-        validated_response = GetArchicadLocationResult.model_validate(response_dict)
+        with profiled_call("GetArchicadLocation") as profile:
+            response_dict = self._core.post_tapir_command("GetArchicadLocation")
+            profile.lap()
+            validated_response = GetArchicadLocationResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.archicadLocation
 
     def get_current_window_type(self) -> WindowType:
@@ -98,8 +109,11 @@ class ApplicationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetCurrentWindowType")
-        validated_response = GetCurrentWindowTypeResult.model_validate(response_dict)
+        with profiled_call("GetCurrentWindowType") as profile:
+            response_dict = self._core.post_tapir_command("GetCurrentWindowType")
+            profile.lap()
+            validated_response = GetCurrentWindowTypeResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.currentWindowType
 
     def quit_archicad(self) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -114,6 +128,9 @@ class ApplicationCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("QuitArchicad")
-        validated_response = TypeAdapter(QuitArchicadResult).validate_python(response_dict)
+        with profiled_call("QuitArchicad") as profile:
+            response_dict = self._core.post_tapir_command("QuitArchicad")
+            profile.lap()
+            validated_response = TypeAdapter(QuitArchicadResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
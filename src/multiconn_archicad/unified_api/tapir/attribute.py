@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreateBuildingMaterialsParameters,
     CreateBuildingMaterialsResult,
@@ -69,11 +70,15 @@ class AttributeCommands:
             "buildingMaterialDataArray": building_material_data_array,
             "overwriteExisting": overwrite_existing,
         }
-        validated_params = CreateBuildingMaterialsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateBuildingMaterials", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateBuildingMaterialsResult.model_validate(response_dict)
+        with profiled_call("CreateBuildingMaterials") as profile:
+            validated_params = CreateBuildingMaterialsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateBuildingMaterials", dumped_params)
+            profile.lap()
+            validated_response = CreateBuildingMaterialsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def create_composites(
@@ -100,11 +105,15 @@ class AttributeCommands:
             "compositeDataArray": composite_data_array,
             "overwriteExisting": overwrite_existing,
         }
-        validated_params = CreateCompositesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateComposites", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateCompositesResult.model_validate(response_dict)
+        with profiled_call("CreateComposites") as profile:
+            validated_params = CreateCompositesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateComposites", dumped_params)
+            profile.lap()
+            validated_response = CreateCompositesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def create_layer_combinations(
@@ -131,11 +140,15 @@ class AttributeCommands:
             "layerCombinationDataArray": layer_combination_data_array,
             "overwriteExisting": overwrite_existing,
         }
-        validated_params = CreateLayerCombinationsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateLayerCombinations", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLayerCombinationsResult.model_validate(response_dict)
+        with profiled_call("CreateLayerCombinations") as profile:
+            validated_params = CreateLayerCombinationsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateLayerCombinations", dumped_params)
+            profile.lap()
+            validated_response = CreateLayerCombinationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def create_layers(
@@ -161,11 +174,15 @@ class AttributeCommands:
             "layerDataArray": layer_data_array,
             "overwriteExisting": overwrite_existing,
         }
-        validated_params = CreateLayersParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateLayers", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLayersResult.model_validate(response_dict)
+        with profiled_call("CreateLayers") as profile:
+            validated_params = CreateLayersParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateLayers", dumped_params)
+            profile.lap()
+            validated_response = CreateLayersResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def create_surfaces(
@@ -192,11 +209,15 @@ class AttributeCommands:
             "surfaceDataArray": surface_data_array,
             "overwriteExisting": overwrite_existing,
         }
-        validated_params = CreateSurfacesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateSurfaces", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateSurfacesResult.model_validate(response_dict)
+        with profiled_call("CreateSurfaces") as profile:
+            validated_params = CreateSurfacesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateSurfaces", dumped_params)
+            profile.lap()
+            validated_response = CreateSurfacesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.attributeIds
 
     def get_attributes_by_type(self, attribute_type: AttributeType) -> AttributeHeadersWrapper | ErrorItem:
@@ -217,11 +238,15 @@ class AttributeCommands:
         params_dict = {
             "attributeType": attribute_type,
         }
-        validated_params = GetAttributesByTypeParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetAttributesByType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetAttributesByTypeResult).validate_python(response_dict)
+        with profiled_call("GetAttributesByType") as profile:
+            validated_params = GetAttributesByTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetAttributesByType", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetAttributesByTypeResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_building_material_physical_properties(
@@ -245,12 +270,15 @@ class AttributeCommands:
         params_dict = {
             "attributeIds": attribute_ids,
         }
-        validated_params = GetBuildingMaterialPhysicalPropertiesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetBuildingMaterialPhysicalProperties",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetBuildingMaterialPhysicalPropertiesResult.model_validate(response_dict)
+        with profiled_call("GetBuildingMaterialPhysicalProperties") as profile:
+            validated_params = GetBuildingMaterialPhysicalPropertiesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetBuildingMaterialPhysicalProperties", dumped_params)
+            profile.lap()
+            validated_response = GetBuildingMaterialPhysicalPropertiesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.properties
 
     def get_layer_combinations(
@@ -273,9 +301,13 @@ class AttributeCommands:
         params_dict = {
             "attributes": attributes,
         }
-        validated_params = GetLayerCombinationsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetLayerCombinations", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetLayerCombinationsResult.model_validate(response_dict)
+        with profiled_call("GetLayerCombinations") as profile:
+            validated_params = GetLayerCombinationsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetLayerCombinations", dumped_params)
+            profile.lap()
+            validated_response = GetLayerCombinationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.layerCombinations
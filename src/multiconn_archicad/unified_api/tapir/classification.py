@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreateClassificationItemsParameters,
     CreateClassificationItemsResult,
@@ -63,11 +64,15 @@ class ClassificationCommands:
         params_dict = {
             "newClassificationItems": new_classification_items,
         }
-        validated_params = CreateClassificationItemsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateClassificationItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateClassificationItemsResult.model_validate(response_dict)
+        with profiled_call("CreateClassificationItems") as profile:
+            validated_params = CreateClassificationItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateClassificationItems", dumped_params)
+            profile.lap()
+            validated_response = CreateClassificationItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def create_classification_systems(
@@ -93,11 +98,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationSystemsWithItems": classification_systems_with_items,
         }
-        validated_params = CreateClassificationSystemsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateClassificationSystems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateClassificationSystemsResult.model_validate(response_dict)
+        with profiled_call("CreateClassificationSystems") as profile:
+            validated_params = CreateClassificationSystemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateClassificationSystems", dumped_params)
+            profile.lap()
+            validated_response = CreateClassificationSystemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def delete_classification_items(
@@ -122,11 +131,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationItemIds": classification_item_ids,
         }
-        validated_params = DeleteClassificationItemsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeleteClassificationItems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeleteClassificationItemsResult.model_validate(response_dict)
+        with profiled_call("DeleteClassificationItems") as profile:
+            validated_params = DeleteClassificationItemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeleteClassificationItems", dumped_params)
+            profile.lap()
+            validated_response = DeleteClassificationItemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def delete_classification_systems(
@@ -151,11 +164,15 @@ class ClassificationCommands:
         params_dict = {
             "classificationSystemIds": classification_system_ids,
         }
-        validated_params = DeleteClassificationSystemsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeleteClassificationSystems", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeleteClassificationSystemsResult.model_validate(response_dict)
+        with profiled_call("DeleteClassificationSystems") as profile:
+            validated_params = DeleteClassificationSystemsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeleteClassificationSystems", dumped_params)
+            profile.lap()
+            validated_response = DeleteClassificationSystemsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def get_classifications_of_elements(
@@ -185,11 +202,20 @@ class ClassificationCommands:
             "elements": elements,
             "classificationSystemIds": classification_system_ids,
         }
-        validated_params = GetClassificationsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetClassificationsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetClassificationsOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetClassificationsOfElements") as profile:
+            validated_params = GetClassificationsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetClassificationsOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="elementClassifications",
+            )
+            profile.lap()
+            validated_response = GetClassificationsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementClassifications
 
     def set_classifications_of_elements(
@@ -216,9 +242,13 @@ class ClassificationCommands:
         params_dict = {
             "elementClassifications": element_classifications,
         }
-        validated_params = SetClassificationsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetClassificationsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetClassificationsOfElementsResult.model_validate(response_dict)
+        with profiled_call("SetClassificationsOfElements") as profile:
+            validated_params = SetClassificationsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetClassificationsOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetClassificationsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreateDesignOptionCombinationsParameters,
     CreateDesignOptionCombinationsResult,
@@ -75,11 +76,15 @@ class DesignOptionsCommands:
         params_dict = {
             "designOptionCombinations": design_option_combinations,
         }
-        validated_params = CreateDesignOptionCombinationsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDesignOptionCombinations", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDesignOptionCombinationsResult.model_validate(response_dict)
+        with profiled_call("CreateDesignOptionCombinations") as profile:
+            validated_params = CreateDesignOptionCombinationsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDesignOptionCombinations", dumped_params)
+            profile.lap()
+            validated_response = CreateDesignOptionCombinationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptionCombinationIdsOrErrors
 
     def create_design_option_sets(
@@ -103,11 +108,15 @@ class DesignOptionsCommands:
         params_dict = {
             "designOptionSets": design_option_sets,
         }
-        validated_params = CreateDesignOptionSetsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDesignOptionSets", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDesignOptionSetsResult.model_validate(response_dict)
+        with profiled_call("CreateDesignOptionSets") as profile:
+            validated_params = CreateDesignOptionSetsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDesignOptionSets", dumped_params)
+            profile.lap()
+            validated_response = CreateDesignOptionSetsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def create_design_options(
@@ -131,11 +140,15 @@ class DesignOptionsCommands:
         params_dict = {
             "designOptions": design_options,
         }
-        validated_params = CreateDesignOptionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDesignOptions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDesignOptionsResult.model_validate(response_dict)
+        with profiled_call("CreateDesignOptions") as profile:
+            validated_params = CreateDesignOptionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDesignOptions", dumped_params)
+            profile.lap()
+            validated_response = CreateDesignOptionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptionIdsOrErrors
 
     def get_design_option_combinations(self) -> list[DesignOptionCombinationDetails]:
@@ -150,8 +163,11 @@ class DesignOptionsCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetDesignOptionCombinations")
-        validated_response = GetDesignOptionCombinationsResult.model_validate(response_dict)
+        with profiled_call("GetDesignOptionCombinations") as profile:
+            response_dict = self._core.post_tapir_command("GetDesignOptionCombinations")
+            profile.lap()
+            validated_response = GetDesignOptionCombinationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptionCombinations
 
     def get_design_option_for_elements(self, elements: list[ElementIdArrayItem]) -> list[DesignOptionForElement]:
@@ -173,11 +189,20 @@ class DesignOptionsCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetDesignOptionForElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetDesignOptionForElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetDesignOptionForElementsResult.model_validate(response_dict)
+        with profiled_call("GetDesignOptionForElements") as profile:
+            validated_params = GetDesignOptionForElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetDesignOptionForElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="designOptionForElements",
+            )
+            profile.lap()
+            validated_response = GetDesignOptionForElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptionForElements
 
     def get_design_option_sets(self) -> list[DesignOptionSet]:
@@ -192,8 +217,11 @@ class DesignOptionsCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetDesignOptionSets")
-        validated_response = GetDesignOptionSetsResult.model_validate(response_dict)
+        with profiled_call("GetDesignOptionSets") as profile:
+            response_dict = self._core.post_tapir_command("GetDesignOptionSets")
+            profile.lap()
+            validated_response = GetDesignOptionSetsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptionSets
 
     def get_design_options(self) -> list[DesignOptionDetails]:
@@ -208,8 +236,11 @@ class DesignOptionsCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetDesignOptions")
-        validated_response = GetDesignOptionsResult.model_validate(response_dict)
+        with profiled_call("GetDesignOptions") as profile:
+            response_dict = self._core.post_tapir_command("GetDesignOptions")
+            profile.lap()
+            validated_response = GetDesignOptionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.designOptions
 
     def get_elements_of_design_options(
@@ -233,11 +264,15 @@ class DesignOptionsCommands:
         params_dict = {
             "designOptions": design_options,
         }
-        validated_params = GetElementsOfDesignOptionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetElementsOfDesignOptions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementsOfDesignOptionsResult.model_validate(response_dict)
+        with profiled_call("GetElementsOfDesignOptions") as profile:
+            validated_params = GetElementsOfDesignOptionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetElementsOfDesignOptions", dumped_params)
+            profile.lap()
+            validated_response = GetElementsOfDesignOptionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementsOfDesignOptions
 
     def move_design_options_to_another_set(
@@ -261,11 +296,15 @@ class DesignOptionsCommands:
         params_dict = {
             "designOptionAndSetPairs": design_option_and_set_pairs,
         }
-        validated_params = MoveDesignOptionsToAnotherSetParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "MoveDesignOptionsToAnotherSet", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = MoveDesignOptionsToAnotherSetResult.model_validate(response_dict)
+        with profiled_call("MoveDesignOptionsToAnotherSet") as profile:
+            validated_params = MoveDesignOptionsToAnotherSetParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("MoveDesignOptionsToAnotherSet", dumped_params)
+            profile.lap()
+            validated_response = MoveDesignOptionsToAnotherSetResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def move_elements_to_design_options(
@@ -291,11 +330,15 @@ class DesignOptionsCommands:
         params_dict = {
             "elementDesignOptionPairs": element_design_option_pairs,
         }
-        validated_params = MoveElementsToDesignOptionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "MoveElementsToDesignOptions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = MoveElementsToDesignOptionsResult.model_validate(response_dict)
+        with profiled_call("MoveElementsToDesignOptions") as profile:
+            validated_params = MoveElementsToDesignOptionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("MoveElementsToDesignOptions", dumped_params)
+            profile.lap()
+            validated_response = MoveElementsToDesignOptionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def set_active_design_options_in_combinations(
@@ -319,10 +362,13 @@ class DesignOptionsCommands:
         params_dict = {
             "activeDesignOptionsInCombinations": active_design_options_in_combinations,
         }
-        validated_params = SetActiveDesignOptionsInCombinationsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetActiveDesignOptionsInCombinations",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = SetActiveDesignOptionsInCombinationsResult.model_validate(response_dict)
+        with profiled_call("SetActiveDesignOptionsInCombinations") as profile:
+            validated_params = SetActiveDesignOptionsInCombinationsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetActiveDesignOptionsInCombinations", dumped_params)
+            profile.lap()
+            validated_response = SetActiveDesignOptionsInCombinationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     ChangeSelectionOfElementsParameters,
     ChangeSelectionOfElementsResult,
@@ -118,11 +119,15 @@ class ElementCommands:
             "addElementsToSelection": add_elements_to_selection,
             "removeElementsFromSelection": remove_elements_from_selection,
         }
-        validated_params = ChangeSelectionOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ChangeSelectionOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ChangeSelectionOfElementsResult.model_validate(response_dict)
+        with profiled_call("ChangeSelectionOfElements") as profile:
+            validated_params = ChangeSelectionOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ChangeSelectionOfElements", dumped_params)
+            profile.lap()
+            validated_response = ChangeSelectionOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def delete_elements(self, elements: list[ElementIdArrayItem]) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -143,11 +148,15 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = DeleteElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeleteElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(DeleteElementsResult).validate_python(response_dict)
+        with profiled_call("DeleteElements") as profile:
+            validated_params = DeleteElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeleteElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(DeleteElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def filter_elements(
@@ -172,11 +181,17 @@ class ElementCommands:
             "elements": elements,
             "filters": filters,
         }
-        validated_params = FilterElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "FilterElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = FilterElementsResult.model_validate(response_dict)
+        with profiled_call("FilterElements") as profile:
+            validated_params = FilterElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "FilterElements", dumped_params, chunked_parameter="elements", chunked_result="elements"
+            )
+            profile.lap()
+            validated_response = FilterElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_3d_bounding_boxes(self, elements: list[ElementIdArrayItem]) -> list[BoundingBox3DArrayItem | ErrorItem]:
@@ -199,11 +214,17 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = Get3DBoundingBoxesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "Get3DBoundingBoxes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = Get3DBoundingBoxesResult.model_validate(response_dict)
+        with profiled_call("Get3DBoundingBoxes") as profile:
+            validated_params = Get3DBoundingBoxesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "Get3DBoundingBoxes", dumped_params, chunked_parameter="elements", chunked_result="boundingBoxes3D"
+            )
+            profile.lap()
+            validated_response = Get3DBoundingBoxesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.boundingBoxes3D
 
     def get_all_elements(
@@ -229,11 +250,15 @@ class ElementCommands:
             "filters": filters,
             "databases": databases,
         }
-        validated_params = GetAllElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetAllElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetAllElementsResult).validate_python(response_dict)
+        with profiled_call("GetAllElements") as profile:
+            validated_params = GetAllElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetAllElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetAllElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_collisions(
@@ -263,11 +288,15 @@ class ElementCommands:
             "elementsGroup2": elements_group_2,
             "settings": settings,
         }
-        validated_params = GetCollisionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetCollisions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetCollisionsResult.model_validate(response_dict)
+        with profiled_call("GetCollisions") as profile:
+            validated_params = GetCollisionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetCollisions", dumped_params)
+            profile.lap()
+            validated_response = GetCollisionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.collisions
 
     def get_connected_elements(
@@ -292,11 +321,15 @@ class ElementCommands:
             "elements": elements,
             "connectedElementType": connected_element_type,
         }
-        validated_params = GetConnectedElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetConnectedElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetConnectedElementsResult).validate_python(response_dict)
+        with profiled_call("GetConnectedElements") as profile:
+            validated_params = GetConnectedElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetConnectedElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetConnectedElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_details_of_elements(self, elements: list[ElementIdArrayItem]) -> list[DetailsOfElement]:
@@ -317,11 +350,17 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetDetailsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetDetailsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetDetailsOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetDetailsOfElements") as profile:
+            validated_params = GetDetailsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetDetailsOfElements", dumped_params, chunked_parameter="elements", chunked_result="detailsOfElements"
+            )
+            profile.lap()
+            validated_response = GetDetailsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.detailsOfElements
 
     def get_dimension_data(self, elements: list[Element]) -> list[DimensionData | ErrorItem]:
@@ -342,11 +381,17 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetDimensionDataParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetDimensionData", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetDimensionDataResult.model_validate(response_dict)
+        with profiled_call("GetDimensionData") as profile:
+            validated_params = GetDimensionDataParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetDimensionData", dumped_params, chunked_parameter="elements", chunked_result="dimensionsData"
+            )
+            profile.lap()
+            validated_response = GetDimensionDataResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.dimensionsData
 
     def get_element_preview_image(
@@ -382,11 +427,15 @@ class ElementCommands:
             "width": width,
             "height": height,
         }
-        validated_params = GetElementPreviewImageParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetElementPreviewImage", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementPreviewImageResult.model_validate(response_dict)
+        with profiled_call("GetElementPreviewImage") as profile:
+            validated_params = GetElementPreviewImageParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetElementPreviewImage", dumped_params)
+            profile.lap()
+            validated_response = GetElementPreviewImageResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.previewImage
 
     def get_elements_by_type(
@@ -417,11 +466,15 @@ class ElementCommands:
             "filters": filters,
             "databases": databases,
         }
-        validated_params = GetElementsByTypeParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetElementsByType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetElementsByTypeResult).validate_python(response_dict)
+        with profiled_call("GetElementsByType") as profile:
+            validated_params = GetElementsByTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetElementsByType", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetElementsByTypeResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_gdl_parameters_of_elements(self, elements: list[ElementIdArrayItem]) -> list[GDLParameterList]:
@@ -442,11 +495,20 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetGDLParametersOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetGDLParametersOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetGDLParametersOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetGDLParametersOfElements") as profile:
+            validated_params = GetGDLParametersOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetGDLParametersOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="gdlParametersOfElements",
+            )
+            profile.lap()
+            validated_response = GetGDLParametersOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.gdlParametersOfElements
 
     def get_room_image(
@@ -490,11 +552,15 @@ class ElementCommands:
             "scale": scale,
             "backgroundColor": background_color,
         }
-        validated_params = GetRoomImageParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetRoomImage", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetRoomImageResult.model_validate(response_dict)
+        with profiled_call("GetRoomImage") as profile:
+            validated_params = GetRoomImageParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetRoomImage", dumped_params)
+            profile.lap()
+            validated_response = GetRoomImageResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.roomImage
 
     def get_selected_elements(self) -> list[ElementIdArrayItem]:
@@ -509,8 +575,11 @@ class ElementCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetSelectedElements")
-        validated_response = GetSelectedElementsResult.model_validate(response_dict)
+        with profiled_call("GetSelectedElements") as profile:
+            response_dict = self._core.post_tapir_command("GetSelectedElements")
+            profile.lap()
+            validated_response = GetSelectedElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_subelements_of_hierarchical_elements(self, elements: list[ElementIdArrayItem]) -> list[Subelement]:
@@ -531,12 +600,20 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetSubelementsOfHierarchicalElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetSubelementsOfHierarchicalElements",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetSubelementsOfHierarchicalElementsResult.model_validate(response_dict)
+        with profiled_call("GetSubelementsOfHierarchicalElements") as profile:
+            validated_params = GetSubelementsOfHierarchicalElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetSubelementsOfHierarchicalElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="subelements",
+            )
+            profile.lap()
+            validated_response = GetSubelementsOfHierarchicalElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.subelements
 
     def get_zone_boundaries(self, zone_element_id: ElementId) -> ErrorItem | ZoneBoundariesWrapper:
@@ -557,11 +634,15 @@ class ElementCommands:
         params_dict = {
             "zoneElementId": zone_element_id,
         }
-        validated_params = GetZoneBoundariesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetZoneBoundaries", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetZoneBoundariesResult).validate_python(response_dict)
+        with profiled_call("GetZoneBoundaries") as profile:
+            validated_params = GetZoneBoundariesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetZoneBoundaries", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetZoneBoundariesResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def highlight_elements(
@@ -598,11 +679,15 @@ class ElementCommands:
             "wireframe3D": wireframe_3d,
             "nonHighlightedColor": non_highlighted_color,
         }
-        validated_params = HighlightElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "HighlightElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(HighlightElementsResult).validate_python(response_dict)
+        with profiled_call("HighlightElements") as profile:
+            validated_params = HighlightElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("HighlightElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(HighlightElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def lock_elements(self, elements: list[ElementIdArrayItem]) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -623,11 +708,15 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = LockElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "LockElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(LockElementsResult).validate_python(response_dict)
+        with profiled_call("LockElements") as profile:
+            validated_params = LockElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("LockElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(LockElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def move_elements(
@@ -652,11 +741,15 @@ class ElementCommands:
         params_dict = {
             "elementsWithMoveVectors": elements_with_move_vectors,
         }
-        validated_params = MoveElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "MoveElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = MoveElementsResult.model_validate(response_dict)
+        with profiled_call("MoveElements") as profile:
+            validated_params = MoveElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("MoveElements", dumped_params)
+            profile.lap()
+            validated_response = MoveElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def remove_element_notification_client(
@@ -682,12 +775,15 @@ class ElementCommands:
             "host": host,
             "port": port,
         }
-        validated_params = RemoveElementNotificationClientParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "RemoveElementNotificationClient",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = TypeAdapter(RemoveElementNotificationClientResult).validate_python(response_dict)
+        with profiled_call("RemoveElementNotificationClient") as profile:
+            validated_params = RemoveElementNotificationClientParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("RemoveElementNotificationClient", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(RemoveElementNotificationClientResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def rotate_elements(
@@ -712,11 +808,15 @@ class ElementCommands:
         params_dict = {
             "elementsWithRotations": elements_with_rotations,
         }
-        validated_params = RotateElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "RotateElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = RotateElementsResult.model_validate(response_dict)
+        with profiled_call("RotateElements") as profile:
+            validated_params = RotateElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("RotateElements", dumped_params)
+            profile.lap()
+            validated_response = RotateElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def set_details_of_elements(
@@ -740,11 +840,15 @@ class ElementCommands:
         params_dict = {
             "elementsWithDetails": elements_with_details,
         }
-        validated_params = SetDetailsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetDetailsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetDetailsOfElementsResult.model_validate(response_dict)
+        with profiled_call("SetDetailsOfElements") as profile:
+            validated_params = SetDetailsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetDetailsOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetDetailsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def set_element_notification_client(
@@ -784,11 +888,15 @@ class ElementCommands:
             "notifyOnModificationOfAnElement": notify_on_modification_of_an_element,
             "notifyOnReservationChanges": notify_on_reservation_changes,
         }
-        validated_params = SetElementNotificationClientParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetElementNotificationClient", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(SetElementNotificationClientResult).validate_python(response_dict)
+        with profiled_call("SetElementNotificationClient") as profile:
+            validated_params = SetElementNotificationClientParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetElementNotificationClient", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(SetElementNotificationClientResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def set_gdl_parameters_of_elements(
@@ -813,11 +921,15 @@ class ElementCommands:
         params_dict = {
             "elementsWithGDLParameters": elements_with_gdl_parameters,
         }
-        validated_params = SetGDLParametersOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetGDLParametersOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetGDLParametersOfElementsResult.model_validate(response_dict)
+        with profiled_call("SetGDLParametersOfElements") as profile:
+            validated_params = SetGDLParametersOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetGDLParametersOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetGDLParametersOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def unlock_elements(self, elements: list[ElementIdArrayItem]) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -838,9 +950,13 @@ class ElementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = UnlockElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "UnlockElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(UnlockElementsResult).validate_python(response_dict)
+        with profiled_call("UnlockElements") as profile:
+            validated_params = UnlockElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("UnlockElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(UnlockElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreateAssociativeDimensionsOnSectionParameters,
     CreateAssociativeDimensionsOnSectionResult,
@@ -99,11 +100,15 @@ class ElementCreationCommands:
         params_dict = {
             "dimensionsData": dimensions_data,
         }
-        validated_params = CreateAssociativeDimensionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateAssociativeDimensions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateAssociativeDimensionsResult.model_validate(response_dict)
+        with profiled_call("CreateAssociativeDimensions") as profile:
+            validated_params = CreateAssociativeDimensionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateAssociativeDimensions", dumped_params)
+            profile.lap()
+            validated_response = CreateAssociativeDimensionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_associative_dimensions_on_section(
@@ -127,12 +132,15 @@ class ElementCreationCommands:
         params_dict = {
             "dimensionsData": dimensions_data,
         }
-        validated_params = CreateAssociativeDimensionsOnSectionParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateAssociativeDimensionsOnSection",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = CreateAssociativeDimensionsOnSectionResult.model_validate(response_dict)
+        with profiled_call("CreateAssociativeDimensionsOnSection") as profile:
+            validated_params = CreateAssociativeDimensionsOnSectionParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateAssociativeDimensionsOnSection", dumped_params)
+            profile.lap()
+            validated_response = CreateAssociativeDimensionsOnSectionResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_beams(self, beams_data: list[BeamData]) -> list[ElementIdArrayItem]:
@@ -153,11 +161,15 @@ class ElementCreationCommands:
         params_dict = {
             "beamsData": beams_data,
         }
-        validated_params = CreateBeamsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateBeams", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateBeamsResult.model_validate(response_dict)
+        with profiled_call("CreateBeams") as profile:
+            validated_params = CreateBeamsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateBeams", dumped_params)
+            profile.lap()
+            validated_response = CreateBeamsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_columns(self, columns_data: list[ColumnData]) -> list[ElementIdArrayItem]:
@@ -178,11 +190,15 @@ class ElementCreationCommands:
         params_dict = {
             "columnsData": columns_data,
         }
-        validated_params = CreateColumnsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateColumns", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateColumnsResult.model_validate(response_dict)
+        with profiled_call("CreateColumns") as profile:
+            validated_params = CreateColumnsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateColumns", dumped_params)
+            profile.lap()
+            validated_response = CreateColumnsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_doors(self, doors_data: list[DoorData]) -> list[ElementIdArrayItem]:
@@ -203,11 +219,15 @@ class ElementCreationCommands:
         params_dict = {
             "doorsData": doors_data,
         }
-        validated_params = CreateDoorsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDoors", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDoorsResult.model_validate(response_dict)
+        with profiled_call("CreateDoors") as profile:
+            validated_params = CreateDoorsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDoors", dumped_params)
+            profile.lap()
+            validated_response = CreateDoorsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_labels(self, labels_data: list[LabelData]) -> list[ElementIdArrayItem]:
@@ -228,11 +248,15 @@ class ElementCreationCommands:
         params_dict = {
             "labelsData": labels_data,
         }
-        validated_params = CreateLabelsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateLabels", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLabelsResult.model_validate(response_dict)
+        with profiled_call("CreateLabels") as profile:
+            validated_params = CreateLabelsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateLabels", dumped_params)
+            profile.lap()
+            validated_response = CreateLabelsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_lamps(self, lamps_data: list[LampData]) -> list[ElementIdArrayItem]:
@@ -253,11 +277,15 @@ class ElementCreationCommands:
         params_dict = {
             "lampsData": lamps_data,
         }
-        validated_params = CreateLampsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateLamps", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLampsResult.model_validate(response_dict)
+        with profiled_call("CreateLamps") as profile:
+            validated_params = CreateLampsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateLamps", dumped_params)
+            profile.lap()
+            validated_response = CreateLampsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_meshes(self, meshes_data: list[MeshData]) -> list[ElementIdArrayItem]:
@@ -278,11 +306,15 @@ class ElementCreationCommands:
         params_dict = {
             "meshesData": meshes_data,
         }
-        validated_params = CreateMeshesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateMeshes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateMeshesResult.model_validate(response_dict)
+        with profiled_call("CreateMeshes") as profile:
+            validated_params = CreateMeshesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateMeshes", dumped_params)
+            profile.lap()
+            validated_response = CreateMeshesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_morphs(self, morphs_data: list[MorphData]) -> list[ElementIdArrayItem]:
@@ -303,11 +335,15 @@ class ElementCreationCommands:
         params_dict = {
             "morphsData": morphs_data,
         }
-        validated_params = CreateMorphsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateMorphs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateMorphsResult.model_validate(response_dict)
+        with profiled_call("CreateMorphs") as profile:
+            validated_params = CreateMorphsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateMorphs", dumped_params)
+            profile.lap()
+            validated_response = CreateMorphsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_objects(self, objects_data: list[ObjectData]) -> list[ElementIdArrayItem]:
@@ -328,11 +364,15 @@ class ElementCreationCommands:
         params_dict = {
             "objectsData": objects_data,
         }
-        validated_params = CreateObjectsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateObjects", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateObjectsResult.model_validate(response_dict)
+        with profiled_call("CreateObjects") as profile:
+            validated_params = CreateObjectsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateObjects", dumped_params)
+            profile.lap()
+            validated_response = CreateObjectsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_openings(self, openings_data: list[OpeningData]) -> list[ElementIdArrayItem]:
@@ -353,11 +393,15 @@ class ElementCreationCommands:
         params_dict = {
             "openingsData": openings_data,
         }
-        validated_params = CreateOpeningsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateOpenings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateOpeningsResult.model_validate(response_dict)
+        with profiled_call("CreateOpenings") as profile:
+            validated_params = CreateOpeningsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateOpenings", dumped_params)
+            profile.lap()
+            validated_response = CreateOpeningsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_polylines(self, polylines_data: list[PolylineData]) -> list[ElementIdArrayItem]:
@@ -378,11 +422,15 @@ class ElementCreationCommands:
         params_dict = {
             "polylinesData": polylines_data,
         }
-        validated_params = CreatePolylinesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreatePolylines", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreatePolylinesResult.model_validate(response_dict)
+        with profiled_call("CreatePolylines") as profile:
+            validated_params = CreatePolylinesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreatePolylines", dumped_params)
+            profile.lap()
+            validated_response = CreatePolylinesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_roofs(self, roofs_data: list[RoofData]) -> list[ElementIdArrayItem]:
@@ -403,11 +451,15 @@ class ElementCreationCommands:
         params_dict = {
             "roofsData": roofs_data,
         }
-        validated_params = CreateRoofsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateRoofs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateRoofsResult.model_validate(response_dict)
+        with profiled_call("CreateRoofs") as profile:
+            validated_params = CreateRoofsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateRoofs", dumped_params)
+            profile.lap()
+            validated_response = CreateRoofsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_slabs(self, slabs_data: list[SlabData]) -> list[ElementIdArrayItem]:
@@ -428,11 +480,15 @@ class ElementCreationCommands:
         params_dict = {
             "slabsData": slabs_data,
         }
-        validated_params = CreateSlabsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateSlabs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateSlabsResult.model_validate(response_dict)
+        with profiled_call("CreateSlabs") as profile:
+            validated_params = CreateSlabsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateSlabs", dumped_params)
+            profile.lap()
+            validated_response = CreateSlabsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_stairs(self, stairs_data: list[SectionData]) -> list[ElementIdArrayItem]:
@@ -453,11 +509,15 @@ class ElementCreationCommands:
         params_dict = {
             "stairsData": stairs_data,
         }
-        validated_params = CreateStairsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateStairs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateStairsResult.model_validate(response_dict)
+        with profiled_call("CreateStairs") as profile:
+            validated_params = CreateStairsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateStairs", dumped_params)
+            profile.lap()
+            validated_response = CreateStairsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_texts(self, texts_data: list[TextData]) -> list[ElementIdArrayItem]:
@@ -478,11 +538,15 @@ class ElementCreationCommands:
         params_dict = {
             "textsData": texts_data,
         }
-        validated_params = CreateTextsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateTexts", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateTextsResult.model_validate(response_dict)
+        with profiled_call("CreateTexts") as profile:
+            validated_params = CreateTextsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateTexts", dumped_params)
+            profile.lap()
+            validated_response = CreateTextsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_wall_thickness_dimensions(
@@ -505,11 +569,15 @@ class ElementCreationCommands:
         params_dict = {
             "dimensionsData": dimensions_data,
         }
-        validated_params = CreateWallThicknessDimensionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateWallThicknessDimensions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateWallThicknessDimensionsResult.model_validate(response_dict)
+        with profiled_call("CreateWallThicknessDimensions") as profile:
+            validated_params = CreateWallThicknessDimensionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateWallThicknessDimensions", dumped_params)
+            profile.lap()
+            validated_response = CreateWallThicknessDimensionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_walls(self, walls_data: list[WallData]) -> list[ElementIdArrayItem]:
@@ -530,11 +598,15 @@ class ElementCreationCommands:
         params_dict = {
             "wallsData": walls_data,
         }
-        validated_params = CreateWallsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateWalls", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateWallsResult.model_validate(response_dict)
+        with profiled_call("CreateWalls") as profile:
+            validated_params = CreateWallsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateWalls", dumped_params)
+            profile.lap()
+            validated_response = CreateWallsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_windows(self, windows_data: list[WindowData]) -> list[ElementIdArrayItem]:
@@ -555,11 +627,15 @@ class ElementCreationCommands:
         params_dict = {
             "windowsData": windows_data,
         }
-        validated_params = CreateWindowsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateWindows", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateWindowsResult.model_validate(response_dict)
+        with profiled_call("CreateWindows") as profile:
+            validated_params = CreateWindowsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateWindows", dumped_params)
+            profile.lap()
+            validated_response = CreateWindowsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_zones(self, zones_data: list[ZoneData]) -> list[ElementIdArrayItem]:
@@ -580,9 +656,13 @@ class ElementCreationCommands:
         params_dict = {
             "zonesData": zones_data,
         }
-        validated_params = CreateZonesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateZones", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateZonesResult.model_validate(response_dict)
+        with profiled_call("CreateZones") as profile:
+            validated_params = CreateZonesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateZones", dumped_params)
+            profile.lap()
+            validated_response = CreateZonesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
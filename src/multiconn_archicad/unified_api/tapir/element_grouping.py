@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import CreateGroupsParameters, CreateGroupsResult
 from multiconn_archicad.models.tapir.types import ElementGroupParameters, ErrorItem, GroupIdArrayItem
 
@@ -34,9 +35,13 @@ class ElementGroupingCommands:
         params_dict = {
             "elementGroups": element_groups,
         }
-        validated_params = CreateGroupsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateGroups", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateGroupsResult.model_validate(response_dict)
+        with profiled_call("CreateGroups") as profile:
+            validated_params = CreateGroupsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateGroups", dumped_params)
+            profile.lap()
+            validated_response = CreateGroupsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.groupGuids
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     ModifyBeamsParameters,
     ModifyBeamsResult,
@@ -65,11 +66,15 @@ class ElementModificationCommands:
         params_dict = {
             "beamsWithDetails": beams_with_details,
         }
-        validated_params = ModifyBeamsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyBeams", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyBeamsResult.model_validate(response_dict)
+        with profiled_call("ModifyBeams") as profile:
+            validated_params = ModifyBeamsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyBeams", dumped_params)
+            profile.lap()
+            validated_response = ModifyBeamsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_columns(
@@ -93,11 +98,15 @@ class ElementModificationCommands:
         params_dict = {
             "columnsWithDetails": columns_with_details,
         }
-        validated_params = ModifyColumnsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyColumns", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyColumnsResult.model_validate(response_dict)
+        with profiled_call("ModifyColumns") as profile:
+            validated_params = ModifyColumnsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyColumns", dumped_params)
+            profile.lap()
+            validated_response = ModifyColumnsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_doors(
@@ -121,11 +130,15 @@ class ElementModificationCommands:
         params_dict = {
             "doorsWithDetails": doors_with_details,
         }
-        validated_params = ModifyDoorsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyDoors", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyDoorsResult.model_validate(response_dict)
+        with profiled_call("ModifyDoors") as profile:
+            validated_params = ModifyDoorsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyDoors", dumped_params)
+            profile.lap()
+            validated_response = ModifyDoorsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_morphs(
@@ -149,11 +162,15 @@ class ElementModificationCommands:
         params_dict = {
             "morphsWithDetails": morphs_with_details,
         }
-        validated_params = ModifyMorphsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyMorphs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyMorphsResult.model_validate(response_dict)
+        with profiled_call("ModifyMorphs") as profile:
+            validated_params = ModifyMorphsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyMorphs", dumped_params)
+            profile.lap()
+            validated_response = ModifyMorphsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_roofs(
@@ -177,11 +194,15 @@ class ElementModificationCommands:
         params_dict = {
             "roofsWithDetails": roofs_with_details,
         }
-        validated_params = ModifyRoofsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyRoofs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyRoofsResult.model_validate(response_dict)
+        with profiled_call("ModifyRoofs") as profile:
+            validated_params = ModifyRoofsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyRoofs", dumped_params)
+            profile.lap()
+            validated_response = ModifyRoofsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_slabs(
@@ -205,11 +226,15 @@ class ElementModificationCommands:
         params_dict = {
             "slabsWithDetails": slabs_with_details,
         }
-        validated_params = ModifySlabsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifySlabs", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifySlabsResult.model_validate(response_dict)
+        with profiled_call("ModifySlabs") as profile:
+            validated_params = ModifySlabsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifySlabs", dumped_params)
+            profile.lap()
+            validated_response = ModifySlabsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_walls(
@@ -233,11 +258,15 @@ class ElementModificationCommands:
         params_dict = {
             "wallsWithDetails": walls_with_details,
         }
-        validated_params = ModifyWallsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyWalls", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyWallsResult.model_validate(response_dict)
+        with profiled_call("ModifyWalls") as profile:
+            validated_params = ModifyWallsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyWalls", dumped_params)
+            profile.lap()
+            validated_response = ModifyWallsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def modify_windows(
@@ -261,9 +290,13 @@ class ElementModificationCommands:
         params_dict = {
             "windowsWithDetails": windows_with_details,
         }
-        validated_params = ModifyWindowsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ModifyWindows", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ModifyWindowsResult.model_validate(response_dict)
+        with profiled_call("ModifyWindows") as profile:
+            validated_params = ModifyWindowsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ModifyWindows", dumped_params)
+            profile.lap()
+            validated_response = ModifyWindowsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
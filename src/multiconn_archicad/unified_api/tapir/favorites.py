@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     ApplyFavoritesToElementDefaultsParameters,
     ApplyFavoritesToElementDefaultsResult,
@@ -59,12 +60,15 @@ class FavoritesCommands:
         params_dict = {
             "favorites": favorites,
         }
-        validated_params = ApplyFavoritesToElementDefaultsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ApplyFavoritesToElementDefaults",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = ApplyFavoritesToElementDefaultsResult.model_validate(response_dict)
+        with profiled_call("ApplyFavoritesToElementDefaults") as profile:
+            validated_params = ApplyFavoritesToElementDefaultsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ApplyFavoritesToElementDefaults", dumped_params)
+            profile.lap()
+            validated_response = ApplyFavoritesToElementDefaultsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def create_favorites_from_elements(
@@ -88,11 +92,15 @@ class FavoritesCommands:
         params_dict = {
             "favoritesFromElements": favorites_from_elements,
         }
-        validated_params = CreateFavoritesFromElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateFavoritesFromElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateFavoritesFromElementsResult.model_validate(response_dict)
+        with profiled_call("CreateFavoritesFromElements") as profile:
+            validated_params = CreateFavoritesFromElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateFavoritesFromElements", dumped_params)
+            profile.lap()
+            validated_response = CreateFavoritesFromElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def export_favorites(self, path: str, names: None | list[str] = None) -> None:
@@ -114,10 +122,12 @@ class FavoritesCommands:
             "path": path,
             "names": names,
         }
-        validated_params = ExportFavoritesParameters(**params_dict)
-        self._core.post_tapir_command(
-            "ExportFavorites", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("ExportFavorites") as profile:
+            validated_params = ExportFavoritesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_tapir_command("ExportFavorites", dumped_params)
         return None
 
     def get_favorite_preview_image(
@@ -153,11 +163,15 @@ class FavoritesCommands:
             "width": width,
             "height": height,
         }
-        validated_params = GetFavoritePreviewImageParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetFavoritePreviewImage", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetFavoritePreviewImageResult.model_validate(response_dict)
+        with profiled_call("GetFavoritePreviewImage") as profile:
+            validated_params = GetFavoritePreviewImageParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetFavoritePreviewImage", dumped_params)
+            profile.lap()
+            validated_response = GetFavoritePreviewImageResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.previewImage
 
     def get_favorites_by_type(self, element_type: ElementType) -> ErrorItem | FavoritesWrapper:
@@ -178,11 +192,15 @@ class FavoritesCommands:
         params_dict = {
             "elementType": element_type,
         }
-        validated_params = GetFavoritesByTypeParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetFavoritesByType", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(GetFavoritesByTypeResult).validate_python(response_dict)
+        with profiled_call("GetFavoritesByType") as profile:
+            validated_params = GetFavoritesByTypeParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetFavoritesByType", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(GetFavoritesByTypeResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def import_favorites(
@@ -218,9 +236,13 @@ class FavoritesCommands:
             "importFolders": import_folders,
             "conflictPolicy": conflict_policy,
         }
-        validated_params = ImportFavoritesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ImportFavorites", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ImportFavoritesResult.model_validate(response_dict)
+        with profiled_call("ImportFavorites") as profile:
+            validated_params = ImportFavoritesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ImportFavorites", dumped_params)
+            profile.lap()
+            validated_response = ImportFavoritesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.firstConflictName
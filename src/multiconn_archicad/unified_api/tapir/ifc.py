@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     GetElementsByIFCIdsParameters,
     GetElementsByIFCIdsResult,
@@ -58,11 +59,15 @@ class IfcCommands:
         params_dict = {
             "ifcIds": ifc_ids,
         }
-        validated_params = GetElementsByIFCIdsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetElementsByIFCIds", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementsByIFCIdsResult.model_validate(response_dict)
+        with profiled_call("GetElementsByIFCIds") as profile:
+            validated_params = GetElementsByIFCIdsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetElementsByIFCIds", dumped_params)
+            profile.lap()
+            validated_response = GetElementsByIFCIdsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementsByIFCIds
 
     def get_ifc_ids_of_elements(self, elements: list[ElementIdArrayItem]) -> list[ElementIFCIds | ErrorItem]:
@@ -84,11 +89,17 @@ class IfcCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetIFCIdsOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetIFCIdsOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetIFCIdsOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetIFCIdsOfElements") as profile:
+            validated_params = GetIFCIdsOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetIFCIdsOfElements", dumped_params, chunked_parameter="elements", chunked_result="elementIFCIds"
+            )
+            profile.lap()
+            validated_response = GetIFCIdsOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementIFCIds
 
     def get_ifc_properties_of_elements(
@@ -112,11 +123,20 @@ class IfcCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetIFCPropertiesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetIFCPropertiesOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetIFCPropertiesOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetIFCPropertiesOfElements") as profile:
+            validated_params = GetIFCPropertiesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetIFCPropertiesOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="elementIFCProperties",
+            )
+            profile.lap()
+            validated_response = GetIFCPropertiesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementIFCProperties
 
     def get_ifc_type_of_elements(self, elements: list[ElementIdArrayItem]) -> list[ElementIFCType | ErrorItem]:
@@ -137,11 +157,17 @@ class IfcCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetIFCTypeOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetIFCTypeOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetIFCTypeOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetIFCTypeOfElements") as profile:
+            validated_params = GetIFCTypeOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetIFCTypeOfElements", dumped_params, chunked_parameter="elements", chunked_result="elementIFCTypes"
+            )
+            profile.lap()
+            validated_response = GetIFCTypeOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elementIFCTypes
 
     def ifc_file_operation(
@@ -168,9 +194,13 @@ class IfcCommands:
             "ifcFilePath": ifc_file_path,
             "fileType": file_type,
         }
-        validated_params = IFCFileOperationParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "IFCFileOperation", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(IFCFileOperationResult).validate_python(response_dict)
+        with profiled_call("IFCFileOperation") as profile:
+            validated_params = IFCFileOperationParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("IFCFileOperation", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(IFCFileOperationResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     AddCommentToIssueParameters,
     AddCommentToIssueResult,
@@ -72,11 +73,15 @@ class IssueManagementCommands:
             "status": status,
             "text": text,
         }
-        validated_params = AddCommentToIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "AddCommentToIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(AddCommentToIssueResult).validate_python(response_dict)
+        with profiled_call("AddCommentToIssue") as profile:
+            validated_params = AddCommentToIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("AddCommentToIssue", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(AddCommentToIssueResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def attach_elements_to_issue(
@@ -103,11 +108,15 @@ class IssueManagementCommands:
             "elements": elements,
             "type": type,
         }
-        validated_params = AttachElementsToIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "AttachElementsToIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(AttachElementsToIssueResult).validate_python(response_dict)
+        with profiled_call("AttachElementsToIssue") as profile:
+            validated_params = AttachElementsToIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("AttachElementsToIssue", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(AttachElementsToIssueResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def create_issue(self, name: str, parent_issue_id: IssueId | None = None, tag_text: None | str = None) -> IssueId:
@@ -132,11 +141,15 @@ class IssueManagementCommands:
             "parentIssueId": parent_issue_id,
             "tagText": tag_text,
         }
-        validated_params = CreateIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateIssueResult.model_validate(response_dict)
+        with profiled_call("CreateIssue") as profile:
+            validated_params = CreateIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateIssue", dumped_params)
+            profile.lap()
+            validated_response = CreateIssueResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.issueId
 
     def delete_issue(
@@ -162,11 +175,15 @@ class IssueManagementCommands:
             "issueId": issue_id,
             "acceptAllElements": accept_all_elements,
         }
-        validated_params = DeleteIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeleteIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(DeleteIssueResult).validate_python(response_dict)
+        with profiled_call("DeleteIssue") as profile:
+            validated_params = DeleteIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeleteIssue", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(DeleteIssueResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def detach_elements_from_issue(
@@ -191,11 +208,15 @@ class IssueManagementCommands:
             "issueId": issue_id,
             "elements": elements,
         }
-        validated_params = DetachElementsFromIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DetachElementsFromIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(DetachElementsFromIssueResult).validate_python(response_dict)
+        with profiled_call("DetachElementsFromIssue") as profile:
+            validated_params = DetachElementsFromIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DetachElementsFromIssue", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(DetachElementsFromIssueResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def export_issues_to_bcf(
@@ -230,11 +251,15 @@ class IssueManagementCommands:
             "useExternalId": use_external_id,
             "alignBySurveyPoint": align_by_survey_point,
         }
-        validated_params = ExportIssuesToBCFParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ExportIssuesToBCF", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(ExportIssuesToBCFResult).validate_python(response_dict)
+        with profiled_call("ExportIssuesToBCF") as profile:
+            validated_params = ExportIssuesToBCFParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ExportIssuesToBCF", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(ExportIssuesToBCFResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_comments_from_issue(self, issue_id: IssueId) -> list[Comment]:
@@ -255,11 +280,15 @@ class IssueManagementCommands:
         params_dict = {
             "issueId": issue_id,
         }
-        validated_params = GetCommentsFromIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetCommentsFromIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetCommentsFromIssueResult.model_validate(response_dict)
+        with profiled_call("GetCommentsFromIssue") as profile:
+            validated_params = GetCommentsFromIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetCommentsFromIssue", dumped_params)
+            profile.lap()
+            validated_response = GetCommentsFromIssueResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.comments
 
     def get_elements_attached_to_issue(self, issue_id: IssueId, type: IssueElementType) -> list[ElementIdArrayItem]:
@@ -282,11 +311,15 @@ class IssueManagementCommands:
             "issueId": issue_id,
             "type": type,
         }
-        validated_params = GetElementsAttachedToIssueParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetElementsAttachedToIssue", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetElementsAttachedToIssueResult.model_validate(response_dict)
+        with profiled_call("GetElementsAttachedToIssue") as profile:
+            validated_params = GetElementsAttachedToIssueParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetElementsAttachedToIssue", dumped_params)
+            profile.lap()
+            validated_response = GetElementsAttachedToIssueResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def get_issues(self) -> list[Issue]:
@@ -301,8 +334,11 @@ class IssueManagementCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetIssues")
-        validated_response = GetIssuesResult.model_validate(response_dict)
+        with profiled_call("GetIssues") as profile:
+            response_dict = self._core.post_tapir_command("GetIssues")
+            profile.lap()
+            validated_response = GetIssuesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.issues
 
     def import_issues_from_bcf(
@@ -328,9 +364,13 @@ class IssueManagementCommands:
             "importPath": import_path,
             "alignBySurveyPoint": align_by_survey_point,
         }
-        validated_params = ImportIssuesFromBCFParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ImportIssuesFromBCF", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(ImportIssuesFromBCFResult).validate_python(response_dict)
+        with profiled_call("ImportIssuesFromBCF") as profile:
+            validated_params = ImportIssuesFromBCFParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ImportIssuesFromBCF", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(ImportIssuesFromBCFResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
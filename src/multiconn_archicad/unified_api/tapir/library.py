@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     AddFilesToEmbeddedLibraryParameters,
     AddFilesToEmbeddedLibraryResult,
@@ -51,11 +52,15 @@ class LibraryCommands:
         params_dict = {
             "files": files,
         }
-        validated_params = AddFilesToEmbeddedLibraryParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "AddFilesToEmbeddedLibrary", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = AddFilesToEmbeddedLibraryResult.model_validate(response_dict)
+        with profiled_call("AddFilesToEmbeddedLibrary") as profile:
+            validated_params = AddFilesToEmbeddedLibraryParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("AddFilesToEmbeddedLibrary", dumped_params)
+            profile.lap()
+            validated_response = AddFilesToEmbeddedLibraryResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def get_available_library_parts(
@@ -80,11 +85,15 @@ class LibraryCommands:
         params_dict = {
             "filterByTypeId": filter_by_type_id,
         }
-        validated_params = GetAvailableLibraryPartsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetAvailableLibraryParts", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetAvailableLibraryPartsResult.model_validate(response_dict)
+        with profiled_call("GetAvailableLibraryParts") as profile:
+            validated_params = GetAvailableLibraryPartsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetAvailableLibraryParts", dumped_params)
+            profile.lap()
+            validated_response = GetAvailableLibraryPartsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_libraries(self) -> list[Library]:
@@ -99,8 +108,11 @@ class LibraryCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetLibraries")
-        validated_response = GetLibrariesResult.model_validate(response_dict)
+        with profiled_call("GetLibraries") as profile:
+            response_dict = self._core.post_tapir_command("GetLibraries")
+            profile.lap()
+            validated_response = GetLibrariesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.libraries
 
     def reload_libraries(self) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -115,6 +127,9 @@ class LibraryCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("ReloadLibraries")
-        validated_response = TypeAdapter(ReloadLibrariesResult).validate_python(response_dict)
+        with profiled_call("ReloadLibraries") as profile:
+            response_dict = self._core.post_tapir_command("ReloadLibraries")
+            profile.lap()
+            validated_response = TypeAdapter(ReloadLibrariesResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreateDetailsParameters,
     CreateDetailsResult,
@@ -81,11 +82,15 @@ class NavigatorCommands:
         params_dict = {
             "detailsData": details_data,
         }
-        validated_params = CreateDetailsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDetails", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDetailsResult.model_validate(response_dict)
+        with profiled_call("CreateDetails") as profile:
+            validated_params = CreateDetailsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDetails", dumped_params)
+            profile.lap()
+            validated_response = CreateDetailsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.databases
 
     def create_drawings(self, drawings_data: list[DrawingData]) -> list[ElementIdArrayItem]:
@@ -106,11 +111,15 @@ class NavigatorCommands:
         params_dict = {
             "drawingsData": drawings_data,
         }
-        validated_params = CreateDrawingsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateDrawings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateDrawingsResult.model_validate(response_dict)
+        with profiled_call("CreateDrawings") as profile:
+            validated_params = CreateDrawingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateDrawings", dumped_params)
+            profile.lap()
+            validated_response = CreateDrawingsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_layouts(self, layouts_data: list[LayoutData]) -> list[DatabaseIdArrayItem]:
@@ -131,11 +140,15 @@ class NavigatorCommands:
         params_dict = {
             "layoutsData": layouts_data,
         }
-        validated_params = CreateLayoutsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateLayouts", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateLayoutsResult.model_validate(response_dict)
+        with profiled_call("CreateLayouts") as profile:
+            validated_params = CreateLayoutsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateLayouts", dumped_params)
+            profile.lap()
+            validated_response = CreateLayoutsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.databases
 
     def create_sections(self, sections_data: list[SectionData]) -> list[ElementIdArrayItem]:
@@ -156,11 +169,15 @@ class NavigatorCommands:
         params_dict = {
             "sectionsData": sections_data,
         }
-        validated_params = CreateSectionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateSections", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateSectionsResult.model_validate(response_dict)
+        with profiled_call("CreateSections") as profile:
+            validated_params = CreateSectionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateSections", dumped_params)
+            profile.lap()
+            validated_response = CreateSectionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.elements
 
     def create_subsets(self, subsets_data: list[SubsetData]) -> list[FailedExecutionResult | SuccessfulExecutionResult]:
@@ -182,11 +199,15 @@ class NavigatorCommands:
         params_dict = {
             "subsetsData": subsets_data,
         }
-        validated_params = CreateSubsetsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateSubsets", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateSubsetsResult.model_validate(response_dict)
+        with profiled_call("CreateSubsets") as profile:
+            validated_params = CreateSubsetsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateSubsets", dumped_params)
+            profile.lap()
+            validated_response = CreateSubsetsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def create_worksheets(self, worksheets_data: list[WorksheetData]) -> list[DatabaseIdArrayItem]:
@@ -207,11 +228,15 @@ class NavigatorCommands:
         params_dict = {
             "worksheetsData": worksheets_data,
         }
-        validated_params = CreateWorksheetsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateWorksheets", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateWorksheetsResult.model_validate(response_dict)
+        with profiled_call("CreateWorksheets") as profile:
+            validated_params = CreateWorksheetsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateWorksheets", dumped_params)
+            profile.lap()
+            validated_response = CreateWorksheetsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.databases
 
     def fit_in_window(
@@ -234,11 +259,15 @@ class NavigatorCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = FitInWindowParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "FitInWindow", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(FitInWindowResult).validate_python(response_dict)
+        with profiled_call("FitInWindow") as profile:
+            validated_params = FitInWindowParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("FitInWindow", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(FitInWindowResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_database_id_from_navigator_item_id(
@@ -262,12 +291,15 @@ class NavigatorCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetDatabaseIdFromNavigatorItemIdParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetDatabaseIdFromNavigatorItemId",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetDatabaseIdFromNavigatorItemIdResult.model_validate(response_dict)
+        with profiled_call("GetDatabaseIdFromNavigatorItemId") as profile:
+            validated_params = GetDatabaseIdFromNavigatorItemIdParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetDatabaseIdFromNavigatorItemId", dumped_params)
+            profile.lap()
+            validated_response = GetDatabaseIdFromNavigatorItemIdResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.databases
 
     def get_model_view_options(self) -> list[ModelViewOption]:
@@ -282,8 +314,11 @@ class NavigatorCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetModelViewOptions")
-        validated_response = GetModelViewOptionsResult.model_validate(response_dict)
+        with profiled_call("GetModelViewOptions") as profile:
+            response_dict = self._core.post_tapir_command("GetModelViewOptions")
+            profile.lap()
+            validated_response = GetModelViewOptionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.modelViewOptions
 
     def get_view_2d_transformations(
@@ -306,11 +341,15 @@ class NavigatorCommands:
         params_dict = {
             "databases": databases,
         }
-        validated_params = GetView2DTransformationsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetView2DTransformations", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetView2DTransformationsResult.model_validate(response_dict)
+        with profiled_call("GetView2DTransformations") as profile:
+            validated_params = GetView2DTransformationsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetView2DTransformations", dumped_params)
+            profile.lap()
+            validated_response = GetView2DTransformationsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.transformations
 
     def get_view_settings(self, navigator_item_ids: list[NavigatorItemIdArrayItem]) -> list[ErrorItem | ViewSettings]:
@@ -332,11 +371,15 @@ class NavigatorCommands:
         params_dict = {
             "navigatorItemIds": navigator_item_ids,
         }
-        validated_params = GetViewSettingsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetViewSettings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetViewSettingsResult.model_validate(response_dict)
+        with profiled_call("GetViewSettings") as profile:
+            validated_params = GetViewSettingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetViewSettings", dumped_params)
+            profile.lap()
+            validated_response = GetViewSettingsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.viewSettings
 
     def publish_publisher_set(
@@ -366,10 +409,12 @@ class NavigatorCommands:
             "outputPath": output_path,
             "selectedNavigatorItemIds": selected_navigator_item_ids,
         }
-        validated_params = PublishPublisherSetParameters(**params_dict)
-        self._core.post_tapir_command(
-            "PublishPublisherSet", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("PublishPublisherSet") as profile:
+            validated_params = PublishPublisherSetParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_tapir_command("PublishPublisherSet", dumped_params)
         return None
 
     def set_3d_cut_planes(
@@ -392,11 +437,15 @@ class NavigatorCommands:
         params_dict = {
             "cutPlanes": cut_planes,
         }
-        validated_params = Set3DCutPlanesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "Set3DCutPlanes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(Set3DCutPlanesResult).validate_python(response_dict)
+        with profiled_call("Set3DCutPlanes") as profile:
+            validated_params = Set3DCutPlanesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("Set3DCutPlanes", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(Set3DCutPlanesResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def set_view_settings(
@@ -420,11 +469,15 @@ class NavigatorCommands:
         params_dict = {
             "navigatorItemIdsWithViewSettings": navigator_item_ids_with_view_settings,
         }
-        validated_params = SetViewSettingsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetViewSettings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetViewSettingsResult.model_validate(response_dict)
+        with profiled_call("SetViewSettings") as profile:
+            validated_params = SetViewSettingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetViewSettings", dumped_params)
+            profile.lap()
+            validated_response = SetViewSettingsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def update_drawings(self, elements: list[ElementIdArrayItem]) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -445,9 +498,13 @@ class NavigatorCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = UpdateDrawingsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "UpdateDrawings", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(UpdateDrawingsResult).validate_python(response_dict)
+        with profiled_call("UpdateDrawings") as profile:
+            validated_params = UpdateDrawingsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("UpdateDrawings", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(UpdateDrawingsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CloseProjectResult,
     CreateProjectInfoFieldsParameters,
@@ -60,8 +61,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("CloseProject")
-        validated_response = TypeAdapter(CloseProjectResult).validate_python(response_dict)
+        with profiled_call("CloseProject") as profile:
+            response_dict = self._core.post_tapir_command("CloseProject")
+            profile.lap()
+            validated_response = TypeAdapter(CloseProjectResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def create_project_info_fields(self, project_info_fields: list[ProjectInfoFieldData]) -> list[ProjectInfoField]:
@@ -83,11 +87,15 @@ class ProjectCommands:
         params_dict = {
             "projectInfoFields": project_info_fields,
         }
-        validated_params = CreateProjectInfoFieldsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreateProjectInfoFields", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreateProjectInfoFieldsResult.model_validate(response_dict)
+        with profiled_call("CreateProjectInfoFields") as profile:
+            validated_params = CreateProjectInfoFieldsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreateProjectInfoFields", dumped_params)
+            profile.lap()
+            validated_response = CreateProjectInfoFieldsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.fields
 
     def get_calculation_units(self) -> GetCalculationUnitsResult:
@@ -102,8 +110,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetCalculationUnits")
-        validated_response = GetCalculationUnitsResult.model_validate(response_dict)
+        with profiled_call("GetCalculationUnits") as profile:
+            response_dict = self._core.post_tapir_command("GetCalculationUnits")
+            profile.lap()
+            validated_response = GetCalculationUnitsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_geo_location(self) -> GetGeoLocationResult:
@@ -118,8 +129,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetGeoLocation")
-        validated_response = GetGeoLocationResult.model_validate(response_dict)
+        with profiled_call("GetGeoLocation") as profile:
+            response_dict = self._core.post_tapir_command("GetGeoLocation")
+            profile.lap()
+            validated_response = GetGeoLocationResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_hotlinks(self) -> list[Hotlink]:
@@ -135,8 +149,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetHotlinks")
-        validated_response = GetHotlinksResult.model_validate(response_dict)
+        with profiled_call("GetHotlinks") as profile:
+            response_dict = self._core.post_tapir_command("GetHotlinks")
+            profile.lap()
+            validated_response = GetHotlinksResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.hotlinks
 
     def get_project_info(self) -> GetProjectInfoResult:
@@ -151,8 +168,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetProjectInfo")
-        validated_response = GetProjectInfoResult.model_validate(response_dict)
+        with profiled_call("GetProjectInfo") as profile:
+            response_dict = self._core.post_tapir_command("GetProjectInfo")
+            profile.lap()
+            validated_response = GetProjectInfoResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def get_project_info_fields(self) -> list[ProjectInfoField]:
@@ -167,8 +187,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetProjectInfoFields")
-        validated_response = GetProjectInfoFieldsResult.model_validate(response_dict)
+        with profiled_call("GetProjectInfoFields") as profile:
+            response_dict = self._core.post_tapir_command("GetProjectInfoFields")
+            profile.lap()
+            validated_response = GetProjectInfoFieldsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.fields
 
     def get_stories(self) -> GetStoriesResult:
@@ -183,8 +206,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetStories")
-        validated_response = GetStoriesResult.model_validate(response_dict)
+        with profiled_call("GetStories") as profile:
+            response_dict = self._core.post_tapir_command("GetStories")
+            profile.lap()
+            validated_response = GetStoriesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def open_project(self, project_file_path: str) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -205,11 +231,15 @@ class ProjectCommands:
         params_dict = {
             "projectFilePath": project_file_path,
         }
-        validated_params = OpenProjectParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "OpenProject", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(OpenProjectResult).validate_python(response_dict)
+        with profiled_call("OpenProject") as profile:
+            validated_params = OpenProjectParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("OpenProject", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(OpenProjectResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def print_view(
@@ -242,11 +272,15 @@ class ProjectCommands:
             "scale": scale,
             "printArea": print_area,
         }
-        validated_params = PrintViewParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "PrintView", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(PrintViewResult).validate_python(response_dict)
+        with profiled_call("PrintView") as profile:
+            validated_params = PrintViewParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("PrintView", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(PrintViewResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def rebuild_view(self, regenerate: None | bool = None) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -268,11 +302,15 @@ class ProjectCommands:
         params_dict = {
             "regenerate": regenerate,
         }
-        validated_params = RebuildViewParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "RebuildView", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(RebuildViewResult).validate_python(response_dict)
+        with profiled_call("RebuildView") as profile:
+            validated_params = RebuildViewParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("RebuildView", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(RebuildViewResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def save_project(self) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -287,8 +325,11 @@ class ProjectCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("SaveProject")
-        validated_response = TypeAdapter(SaveProjectResult).validate_python(response_dict)
+        with profiled_call("SaveProject") as profile:
+            response_dict = self._core.post_tapir_command("SaveProject")
+            profile.lap()
+            validated_response = TypeAdapter(SaveProjectResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def set_geo_location(
@@ -313,11 +354,15 @@ class ProjectCommands:
             "projectLocation": project_location,
             "surveyPoint": survey_point,
         }
-        validated_params = SetGeoLocationParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetGeoLocation", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(SetGeoLocationResult).validate_python(response_dict)
+        with profiled_call("SetGeoLocation") as profile:
+            validated_params = SetGeoLocationParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetGeoLocation", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(SetGeoLocationResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def set_project_info_field(self, project_info_id: str, project_info_value: str) -> None:
@@ -337,10 +382,12 @@ class ProjectCommands:
             "projectInfoId": project_info_id,
             "projectInfoValue": project_info_value,
         }
-        validated_params = SetProjectInfoFieldParameters(**params_dict)
-        self._core.post_tapir_command(
-            "SetProjectInfoField", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        with profiled_call("SetProjectInfoField") as profile:
+            validated_params = SetProjectInfoFieldParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            self._core.post_tapir_command("SetProjectInfoField", dumped_params)
         return None
 
     def set_stories(self, stories: list[StorySettings]) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -362,9 +409,13 @@ class ProjectCommands:
         params_dict = {
             "stories": stories,
         }
-        validated_params = SetStoriesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetStories", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(SetStoriesResult).validate_python(response_dict)
+        with profiled_call("SetStories") as profile:
+            validated_params = SetStoriesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetStories", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(SetStoriesResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
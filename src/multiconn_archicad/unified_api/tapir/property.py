@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     CreatePropertyDefinitionsParameters,
     CreatePropertyDefinitionsResult,
@@ -69,11 +70,15 @@ class PropertyCommands:
         params_dict = {
             "propertyDefinitions": property_definitions,
         }
-        validated_params = CreatePropertyDefinitionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreatePropertyDefinitions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreatePropertyDefinitionsResult.model_validate(response_dict)
+        with profiled_call("CreatePropertyDefinitions") as profile:
+            validated_params = CreatePropertyDefinitionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreatePropertyDefinitions", dumped_params)
+            profile.lap()
+            validated_response = CreatePropertyDefinitionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyIds
 
     def create_property_groups(self, property_groups: list[PropertyGroupArrayItem]) -> list[PropertyGroupIdArrayItem]:
@@ -95,11 +100,15 @@ class PropertyCommands:
         params_dict = {
             "propertyGroups": property_groups,
         }
-        validated_params = CreatePropertyGroupsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "CreatePropertyGroups", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = CreatePropertyGroupsResult.model_validate(response_dict)
+        with profiled_call("CreatePropertyGroups") as profile:
+            validated_params = CreatePropertyGroupsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("CreatePropertyGroups", dumped_params)
+            profile.lap()
+            validated_response = CreatePropertyGroupsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyGroupIds
 
     def delete_property_definitions(
@@ -123,11 +132,15 @@ class PropertyCommands:
         params_dict = {
             "propertyIds": property_ids,
         }
-        validated_params = DeletePropertyDefinitionsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeletePropertyDefinitions", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeletePropertyDefinitionsResult.model_validate(response_dict)
+        with profiled_call("DeletePropertyDefinitions") as profile:
+            validated_params = DeletePropertyDefinitionsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeletePropertyDefinitions", dumped_params)
+            profile.lap()
+            validated_response = DeletePropertyDefinitionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def delete_property_groups(
@@ -152,11 +165,15 @@ class PropertyCommands:
         params_dict = {
             "propertyGroupIds": property_group_ids,
         }
-        validated_params = DeletePropertyGroupsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "DeletePropertyGroups", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = DeletePropertyGroupsResult.model_validate(response_dict)
+        with profiled_call("DeletePropertyGroups") as profile:
+            validated_params = DeletePropertyGroupsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("DeletePropertyGroups", dumped_params)
+            profile.lap()
+            validated_response = DeletePropertyGroupsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def get_all_properties(self) -> list[PropertyDetails]:
@@ -171,8 +188,11 @@ class PropertyCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetAllProperties")
-        validated_response = GetAllPropertiesResult.model_validate(response_dict)
+        with profiled_call("GetAllProperties") as profile:
+            response_dict = self._core.post_tapir_command("GetAllProperties")
+            profile.lap()
+            validated_response = GetAllPropertiesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.properties
 
     def get_property_values_of_attributes(
@@ -199,11 +219,15 @@ class PropertyCommands:
             "attributeIds": attribute_ids,
             "properties": properties,
         }
-        validated_params = GetPropertyValuesOfAttributesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetPropertyValuesOfAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetPropertyValuesOfAttributesResult.model_validate(response_dict)
+        with profiled_call("GetPropertyValuesOfAttributes") as profile:
+            validated_params = GetPropertyValuesOfAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetPropertyValuesOfAttributes", dumped_params)
+            profile.lap()
+            validated_response = GetPropertyValuesOfAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyValuesForAttributes
 
     def get_property_values_of_elements(
@@ -231,11 +255,20 @@ class PropertyCommands:
             "elements": elements,
             "properties": properties,
         }
-        validated_params = GetPropertyValuesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetPropertyValuesOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetPropertyValuesOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetPropertyValuesOfElements") as profile:
+            validated_params = GetPropertyValuesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command_chunked(
+                "GetPropertyValuesOfElements",
+                dumped_params,
+                chunked_parameter="elements",
+                chunked_result="propertyValuesForElements",
+            )
+            profile.lap()
+            validated_response = GetPropertyValuesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.propertyValuesForElements
 
     def set_property_values_of_attributes(
@@ -260,11 +293,15 @@ class PropertyCommands:
         params_dict = {
             "attributePropertyValues": attribute_property_values,
         }
-        validated_params = SetPropertyValuesOfAttributesParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetPropertyValuesOfAttributes", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetPropertyValuesOfAttributesResult.model_validate(response_dict)
+        with profiled_call("SetPropertyValuesOfAttributes") as profile:
+            validated_params = SetPropertyValuesOfAttributesParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetPropertyValuesOfAttributes", dumped_params)
+            profile.lap()
+            validated_response = SetPropertyValuesOfAttributesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
 
     def set_property_values_of_elements(
@@ -290,9 +327,13 @@ class PropertyCommands:
         params_dict = {
             "elementPropertyValues": element_property_values,
         }
-        validated_params = SetPropertyValuesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "SetPropertyValuesOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = SetPropertyValuesOfElementsResult.model_validate(response_dict)
+        with profiled_call("SetPropertyValuesOfElements") as profile:
+            validated_params = SetPropertyValuesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("SetPropertyValuesOfElements", dumped_params)
+            profile.lap()
+            validated_response = SetPropertyValuesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.executionResults
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     GetCurrentRevisionChangesOfLayoutsParameters,
     GetCurrentRevisionChangesOfLayoutsResult,
@@ -52,12 +53,15 @@ class RevisionManagementCommands:
         params_dict = {
             "layoutDatabaseIds": layout_database_ids,
         }
-        validated_params = GetCurrentRevisionChangesOfLayoutsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetCurrentRevisionChangesOfLayouts",
-            validated_params.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
-        validated_response = GetCurrentRevisionChangesOfLayoutsResult.model_validate(response_dict)
+        with profiled_call("GetCurrentRevisionChangesOfLayouts") as profile:
+            validated_params = GetCurrentRevisionChangesOfLayoutsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetCurrentRevisionChangesOfLayouts", dumped_params)
+            profile.lap()
+            validated_response = GetCurrentRevisionChangesOfLayoutsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.currentRevisionChangesOfLayouts
 
     def get_document_revisions(self) -> list[DocumentRevision]:
@@ -72,8 +76,11 @@ class RevisionManagementCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetDocumentRevisions")
-        validated_response = GetDocumentRevisionsResult.model_validate(response_dict)
+        with profiled_call("GetDocumentRevisions") as profile:
+            response_dict = self._core.post_tapir_command("GetDocumentRevisions")
+            profile.lap()
+            validated_response = GetDocumentRevisionsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.documentRevisions
 
     def get_revision_changes(self) -> list[RevisionChange]:
@@ -88,8 +95,11 @@ class RevisionManagementCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetRevisionChanges")
-        validated_response = GetRevisionChangesResult.model_validate(response_dict)
+        with profiled_call("GetRevisionChanges") as profile:
+            response_dict = self._core.post_tapir_command("GetRevisionChanges")
+            profile.lap()
+            validated_response = GetRevisionChangesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.revisionChanges
 
     def get_revision_changes_of_elements(
@@ -112,11 +122,15 @@ class RevisionManagementCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = GetRevisionChangesOfElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "GetRevisionChangesOfElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = GetRevisionChangesOfElementsResult.model_validate(response_dict)
+        with profiled_call("GetRevisionChangesOfElements") as profile:
+            validated_params = GetRevisionChangesOfElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("GetRevisionChangesOfElements", dumped_params)
+            profile.lap()
+            validated_response = GetRevisionChangesOfElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.revisionChangesOfElements
 
     def get_revision_issues(self) -> list[RevisionIssue]:
@@ -131,6 +145,9 @@ class RevisionManagementCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("GetRevisionIssues")
-        validated_response = GetRevisionIssuesResult.model_validate(response_dict)
+        with profiled_call("GetRevisionIssues") as profile:
+            response_dict = self._core.post_tapir_command("GetRevisionIssues")
+            profile.lap()
+            validated_response = GetRevisionIssuesResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response.revisionIssues
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
+from multiconn_archicad.core.profiling import profiled_call
 from multiconn_archicad.models.tapir.commands import (
     ReleaseElementsParameters,
     ReleaseElementsResult,
@@ -41,11 +42,15 @@ class TeamworkCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = ReleaseElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ReleaseElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = TypeAdapter(ReleaseElementsResult).validate_python(response_dict)
+        with profiled_call("ReleaseElements") as profile:
+            validated_params = ReleaseElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ReleaseElements", dumped_params)
+            profile.lap()
+            validated_response = TypeAdapter(ReleaseElementsResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def reserve_elements(self, elements: list[ElementIdArrayItem]) -> ReserveElementsResult:
@@ -66,11 +71,15 @@ class TeamworkCommands:
         params_dict = {
             "elements": elements,
         }
-        validated_params = ReserveElementsParameters(**params_dict)
-        response_dict = self._core.post_tapir_command(
-            "ReserveElements", validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
-        validated_response = ReserveElementsResult.model_validate(response_dict)
+        with profiled_call("ReserveElements") as profile:
+            validated_params = ReserveElementsParameters(**params_dict)
+            profile.lap("validate_parameters")
+            dumped_params = validated_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+            profile.lap("dump_parameters")
+            response_dict = self._core.post_tapir_command("ReserveElements", dumped_params)
+            profile.lap()
+            validated_response = ReserveElementsResult.model_validate(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def teamwork_receive(self) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -85,8 +94,11 @@ class TeamworkCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("TeamworkReceive")
-        validated_response = TypeAdapter(TeamworkReceiveResult).validate_python(response_dict)
+        with profiled_call("TeamworkReceive") as profile:
+            response_dict = self._core.post_tapir_command("TeamworkReceive")
+            profile.lap()
+            validated_response = TypeAdapter(TeamworkReceiveResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
 
     def teamwork_send(self) -> FailedExecutionResult | SuccessfulExecutionResult:
@@ -101,6 +113,9 @@ class TeamworkCommands:
             RequestError: If there is a network or connection error.
             pydantic.ValidationError: If the parameters, or the API Response fail validation.
         """
-        response_dict = self._core.post_tapir_command("TeamworkSend")
-        validated_response = TypeAdapter(TeamworkSendResult).validate_python(response_dict)
+        with profiled_call("TeamworkSend") as profile:
+            response_dict = self._core.post_tapir_command("TeamworkSend")
+            profile.lap()
+            validated_response = TypeAdapter(TeamworkSendResult).validate_python(response_dict)
+            profile.lap("validate_result", validated_response)
         return validated_response
@@ -1,8 +1,26 @@
+import errno
+import selectors
 import socket
+import time
+from typing import Iterable
 from urllib.parse import urlparse
 
+# connect_ex codes of a non-blocking connect that is still in progress (EWOULDBLOCK on Windows)
+_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+
+def _hostname(address: str) -> str:
+    return urlparse(address).hostname if "://" in address else address
+
+
+def is_local_address(address: str) -> bool:
+    """Whether `address` names this machine through a loopback interface."""
+    host = _hostname(address) or ""
+    return host == "localhost" or host.startswith("127.") or host == "::1"
+
+
 def is_port_listening(address: str, port: int, timeout: float = 0.1) -> bool:
-    host = urlparse(address).hostname if "://" in address else address
+    host = _hostname(address)
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.settimeout(timeout)
@@ -10,4 +28,65 @@ def is_port_listening(address: str, port: int, timeout: float = 0.1) -> bool:
             s.connect((host, port))
             return True
         except (socket.timeout, ConnectionRefusedError, OSError):
-            return False
\ No newline at end of file
+            return False
+
+
+def listening_ports(address: str, ports: Iterable[int], timeout: float = 0.1) -> set[int]:
+    """The `ports` of `address` that accept a TCP connection, all probed at once within a single `timeout`."""
+    return {port for _, port in scan_endpoints(((address, port) for port in ports), timeout)}
+
+
+def scan_endpoints(endpoints: Iterable[tuple[str, int]], timeout: float = 0.1) -> set[tuple[str, int]]:
+    """
+    The (address, port) pairs that accept a TCP connection. Every endpoint is connected to without blocking
+    and the connections are awaited together on one selector, so the scan takes at most `timeout` seconds
+    (plus resolving the host names) however many endpoints there are, and it needs no worker threads.
+    """
+    resolved: dict[str, str | None] = {}
+    pending: dict[socket.socket, tuple[str, int]] = {}
+    listening: set[tuple[str, int]] = set()
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as selector:
+        try:
+            for address, port in endpoints:
+                if address not in resolved:
+                    resolved[address] = _resolve(address)
+                if resolved[address] is None:
+                    continue
+                sock = _start_connect(resolved[address], int(port))
+                if sock is not None:
+                    pending[sock] = (address, port)
+                    selector.register(sock, selectors.EVENT_WRITE)
+            while pending and (remaining := deadline - time.monotonic()) > 0:
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    selector.unregister(sock)
+                    endpoint = pending.pop(sock)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        listening.add(endpoint)
+                    sock.close()
+        finally:
+            for sock in pending:
+                sock.close()
+    return listening
+
+
+def _resolve(address: str) -> str | None:
+    try:
+        return socket.gethostbyname(_hostname(address))
+    except OSError:
+        return None
+
+
+def _start_connect(host: str, port: int) -> socket.socket | None:
+    """A socket with a connection to `host` in progress, or None if the connection failed right away."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    try:
+        code = sock.connect_ex((host, port))
+    except OSError:
+        code = -1
+    if code not in _IN_PROGRESS:
+        sock.close()
+        return None
+    return sock
@@ -1,6 +1,18 @@
 import concurrent.futures
+import contextvars
 
-EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+
+class ContextPropagatingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Runs every task in a copy of the submitting thread's context, so context variables such as the
+    current trace span or profiled call follow the work onto the worker threads.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+EXECUTOR = ContextPropagatingExecutor(
     max_workers=25,
     thread_name_prefix="MultiConnWorker"
-)
\ No newline at end of file
+)
@@ -2,8 +2,8 @@ import json
 import sys
 import socket
 import threading
+import time
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
-import concurrent.futures
 from pathlib import Path
 from typing import Dict, Any, Callable
 
@@ -13,6 +13,8 @@ import pytest
 import multiconn_archicad.multi_conn as multi_conn
 import multiconn_archicad.utilities.cli_parser as cli_parser
 from multiconn_archicad.basic_types import Port
+from multiconn_archicad.core.recording import Recording, Replayer
+from multiconn_archicad.utilities.thread_utils import ContextPropagatingExecutor
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -44,11 +46,25 @@ class ServerController:
         }
         self.responses: Dict[str, str] = {}
         self.command_handlers: Dict[str, Callable[[dict], dict]] = {}
+        self.connections_opened = 0
+        self._connections_lock = threading.Lock()
+        self.replayer: Replayer | None = None
         self.reset()
 
     def reset(self):
         self.responses = self._default_responses.copy()
         self.command_handlers = {}
+        self.replayer = None
+
+    def replay(self, recording: Recording | str | Path, timing: bool = False, time_scale: float = 1.0):
+        """Serve the responses of a recorded session; requests that were not recorded fall back to the
+        handlers and fixtures.
+        """
+        self.replayer = Replayer(recording, timing=timing, time_scale=time_scale, strict=False)
+
+    def register_connection(self):
+        with self._connections_lock:
+            self.connections_opened += 1
 
     def set_response(self, command: str, response_filename: str):
         self.responses[command] = response_filename
@@ -72,14 +88,25 @@ def create_handler_class(controller: ServerController):
     """Factory to create a RequestHandler bound to our controller."""
 
     class ArchicadAPIHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps the connection open between requests, like Archicad does
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, Nagle + delayed ACK stall each response by ~40ms
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            controller.register_connection()
+
         def log_message(self, format, *args):
             pass  # Suppress HTTP server logging to keep test output clean
 
         def do_GET(self):
+            body = b"Server is alive"
             self.send_response(200)
             self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(b"Server is alive")
+            self.wfile.write(body)
 
         def do_POST(self):
             # Parse the incoming JSON
@@ -87,6 +114,16 @@ def create_handler_class(controller: ServerController):
             body = self.rfile.read(content_length)
             payload = json.loads(body)
 
+            if controller.replayer and (exchange := controller.replayer.lookup(body)):
+                if delay := controller.replayer.delay(exchange):
+                    time.sleep(delay)
+                self.send_response(exchange.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(exchange.response)))
+                self.end_headers()
+                self.wfile.write(exchange.response)
+                return
+
             command = payload.get("command")
             command_name = command
             # Unwrap Tapir AddOn commands
@@ -103,10 +140,12 @@ def create_handler_class(controller: ServerController):
                     response_dict = {"succeeded": True, "result": {}}
 
             # Send the response back
+            response_body = json.dumps(response_dict).encode('utf-8')
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response_body)))
             self.end_headers()
-            self.wfile.write(json.dumps(response_dict).encode('utf-8'))
+            self.wfile.write(response_body)
 
     return ArchicadAPIHandler
 
@@ -117,19 +156,39 @@ def isolate_executor(monkeypatch):
     Gives every test a completely blank, isolated ThreadPool.
     Prevents zombie threads from previous tests from exhausting the worker pool.
     """
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=25, thread_name_prefix="MultiConnWorker")
+    executor = ContextPropagatingExecutor(max_workers=25, thread_name_prefix="MultiConnWorker")
     monkeypatch.setattr("multiconn_archicad.multi_conn.EXECUTOR", executor)
     monkeypatch.setattr("multiconn_archicad.conn_header.EXECUTOR", executor)
+    monkeypatch.setattr("multiconn_archicad.core.core_commands.EXECUTOR", executor)
     yield
     executor.shutdown(wait=False, cancel_futures=True)
 
 
+@pytest.fixture
+def isolate_port_states(monkeypatch):
+    """
+    Gives every test a blank registry of shared per-port state (request budgets, etc.).
+    Tests reuse the same mock server port, so state would otherwise leak between them.
+    """
+    monkeypatch.setattr("multiconn_archicad.core.port_state._registry", {})
+    yield
+
+
 def pytest_collection_modifyitems(config, items):
-    """ Dynamically apply the 'isolate_executor' fixture to all tests marked with 'integration'. """
+    """
+    Dynamically apply the isolation fixtures to all tests marked with 'integration'.
+    Benchmarks are skipped unless they are selected with `-m benchmark`.
+    """
+    run_benchmarks = "benchmark" in (config.getoption("markexpr") or "")
+    skip_benchmark = pytest.mark.skip(reason="benchmark: run with `pytest -m benchmark`")
     for item in items:
+        if item.get_closest_marker("benchmark") and not run_benchmarks:
+            item.add_marker(skip_benchmark)
         if item.get_closest_marker("integration"):
-            if "isolate_executor" not in item.fixturenames:
-                item.fixturenames.append("isolate_executor")
+            # Inserted first, so fixtures that build CoreCommands already see the isolated state
+            for fixture_name in ("isolate_port_states", "isolate_executor"):
+                if fixture_name not in item.fixturenames:
+                    item.fixturenames.insert(0, fixture_name)
 
 
 @pytest.fixture
@@ -224,15 +224,15 @@ def test_execute_add_on_command_logic(input_data: dict, mock_response: dict):
 def test_get_2d_bounding_boxes_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialElementGeometryCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_2d_bounding_boxes(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.Get2DBoundingBoxes'
     expected_payload = commands.Get2DBoundingBoxesParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -243,15 +243,15 @@ def test_get_2d_bounding_boxes_logic(input_data: dict, mock_response: dict):
 def test_get_3d_bounding_boxes_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialElementGeometryCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_3d_bounding_boxes(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.Get3DBoundingBoxes'
     expected_payload = commands.Get3DBoundingBoxesParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -300,15 +300,15 @@ def test_get_all_property_group_ids_logic(input_data: dict, mock_response: dict)
 def test_get_all_property_ids_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialPropertyCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_all_property_ids_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.GetAllPropertyIdsOfElements'
     expected_payload = commands.GetAllPropertyIdsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -490,15 +490,15 @@ def test_get_classification_systems_logic(input_data: dict, mock_response: dict)
 def test_get_classifications_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialClassificationCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_classifications_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.GetClassificationsOfElements'
     expected_payload = commands.GetClassificationsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -509,15 +509,15 @@ def test_get_classifications_of_elements_logic(input_data: dict, mock_response:
 def test_get_components_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialComponentCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_components_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.GetComponentsOfElements'
     expected_payload = commands.GetComponentsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -984,15 +984,15 @@ def test_get_property_values_of_element_components_logic(input_data: dict, mock_
 def test_get_property_values_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialPropertyCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_property_values_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.GetPropertyValuesOfElements'
     expected_payload = commands.GetPropertyValuesOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1079,15 +1079,15 @@ def test_get_surface_attributes_logic(input_data: dict, mock_response: dict):
 def test_get_types_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = OfficialElementListingCommands(core=MagicMock())
-    command_group._core.post_command.return_value = mock_response
+    command_group._core.post_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_types_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_command.assert_called_once()
-    args, _ = command_group._core.post_command.call_args
+    command_group._core.post_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_command_chunked.call_args
     assert args[0] == 'API.GetTypesOfElements'
     expected_payload = commands.GetTypesOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1148,15 +1148,15 @@ def test_export_issues_to_bcf_logic(input_data: dict, mock_response: dict):
 def test_filter_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.filter_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'FilterElements'
     expected_payload = commands.FilterElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1187,15 +1187,15 @@ def test_fit_in_window_logic(input_data: dict, mock_response: dict):
 def test_get_3d_bounding_boxes_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_3d_bounding_boxes(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'Get3DBoundingBoxes'
     expected_payload = commands.Get3DBoundingBoxesParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1285,15 +1285,15 @@ def test_get_building_material_physical_properties_logic(input_data: dict, mock_
 def test_get_classifications_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirClassificationCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_classifications_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetClassificationsOfElements'
     expected_payload = commands.GetClassificationsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1400,15 +1400,15 @@ def test_get_database_id_from_navigator_item_id_logic(input_data: dict, mock_res
 def test_get_design_option_for_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirDesignOptionsCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_design_option_for_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetDesignOptionForElements'
     expected_payload = commands.GetDesignOptionForElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1419,15 +1419,15 @@ def test_get_design_option_for_elements_logic(input_data: dict, mock_response: d
 def test_get_details_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_details_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetDetailsOfElements'
     expected_payload = commands.GetDetailsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1438,15 +1438,15 @@ def test_get_details_of_elements_logic(input_data: dict, mock_response: dict):
 def test_get_dimension_data_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_dimension_data(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetDimensionData'
     expected_payload = commands.GetDimensionDataParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1592,15 +1592,15 @@ def test_get_favorites_by_type_logic(input_data: dict, mock_response: dict):
 def test_get_gdl_parameters_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_gdl_parameters_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetGDLParametersOfElements'
     expected_payload = commands.GetGDLParametersOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1611,15 +1611,15 @@ def test_get_gdl_parameters_of_elements_logic(input_data: dict, mock_response: d
 def test_get_ifc_ids_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirIfcCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_ifc_ids_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetIFCIdsOfElements'
     expected_payload = commands.GetIFCIdsOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1630,15 +1630,15 @@ def test_get_ifc_ids_of_elements_logic(input_data: dict, mock_response: dict):
 def test_get_ifc_properties_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirIfcCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_ifc_properties_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetIFCPropertiesOfElements'
     expected_payload = commands.GetIFCPropertiesOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1649,15 +1649,15 @@ def test_get_ifc_properties_of_elements_logic(input_data: dict, mock_response: d
 def test_get_ifc_type_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirIfcCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_ifc_type_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetIFCTypeOfElements'
     expected_payload = commands.GetIFCTypeOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1706,15 +1706,15 @@ def test_get_property_values_of_attributes_logic(input_data: dict, mock_response
 def test_get_property_values_of_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirPropertyCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_property_values_of_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetPropertyValuesOfElements'
     expected_payload = commands.GetPropertyValuesOfElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
@@ -1763,15 +1763,15 @@ def test_get_room_image_logic(input_data: dict, mock_response: dict):
 def test_get_subelements_of_hierarchical_elements_logic(input_data: dict, mock_response: dict):
     # 1. ARRANGE
     command_group = TapirElementCommands(core=MagicMock())
-    command_group._core.post_tapir_command.return_value = mock_response
+    command_group._core.post_tapir_command_chunked.return_value = mock_response
 
     # 2. ACT
     kwargs = {camel_to_snake(k): v for k, v in input_data.items()}
     result = command_group.get_subelements_of_hierarchical_elements(**kwargs)
 
     # 3. ASSERT
-    command_group._core.post_tapir_command.assert_called_once()
-    args, _ = command_group._core.post_tapir_command.call_args
+    command_group._core.post_tapir_command_chunked.assert_called_once()
+    args, _ = command_group._core.post_tapir_command_chunked.call_args
     assert args[0] == 'GetSubelementsOfHierarchicalElements'
     expected_payload = commands.GetSubelementsOfHierarchicalElementsParameters.model_validate(input_data).model_dump(mode='json', by_alias=True, exclude_none=True)
     assert args[1] == expected_payload
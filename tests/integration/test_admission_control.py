@@ -0,0 +1,220 @@
+import pytest
+import time
+import asyncio
+import threading
+import concurrent.futures
+
+from multiconn_archicad import (
+    MultiConn,
+    ConnHeader,
+    CoreCommands,
+    CoreConfig,
+    AdaptiveConcurrency,
+    MetricsPolicy,
+    Port,
+    ResponseCachePolicy,
+    SlowCommandPolicy,
+)
+from multiconn_archicad.errors import CommandTimeoutError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def concurrency_probe(archicad_api):
+    """Registers a slow 'Test.Probe' command that records the peak number of requests the server handled at once."""
+    probe = {"current": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def probe_handler(payload: dict) -> dict:
+        with lock:
+            probe["current"] += 1
+            probe["peak"] = max(probe["peak"], probe["current"])
+        time.sleep(0.02)
+        with lock:
+            probe["current"] -= 1
+        return {"succeeded": True, "result": {}}
+
+    archicad_api.set_handler("Test.Probe", probe_handler)
+    yield probe
+
+
+def test_thread_fan_out_is_capped_across_core_instances(archicad_api, concurrency_probe):
+    """
+    Verifies that two CoreCommands of the same port draw from one shared request budget.
+    """
+    # ARRANGE
+    config = CoreConfig(max_in_flight_per_port=3)
+    first = CoreCommands(Port(archicad_api.server_port), config=config)
+    second = CoreCommands(Port(archicad_api.server_port), config=config)
+    assert first.admission is second.admission
+
+    # ACT
+    with concurrent.futures.ThreadPoolExecutor(max_workers=24) as executor:
+        list(executor.map(lambda i: (first if i % 2 else second).post_command("Test.Probe"), range(48)))
+
+    # ASSERT
+    assert concurrency_probe["peak"] <= 3
+    stats = first.admission.stats()
+    assert stats.admitted == 48
+    assert stats.in_flight == 0
+    assert stats.queued > 0
+
+
+def test_async_fan_out_is_capped(archicad_api, concurrency_probe):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(max_in_flight_per_port=2))
+
+    async def run():
+        async with core:
+            await asyncio.gather(*(core.post_command_async("Test.Probe") for _ in range(30)))
+
+    # ACT
+    asyncio.run(run())
+
+    # ASSERT
+    assert concurrency_probe["peak"] <= 2
+    assert core.admission.stats().admitted == 30
+
+
+def test_queue_wait_respects_command_timeout(archicad_api):
+    # ARRANGE
+    release = threading.Event()
+
+    def blocking_handler(payload: dict) -> dict:
+        release.wait(2.0)
+        return {"succeeded": True, "result": {}}
+
+    archicad_api.set_handler("Test.Block", blocking_handler)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(max_in_flight_per_port=1))
+    blocker = threading.Thread(target=core.post_command, args=("Test.Block",))
+    blocker.start()
+    while core.admission.in_flight == 0:
+        time.sleep(0.001)
+
+    # ACT & ASSERT
+    with pytest.raises(CommandTimeoutError, match="request slot"):
+        core.post_command("API.IsAlive", timeout=0.1)
+
+    release.set()
+    blocker.join()
+    assert core.admission.queue_depth == 0
+
+
+def test_multiconn_headers_share_the_port_budget(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+
+    # ACT
+    conn = MultiConn(core_config=CoreConfig(max_in_flight_per_port=2))
+    header = conn.open_port_headers[archicad_api.server_port]
+
+    # ASSERT
+    assert conn.primary.core.admission is header.core.admission
+    assert header.core.admission.limit == 2
+
+
+def test_a_later_core_with_another_config_keeps_the_port_settings(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    config = CoreConfig(
+        max_in_flight_per_port=2,
+        response_cache=ResponseCachePolicy(),
+        metrics=MetricsPolicy(),
+        slow_commands=SlowCommandPolicy(),
+    )
+    conn = MultiConn(core_config=config)
+    core = conn.primary.core
+    core.post_command("API.IsAlive")
+
+    # ACT
+    CoreCommands(Port(archicad_api.server_port))
+    ConnHeader.from_dict(conn.primary.to_dict())
+
+    # ASSERT
+    assert core.admission.limit == 2
+    assert core.cache is not None
+    assert core.metrics.snapshot()
+    assert core.slow_log is not None
+
+
+def test_a_later_core_with_another_config_gets_its_own_settings(archicad_api):
+    # ARRANGE
+    conn = MultiConn(core_config=CoreConfig(max_in_flight_per_port=2))
+    config = CoreConfig(metrics=MetricsPolicy(), response_cache=ResponseCachePolicy(), max_in_flight_per_port=1)
+
+    # ACT
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    # ASSERT
+    assert core.admission.limit == 1
+    assert core.cache is not None
+    assert core.metrics is not None
+    assert conn.primary.core.admission.limit == 2
+    assert conn.primary.core.cache is None
+
+
+def test_reconfigure_replaces_the_port_settings(archicad_api):
+    # ARRANGE
+    config = CoreConfig(max_in_flight_per_port=2)
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+    other = CoreCommands(Port(archicad_api.server_port), config=config)
+    core.post_command("API.IsAlive")
+    cache = ResponseCachePolicy()
+
+    # ACT
+    other.reconfigure(CoreConfig(max_in_flight_per_port=3, response_cache=cache))
+
+    # ASSERT
+    assert core.admission.limit == 3
+    assert core.cache.policy == cache
+
+
+def test_adaptive_limit_grows_while_latency_is_stable(archicad_api, concurrency_probe):
+    # ARRANGE
+    config = CoreConfig(adaptive_concurrency=AdaptiveConcurrency(initial_limit=1, max_limit=4))
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+    assert core.admission.limit == 1
+
+    # ACT
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: core.post_command("Test.Probe"), range(40)))
+
+    # ASSERT
+    assert core.admission.limit == 4
+    assert concurrency_probe["peak"] <= 4
+
+
+def test_adaptive_limit_backs_off_on_timeouts(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("Test.Stall", lambda payload: time.sleep(0.3) or {"succeeded": True, "result": {}})
+    config = CoreConfig(adaptive_concurrency=AdaptiveConcurrency(initial_limit=4, max_limit=4))
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    # ACT
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(core.post_command, "Test.Stall", timeout=0.05) for _ in range(4)]
+        for future in futures:
+            with pytest.raises(CommandTimeoutError):
+                future.result()
+
+    # ASSERT
+    assert core.admission.limit == 2
+
+
+def test_learned_limit_is_visible_per_header(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    config = CoreConfig(adaptive_concurrency=AdaptiveConcurrency(initial_limit=3, max_limit=6))
+
+    # ACT
+    conn = MultiConn(core_config=config)
+    header = conn.open_port_headers[archicad_api.server_port]
+    core = header.core
+
+    # ASSERT
+    assert header.concurrency_limit == core.admission.limit
+    assert 3 <= header.concurrency_limit <= 6
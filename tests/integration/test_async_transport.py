@@ -0,0 +1,132 @@
+import pytest
+import time
+import asyncio
+import threading
+
+from multiconn_archicad import CoreCommands, Port
+from multiconn_archicad.errors import (
+    APIConnectionError,
+    CommandTimeoutError,
+    StandardAPIError,
+    TapirCommandError,
+)
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+def test_async_gather_runs_without_worker_threads(archicad_api, monkeypatch):
+    """
+    Verifies that awaiting many commands uses the native async client, not the default thread pool.
+    """
+    # ARRANGE
+    def fail_to_thread(*args, **kwargs):
+        raise AssertionError("post_command_async must not fall back to threads")
+
+    monkeypatch.setattr(asyncio, "to_thread", fail_to_thread)
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    core = CoreCommands(Port(archicad_api.server_port))
+    threads_before = threading.active_count()
+
+    async def run():
+        async with core:
+            return await asyncio.gather(
+                *[core.post_command_async("API.IsAlive") for _ in range(100)],
+                *[core.post_tapir_command_async("GetProjectInfo") for _ in range(100)],
+            )
+
+    # ACT
+    results = asyncio.run(run())
+
+    # ASSERT
+    assert results[:100] == [{"isAlive": True}] * 100
+    assert all(result["projectName"] == "My Solo Project.pln" for result in results[100:])
+    assert threading.active_count() <= threads_before + core.config.max_connections_per_port
+
+
+def test_async_pool_reuses_connections(archicad_api):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+    opened_before = archicad_api.connections_opened
+
+    async def run():
+        for _ in range(20):
+            await core.post_command_async("API.IsAlive")
+        await core.aclose()
+
+    # ACT
+    asyncio.run(run())
+
+    # ASSERT
+    assert archicad_api.connections_opened - opened_before == 1
+
+
+def test_async_pool_survives_successive_event_loops(archicad_api):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    # ACT
+    first = asyncio.run(core.post_command_async("API.IsAlive"))
+    second = asyncio.run(core.post_command_async("API.IsAlive"))
+    core.close()
+
+    # ASSERT
+    assert first == second == {"isAlive": True}
+
+
+def test_async_pool_is_closed_with_its_event_loop(archicad_api):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    async def run():
+        await core.post_command_async("API.IsAlive")
+        return await core._get_async_client()
+
+    # ACT
+    client = asyncio.run(run())
+
+    # ASSERT
+    assert client.is_closed
+    assert not core._async_clients
+
+
+def test_async_errors_are_mapped_like_sync_errors(archicad_api):
+    # ARRANGE
+    def timeout_handler(payload: dict) -> dict:
+        time.sleep(0.5)
+        return {"succeeded": True, "result": {}}
+
+    archicad_api.set_handler("Test.Timeout", timeout_handler)
+    archicad_api.set_response("API.GetAttributesByType", "standard_api_error.json")
+    archicad_api.set_response("DeleteElements", "tapir_command_error.json")
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    async def run():
+        async with core:
+            with pytest.raises(CommandTimeoutError):
+                await core.post_command_async("Test.Timeout", timeout=0.1)
+            with pytest.raises(StandardAPIError) as standard_error:
+                await core.post_command_async("API.GetAttributesByType")
+            with pytest.raises(TapirCommandError) as tapir_error:
+                await core.post_tapir_command_async("DeleteElements", {"elements": []})
+            return standard_error.value, tapir_error.value
+
+    # ACT
+    standard_error, tapir_error = asyncio.run(run())
+
+    # ASSERT
+    assert standard_error.code == 1234
+    assert tapir_error.code == 5678
+
+
+def test_async_connection_refused_raises_api_connection_error(archicad_api):
+    # ARRANGE
+    archicad_api.http_server.shutdown()
+    archicad_api.http_server.server_close()
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    # ACT & ASSERT
+    with pytest.raises(APIConnectionError):
+        asyncio.run(core.post_command_async("API.IsAlive", timeout=1.0))
@@ -0,0 +1,102 @@
+import pytest
+import threading
+import uuid
+
+from multiconn_archicad import CoreCommands, CoreConfig, ChunkingPolicy, Port
+from multiconn_archicad.models.official.types import ElementId, ElementIdArrayItem, ErrorItem, TypeOfElementWrapperItem
+from multiconn_archicad.unified_api.api import UnifiedApi
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def types_of_elements(archicad_api):
+    """Answers GetTypesOfElements with 'Wall' per element, or an error item for every third one."""
+    requests = []
+    lock = threading.Lock()
+    error_indices: set[str] = set()
+
+    def handler(payload: dict) -> dict:
+        elements = payload["parameters"]["elements"]
+        with lock:
+            requests.append(len(elements))
+        items = []
+        for element in elements:
+            guid = element["elementId"]["guid"]
+            if guid in error_indices:
+                items.append({"error": {"code": 404, "message": f"missing {guid}"}})
+            else:
+                items.append({"typeOfElement": {"elementId": {"guid": guid}, "elementType": "Wall"}})
+        return {"succeeded": True, "result": {"typesOfElements": items}}
+
+    archicad_api.set_handler("API.GetTypesOfElements", handler)
+    return requests, error_indices
+
+
+def _elements(count: int) -> list[ElementIdArrayItem]:
+    return [ElementIdArrayItem(elementId=ElementId(guid=uuid.uuid4())) for _ in range(count)]
+
+
+def test_large_element_list_is_split_and_reassembled(archicad_api, types_of_elements):
+    # ARRANGE
+    requests, error_guids = types_of_elements
+    elements = _elements(10)
+    error_guids.update(str(element.elementId.guid) for element in elements[::3])
+    config = CoreConfig(chunking=ChunkingPolicy(chunk_size=3, max_parallel=2))
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port), config=config))
+
+    # ACT
+    result = unified.official.element_listing.get_types_of_elements(elements)
+
+    # ASSERT
+    assert sorted(requests) == [1, 3, 3, 3]
+    assert len(result) == 10
+    for index, (element, item) in enumerate(zip(elements, result)):
+        if index % 3 == 0:
+            assert isinstance(item, ErrorItem)
+            assert item.error.message == f"missing {element.elementId.guid}"
+        else:
+            assert isinstance(item, TypeOfElementWrapperItem)
+            assert item.typeOfElement.elementId.guid == element.elementId.guid
+
+
+def test_small_element_list_is_sent_whole(archicad_api, types_of_elements):
+    requests, _ = types_of_elements
+    config = CoreConfig(chunking=ChunkingPolicy(chunk_size=100))
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port), config=config))
+
+    unified.official.element_listing.get_types_of_elements(_elements(100))
+
+    assert requests == [100]
+
+
+def test_chunking_is_disabled_by_default(archicad_api, types_of_elements):
+    requests, _ = types_of_elements
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port)))
+
+    unified.official.element_listing.get_types_of_elements(_elements(5000))
+
+    assert requests == [5000]
+
+
+def test_tapir_chunks_are_merged(archicad_api):
+    # ARRANGE
+    def handler(payload: dict) -> dict:
+        elements = payload["parameters"]["addOnCommandParameters"]["elements"]
+        ids = [{"ifcId": element["elementId"]["guid"][:8]} for element in elements]
+        return {"succeeded": True, "result": {"addOnCommandResponse": {"elementIFCIds": ids}}}
+
+    archicad_api.set_handler("GetIFCIdsOfElements", handler)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(chunking=ChunkingPolicy(chunk_size=4)))
+    elements = [{"elementId": {"guid": str(uuid.uuid4())}} for _ in range(9)]
+
+    # ACT
+    result = core.post_tapir_command_chunked(
+        "GetIFCIdsOfElements", {"elements": elements}, chunked_parameter="elements", chunked_result="elementIFCIds"
+    )
+
+    # ASSERT
+    assert [item["ifcId"] for item in result["elementIFCIds"]] == [e["elementId"]["guid"][:8] for e in elements]
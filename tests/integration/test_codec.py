@@ -0,0 +1,70 @@
+import logging
+from typing import Any
+
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, JsonCodec, Port, StdlibJsonCodec
+from multiconn_archicad.errors import InvalidResponseFormatError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+class CountingCodec(StdlibJsonCodec):
+    def __init__(self) -> None:
+        self.encoded: list[Any] = []
+        self.decoded: list[bytes] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def test_configured_codec_encodes_and_decodes(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": payload})
+    json_codec = CountingCodec()
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(codec=json_codec))
+
+    # ACT
+    result = core.post_command("API.GetAllElements", {"name": "Fal – ő"})
+
+    # ASSERT
+    assert result == {"command": "API.GetAllElements", "parameters": {"name": "Fal – ő"}}
+    assert json_codec.encoded == [{"command": "API.GetAllElements", "parameters": {"name": "Fal – ő"}}]
+    assert len(json_codec.decoded) == 1
+
+
+def test_codec_decode_error_maps_to_invalid_response(archicad_api):
+    class BrokenCodec(StdlibJsonCodec):
+        def loads(self, data: bytes) -> Any:
+            raise ValueError("cannot decode")
+
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(codec=BrokenCodec()))
+
+    with pytest.raises(InvalidResponseFormatError, match="API.IsAlive"):
+        core.post_command("API.IsAlive")
+
+
+def test_debug_log_renders_parameters_and_response(archicad_api, caplog):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": {"elements": []}})
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    # ACT
+    with caplog.at_level(logging.DEBUG, logger="multiconn_archicad.core.core_commands"):
+        core.post_command("API.GetAllElements", {"flag": True})
+
+    # ASSERT
+    assert '"flag": true' in caplog.text
+    assert '"elements": []' in caplog.text
+
+
+def test_custom_codec_subclass_is_accepted():
+    assert issubclass(CountingCodec, JsonCodec)
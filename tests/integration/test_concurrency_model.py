@@ -1,8 +1,9 @@
 import pytest
 import time
 import os
+import threading
 
-from multiconn_archicad import MultiConn
+from multiconn_archicad import MultiConn, ConnHeader, Port, CoreConfig
 from multiconn_archicad.conn_header import Status
 from multiconn_archicad.basic_types import PendingResponse, ProductInfo, APIResponseError
 
@@ -105,8 +106,8 @@ def test_default_mode_blocks_and_waits(slow_archicad_api):
     product_info = conn.primary.product_info
     duration = time.time() - start_time
 
-    # ASSERT 1 (Blocking): 3 sequentially fetched endpoints at 0.2s each = 0.6s
-    assert 0.6 <= duration < 2.0 if IS_CI else 0.7, f"Blocking duration was {duration:.2f}s, expected[0.6, 0.8)"
+    # ASSERT 1 (Blocking): 3 concurrently fetched endpoints at 0.2s each = 0.2s
+    assert 0.2 <= duration < (2.0 if IS_CI else 0.55), f"Blocking duration was {duration:.2f}s, expected[0.2, 0.55)"
 
     # ASSERT 2 (Final Data)
     assert isinstance(product_info, ProductInfo)
@@ -218,7 +219,7 @@ def test_stress_multiple_connections_performance(slow_archicad_api, monkeypatch)
     monkeypatch.setattr("multiconn_archicad.multi_conn.MultiConn._port_range", full_range)
 
     # 2. Mock the TCP knock so MultiConn thinks all 21 ports are actively listening
-    monkeypatch.setattr("multiconn_archicad.multi_conn.is_port_listening", lambda url, port: True)
+    monkeypatch.setattr("multiconn_archicad.multi_conn.listening_ports", lambda url, ports, timeout: set(ports))
 
     # 3. ROUTING FIX: Silently redirect all httpx requests to the single mock server!
     mock_url = f"http://127.0.0.1:{slow_archicad_api.server_port}"
@@ -251,10 +252,68 @@ def test_stress_multiple_connections_performance(slow_archicad_api, monkeypatch)
     fetch_duration = time.perf_counter() - fetch_start
 
     # ASSERT 2: The Parallelism Proof
-    # 21 parallel batches of 3 sequential requests (0.2s * 3 = 0.6s total expected)
+    # 21 parallel batches of 3 concurrent requests (0.2s total expected)
     # Allowed threshold is < 1.5s to account for OS thread scheduling overhead
-    assert 0.6 <= fetch_duration < 6.0 if IS_CI else 1.5, f"Parallel fetch failed or bottlenecked! Took {fetch_duration:.2f}s"
+    assert fetch_duration < (6.0 if IS_CI else 1.5), f"Parallel fetch failed or bottlenecked! Took {fetch_duration:.2f}s"
 
     # Ensure they resolved correctly
     assert conn.primary.status == Status.ACTIVE
     assert conn.open_port_headers[Port(19743)].status == Status.PENDING
+
+
+def test_metadata_requests_share_one_deadline(archicad_api, monkeypatch):
+    """
+    A metadata request that hangs is cut off by the shared deadline without costing the others their answers.
+    """
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    monkeypatch.setattr("multiconn_archicad.conn_header.METADATA_TIMEOUT", 0.3)
+
+    def hanging_handler(payload: dict) -> dict:
+        time.sleep(1.0)
+        return {"succeeded": True, "result": {}}
+
+    archicad_api.set_handler("GetArchicadLocation", hanging_handler)
+
+    # ACT
+    start_time = time.perf_counter()
+    header = ConnHeader(Port(archicad_api.server_port))
+    header.init_future.result()
+    duration = time.perf_counter() - start_time
+
+    # ASSERT
+    assert duration < 0.9
+    assert isinstance(header.product_info, ProductInfo)
+    assert isinstance(header.archicad_location, APIResponseError)
+    assert "timed out" in header.archicad_location.message
+    assert header.core._client is not None  # sent through the pooled sync client
+    assert not header.core._async_clients
+
+
+def test_metadata_requests_respect_the_request_budget(archicad_api):
+    """
+    The metadata requests go through the port's request budget, so a limit below three sends them one by one.
+    """
+    # ARRANGE
+    probe = {"current": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def probe_handler(payload: dict) -> dict:
+        with lock:
+            probe["current"] += 1
+            probe["peak"] = max(probe["peak"], probe["current"])
+        time.sleep(0.05)
+        with lock:
+            probe["current"] -= 1
+        return {"succeeded": True, "result": {}}
+
+    for command in ("API.GetProductInfo", "GetProjectInfo", "GetArchicadLocation"):
+        archicad_api.set_handler(command, probe_handler)
+
+    # ACT
+    header = ConnHeader(Port(archicad_api.server_port), config=CoreConfig(max_in_flight_per_port=1))
+    header.init_future.result()
+
+    # ASSERT
+    assert probe["peak"] == 1
+    assert header.core.admission.stats().max_wait > 0
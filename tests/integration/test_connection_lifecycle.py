@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from multiconn_archicad import MultiConn, Port
@@ -121,3 +123,27 @@ def test_quit_all_sends_command_and_removes_header(archicad_api):
     assert processed_headers[0] is header_to_quit
     assert len(conn.open_port_headers) == 0
     assert header_to_quit.status == Status.UNASSIGNED
+
+
+def test_scanning_the_whole_range_takes_one_timeout_without_worker_threads(archicad_api, monkeypatch):
+    """
+    Verifies that the ports are probed together from the calling thread, so closed ports do not add up.
+    """
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    full_range = [Port(port) for port in range(19723, 19744)]
+    monkeypatch.setattr("multiconn_archicad.multi_conn.MultiConn._port_range", full_range)
+    conn = MultiConn(scan_timeout=0.3)
+    monkeypatch.setattr("multiconn_archicad.multi_conn.is_port_listening", None)  # no port is probed on its own
+
+    start = time.perf_counter()
+    conn.refresh.all_ports()
+    duration = time.perf_counter() - start
+
+    assert duration < 0.6
+    assert list(conn.open_port_headers) == [archicad_api.server_port]
+    conn.open_port_headers[archicad_api.server_port].init_future.result()  # let the refresh finish in this test
+
+
+def test_scan_timeout_must_be_positive():
+    with pytest.raises(ValueError):
+        MultiConn(scan_timeout=0)
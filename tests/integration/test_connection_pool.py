@@ -0,0 +1,132 @@
+import pytest
+import time
+import statistics
+import concurrent.futures
+
+import httpx
+
+from multiconn_archicad import MultiConn, CoreCommands, CoreConfig, Port
+from multiconn_archicad.conn_header import Status
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+ROUND_TRIPS = 200
+
+
+def _median_latency(send_command) -> float:
+    samples = []
+    for _ in range(ROUND_TRIPS):
+        start = time.perf_counter()
+        send_command()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def test_sequential_commands_reuse_one_connection(archicad_api):
+    """
+    Verifies that a CoreCommands keeps its connection alive between commands.
+    """
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+    opened_before = archicad_api.connections_opened
+
+    # ACT
+    for _ in range(50):
+        core.post_command("API.IsAlive")
+
+    # ASSERT
+    assert archicad_api.connections_opened - opened_before == 1
+    core.close()
+
+
+def test_parallel_commands_respect_max_connections_per_port(archicad_api):
+    """
+    Verifies that a burst of threads never opens more connections than the configured cap.
+    """
+    # ARRANGE
+    def slow_handler(payload: dict) -> dict:
+        time.sleep(0.05)
+        return {"succeeded": True, "result": {}}
+
+    archicad_api.set_handler("Test.Slow", slow_handler)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(max_connections_per_port=2))
+    opened_before = archicad_api.connections_opened
+
+    # ACT
+    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(lambda _: core.post_command("Test.Slow"), range(40)))
+
+    # ASSERT
+    assert len(results) == 40
+    assert archicad_api.connections_opened - opened_before <= 2
+    core.close()
+
+
+def test_close_releases_pool_and_reopens_lazily(archicad_api):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+    core.post_command("API.IsAlive")
+    opened_before = archicad_api.connections_opened
+
+    # ACT
+    core.close()
+    result = core.post_command("API.IsAlive")
+
+    # ASSERT
+    assert result == {"isAlive": True}
+    assert archicad_api.connections_opened - opened_before == 1
+    core.close()
+
+
+def test_unassign_and_multiconn_teardown_close_pools(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    with MultiConn() as conn:
+        header = conn.open_port_headers[archicad_api.server_port]
+        _ = header.product_info
+        header.core.post_command("API.IsAlive")
+        conn.core.post_command("API.IsAlive")
+        core = header.core
+        assert core._client is not None
+        assert conn.primary.core._client is not None
+
+    # ASSERT 1: Leaving the context closes every pool
+    assert core._client is None
+    assert conn.primary.core._client is None
+
+    # ASSERT 2: Unassigning releases the pool as well
+    header.core.post_command("API.IsAlive")
+    header.unassign()
+    assert core._client is None
+    assert header.status == Status.UNASSIGNED
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError):
+        CoreConfig(max_connections_per_port=0)
+
+
+@pytest.mark.benchmark
+def test_benchmark_round_trip_latency_pooled_vs_fresh_client(archicad_api):
+    """
+    Compares the old one-client-per-command round trip with the pooled keep-alive client.
+    Wall-clock timings are noisy on shared machines, so it only runs with `pytest -m benchmark`.
+    """
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+    payload = {"command": "API.IsAlive", "parameters": None}
+
+    def post_with_fresh_client():
+        with httpx.Client(timeout=None) as client:
+            client.post(core.url, json=payload).json()
+
+    # ACT
+    fresh_latency = _median_latency(post_with_fresh_client)
+    pooled_latency = _median_latency(lambda: core.post_command("API.IsAlive"))
+    core.close()
+
+    # ASSERT
+    assert pooled_latency < fresh_latency
@@ -0,0 +1,74 @@
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, Port, RetryPolicy
+from multiconn_archicad.simulation import SimulatedArchicad, SimulationSettings, SyntheticProject, faults
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def server():
+    settings = SimulationSettings(latency=0.001)
+    with SimulatedArchicad(SyntheticProject.generate(element_count=100), settings) as simulated:
+        yield simulated
+
+
+@pytest.fixture
+def core(server):
+    with CoreCommands(Port(server.port), config=CoreConfig(retry=RetryPolicy(base_delay=0.01))) as client:
+        yield client
+
+
+def test_dirty_disconnects_do_not_disturb_other_clients(server, core):
+    report = faults.dirty_disconnects(core, requests=60, threads=4, disconnects=20)
+
+    assert report.injected == 20
+    assert report.errors == {}
+    assert len(report.latencies) == 60
+
+
+def test_tcp_knocks_do_not_disturb_other_clients(server, core):
+    report = faults.tcp_knocks(core, requests=60, threads=4, knocks=100)
+
+    assert report.injected == 100
+    assert report.errors == {}
+
+
+def test_more_threads_than_connections_all_get_through(core):
+    # ACT
+    report = faults.pool_exhaustion(core, requests=150, threads=100)
+
+    # ASSERT
+    assert report.errors == {}
+    assert report.throughput > 0
+    assert report.percentile(0.99) >= report.percentile(0.5)
+
+
+def test_heavy_payloads_mixed_with_tapir_commands(core):
+    report = faults.heavy_payloads(core, requests=20, threads=10, properties=500)
+
+    assert report.errors == {}
+
+
+def test_client_recovers_after_the_server_restarts(server, core):
+    # ARRANGE
+    port = server.port
+
+    # ACT
+    report = faults.recovery(server, core, outage=0.5, threads=2, timeout=10.0)
+
+    # ASSERT
+    assert server.port == port
+    assert report.injected == 1
+    assert report.errors.get("APIConnectionError", 0) > 0
+    assert report.recovery_time is not None and report.recovery_time < 2.0
+    summary = report.to_dict()
+    assert summary["recovery_time"] == report.recovery_time
+    assert set(summary["latency"]) == {"p50", "p95", "p99", "max"}
+
+
+def test_recovery_needs_the_server_of_the_client(server):
+    other = CoreCommands(Port(server.port + 1))
+
+    with pytest.raises(ValueError):
+        faults.recovery(server, other)
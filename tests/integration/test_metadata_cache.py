@@ -0,0 +1,79 @@
+import json
+import time
+
+import pytest
+
+from multiconn_archicad import MetadataCache, MultiConn, Port
+from multiconn_archicad.simulation import SimulatedArchicad, SyntheticProject
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def simulator(monkeypatch):
+    with SimulatedArchicad(SyntheticProject.generate(element_count=10, name="Cached.pln", seed=1)) as server:
+        monkeypatch.setattr(MultiConn, "_port_range", [Port(server.port)])
+        yield server
+
+
+def wait_until_cached(cache: MetadataCache, port: int, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while cache.load(Port(port)) is None:
+        assert time.monotonic() < deadline, "metadata was not cached"
+        time.sleep(0.01)
+
+
+def test_warm_start_sends_no_identification_requests(simulator, tmp_path):
+    # ARRANGE
+    cache = MetadataCache(tmp_path / "metadata.json")
+    with MultiConn(metadata_cache=cache) as first:
+        first.connect.all()
+    wait_until_cached(cache, simulator.port)
+    served = simulator.requests_served
+
+    # ACT
+    with MultiConn(metadata_cache=cache) as second:
+        second.connect.all()
+        header = second.open_port_headers[Port(simulator.port)]
+
+        # ASSERT
+        assert simulator.requests_served == served
+        assert header.archicad_id.projectName == "Cached.pln"
+        assert second.primary.archicad_id == first.primary.archicad_id
+        assert header.product_info == first.primary.product_info
+        second.core.post_command("API.IsAlive")
+
+
+def test_stale_entries_are_fetched_again(simulator, tmp_path):
+    # ARRANGE
+    path = tmp_path / "metadata.json"
+    cache = MetadataCache(path)
+    with MultiConn(metadata_cache=cache):
+        wait_until_cached(cache, simulator.port)
+    data = json.loads(path.read_text())
+    data["instances"][str(simulator.port)]["created"] -= 60  # another process got the PID since
+    path.write_text(json.dumps(data))
+    served = simulator.requests_served
+
+    # ACT
+    conn = MultiConn(metadata_cache=cache)
+
+    # ASSERT
+    assert conn.primary.archicad_id.projectName == "Cached.pln"
+    assert simulator.requests_served >= served + 3
+    wait_until_cached(cache, simulator.port)
+
+
+def test_refresh_replaces_the_cached_metadata(simulator, tmp_path):
+    cache = MetadataCache(tmp_path / "metadata.json")
+    conn = MultiConn(metadata_cache=cache)
+    wait_until_cached(cache, simulator.port)
+    simulator.project.name = "Renamed.pln"
+
+    conn.refresh.all_ports()
+    conn.open_port_headers[Port(simulator.port)].init_future.result(timeout=5)
+
+    deadline = time.monotonic() + 5
+    while cache.load(Port(simulator.port))[1].projectName != "Renamed.pln":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pytest
+
+from multiconn_archicad import ConnHeader, CoreCommands, CoreConfig, MetricsPolicy, MultiConn, OpenTelemetrySink, Port
+from multiconn_archicad.core.config import ResponseCachePolicy
+from multiconn_archicad.errors import CommandTimeoutError, StandardAPIError, TapirCommandError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+class FakeInstrument:
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def add(self, value, attributes):
+        self.points.append((value, attributes))
+
+    record = add
+
+
+class FakeMeter:
+    def __init__(self):
+        self.instruments = {}
+
+    def create_counter(self, name, unit="", description=""):
+        return self.instruments.setdefault(name, FakeInstrument(name))
+
+    create_histogram = create_counter
+
+
+def test_metrics_are_disabled_by_default(archicad_api):
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    core.post_command("API.IsAlive")
+
+    assert core.metrics is None
+
+
+def test_cores_without_metrics_keep_the_port_counters(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    conn = MultiConn(core_config=CoreConfig(metrics=MetricsPolicy()))
+    core = conn.primary.core
+    core.post_command("API.IsAlive")
+    recorder = core.metrics
+
+    # ACT
+    CoreCommands(Port(archicad_api.server_port))
+    ConnHeader.from_dict(conn.primary.to_dict())
+    core.reconfigure(CoreConfig())
+
+    # ASSERT
+    assert core.metrics is recorder
+    assert "API.IsAlive" in [entry.command for entry in conn.metrics().commands]
+
+
+def test_calls_latency_and_payload_sizes_are_recorded(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("Test.Slow", lambda payload: time.sleep(0.05) or {"succeeded": True, "result": {}})
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(metrics=MetricsPolicy()))
+
+    # ACT
+    for _ in range(3):
+        core.post_command("Test.Slow", {"padding": "x" * 100})
+    core.post_command("API.IsAlive")
+
+    # ASSERT
+    is_alive, slow = core.metrics.snapshot()
+    assert (slow.command, slow.port) == ("Test.Slow", archicad_api.server_port)
+    assert slow.calls == slow.requests == 3
+    assert slow.latency.count == 3
+    assert slow.latency.mean >= 0.05
+    assert slow.request_bytes > 300
+    assert slow.response_bytes == 3 * len(b'{"succeeded": true, "result": {}}')
+    assert is_alive.calls == 1
+
+
+def test_errors_are_counted_by_exception_class(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("Test.Fail", lambda payload: {"succeeded": False, "error": {"code": 1, "message": "no"}})
+    archicad_api.set_handler(
+        "GetStories",
+        lambda payload: {
+            "succeeded": True,
+            "result": {"addOnCommandResponse": {"error": {"code": 2, "message": "no"}}},
+        },
+    )
+    archicad_api.set_handler("Test.Stall", lambda payload: time.sleep(0.3) or {"succeeded": True, "result": {}})
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(metrics=MetricsPolicy()))
+
+    # ACT
+    with pytest.raises(StandardAPIError):
+        core.post_command("Test.Fail")
+    with pytest.raises(CommandTimeoutError):
+        core.post_command("Test.Stall", timeout=0.05)
+    with pytest.raises(TapirCommandError):
+        core.post_tapir_command("GetStories")
+
+    # ASSERT
+    snapshot = core.metrics.snapshot()
+    assert {m.command: m.errors for m in snapshot} == {
+        "GetStories": {"TapirCommandError": 1},
+        "Test.Fail": {"StandardAPIError": 1},
+        "Test.Stall": {"CommandTimeoutError": 1},
+    }
+
+
+def test_cache_hits_are_calls_without_requests(archicad_api):
+    config = CoreConfig(metrics=MetricsPolicy(), response_cache=ResponseCachePolicy(commands=frozenset({"GetStories"})))
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    for _ in range(4):
+        core.post_tapir_command("GetStories")
+
+    stories = core.metrics.snapshot()[0]
+    assert (stories.command, stories.calls, stories.requests) == ("GetStories", 4, 1)
+
+
+def test_queue_wait_is_recorded(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("Test.Slow", lambda payload: time.sleep(0.1) or {"succeeded": True, "result": {}})
+    config = CoreConfig(metrics=MetricsPolicy(), max_in_flight_per_port=1)
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    async def run():
+        async with core:
+            await asyncio.gather(*[core.post_command_async("Test.Slow") for _ in range(3)])
+
+    # ACT
+    asyncio.run(run())
+
+    # ASSERT
+    slow = core.metrics.snapshot()[0]
+    assert slow.queue_wait.count == 3
+    assert slow.queue_wait.total >= 0.25
+
+
+def test_streams_are_recorded_as_one_call(archicad_api):
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": {"elements": [1, 2]}})
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(metrics=MetricsPolicy()))
+
+    assert list(core.stream_command("API.GetAllElements")) == [1, 2]
+
+    elements = core.metrics.snapshot()[0]
+    assert (elements.calls, elements.requests) == (1, 1)
+    assert elements.response_bytes > 0
+
+
+def test_multiconn_snapshot_counts_each_port_once(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    conn = MultiConn(core_config=CoreConfig(metrics=MetricsPolicy()))
+
+    # ACT
+    conn.primary.core.post_command("API.IsAlive")
+    conn.open_port_headers[archicad_api.server_port].core.post_command("API.IsAlive")
+
+    # ASSERT
+    snapshot = conn.metrics()
+    assert [m.port for m in snapshot.commands if m.command == "API.IsAlive"] == [archicad_api.server_port]
+    assert snapshot.get("API.IsAlive").calls == 2
+    assert "multiconn_archicad_command_calls_total" in snapshot.to_prometheus()
+
+
+def test_open_telemetry_sink_receives_observations(archicad_api):
+    # ARRANGE
+    meter = FakeMeter()
+    config = CoreConfig(metrics=MetricsPolicy(sinks=(OpenTelemetrySink(meter),)))
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    # ACT
+    core.post_command("API.IsAlive")
+
+    # ASSERT
+    attributes = {"port": str(archicad_api.server_port), "command": "API.IsAlive"}
+    assert meter.instruments["multiconn_archicad.command.calls"].points == [(1, attributes)]
+    assert len(meter.instruments["multiconn_archicad.command.duration"].points) == 1
+    assert meter.instruments["multiconn_archicad.command.errors"].points == []
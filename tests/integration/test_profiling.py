@@ -0,0 +1,108 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from multiconn_archicad import ChunkingPolicy, CoreCommands, CoreConfig, Port, StageProfiler
+from multiconn_archicad.core.profiling import STAGES
+from multiconn_archicad.models.tapir.types import ElementId, ElementIdArrayItem
+from multiconn_archicad.unified_api.api import UnifiedApi
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def details_of_elements(archicad_api):
+    def handler(payload: dict) -> dict:
+        time.sleep(0.02)
+        elements = payload["parameters"]["addOnCommandParameters"]["elements"]
+        details = [
+            {"type": "Wall", "id": "W-001", "floorIndex": 0, "layerIndex": 1, "drawIndex": 1, "details": {}}
+            for _ in elements
+        ]
+        return {"succeeded": True, "result": {"addOnCommandResponse": {"detailsOfElements": details}}}
+
+    archicad_api.set_handler("GetDetailsOfElements", handler)
+
+
+def _elements(count: int) -> list[ElementIdArrayItem]:
+    return [ElementIdArrayItem(elementId=ElementId(guid=uuid.uuid4())) for _ in range(count)]
+
+
+def test_unified_call_records_every_stage(archicad_api, details_of_elements):
+    # ARRANGE
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port)))
+
+    # ACT
+    with StageProfiler() as profiler:
+        unified.tapir.element.get_details_of_elements(_elements(3))
+
+    # ASSERT
+    (profile,) = profiler.calls
+    assert profile.command == "GetDetailsOfElements"
+    assert set(profile.stages) == set(STAGES)
+    assert profile.stages["round_trip"] >= 0.02
+    assert sum(profile.stages.values()) <= profile.total
+    assert profiler.summary()[0].stage == "round_trip"
+
+
+def test_chunks_add_to_the_profile_of_their_call(archicad_api, details_of_elements):
+    # ARRANGE
+    config = CoreConfig(chunking=ChunkingPolicy(chunk_size=2, max_parallel=3))
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port), config=config))
+
+    # ACT
+    with StageProfiler() as profiler:
+        result = unified.tapir.element.get_details_of_elements(_elements(6))
+
+    # ASSERT
+    assert len(result) == 6
+    (profile,) = profiler.calls
+    assert profile.stages["round_trip"] >= 3 * 0.02
+
+
+def test_core_calls_are_profiled_on_their_own(archicad_api):
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    with StageProfiler() as profiler:
+        core.post_command("API.IsAlive")
+        asyncio.run(core.post_tapir_command_async("GetProjectInfo"))
+
+    assert [profile.command for profile in profiler.calls] == ["API.IsAlive", "GetProjectInfo"]
+    assert all({"encode", "queue_wait", "round_trip", "decode"} <= set(p.stages) for p in profiler.calls)
+
+
+def test_profiles_stay_separate_across_concurrent_tasks(archicad_api):
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    async def run():
+        async with core:
+            await asyncio.gather(*[core.post_command_async("API.IsAlive") for _ in range(10)])
+
+    with StageProfiler() as profiler:
+        asyncio.run(run())
+
+    assert len(profiler.calls) == 10
+    assert all(len(p.stages) == 4 for p in profiler.calls)
+
+
+def test_memory_profile_attributes_decoded_responses_and_models(archicad_api, details_of_elements):
+    # ARRANGE
+    unified = UnifiedApi(CoreCommands(Port(archicad_api.server_port)))
+
+    # ACT
+    with StageProfiler(memory=True) as profiler:
+        unified.tapir.element.get_details_of_elements(_elements(200))
+
+    # ASSERT
+    (profile,) = profiler.calls
+    assert {"decode", "validate_result"} <= set(profile.memory)
+    assert profile.memory_peak > 0
+    assert profile.objects["decode"]["dict"][0] >= 200
+    assert "GetDetailsOfElementsResult" in profile.objects["validate_result"]
+    by_command = profiler.object_summary(by_command=True)
+    assert {s.command for s in by_command} == {"GetDetailsOfElements"}
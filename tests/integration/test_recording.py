@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, Port, Recorder, Recording, Replayer
+from multiconn_archicad.errors import APIConnectionError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+def elements(count):
+    return lambda payload: {"succeeded": True, "result": {"elements": [{"guid": str(i)} for i in range(count)]}}
+
+
+def record_session(archicad_api, path=None) -> Recorder:
+    archicad_api.set_handler("API.GetAllElements", elements(3))
+    recorder = Recorder(path)
+    with CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=recorder)) as core:
+        core.post_command("API.IsAlive")
+        core.post_command("API.GetAllElements")
+        core.post_tapir_command("GetStories")
+    recorder.close()
+    return recorder
+
+
+def test_session_is_recorded_to_disk(archicad_api, tmp_path):
+    # ACT
+    record_session(archicad_api, tmp_path / "session.jsonl.gz")
+
+    # ASSERT
+    recording = Recording.load(tmp_path / "session.jsonl.gz")
+    assert [exchange.request["command"] for exchange in recording] == [
+        "API.IsAlive",
+        "API.GetAllElements",
+        "API.ExecuteAddOnCommand",
+    ]
+    assert all(exchange.status == 200 and exchange.duration > 0 for exchange in recording)
+
+
+def test_replay_answers_without_the_server(archicad_api):
+    # ARRANGE
+    recorder = record_session(archicad_api)
+    archicad_api.set_handler("API.GetAllElements", elements(0))
+    connections = archicad_api.connections_opened
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=Replayer(recorder.recording)))
+
+    # ACT
+    result = core.post_command("API.GetAllElements")
+    streamed = list(core.stream_command("API.GetAllElements"))
+
+    # ASSERT
+    assert len(result["elements"]) == len(streamed) == 3
+    assert archicad_api.connections_opened == connections
+
+
+def test_strict_replay_fails_unrecorded_requests(archicad_api):
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=Replayer(Recording())))
+
+    with pytest.raises(APIConnectionError, match="No recorded response"):
+        core.post_command("API.IsAlive")
+
+
+def test_lenient_replay_sends_unrecorded_requests(archicad_api):
+    replayer = Replayer(record_session(archicad_api).recording, strict=False)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=replayer))
+
+    assert core.post_command("API.GetSelectedElements") == {}
+
+
+def test_async_replay_keeps_the_original_timing(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("Test.Slow", lambda payload: time.sleep(0.1) or {"succeeded": True, "result": {}})
+    recorder = Recorder()
+    CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=recorder)).post_command("Test.Slow")
+    replayer = Replayer(recorder.recording, timing=True)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(transport_mode=replayer))
+
+    async def run():
+        async with core:
+            start = time.perf_counter()
+            await core.post_command_async("Test.Slow")
+            return time.perf_counter() - start
+
+    # ACT
+    elapsed = asyncio.run(run())
+
+    # ASSERT
+    assert elapsed >= 0.1
+
+
+def test_mock_server_replays_a_recording(archicad_api, tmp_path):
+    # ARRANGE
+    record_session(archicad_api, tmp_path / "session.jsonl")
+    archicad_api.reset()
+    archicad_api.replay(tmp_path / "session.jsonl")
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    # ACT
+    result = core.post_command("API.GetAllElements")
+
+    # ASSERT
+    assert [element["guid"] for element in result["elements"]] == ["0", "1", "2"]
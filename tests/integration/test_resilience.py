@@ -0,0 +1,162 @@
+import pytest
+import time
+import asyncio
+
+from multiconn_archicad import (
+    MultiConn,
+    CoreCommands,
+    CoreConfig,
+    RetryPolicy,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    CommandTimeoutError,
+    APIConnectionError,
+    Port,
+)
+from multiconn_archicad.conn_header import Status
+from multiconn_archicad.core.resilience import BreakerState
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def flaky(archicad_api):
+    """Makes a command stall past the client timeout for its first `failures` calls, then answer."""
+    calls = {"count": 0, "failures": 0}
+
+    def register(command: str, failures: int) -> dict:
+        calls["failures"] = failures
+
+        def handler(payload: dict) -> dict:
+            calls["count"] += 1
+            if calls["count"] <= calls["failures"]:
+                time.sleep(0.2)
+            return {"succeeded": True, "result": {"ok": True}}
+
+        archicad_api.set_handler(command, handler)
+        return calls
+
+    return register
+
+
+def _unused_port_core(config: CoreConfig) -> CoreCommands:
+    return CoreCommands(Port(19744), config=config)
+
+
+def test_read_only_command_is_retried(archicad_api, flaky):
+    # ARRANGE
+    calls = flaky("API.GetAllElements", failures=2)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(retry=RetryPolicy(base_delay=0.01)))
+
+    # ACT
+    result = core.post_command("API.GetAllElements", timeout=0.05)
+
+    # ASSERT
+    assert result == {"ok": True}
+    assert calls["count"] == 3
+
+
+def test_async_read_only_command_is_retried(archicad_api, flaky):
+    # ARRANGE
+    calls = flaky("API.GetAllElements", failures=1)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(retry=RetryPolicy(base_delay=0.01)))
+
+    async def run():
+        async with core:
+            return await core.post_command_async("API.GetAllElements", timeout=0.05)
+
+    # ACT
+    result = asyncio.run(run())
+
+    # ASSERT
+    assert result == {"ok": True}
+    assert calls["count"] == 2
+
+
+def test_retries_give_up_after_max_retries(archicad_api, flaky):
+    # ARRANGE
+    calls = flaky("API.GetAllElements", failures=10)
+    config = CoreConfig(retry=RetryPolicy(max_retries=2, base_delay=0.01))
+    core = CoreCommands(Port(archicad_api.server_port), config=config)
+
+    # ACT & ASSERT
+    with pytest.raises(CommandTimeoutError):
+        core.post_command("API.GetAllElements", timeout=0.05)
+    assert calls["count"] == 3
+
+
+def test_mutating_command_is_not_retried(archicad_api, flaky):
+    # ARRANGE
+    calls = flaky("API.SetPropertyValuesOfElements", failures=1)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(retry=RetryPolicy(base_delay=0.01)))
+
+    # ACT & ASSERT
+    with pytest.raises(CommandTimeoutError):
+        core.post_command("API.SetPropertyValuesOfElements", {"elementPropertyValues": []}, timeout=0.05)
+    assert calls["count"] == 1
+
+
+def test_tapir_mutating_command_is_not_retried(archicad_api, flaky):
+    calls = flaky("CreateColumns", failures=1)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(retry=RetryPolicy(base_delay=0.01)))
+
+    with pytest.raises(CommandTimeoutError):
+        core.post_tapir_command("CreateColumns", {"columnsData": []}, timeout=0.05)
+    assert calls["count"] == 1
+
+
+def test_breaker_fails_fast_after_threshold():
+    # ARRANGE
+    core = _unused_port_core(CoreConfig(circuit_breaker=CircuitBreakerPolicy(failure_threshold=2, reset_timeout=60)))
+    for _ in range(2):
+        with pytest.raises(APIConnectionError):
+            core.post_command("API.IsAlive")
+
+    # ACT & ASSERT
+    with pytest.raises(CircuitOpenError):
+        core.post_command("API.IsAlive")
+    assert not core.is_available()
+
+
+def test_breaker_stops_retries():
+    # ARRANGE
+    config = CoreConfig(
+        retry=RetryPolicy(max_retries=5, base_delay=0.0),
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=2, reset_timeout=60),
+    )
+    core = _unused_port_core(config)
+
+    # ACT & ASSERT
+    with pytest.raises(CircuitOpenError):
+        core.post_command("API.GetAllElements")
+    assert core._port_state.breaker.state is BreakerState.OPEN
+
+
+def test_open_breaker_takes_header_out_of_active(archicad_api, flaky):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    policy = CircuitBreakerPolicy(failure_threshold=2, reset_timeout=0.2)
+    conn = MultiConn(core_config=CoreConfig(circuit_breaker=policy))
+    conn.connect.all()
+    port = Port(archicad_api.server_port)
+    assert port in conn.active
+    calls = flaky("API.GetAllElements", failures=2)
+
+    # ACT
+    for _ in range(2):
+        with pytest.raises(CommandTimeoutError):
+            conn.open_port_headers[port].core.post_command("API.GetAllElements", timeout=0.05)
+
+    # ASSERT
+    assert conn.open_port_headers[port].status is Status.FAILED
+    assert port not in conn.active
+    assert port in conn.failed
+
+    deadline = time.monotonic() + 3.0
+    while port not in conn.active and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert port in conn.active
+    assert calls["count"] == 2
@@ -0,0 +1,159 @@
+import pytest
+import asyncio
+
+from multiconn_archicad import CoreCommands, CoreConfig, ResponseCachePolicy, MultiConn, Port
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def counted(archicad_api):
+    """Registers commands that answer with an incrementing counter, so repeated calls are distinguishable."""
+    calls: dict[str, int] = {}
+
+    def register(*commands: str) -> dict[str, int]:
+        for command in commands:
+            calls[command] = 0
+
+            def handler(payload: dict, command=command) -> dict:
+                calls[command] += 1
+                result = {"call": calls[command]}
+                if payload["command"] == "API.ExecuteAddOnCommand":
+                    return {"succeeded": True, "result": {"addOnCommandResponse": result}}
+                return {"succeeded": True, "result": result}
+
+            archicad_api.set_handler(command, handler)
+        return calls
+
+    return register
+
+
+@pytest.fixture
+def cached_core(archicad_api) -> CoreCommands:
+    return CoreCommands(Port(archicad_api.server_port), config=CoreConfig(response_cache=ResponseCachePolicy()))
+
+
+def test_repeated_read_is_served_from_cache(cached_core, counted):
+    # ARRANGE
+    calls = counted("API.GetAllPropertyNames")
+
+    # ACT
+    first = cached_core.post_command("API.GetAllPropertyNames")
+    first["mutated"] = True
+    second = cached_core.post_command("API.GetAllPropertyNames")
+
+    # ASSERT
+    assert calls["API.GetAllPropertyNames"] == 1
+    assert second == {"call": 1}
+    stats = cached_core.cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_different_parameters_are_cached_separately(cached_core, counted):
+    calls = counted("API.GetAttributesByType")
+
+    cached_core.post_command("API.GetAttributesByType", {"attributeType": "Layer"})
+    cached_core.post_command("API.GetAttributesByType", {"attributeType": "Fill"})
+    cached_core.post_command("API.GetAttributesByType", {"attributeType": "Layer"})
+
+    assert calls["API.GetAttributesByType"] == 2
+
+
+def test_tapir_reads_are_cached(cached_core, counted):
+    calls = counted("GetStories")
+
+    cached_core.post_tapir_command("GetStories")
+    result = cached_core.post_tapir_command("GetStories")
+
+    assert calls["GetStories"] == 1
+    assert result == {"call": 1}
+
+
+def test_mutating_command_invalidates_the_port(archicad_api, counted):
+    # ARRANGE
+    calls = counted("API.GetAllPropertyNames", "CreateColumns")
+    config = CoreConfig(response_cache=ResponseCachePolicy())
+    reader = CoreCommands(Port(archicad_api.server_port), config=config)
+    writer = CoreCommands(Port(archicad_api.server_port), config=config)
+    reader.post_command("API.GetAllPropertyNames")
+
+    # ACT
+    writer.post_tapir_command("CreateColumns", {"columnsData": []})
+    result = reader.post_command("API.GetAllPropertyNames")
+
+    # ASSERT
+    assert result == {"call": 2}
+    assert calls["API.GetAllPropertyNames"] == 2
+
+
+def test_commands_outside_the_policy_are_not_cached(cached_core, counted):
+    calls = counted("API.GetSelectedElements")
+
+    cached_core.post_command("API.GetSelectedElements")
+    cached_core.post_command("API.GetSelectedElements")
+
+    assert calls["API.GetSelectedElements"] == 2
+
+
+def test_async_path_shares_the_cache(cached_core, counted):
+    # ARRANGE
+    calls = counted("API.GetAllClassificationSystems")
+    cached_core.post_command("API.GetAllClassificationSystems")
+
+    async def run():
+        async with cached_core:
+            return await cached_core.post_command_async("API.GetAllClassificationSystems")
+
+    # ACT
+    result = asyncio.run(run())
+
+    # ASSERT
+    assert result == {"call": 1}
+    assert calls["API.GetAllClassificationSystems"] == 1
+
+
+def test_headers_of_one_port_share_the_cache(archicad_api):
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+
+    conn = MultiConn(core_config=CoreConfig(response_cache=ResponseCachePolicy()))
+    header = conn.open_port_headers[archicad_api.server_port]
+
+    assert header.core.cache is not None
+    assert conn.primary.core.cache is header.core.cache
+
+
+def test_cache_is_disabled_by_default(archicad_api):
+    assert CoreCommands(Port(archicad_api.server_port)).cache is None
+
+
+def test_other_cores_of_the_port_do_not_change_the_cache(cached_core, counted):
+    # ARRANGE
+    calls = counted("API.GetAllPropertyNames", "GetStories")
+    cached_core.post_command("API.GetAllPropertyNames")
+    cache = cached_core.cache
+
+    # ACT
+    CoreCommands(Port(cached_core.port))
+    CoreCommands(Port(cached_core.port), config=CoreConfig(response_cache=ResponseCachePolicy(commands=frozenset())))
+    cached_core.reconfigure(CoreConfig(response_cache=ResponseCachePolicy()))
+    cached_core.post_command("API.GetAllPropertyNames")
+    cached_core.post_tapir_command("GetStories")
+    cached_core.post_tapir_command("GetStories")
+
+    # ASSERT
+    assert cached_core.cache is cache
+    assert calls == {"API.GetAllPropertyNames": 1, "GetStories": 1}
+
+
+def test_reconfigure_with_another_policy_replaces_the_cache(cached_core, counted):
+    calls = counted("API.GetAllPropertyNames")
+    cached_core.post_command("API.GetAllPropertyNames")
+
+    cached_core.reconfigure(CoreConfig(response_cache=ResponseCachePolicy(ttl=60.0)))
+    cached_core.post_command("API.GetAllPropertyNames")
+
+    assert cached_core.cache.policy.ttl == 60.0
+    assert calls["API.GetAllPropertyNames"] == 2
@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+
+from multiconn_archicad import CoreCommands, MultiConn, Port
+from multiconn_archicad import multi_conn
+from multiconn_archicad.errors import APIConnectionError, CommandTimeoutError
+from multiconn_archicad.simulation import SimulatedArchicad, SimulationSettings, SyntheticProject, start_instances
+from multiconn_archicad.unified_api.api import UnifiedApi
+from multiconn_archicad.utilities.network_utils import listening_ports
+from multiconn_archicad.utilities.thread_utils import EXECUTOR
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def simulator():
+    with SimulatedArchicad(SyntheticProject.generate(element_count=500, seed=1)) as server:
+        yield server
+
+
+def test_typed_api_reads_the_synthetic_project(simulator):
+    # ARRANGE
+    unified = UnifiedApi(CoreCommands(Port(simulator.port)))
+
+    # ACT
+    elements = unified.official.element_listing.get_all_elements()
+    walls = unified.official.element_listing.get_elements_by_type("Wall")
+    stories = unified.tapir.project.get_stories()
+
+    # ASSERT
+    assert len(elements) == 500
+    assert {str(item.elementId.guid).upper() for item in walls} == {
+        element.guid for element in simulator.project.elements if element.type == "Wall"
+    }
+    assert len(stories.stories) == len(simulator.project.stories)
+
+
+def test_injected_resets_fail_the_call():
+    settings = SimulationSettings(failure_rate=1.0, failures=("reset",))
+    with SimulatedArchicad(settings=settings) as server:
+        with pytest.raises(APIConnectionError):
+            CoreCommands(Port(server.port)).post_command("API.IsAlive")
+        assert server.failures_injected >= 1
+
+
+def test_injected_hangs_time_out():
+    settings = SimulationSettings(failure_rate=1.0, failures=("timeout",), hang_seconds=2.0)
+    with SimulatedArchicad(settings=settings) as server:
+        with pytest.raises(CommandTimeoutError):
+            CoreCommands(Port(server.port)).post_command("API.IsAlive", timeout=0.3)
+
+
+def test_commands_are_processed_one_at_a_time():
+    # ARRANGE
+    settings = SimulationSettings(latency=0.2, max_concurrency=1)
+    with SimulatedArchicad(settings=settings) as server:
+        core = CoreCommands(Port(server.port))
+        core.post_command("API.IsAlive")  # opens the first connection outside of the measurement
+        start = time.perf_counter()
+
+        # ACT
+        list(EXECUTOR.map(lambda _: core.post_command("API.GetAllElements"), range(3)))
+
+    # ASSERT
+    assert time.perf_counter() - start >= 0.55
+
+
+def test_multi_conn_discovers_simulated_instances(monkeypatch):
+    # ARRANGE
+    instances = start_instances(2, element_count=10)
+    monkeypatch.setattr(MultiConn, "_port_range", [Port(instance.port) for instance in instances])
+    try:
+        # ACT
+        conn = MultiConn()
+        conn.connect.all()
+
+        # ASSERT
+        projects = sorted(header.archicad_id.projectName for header in conn.active.values())
+        assert projects == ["Simulated Project 1.pln", "Simulated Project 2.pln"]
+    finally:
+        for instance in instances:
+            instance.stop()
+
+
+def test_lazy_discovery_starts_from_the_given_port(monkeypatch):
+    # ARRANGE
+    instances = start_instances(3, element_count=10)
+    ports = [Port(instance.port) for instance in instances]
+    monkeypatch.setattr(MultiConn, "_port_range", ports)
+    scanned: list[list[Port]] = []
+    scan_ports = MultiConn.scan_ports
+    monkeypatch.setattr(
+        MultiConn, "scan_ports", lambda self, requested: scanned.append(requested) or scan_ports(self, requested)
+    )
+    try:
+        # ACT
+        conn = MultiConn(port=ports[1], lazy_discovery=True)
+
+        # ASSERT
+        assert scanned == [[ports[1]]]
+        assert conn.primary.port == ports[1]
+        conn.discovery_future.result(timeout=5)
+        assert list(conn.open_port_headers) == ports
+        assert conn.primary.archicad_id.projectName == "Simulated Project 2.pln"
+    finally:
+        for instance in instances:
+            instance.stop()
+
+
+def test_background_discovery_respects_changes_made_while_it_probes(monkeypatch):
+    # ARRANGE
+    instances = start_instances(3, element_count=10)
+    first, closed, refreshed = [Port(instance.port) for instance in instances]
+    monkeypatch.setattr(MultiConn, "_port_range", [first, closed, refreshed])
+    probing, release = threading.Event(), threading.Event()
+
+    def blocking_listening_ports(address, ports, timeout):
+        found = listening_ports(address, ports, timeout)
+        if list(ports) != [first]:
+            probing.set()
+            release.wait(5)
+        return found
+
+    monkeypatch.setattr(multi_conn, "listening_ports", blocking_listening_ports)
+    try:
+        conn = MultiConn(port=first, lazy_discovery=True)
+        assert probing.wait(5)
+
+        # ACT
+        conn.create_or_refresh_connection(closed)
+        conn.close_if_open(closed)
+        conn.create_or_refresh_connection(refreshed)
+        header = conn.open_port_headers[refreshed]
+        release.set()
+        conn.discovery_future.result(timeout=5)
+
+        # ASSERT
+        assert list(conn.open_port_headers) == [first, refreshed]
+        assert conn.open_port_headers[refreshed] is header
+    finally:
+        release.set()
+        for instance in instances:
+            instance.stop()
+
+
+def test_lazy_discovery_without_a_port_scans_the_whole_range(monkeypatch):
+    instances = start_instances(2, element_count=10)
+    monkeypatch.setattr(MultiConn, "_port_range", [Port(instance.port) for instance in instances])
+    try:
+        conn = MultiConn(lazy_discovery=True)
+
+        assert conn.discovery_future is None
+        assert len(conn.open_port_headers) == 2
+    finally:
+        for instance in instances:
+            instance.stop()
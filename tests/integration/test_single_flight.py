@@ -0,0 +1,159 @@
+import pytest
+import time
+import asyncio
+import threading
+import concurrent.futures
+
+from multiconn_archicad import CoreCommands, CoreConfig, Port, CommandTimeoutError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def slow_counted(archicad_api):
+    """Registers a command that takes a moment to answer and counts how often the server executed it."""
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def register(command: str, delay: float = 0.1) -> dict:
+        def handler(payload: dict) -> dict:
+            with lock:
+                calls["count"] += 1
+            time.sleep(delay)
+            result = {"value": 42}
+            if payload["command"] == "API.ExecuteAddOnCommand":
+                return {"succeeded": True, "result": {"addOnCommandResponse": result}}
+            return {"succeeded": True, "result": result}
+
+        archicad_api.set_handler(command, handler)
+        return calls
+
+    return register
+
+
+@pytest.fixture
+def coalescing_core(archicad_api) -> CoreCommands:
+    return CoreCommands(Port(archicad_api.server_port), config=CoreConfig(coalesce_reads=True))
+
+
+def test_concurrent_identical_reads_share_one_request(coalescing_core, slow_counted):
+    # ARRANGE
+    calls = slow_counted("GetProjectInfo")
+
+    # ACT
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: coalescing_core.post_tapir_command("GetProjectInfo"), range(8)))
+
+    # ASSERT
+    assert calls["count"] == 1
+    assert results == [{"value": 42}] * 8
+    assert len({id(result) for result in results}) == 8
+    assert coalescing_core.single_flight.stats().coalesced == 7
+
+
+def test_concurrent_identical_async_reads_share_one_request(coalescing_core, slow_counted):
+    # ARRANGE
+    calls = slow_counted("API.GetAllElements")
+
+    async def run():
+        async with coalescing_core:
+            return await asyncio.gather(*(coalescing_core.post_command_async("API.GetAllElements") for _ in range(10)))
+
+    # ACT
+    results = asyncio.run(run())
+
+    # ASSERT
+    assert calls["count"] == 1
+    assert results == [{"value": 42}] * 10
+
+
+def test_threads_and_tasks_share_one_request(coalescing_core, slow_counted):
+    # ARRANGE
+    calls = slow_counted("API.GetAllElements", delay=0.3)
+    leader = threading.Thread(target=coalescing_core.post_command, args=("API.GetAllElements",))
+    leader.start()
+    while calls["count"] == 0:
+        time.sleep(0.005)
+
+    async def follow():
+        async with coalescing_core:
+            return await coalescing_core.post_command_async("API.GetAllElements")
+
+    # ACT
+    result = asyncio.run(follow())
+    leader.join()
+
+    # ASSERT
+    assert result == {"value": 42}
+    assert calls["count"] == 1
+
+
+def test_mutating_commands_are_never_coalesced(coalescing_core, slow_counted):
+    calls = slow_counted("API.SetPropertyValuesOfElements")
+    parameters = {"elementPropertyValues": []}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda _: coalescing_core.post_command("API.SetPropertyValuesOfElements", parameters), range(4)
+            )
+        )
+
+    assert calls["count"] == 4
+
+
+def test_different_parameters_are_not_coalesced(coalescing_core, slow_counted):
+    calls = slow_counted("API.GetElementsByType")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(
+            executor.map(
+                lambda element_type: coalescing_core.post_command(
+                    "API.GetElementsByType", {"elementType": element_type}
+                ),
+                ["Wall", "Slab"],
+            )
+        )
+
+    assert calls["count"] == 2
+
+
+def test_follower_timeout_does_not_affect_the_flight(coalescing_core, slow_counted):
+    # ARRANGE
+    calls = slow_counted("API.GetAllElements", delay=0.3)
+    results = []
+    leader = threading.Thread(target=lambda: results.append(coalescing_core.post_command("API.GetAllElements")))
+    leader.start()
+    while calls["count"] == 0:
+        time.sleep(0.005)
+
+    # ACT & ASSERT
+    with pytest.raises(CommandTimeoutError, match="identical request"):
+        coalescing_core.post_command("API.GetAllElements", timeout=0.05)
+    leader.join()
+    assert results == [{"value": 42}]
+
+
+def test_cancelled_async_leader_hands_over_to_followers(coalescing_core, slow_counted):
+    # ARRANGE
+    calls = slow_counted("API.GetAllElements", delay=0.2)
+
+    async def run():
+        async with coalescing_core:
+            leader = asyncio.create_task(coalescing_core.post_command_async("API.GetAllElements"))
+            while calls["count"] == 0:
+                await asyncio.sleep(0.005)
+            follower = asyncio.create_task(coalescing_core.post_command_async("API.GetAllElements"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+    # ACT
+    result = asyncio.run(run())
+
+    # ASSERT
+    assert result == {"value": 42}
+    assert calls["count"] == 2
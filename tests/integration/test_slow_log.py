@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, MultiConn, Port, SlowCommandPolicy
+from multiconn_archicad.errors import CommandTimeoutError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+def slow(seconds):
+    return lambda payload: time.sleep(seconds) or {"succeeded": True, "result": {"elements": [1, 2, 3]}}
+
+
+def test_slow_log_is_disabled_by_default(archicad_api):
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    core.post_command("API.IsAlive")
+
+    assert core.slow_log is None
+
+
+def test_cores_without_a_slow_log_keep_the_port_log(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", slow(0.1))
+    core = CoreCommands(
+        Port(archicad_api.server_port), config=CoreConfig(slow_commands=SlowCommandPolicy(threshold=0.05))
+    )
+    core.post_command("API.GetAllElements")
+
+    # ACT
+    CoreCommands(Port(archicad_api.server_port))
+    core.reconfigure(CoreConfig())
+
+    # ASSERT
+    assert [entry.command for entry in core.slow_log.entries()] == ["API.GetAllElements"]
+
+
+def test_only_calls_above_their_threshold_are_logged(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", slow(0.3))
+    archicad_api.set_handler(
+        "GetNavigatorItemTree", lambda payload: time.sleep(0.3) or {"succeeded": True, "result": {}}
+    )
+    policy = SlowCommandPolicy(threshold=0.2, thresholds={"GetNavigatorItemTree": 1.0}, max_parameter_chars=20)
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(slow_commands=policy))
+
+    # ACT
+    core.post_command("API.IsAlive")
+    core.post_command("API.GetAllElements", {"padding": "x" * 100})
+    core.post_tapir_command("GetNavigatorItemTree", {"navigatorTreeId": {"type": "ProjectMap"}})
+
+    # ASSERT
+    (entry,) = core.slow_log.entries()
+    assert (entry.command, entry.port, entry.error) == ("API.GetAllElements", archicad_api.server_port, None)
+    assert entry.latency >= 0.3
+    assert entry.parameters.startswith('{"padding":')
+    assert entry.parameters.endswith("more chars)")
+    assert entry.request_bytes > 100
+    assert entry.response_bytes == len(b'{"succeeded": true, "result": {"elements": [1, 2, 3]}}')
+
+
+def test_failed_and_streamed_calls_are_logged(archicad_api):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", slow(0.3))
+    archicad_api.set_handler("Test.Stall", slow(0.5))
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(slow_commands=SlowCommandPolicy(0.2)))
+
+    # ACT
+    with pytest.raises(CommandTimeoutError):
+        core.post_command("Test.Stall", timeout=0.25)
+    assert list(core.stream_command("API.GetAllElements")) == [1, 2, 3]
+
+    # ASSERT
+    stall, stream = core.slow_log.entries()
+    assert (stall.command, stall.error, stall.response_bytes) == ("Test.Stall", "CommandTimeoutError", 0)
+    assert (stream.command, stream.error) == ("API.GetAllElements", None)
+    assert stream.response_bytes > 0
+
+
+def test_multiconn_collects_slow_calls_with_project_names(archicad_api):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    archicad_api.set_handler("API.GetAllElements", slow(0.3))
+    conn = MultiConn(core_config=CoreConfig(slow_commands=SlowCommandPolicy(threshold=0.2)))
+    header = conn.open_port_headers[archicad_api.server_port]
+    header.connect()
+
+    # ACT
+    conn.primary.core.post_command("API.GetAllElements")
+    header.core.post_command("API.GetAllElements")
+
+    # ASSERT
+    entries = [entry for entry in conn.slow_commands() if entry.command == "API.GetAllElements"]
+    assert len(entries) == 2
+    assert entries[0].timestamp <= entries[1].timestamp
+    assert {entry.project for entry in entries} == {header.archicad_id.projectName}
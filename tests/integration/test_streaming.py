@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, Port
+from multiconn_archicad.errors import InvalidResponseFormatError, StandardAPIError, TapirCommandError
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+DETAILS = [{"type": "Wall", "floorIndex": index, "layerIndex": 1, "drawIndex": 1} for index in range(5000)]
+
+
+@pytest.fixture
+def details_of_elements(archicad_api):
+    archicad_api.set_handler(
+        "GetDetailsOfElements",
+        lambda payload: {"succeeded": True, "result": {"addOnCommandResponse": {"detailsOfElements": DETAILS}}},
+    )
+
+
+def test_stream_tapir_command_yields_every_item(archicad_api, details_of_elements):
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    items = core.stream_tapir_command("GetDetailsOfElements", {"elements": []}, items="detailsOfElements")
+
+    assert list(items) == DETAILS
+
+
+def test_stream_command_yields_standard_result_items(archicad_api):
+    # ARRANGE
+    elements = [{"elementId": {"guid": f"{index:08d}-0000-0000-0000-000000000000"}} for index in range(100)]
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": {"elements": elements}})
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    # ACT
+    items = list(core.stream_command("API.GetAllElements"))
+
+    # ASSERT
+    assert items == elements
+
+
+def test_stream_holds_the_request_slot_until_closed(archicad_api, details_of_elements):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(max_in_flight_per_port=1))
+    opened_before = archicad_api.connections_opened
+    items = core.stream_tapir_command("GetDetailsOfElements", items="detailsOfElements")
+
+    # ACT
+    first = next(items)
+    in_flight_while_streaming = core.admission.in_flight
+    items.close()
+
+    # ASSERT
+    assert first == DETAILS[0]
+    assert in_flight_while_streaming == 1
+    assert core.admission.in_flight == 0
+    assert core.post_command("API.IsAlive") == {"isAlive": True}
+    assert archicad_api.connections_opened - opened_before <= 2
+
+
+def test_exhausted_stream_returns_its_connection_to_the_pool(archicad_api, details_of_elements):
+    core = CoreCommands(Port(archicad_api.server_port))
+    opened_before = archicad_api.connections_opened
+
+    for _ in range(3):
+        assert sum(1 for _ in core.stream_tapir_command("GetDetailsOfElements", items="detailsOfElements")) == 5000
+    core.post_command("API.IsAlive")
+
+    assert archicad_api.connections_opened - opened_before == 1
+
+
+def test_stream_raises_standard_error(archicad_api):
+    archicad_api.set_handler(
+        "API.GetAllElements", lambda payload: {"succeeded": False, "error": {"code": 4001, "message": "Bad"}}
+    )
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    with pytest.raises(StandardAPIError, match="Bad"):
+        list(core.stream_command("API.GetAllElements"))
+
+
+def test_stream_raises_tapir_error(archicad_api):
+    archicad_api.set_handler(
+        "GetDetailsOfElements",
+        lambda payload: {"succeeded": True, "result": {"addOnCommandResponse": {"error": {"code": 1, "message": "Nope"}}}},
+    )
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    with pytest.raises(TapirCommandError, match="Nope"):
+        list(core.stream_tapir_command("GetDetailsOfElements", items="detailsOfElements"))
+
+
+def test_stream_without_the_list_raises_invalid_format(archicad_api):
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": {"other": []}})
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    with pytest.raises(InvalidResponseFormatError, match="'elements'"):
+        list(core.stream_command("API.GetAllElements"))
+
+
+def test_stream_async_yields_every_item(archicad_api, details_of_elements):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port))
+
+    async def run():
+        async with core:
+            return [
+                item
+                async for item in core.stream_tapir_command_async(
+                    "GetDetailsOfElements", {"elements": []}, items="detailsOfElements"
+                )
+            ]
+
+    # ACT
+    items = asyncio.run(run())
+
+    # ASSERT
+    assert items == DETAILS
+    assert core.admission.in_flight == 0
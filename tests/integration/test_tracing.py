@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+import pytest
+
+from multiconn_archicad import CoreCommands, CoreConfig, InMemorySpanExporter, MultiConn, Port, Tracer
+from multiconn_archicad.errors import StandardAPIError
+from multiconn_archicad.utilities.thread_utils import EXECUTOR
+
+pytestmark = [
+    pytest.mark.usefixtures("archicad_api"),
+    pytest.mark.integration,
+]
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    return Tracer(exporter)
+
+
+def test_command_is_a_child_span_with_port_and_sizes(archicad_api, tracer, exporter):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(tracer=tracer))
+
+    # ACT
+    with tracer.span("workflow") as root:
+        core.post_command("API.IsAlive")
+
+    # ASSERT
+    command, workflow = exporter.spans
+    assert workflow is root
+    assert (command.trace_id, command.parent_id) == (root.trace_id, root.span_id)
+    assert command.name == "API.IsAlive"
+    assert command.attributes["port"] == archicad_api.server_port
+    assert command.attributes["command"] == "API.IsAlive"
+    assert command.attributes["requests"] == 1
+    assert command.attributes["request_bytes"] > 0
+    assert command.attributes["response_bytes"] > 0
+    assert "project" not in command.attributes
+
+
+def test_failed_command_span_records_the_error(archicad_api, tracer, exporter):
+    archicad_api.set_handler("Test.Fail", lambda payload: {"succeeded": False, "error": {"code": 1, "message": "no"}})
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(tracer=tracer))
+
+    with pytest.raises(StandardAPIError):
+        core.post_command("Test.Fail")
+
+    assert exporter.spans[0].error == "StandardAPIError"
+
+
+def test_trace_follows_work_onto_the_executor_and_tasks(archicad_api, tracer, exporter):
+    # ARRANGE
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(tracer=tracer))
+
+    async def run():
+        async with core:
+            await asyncio.gather(*[core.post_command_async("API.IsAlive") for _ in range(3)])
+
+    # ACT
+    with tracer.span("workflow") as root:
+        futures = [EXECUTOR.submit(core.post_command, "API.IsAlive") for _ in range(3)]
+        for future in futures:
+            future.result()
+        asyncio.run(run())
+
+    # ASSERT
+    commands = [span for span in exporter.spans if span is not root]
+    assert len(commands) == 6
+    assert {(span.trace_id, span.parent_id) for span in commands} == {(root.trace_id, root.span_id)}
+
+
+def test_stream_span_does_not_leak_into_the_consumer(archicad_api, tracer, exporter):
+    # ARRANGE
+    archicad_api.set_handler("API.GetAllElements", lambda payload: {"succeeded": True, "result": {"elements": [1, 2]}})
+    core = CoreCommands(Port(archicad_api.server_port), config=CoreConfig(tracer=tracer))
+
+    # ACT
+    with tracer.span("workflow") as root:
+        for _ in core.stream_command("API.GetAllElements"):
+            assert tracer.start_span("consumer").parent_id == root.span_id
+
+    # ASSERT
+    stream, workflow = exporter.spans
+    assert (stream.name, stream.parent_id) == ("API.GetAllElements", root.span_id)
+    assert stream.attributes["response_bytes"] > 0
+    assert "requests" not in workflow.attributes
+
+
+def test_multiconn_fan_out_shares_one_trace_with_project_names(archicad_api, tracer, exporter):
+    # ARRANGE
+    archicad_api.set_response("GetProjectInfo", "get_project_info_solo.json")
+    archicad_api.set_handler("Test.Slow", lambda payload: time.sleep(0.02) or {"succeeded": True, "result": {}})
+    conn = MultiConn(core_config=CoreConfig(tracer=tracer))
+    headers = list(conn.open_port_headers.values())
+    exporter.clear()
+
+    # ACT
+    with tracer.span("fan out") as root:
+        futures = [EXECUTOR.submit(header.core.post_command, "Test.Slow") for header in headers]
+        for future in futures:
+            future.result()
+
+    # ASSERT
+    commands = [span for span in exporter.spans if span.name == "Test.Slow"]
+    assert len(commands) == len(headers)
+    assert {span.trace_id for span in commands} == {root.trace_id}
+    assert {span.attributes["project"] for span in commands} == {header.archicad_id.projectName for header in headers}
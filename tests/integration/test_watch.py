@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+import pytest
+
+from multiconn_archicad import InstanceEventKind, MultiConn, Port, WatchPolicy
+from multiconn_archicad.conn_header import Status
+from multiconn_archicad.simulation import start_instances
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def instances(monkeypatch):
+    servers = start_instances(2, element_count=10)
+    monkeypatch.setattr(MultiConn, "_port_range", [Port(server.port) for server in servers])
+    servers[1].stop()
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def _settle(conn: MultiConn) -> None:
+    for header in conn.open_port_headers.values():
+        header.init_future.result(timeout=5)
+
+
+def test_poll_reports_every_kind_of_change(instances):
+    # ARRANGE
+    first, second = instances
+    conn = MultiConn()
+    conn.watch.policy = WatchPolicy(refresh_metadata=True)
+    _settle(conn)
+    assert conn.watch.poll() == []
+
+    # ACT & ASSERT: a new instance
+    second.start()
+    (appeared,) = conn.watch.poll()
+    assert (appeared.kind, appeared.port) == (InstanceEventKind.APPEARED, second.port)
+    assert list(conn.open_port_headers) == [first.port, second.port]
+
+    # ACT & ASSERT: a project switch and a status change
+    _settle(conn)  # the refresh started by the previous poll must not see the new project yet
+    first.commands.project.name = "Switched.pln"
+    assert conn.watch.poll() == []
+    conn.connect.from_ports(Port(first.port))
+    _settle(conn)
+    events = {event.kind: event for event in conn.watch.poll()}
+    switched = events[InstanceEventKind.PROJECT_SWITCHED]
+    assert (switched.previous.projectName, switched.current.projectName) == ("Simulated Project 1.pln", "Switched.pln")
+    changed = events[InstanceEventKind.STATUS_CHANGED]
+    assert (changed.port, changed.previous, changed.current) == (first.port, Status.PENDING, Status.ACTIVE)
+
+    # ACT & ASSERT: an instance that quit
+    second.stop()
+    (gone,) = conn.watch.poll()
+    assert (gone.kind, gone.port) == (InstanceEventKind.GONE, second.port)
+    assert list(conn.open_port_headers) == [first.port]
+
+
+def test_polls_send_no_commands_by_default(instances):
+    # ARRANGE
+    first, _ = instances
+    conn = MultiConn()
+    _settle(conn)
+    served = first.requests_served
+
+    # ACT
+    events = conn.watch.poll() + conn.watch.poll()
+
+    # ASSERT
+    assert events == []
+    assert first.requests_served == served
+
+
+def test_background_watch_notifies_subscribers(instances):
+    # ARRANGE
+    first, second = instances
+    appeared = threading.Event()
+    conn = MultiConn()
+    conn.watch.subscribe(lambda event: event.kind is InstanceEventKind.APPEARED and appeared.set())
+    conn.watch.subscribe(lambda event: 1 / 0)  # a failing subscriber does not stop the others
+
+    # ACT
+    conn.watch.start(WatchPolicy(interval=0.05, max_interval=0.1))
+    second.start()
+
+    # ASSERT
+    try:
+        assert appeared.wait(timeout=5)
+        assert conn.watch.running
+    finally:
+        conn.close()
+    assert not conn.watch.running
+
+
+def test_events_can_be_awaited(instances):
+    first, second = instances
+    conn = MultiConn()
+
+    async def next_event():
+        events = conn.watch.events()
+        pending = asyncio.ensure_future(anext(events))
+        await asyncio.sleep(0)
+        second.start()
+        try:
+            return await asyncio.wait_for(pending, timeout=5)
+        finally:
+            await events.aclose()
+
+    conn.watch.start(WatchPolicy(interval=0.05, max_interval=0.1))
+    try:
+        event = asyncio.run(next_event())
+    finally:
+        conn.close()
+
+    assert (event.kind, event.port) == (InstanceEventKind.APPEARED, second.port)
+
+
+@pytest.mark.parametrize("settings", [{"interval": 0}, {"interval": 5, "max_interval": 1}, {"backoff_factor": 0.5}])
+def test_watch_policy_rejects_invalid_settings(settings):
+    with pytest.raises(ValueError):
+        WatchPolicy(**settings)
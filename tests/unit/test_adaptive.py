@@ -0,0 +1,116 @@
+import pytest
+
+from multiconn_archicad.core.adaptive import AIMDLimiter
+from multiconn_archicad.core.admission import AdmissionController
+from multiconn_archicad.core.config import AdaptiveConcurrency
+
+pytestmark = pytest.mark.unit
+
+
+def _limiter(**settings) -> AIMDLimiter:
+    return AIMDLimiter(AdmissionController(limit=None), AdaptiveConcurrency(**settings))
+
+
+def _succeed(limiter: AIMDLimiter, count: int, latency: float = 0.01) -> None:
+    for _ in range(count):
+        limiter.on_success(limiter.begin(), latency)
+
+
+def test_starts_at_initial_limit():
+    limiter = _limiter(initial_limit=3, max_limit=8)
+
+    assert limiter.limit == 3
+    assert limiter.baseline_latency is None
+
+
+def test_limit_grows_by_one_per_full_window():
+    # ARRANGE
+    limiter = _limiter(initial_limit=2, max_limit=8)
+
+    # ACT & ASSERT
+    _succeed(limiter, 1)
+    assert limiter.limit == 2
+    _succeed(limiter, 1)
+    assert limiter.limit == 3
+    _succeed(limiter, 3)
+    assert limiter.limit == 4
+
+
+def test_limit_stops_at_max():
+    limiter = _limiter(initial_limit=1, max_limit=3)
+
+    _succeed(limiter, 100)
+
+    assert limiter.limit == 3
+
+
+def test_rising_latency_stops_growth():
+    # ARRANGE
+    limiter = _limiter(initial_limit=2, max_limit=8, latency_tolerance=2.0)
+    _succeed(limiter, 1, latency=0.01)
+
+    # ACT
+    _succeed(limiter, 20, latency=0.05)
+
+    # ASSERT
+    assert limiter.limit == 2
+
+
+def test_overload_cuts_the_limit_multiplicatively():
+    # ARRANGE
+    limiter = _limiter(initial_limit=8, max_limit=8, backoff_factor=0.5)
+
+    # ACT & ASSERT
+    limiter.on_overload(limiter.begin())
+    assert limiter.limit == 4
+    limiter.on_overload(limiter.begin())
+    assert limiter.limit == 2
+
+
+def test_overload_never_goes_below_min():
+    limiter = _limiter(initial_limit=2, min_limit=2, max_limit=8)
+
+    limiter.on_overload(limiter.begin())
+
+    assert limiter.limit == 2
+
+
+def test_one_overload_burst_backs_off_once():
+    # ARRANGE
+    limiter = _limiter(initial_limit=8, max_limit=8, backoff_factor=0.5)
+    tokens = [limiter.begin() for _ in range(8)]
+
+    # ACT
+    for token in tokens:
+        limiter.on_overload(token)
+
+    # ASSERT
+    assert limiter.limit == 4
+
+
+def test_successes_started_before_a_cut_do_not_count():
+    # ARRANGE
+    limiter = _limiter(initial_limit=2, max_limit=8)
+    stale_tokens = [limiter.begin() for _ in range(5)]
+    limiter.on_overload(limiter.begin())
+
+    # ACT
+    for token in stale_tokens:
+        limiter.on_success(token, 0.01)
+
+    # ASSERT
+    assert limiter.limit == 1
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"min_limit": 0},
+        {"initial_limit": 10, "max_limit": 8},
+        {"backoff_factor": 1.0},
+        {"latency_tolerance": 0.5},
+    ],
+)
+def test_invalid_settings_are_rejected(settings):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(**settings)
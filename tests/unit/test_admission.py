@@ -0,0 +1,259 @@
+import pytest
+import time
+import asyncio
+import threading
+
+from multiconn_archicad.basic_types import Port
+from multiconn_archicad.core.admission import AdmissionController
+from multiconn_archicad.core.config import CoreConfig, MetricsPolicy, ResponseCachePolicy
+from multiconn_archicad.core.core_commands import CoreCommands
+from multiconn_archicad.core.port_state import reset_port_states
+
+pytestmark = pytest.mark.unit
+
+
+def _hold_slot(controller: AdmissionController, release: threading.Event) -> threading.Thread:
+    acquired = threading.Event()
+
+    def worker():
+        with controller.slot():
+            acquired.set()
+            release.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    acquired.wait()
+    return thread
+
+
+def _wait_for_queue_depth(controller: AdmissionController, depth: int) -> None:
+    deadline = time.monotonic() + 2.0
+    while controller.queue_depth != depth and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert controller.queue_depth == depth
+
+
+def test_immediate_admission_below_limit():
+    controller = AdmissionController(limit=2)
+
+    assert controller.acquire() == 0.0
+    assert controller.acquire() == 0.0
+    assert controller.in_flight == 2
+
+    controller.release()
+    controller.release()
+    assert controller.in_flight == 0
+
+
+def test_unlimited_controller_never_queues():
+    controller = AdmissionController(limit=None)
+
+    for _ in range(100):
+        controller.acquire()
+
+    assert controller.in_flight == 100
+    assert controller.queue_depth == 0
+
+
+def test_queue_is_fifo_within_a_priority():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+    release = threading.Event()
+    holder = _hold_slot(controller, release)
+    order = []
+
+    def worker(name):
+        with controller.slot():
+            order.append(name)
+
+    # ACT
+    threads = []
+    for name in range(5):
+        thread = threading.Thread(target=worker, args=(name,))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queue_depth(controller, name + 1)
+    release.set()
+    for thread in [holder, *threads]:
+        thread.join()
+
+    # ASSERT
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_higher_priority_is_served_first():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+    release = threading.Event()
+    holder = _hold_slot(controller, release)
+    order = []
+
+    def worker(name, priority):
+        with controller.slot(priority=priority):
+            order.append(name)
+
+    # ACT
+    threads = []
+    for index, (name, priority) in enumerate([("low", 0), ("high", 10), ("mid", 5)]):
+        thread = threading.Thread(target=worker, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queue_depth(controller, index + 1)
+    release.set()
+    for thread in [holder, *threads]:
+        thread.join()
+
+    # ASSERT
+    assert order == ["high", "mid", "low"]
+
+
+def test_acquire_timeout_leaves_queue_clean():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+    controller.acquire()
+
+    # ACT & ASSERT
+    with pytest.raises(TimeoutError):
+        controller.acquire(timeout=0.05)
+    assert controller.queue_depth == 0
+
+    controller.release()
+    assert controller.acquire() == 0.0
+
+
+def test_raising_the_limit_admits_waiters():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+    controller.acquire()
+    admitted = threading.Event()
+
+    def worker():
+        controller.acquire()
+        admitted.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    _wait_for_queue_depth(controller, 1)
+
+    # ACT
+    controller.limit = 2
+
+    # ASSERT
+    assert admitted.wait(1.0)
+    thread.join()
+    assert controller.in_flight == 2
+
+
+def test_stats_report_wait_times():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+    release = threading.Event()
+    holder = _hold_slot(controller, release)
+    waits = []
+    thread = threading.Thread(target=lambda: waits.append(controller.acquire()))
+    thread.start()
+    _wait_for_queue_depth(controller, 1)
+
+    # ACT
+    time.sleep(0.05)
+    release.set()
+    holder.join()
+    thread.join()
+    stats = controller.stats()
+
+    # ASSERT
+    assert waits[0] >= 0.05
+    assert stats.queued == 1
+    assert stats.admitted == 2
+    assert stats.max_wait >= 0.05
+    assert stats.mean_wait == stats.total_wait
+
+
+def test_async_and_thread_callers_share_the_budget():
+    # ARRANGE
+    controller = AdmissionController(limit=2)
+    peak = 0
+    current = 0
+    lock = threading.Lock()
+
+    def enter():
+        nonlocal peak, current
+        with lock:
+            current += 1
+            peak = max(peak, current)
+
+    def leave():
+        nonlocal current
+        with lock:
+            current -= 1
+
+    def thread_worker():
+        with controller.slot():
+            enter()
+            time.sleep(0.01)
+            leave()
+
+    async def async_worker():
+        async with controller.slot_async():
+            enter()
+            await asyncio.sleep(0.01)
+            leave()
+
+    async def run_async():
+        await asyncio.gather(*(async_worker() for _ in range(20)))
+
+    # ACT
+    threads = [threading.Thread(target=thread_worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(run_async())
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert peak <= 2
+    assert controller.in_flight == 0
+    assert controller.stats().admitted == 40
+
+
+def test_cancelled_async_waiter_does_not_leak_a_slot():
+    # ARRANGE
+    controller = AdmissionController(limit=1)
+
+    async def run():
+        controller.acquire()
+        task = asyncio.create_task(controller.acquire_async())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        controller.release()
+
+    # ACT
+    asyncio.run(run())
+
+    # ASSERT
+    assert controller.in_flight == 0
+    assert controller.queue_depth == 0
+
+
+def test_cores_of_one_port_with_different_configs_keep_their_own_settings():
+    # ARRANGE
+    config = CoreConfig(metrics=MetricsPolicy(), response_cache=ResponseCachePolicy(), max_in_flight_per_port=1)
+    try:
+        plain = CoreCommands(Port(19730))
+
+        # ACT
+        configured = CoreCommands(Port(19730), config=config)
+        same_config = CoreCommands(Port(19730), config=config)
+
+        # ASSERT
+        assert configured.admission.limit == 1
+        assert configured.cache is not None
+        assert configured.metrics is not None
+        assert plain.admission.limit == 4
+        assert plain.cache is None
+        assert plain.metrics is None
+        assert same_config.admission is configured.admission
+    finally:
+        reset_port_states()
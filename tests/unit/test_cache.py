@@ -0,0 +1,147 @@
+import pytest
+
+from multiconn_archicad.core.cache import CacheTicket, ResponseCache
+from multiconn_archicad.core.config import ResponseCachePolicy
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _payload(command: str, parameters: dict | None = None) -> dict:
+    return {"command": command, "parameters": parameters}
+
+
+def test_get_counts_hits_and_misses():
+    # ARRANGE
+    cache = ResponseCache(ResponseCachePolicy())
+
+    # ACT
+    assert cache.get("a") is None
+    cache.put("a", b"{}", cache.generation)
+    assert cache.get("a") == b"{}"
+
+    # ASSERT
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ResponseCachePolicy(ttl=10.0), clock=clock)
+    cache.put("a", b"{}", cache.generation)
+
+    clock.now = 9.9
+    assert cache.get("a") == b"{}"
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    # ARRANGE
+    cache = ResponseCache(ResponseCachePolicy(max_entries=2))
+    cache.put("a", b"1", cache.generation)
+    cache.put("b", b"2", cache.generation)
+    cache.get("a")
+
+    # ACT
+    cache.put("c", b"3", cache.generation)
+
+    # ASSERT
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.stats().evictions == 1
+
+
+def test_memory_budget_is_respected():
+    # ARRANGE
+    cache = ResponseCache(ResponseCachePolicy(max_bytes=100))
+
+    # ACT
+    for key in "abcd":
+        cache.put(key, b"x" * 40, cache.generation)
+    cache.put("huge", b"x" * 200, cache.generation)
+
+    # ASSERT
+    stats = cache.stats()
+    assert stats.size_bytes <= 100
+    assert stats.entries == 2
+    assert cache.get("huge") is None
+
+
+def test_put_from_before_an_invalidation_is_ignored():
+    cache = ResponseCache(ResponseCachePolicy())
+    generation = cache.generation
+
+    cache.invalidate()
+    cache.put("a", b"{}", generation)
+
+    assert cache.get("a") is None
+    assert cache.stats().invalidations == 1
+
+
+def test_ticket_keys_ignore_parameter_order():
+    # ARRANGE
+    cache = ResponseCache(ResponseCachePolicy())
+    first = CacheTicket(cache, _payload("API.GetAttributesByType", {"attributeType": "Layer", "x": 1}))
+    first.store(b"{}", {"succeeded": True, "result": {}})
+
+    # ACT
+    second = CacheTicket(cache, _payload("API.GetAttributesByType", {"x": 1, "attributeType": "Layer"}))
+
+    # ASSERT
+    assert second.hit == b"{}"
+
+
+def test_ticket_does_not_store_failed_responses():
+    cache = ResponseCache(ResponseCachePolicy())
+    tapir_payload = {
+        "command": "API.ExecuteAddOnCommand",
+        "parameters": {"addOnCommandId": {"commandNamespace": "TapirCommand", "commandName": "GetStories"}},
+    }
+
+    CacheTicket(cache, tapir_payload).store(
+        b"{}", {"succeeded": True, "result": {"addOnCommandResponse": {"error": {"code": 1, "message": "no"}}}}
+    )
+    CacheTicket(cache, _payload("API.GetAllPropertyNames")).store(b"{}", {"succeeded": False})
+
+    assert cache.stats().entries == 0
+
+
+def test_mutating_ticket_invalidates_before_and_after_sending():
+    # ARRANGE
+    cache = ResponseCache(ResponseCachePolicy())
+    cache.put("a", b"{}", cache.generation)
+
+    # ACT
+    ticket = CacheTicket(cache, _payload("API.SetPropertyValuesOfElements", {"elementPropertyValues": []}))
+    cache.put("b", b"{}", cache.generation)
+    ticket.sent()
+
+    # ASSERT
+    assert cache.stats().entries == 0
+    assert cache.stats().invalidations == 2
+
+
+def test_uncached_read_only_ticket_leaves_cache_alone():
+    cache = ResponseCache(ResponseCachePolicy())
+    cache.put("a", b"{}", cache.generation)
+
+    ticket = CacheTicket(cache, _payload("API.GetSelectedElements"))
+    ticket.sent()
+
+    assert ticket.hit is None
+    assert cache.stats().entries == 1
+
+
+def test_policy_rejects_mutating_commands():
+    with pytest.raises(ValueError, match="read-only"):
+        ResponseCachePolicy(commands=frozenset({"API.GetAllPropertyNames", "CreateColumns"}))
@@ -0,0 +1,70 @@
+import pytest
+import threading
+
+from multiconn_archicad.core.chunking import merge_results, run_chunks, split_parameters
+
+pytestmark = pytest.mark.unit
+
+
+def test_split_keeps_other_parameters():
+    parameters = {"elements": list(range(5)), "properties": ["p"]}
+
+    chunks = split_parameters(parameters, "elements", 2)
+
+    assert [chunk["elements"] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+    assert all(chunk["properties"] == ["p"] for chunk in chunks)
+    assert parameters["elements"] == list(range(5))
+
+
+def test_merge_concatenates_in_chunk_order():
+    results = [{"values": [0, 1]}, {"values": [2, 3]}, {"values": [4]}]
+
+    assert merge_results(results, "values") == {"values": [0, 1, 2, 3, 4]}
+
+
+def test_run_chunks_preserves_order_under_parallelism():
+    # ARRANGE
+    chunks = [{"elements": [index]} for index in range(20)]
+
+    def post(chunk: dict) -> dict:
+        # Later chunks finish first
+        threading.Event().wait(0.001 * (20 - chunk["elements"][0]))
+        return {"values": chunk["elements"]}
+
+    # ACT
+    results = run_chunks(post, chunks, max_parallel=5)
+
+    # ASSERT
+    assert [result["values"][0] for result in results] == list(range(20))
+
+
+def test_run_chunks_caps_parallelism():
+    # ARRANGE
+    current, peak = 0, 0
+    lock = threading.Lock()
+
+    def post(chunk: dict) -> dict:
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        threading.Event().wait(0.01)
+        with lock:
+            current -= 1
+        return chunk
+
+    # ACT
+    run_chunks(post, [{} for _ in range(12)], max_parallel=3)
+
+    # ASSERT
+    assert 1 < peak <= 3
+
+
+def test_run_chunks_raises_the_first_failure():
+    def post(chunk: dict) -> dict:
+        if chunk["index"] == 2:
+            raise ValueError("chunk failed")
+        return chunk
+
+    with pytest.raises(ValueError, match="chunk failed"):
+        run_chunks(post, [{"index": index} for index in range(6)], max_parallel=2)
@@ -0,0 +1,72 @@
+import json
+import logging
+
+import pytest
+
+from multiconn_archicad.core import codec
+from multiconn_archicad.core.codec import OrjsonCodec, PrettyJson, StdlibJsonCodec, default_codec
+
+pytestmark = pytest.mark.unit
+
+PAYLOAD = {"command": "API.GetAllElements", "parameters": {"name": "Fal – ő", "values": [1, 2.5, None, True]}}
+
+
+@pytest.mark.parametrize("codec_class", [StdlibJsonCodec, OrjsonCodec])
+def test_round_trip(codec_class):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    json_codec = codec_class()
+
+    encoded = json_codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert json_codec.loads(encoded) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec_class", [StdlibJsonCodec, OrjsonCodec])
+def test_malformed_input_raises_value_error(codec_class):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+
+    with pytest.raises(ValueError):
+        codec_class().loads(b"{not json")
+
+
+def test_default_codec_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(codec, "orjson", None)
+
+    assert isinstance(default_codec(), StdlibJsonCodec)
+    with pytest.raises(ImportError, match="fast-json"):
+        OrjsonCodec()
+
+
+def test_default_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_codecs_compare_by_type():
+    assert StdlibJsonCodec() == StdlibJsonCodec()
+    assert hash(StdlibJsonCodec()) == hash(StdlibJsonCodec())
+
+
+def test_pretty_json_is_only_rendered_when_emitted(monkeypatch, caplog):
+    # ARRANGE
+    rendered = []
+    original = PrettyJson.__str__
+    monkeypatch.setattr(PrettyJson, "__str__", lambda self: rendered.append(1) or original(self))
+    log = logging.getLogger("multiconn_archicad.tests.pretty_json")
+
+    # ACT
+    with caplog.at_level(logging.INFO, logger=log.name):
+        log.debug("payload: %s", PrettyJson(PAYLOAD))
+    rendered_while_disabled = len(rendered)
+    with caplog.at_level(logging.DEBUG, logger=log.name):
+        log.debug("payload: %s", PrettyJson(PAYLOAD))
+
+    # ASSERT
+    assert rendered_while_disabled == 0
+    assert rendered
+    assert '"command": "API.GetAllElements"' in caplog.text
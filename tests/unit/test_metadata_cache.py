@@ -0,0 +1,99 @@
+import json
+import os
+import socket
+
+import pytest
+
+from multiconn_archicad import ArchicadLocation, MetadataCache, ProductInfo, SoloProjectID
+from multiconn_archicad.metadata_cache import listening_pid
+from multiconn_archicad.utilities.network_utils import is_local_address
+
+METADATA = (
+    ProductInfo(version=28, build=3001, lang="INT"),
+    SoloProjectID(projectPath="C:\\Projects\\Tower.pln", projectName="Tower.pln"),
+    ArchicadLocation(archicadLocation="C:\\Program Files\\Graphisoft\\Archicad 28\\Archicad.exe"),
+)
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def test_listening_pid_finds_this_process(listening_port):
+    assert listening_pid(listening_port) == os.getpid()
+
+
+def test_stored_metadata_loads_while_the_process_listens(listening_port, tmp_path):
+    cache = MetadataCache(tmp_path / "metadata.json")
+
+    cache.store(listening_port, METADATA)
+
+    assert MetadataCache(tmp_path / "metadata.json").load(listening_port) == METADATA
+
+
+def test_entries_of_closed_ports_are_dropped(tmp_path):
+    cache = MetadataCache(tmp_path / "metadata.json")
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        cache.store(port, METADATA)
+
+    assert cache.load(port) is None
+    assert json.loads(cache.path.read_text())["instances"] == {}
+
+
+def test_entries_expire_after_max_age(listening_port, tmp_path):
+    path = tmp_path / "metadata.json"
+    MetadataCache(path).store(listening_port, METADATA)
+    data = json.loads(path.read_text())
+    data["instances"][str(listening_port)]["saved"] -= 120
+    path.write_text(json.dumps(data))
+
+    assert MetadataCache(path, max_age=60).load(listening_port) is None
+
+
+def test_ports_without_a_process_are_not_stored(tmp_path):
+    if listening_pid(19743) is not None:
+        pytest.skip("port 19743 is in use")
+    cache = MetadataCache(tmp_path / "metadata.json")
+
+    cache.store(19743, METADATA)
+
+    assert not cache.path.exists()
+
+
+def test_unreadable_files_count_as_empty(listening_port, tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_text("{not json")
+    cache = MetadataCache(path)
+
+    assert cache.load(listening_port) is None
+    cache.store(listening_port, METADATA)
+    assert cache.load(listening_port) == METADATA
+
+
+def test_invalidate(listening_port, tmp_path):
+    cache = MetadataCache(tmp_path / "metadata.json")
+    cache.store(listening_port, METADATA)
+
+    cache.invalidate(listening_port)
+
+    assert cache.load(listening_port) is None
+
+
+def test_max_age_must_be_positive():
+    with pytest.raises(ValueError):
+        MetadataCache(max_age=0)
+
+
+@pytest.mark.parametrize(
+    ("address", "local"),
+    [("http://127.0.0.1", True), ("http://localhost", True), ("127.0.0.1", True), ("http://192.0.2.1", False)],
+)
+def test_is_local_address(address, local):
+    assert is_local_address(address) is local
@@ -0,0 +1,124 @@
+import math
+
+import pytest
+
+from multiconn_archicad import CommandMetrics, MetricsPolicy, MetricsSink
+from multiconn_archicad.core.metrics import Histogram, MetricsRecorder, MetricsSnapshot
+
+pytestmark = pytest.mark.unit
+
+
+class ListSink(MetricsSink):
+    def __init__(self):
+        self.calls = []
+        self.requests = []
+
+    def record_call(self, port, command, latency, error):
+        self.calls.append((port, command, latency, error))
+
+    def record_request(self, port, command, queue_wait, request_bytes, response_bytes):
+        self.requests.append((port, command, queue_wait, request_bytes, response_bytes))
+
+
+class BrokenSink(ListSink):
+    def record_call(self, port, command, latency, error):
+        raise RuntimeError("sink is down")
+
+
+def test_histogram_counts_statistics():
+    histogram = Histogram(bounds=(0.1, 1.0), counts=(3, 1, 1), total=5.4)
+
+    assert histogram.count == 5
+    assert histogram.mean == pytest.approx(1.08)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.8) == 1.0
+    assert histogram.quantile(1.0) == math.inf
+    assert Histogram(bounds=(1.0,), counts=(0, 0)).quantile(0.9) == 0.0
+
+
+def test_recorder_aggregates_per_command():
+    # ARRANGE
+    recorder = MetricsRecorder(19723, MetricsPolicy(latency_buckets=(0.01, 0.1, 1.0)))
+
+    # ACT
+    recorder.record_call("API.IsAlive", 0.005)
+    recorder.record_call("API.IsAlive", 0.05)
+    recorder.record_call("API.IsAlive", 5.0, TimeoutError())
+    recorder.record_request("API.IsAlive", 0.02, request_bytes=40, response_bytes=60)
+    recorder.record_call("GetProjectInfo", 0.5)
+
+    # ASSERT
+    is_alive, project_info = recorder.snapshot()
+    assert (is_alive.port, is_alive.command, is_alive.calls) == (19723, "API.IsAlive", 3)
+    assert is_alive.latency.counts == (1, 1, 0, 1)
+    assert is_alive.errors == {"TimeoutError": 1}
+    assert is_alive.error_count == 1
+    assert (is_alive.requests, is_alive.request_bytes, is_alive.response_bytes) == (1, 40, 60)
+    assert is_alive.queue_wait.counts == (0, 1, 0, 0)
+    assert project_info.command == "GetProjectInfo"
+    assert project_info.requests == 0
+
+
+def test_snapshot_is_not_affected_by_later_records():
+    recorder = MetricsRecorder(19723, MetricsPolicy())
+    recorder.record_call("API.IsAlive", 0.01)
+
+    snapshot = recorder.snapshot()
+    recorder.record_call("API.IsAlive", 0.01, ValueError())
+
+    assert snapshot[0].calls == 1
+    assert snapshot[0].errors == {}
+
+
+def test_sinks_receive_every_observation_and_failures_are_contained():
+    # ARRANGE
+    sink = ListSink()
+    recorder = MetricsRecorder(19723, MetricsPolicy(sinks=(BrokenSink(), sink)))
+
+    # ACT
+    recorder.record_call("API.IsAlive", 0.01, KeyError())
+    recorder.record_request("API.IsAlive", 0.0, 10, 20)
+
+    # ASSERT
+    assert sink.calls == [(19723, "API.IsAlive", 0.01, "KeyError")]
+    assert sink.requests == [(19723, "API.IsAlive", 0.0, 10, 20)]
+    assert recorder.snapshot()[0].calls == 1
+
+
+def test_prometheus_text_exposition():
+    # ARRANGE
+    recorder = MetricsRecorder(19723, MetricsPolicy(latency_buckets=(0.1, 1.0)))
+    recorder.record_call("API.IsAlive", 0.05)
+    recorder.record_call("API.IsAlive", 0.5, TimeoutError())
+    recorder.record_request("API.IsAlive", 0.0, 40, 60)
+
+    # ACT
+    text = MetricsSnapshot(recorder.snapshot()).to_prometheus()
+
+    # ASSERT
+    labels = 'port="19723",command="API.IsAlive"'
+    assert "# TYPE multiconn_archicad_command_latency_seconds histogram" in text
+    assert f"multiconn_archicad_command_calls_total{{{labels}}} 2" in text
+    assert f'multiconn_archicad_command_errors_total{{{labels},error="TimeoutError"}} 1' in text
+    assert f'multiconn_archicad_command_latency_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'multiconn_archicad_command_latency_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'multiconn_archicad_command_latency_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"multiconn_archicad_command_latency_seconds_count{{{labels}}} 2" in text
+    assert f"multiconn_archicad_command_request_bytes_total{{{labels}}} 40" in text
+    assert text.endswith("\n")
+
+
+def test_snapshot_lookup_by_command_and_port():
+    empty = Histogram(bounds=(1.0,), counts=(0, 0))
+    metrics = [CommandMetrics(port, "API.IsAlive", 1, {}, empty, 1, empty, 0, 0) for port in (19723, 19724)]
+    snapshot = MetricsSnapshot(tuple(metrics))
+
+    assert snapshot.get("API.IsAlive") is metrics[0]
+    assert snapshot.get("API.IsAlive", port=19724) is metrics[1]
+    assert snapshot.get("GetProjectInfo") is None
+
+
+@pytest.mark.parametrize("buckets", [(), (0.0, 1.0), (1.0, 0.5), (1.0, 1.0)])
+def test_policy_rejects_invalid_buckets(buckets):
+    with pytest.raises(ValueError):
+        MetricsPolicy(latency_buckets=buckets)
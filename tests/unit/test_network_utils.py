@@ -0,0 +1,75 @@
+import socket
+import time
+
+import pytest
+
+from multiconn_archicad.utilities import network_utils
+from multiconn_archicad.utilities.network_utils import listening_ports, scan_endpoints
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def listeners():
+    sockets = []
+    for _ in range(3):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        sockets.append(sock)
+    yield [sock.getsockname()[1] for sock in sockets]
+    for sock in sockets:
+        sock.close()
+
+
+def _closed_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_finds_exactly_the_listening_ports(listeners):
+    closed = _closed_port()
+
+    found = listening_ports("http://127.0.0.1", [*listeners, closed], timeout=0.5)
+
+    assert found == set(listeners)
+
+
+def test_scans_several_hosts_at_once(listeners):
+    endpoints = [("127.0.0.1", listeners[0]), ("http://localhost", listeners[1]), ("no-such-host.invalid", 1)]
+
+    found = scan_endpoints(endpoints, timeout=0.5)
+
+    assert found == {("127.0.0.1", listeners[0]), ("http://localhost", listeners[1])}
+
+
+def test_unanswered_connects_end_with_one_timeout(monkeypatch):
+    # ARRANGE
+    never_answered: list[socket.socket] = []
+
+    def start_connect(host: str, port: int) -> socket.socket:
+        # A socket that never becomes writable stands in for a connect to a host that drops packets
+        left, right = socket.socketpair()
+        left.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        left.setblocking(False)
+        try:
+            while True:
+                left.send(b"\0" * 4096)
+        except BlockingIOError:
+            pass
+        never_answered.append(right)
+        return left
+
+    monkeypatch.setattr(network_utils, "_start_connect", start_connect)
+
+    # ACT
+    start = time.perf_counter()
+    found = listening_ports("127.0.0.1", range(19723, 19744), timeout=0.2)
+    duration = time.perf_counter() - start
+
+    # ASSERT
+    assert found == set()
+    assert 0.2 <= duration < 0.5
+    for sock in never_answered:
+        sock.close()
@@ -0,0 +1,185 @@
+import time
+import tracemalloc
+import uuid
+
+import pytest
+
+from multiconn_archicad.core.profiling import (
+    CallProfile,
+    StageProfiler,
+    current_profile,
+    object_census,
+    profiled_call,
+)
+from multiconn_archicad.models.tapir.types import ElementId, ElementIdArrayItem
+
+pytestmark = pytest.mark.unit
+
+
+def test_laps_add_the_time_since_the_previous_lap():
+    # ARRANGE
+    profile = CallProfile("API.IsAlive")
+
+    # ACT
+    time.sleep(0.02)
+    profile.lap("validate_parameters")
+    time.sleep(0.02)
+    profile.lap()
+    profile.add("round_trip", 0.5)
+    profile.add("round_trip", 0.25)
+
+    # ASSERT
+    assert 0.02 <= profile.stages["validate_parameters"] < 0.04
+    assert profile.stages["round_trip"] == 0.75
+    assert set(profile.stages) == {"validate_parameters", "round_trip"}
+
+
+def test_nothing_is_profiled_without_a_running_profiler():
+    with profiled_call("API.IsAlive") as profile:
+        profile.lap("validate_parameters")
+        assert current_profile() is profile
+        assert not isinstance(profile, CallProfile)
+
+
+def test_nested_calls_join_the_outer_profile():
+    # ARRANGE
+    with StageProfiler() as profiler:
+        # ACT
+        with profiled_call("GetDetailsOfElements") as outer:
+            with profiled_call("GetDetailsOfElements") as inner:
+                inner.add("round_trip", 0.1)
+            outer.add("decode", 0.2)
+
+    # ASSERT
+    assert inner is outer
+    (profile,) = profiler.calls
+    assert profile.stages == {"round_trip": 0.1, "decode": 0.2}
+    assert profile.total >= 0
+
+
+def test_stopped_profiler_records_nothing_more():
+    profiler = StageProfiler()
+    with profiler:
+        with profiled_call("API.IsAlive"):
+            pass
+    with profiled_call("API.IsAlive"):
+        pass
+
+    assert len(profiler.calls) == 1
+
+
+def test_profilers_nest():
+    outer, inner = StageProfiler(), StageProfiler()
+
+    with outer:
+        with inner:
+            with profiled_call("API.IsAlive"):
+                pass
+        with profiled_call("API.IsAlive"):
+            pass
+
+    assert (len(outer.calls), len(inner.calls)) == (1, 1)
+
+
+def _record(profiler: StageProfiler, command: str, total: float, **stages: float) -> None:
+    profile = CallProfile(command, stages=dict(stages), total=total)
+    profiler.record(profile)
+
+
+def test_summary_ranks_stages_and_accounts_for_the_rest():
+    # ARRANGE
+    profiler = StageProfiler()
+    _record(profiler, "GetDetailsOfElements", 1.0, round_trip=0.6, validate_result=0.3)
+    _record(profiler, "GetStories", 0.5, round_trip=0.1, validate_result=0.35)
+
+    # ACT
+    summary = profiler.summary()
+    by_command = profiler.summary(by_command=True)
+
+    # ASSERT
+    assert [(s.stage, round(s.total, 3), s.calls) for s in summary] == [
+        ("round_trip", 0.7, 2),
+        ("validate_result", 0.65, 2),
+        ("other", 0.15, 2),
+    ]
+    assert (by_command[0].command, by_command[0].stage) == ("GetDetailsOfElements", "round_trip")
+
+
+def test_report_is_a_ranked_table():
+    profiler = StageProfiler()
+    _record(profiler, "GetStories", 1.0, decode=0.25, round_trip=0.75)
+
+    lines = profiler.report().splitlines()
+
+    assert lines[0].split() == ["Stage", "Total", "(s)", "Share", "Calls", "Mean", "(ms)"]
+    assert lines[1].split() == ["round_trip", "0.750", "75.0%", "1", "750.00"]
+    assert lines[2].split()[0] == "decode"
+    assert "GetStories" in profiler.report(by_command=True)
+    assert len(profiler.report(top=1).splitlines()) == 2
+
+
+def test_census_counts_models_by_class_and_shared_objects_once():
+    # ARRANGE
+    guid = uuid.uuid4()
+    elements = [ElementIdArrayItem(elementId=ElementId(guid=guid)) for _ in range(3)]
+
+    # ACT
+    census = object_census({"elements": elements})
+    raw = object_census({"elements": [{"elementId": {"guid": str(guid)}} for _ in range(3)]})
+
+    # ASSERT
+    assert census["ElementIdArrayItem"][0] == 3
+    assert census["ElementId"][0] == 3
+    assert census["UUID"][0] == 1
+    assert census["list"] == raw["list"]
+    assert raw["dict"][0] == 7
+    assert all(size > 0 for _, size in census.values())
+
+
+def test_memory_laps_charge_allocations_to_their_stage():
+    # ARRANGE
+    was_tracing = tracemalloc.is_tracing()
+
+    # ACT
+    with StageProfiler(memory=True) as profiler:
+        with profiled_call("GetStories") as profile:
+            response = {"stories": [{"index": i, "name": f"Story {i}"} for i in range(10_000)]}
+            profile.add("decode", 0.0, response)
+            profile.lap()
+            result = [story["name"].upper() for story in response["stories"]]
+            profile.lap("validate_result", result)
+
+    # ASSERT
+    assert tracemalloc.is_tracing() == was_tracing
+    assert profile.memory["decode"] > 1_000_000
+    assert profile.memory["validate_result"] > 100_000
+    assert profile.memory_peak >= profile.memory_total > 0
+    assert profile.objects["decode"]["dict"][0] == 10_001
+    assert profile.objects["validate_result"]["str"][0] == 10_000
+    summary = {s.stage: s for s in profiler.memory_summary()}
+    assert summary["peak"].peak == profile.memory_peak
+    assert summary["decode"].total == profile.memory["decode"]
+    assert profiler.object_summary()[0].type == "dict"
+
+
+def test_memory_is_not_profiled_by_default():
+    with StageProfiler() as profiler:
+        with profiled_call("GetStories") as profile:
+            profile.add("decode", 0.0, {"stories": []})
+
+    assert profile.memory is None
+    assert profile.objects == {}
+    assert profiler.memory_summary() == []
+
+
+def test_memory_report_lists_stages_and_objects():
+    with StageProfiler(memory=True) as profiler:
+        with profiled_call("GetStories") as profile:
+            profile.add("decode", 0.0, {"stories": [{"index": 1}]})
+
+    stages, objects = profiler.memory_report().split("\n\n")
+
+    assert stages.splitlines()[0].split() == ["Stage", "Total", "(MB)", "Calls", "Mean", "(MB)"]
+    assert stages.splitlines()[1].split()[0] == "peak"
+    assert objects.splitlines()[0].split() == ["Stage", "Type", "Objects", "Size", "(MB)", "Share"]
+    assert "GetStories" in profiler.memory_report(by_command=True)
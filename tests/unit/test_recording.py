@@ -0,0 +1,93 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from multiconn_archicad.core.recording import RecordedExchange, Recorder, Recording, Replayer
+
+pytestmark = pytest.mark.unit
+
+
+def exchange(command: str, response: dict, duration: float = 0.01) -> RecordedExchange:
+    payload = {"command": command, "parameters": {"a": 1, "b": 2}}
+    return RecordedExchange(payload, 200, json.dumps(response).encode(), duration)
+
+
+@pytest.mark.parametrize("file_name", ["session.jsonl", "session.jsonl.gz"])
+def test_recording_survives_a_round_trip_to_disk(tmp_path, file_name):
+    # ARRANGE
+    recording = Recording([exchange("API.IsAlive", {"succeeded": True}), exchange("API.GetAllElements", {"ü": 1})])
+
+    # ACT
+    recording.save(tmp_path / file_name)
+    loaded = Recording.load(tmp_path / file_name)
+
+    # ASSERT
+    assert loaded.exchanges == recording.exchanges
+
+
+def test_requests_match_regardless_of_key_order():
+    replayer = Replayer(Recording([exchange("API.IsAlive", {"succeeded": True})]))
+
+    found = replayer.lookup(b'{"parameters": {"b": 2, "a": 1}, "command": "API.IsAlive"}')
+
+    assert found is not None and found.response == b'{"succeeded": true}'
+
+
+def test_repeated_requests_replay_in_order_then_repeat_the_last():
+    # ARRANGE
+    replayer = Replayer(Recording([exchange("Test.Count", {"n": 1}), exchange("Test.Count", {"n": 2})]))
+    body = json.dumps({"command": "Test.Count", "parameters": {"a": 1, "b": 2}}).encode()
+
+    # ACT
+    responses = [json.loads(replayer.lookup(body).response)["n"] for _ in range(3)]
+    replayer.rewind()
+
+    # ASSERT
+    assert responses == [1, 2, 2]
+    assert json.loads(replayer.lookup(body).response)["n"] == 1
+
+
+def test_unknown_requests_are_not_found():
+    replayer = Replayer(Recording([exchange("API.IsAlive", {})]))
+
+    assert replayer.lookup(b'{"command": "API.GetAllElements"}') is None
+    assert replayer.lookup(b"not json") is None
+
+
+def test_delay_follows_the_recorded_duration_only_with_timing():
+    recorded = exchange("API.IsAlive", {}, duration=0.5)
+
+    assert Replayer(Recording([recorded])).delay(recorded) == 0.0
+    assert Replayer(Recording([recorded]), timing=True, time_scale=0.1).delay(recorded) == pytest.approx(0.05)
+
+
+@pytest.mark.parametrize("async_client", [False, True])
+def test_recorder_hands_on_compressed_responses_decoded_once(async_client):
+    # ARRANGE
+    body = b'{"succeeded": true, "result": {"text": "' + b"x" * 1000 + b'"}}'
+    compressed = gzip.compress(body)
+    headers = {"Content-Encoding": "gzip", "Content-Length": str(len(compressed))}
+    upstream = httpx.MockTransport(lambda request: httpx.Response(200, headers=headers, content=compressed))
+    recorder = Recorder()
+    request = {"command": "API.IsAlive", "parameters": {}}
+
+    # ACT
+    if async_client:
+
+        async def send():
+            async with httpx.AsyncClient(transport=recorder.wrap_async(upstream)) as client:
+                return await client.post("http://archicad", json=request)
+
+        response = asyncio.run(send())
+    else:
+        with httpx.Client(transport=recorder.wrap(upstream)) as client:
+            response = client.post("http://archicad", json=request)
+
+    # ASSERT
+    assert response.content == body
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(body))
+    assert recorder.recording.exchanges[0].response == body
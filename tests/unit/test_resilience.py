@@ -0,0 +1,113 @@
+import pytest
+
+from multiconn_archicad.core.command_kinds import command_name, is_read_only
+from multiconn_archicad.core.config import CircuitBreakerPolicy, RetryPolicy
+from multiconn_archicad.core.resilience import BreakerState, CircuitBreaker
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("API.GetAllElements", True),
+        ("API.IsAlive", True),
+        ("GetProjectInfo", True),
+        ("FilterElements", True),
+        ("API.SetPropertyValuesOfElements", False),
+        ("CreateColumns", False),
+        ("DeleteElements", False),
+        ("API.MoveNavigatorItem", False),
+    ],
+)
+def test_is_read_only(command, expected):
+    assert is_read_only(command) is expected
+
+
+def test_command_name_unwraps_tapir_commands():
+    payload = {
+        "command": "API.ExecuteAddOnCommand",
+        "parameters": {"addOnCommandId": {"commandNamespace": "TapirCommand", "commandName": "GetStories"}},
+    }
+
+    assert command_name(payload) == "GetStories"
+    assert command_name({"command": "API.IsAlive", "parameters": None}) == "API.IsAlive"
+
+
+def test_retry_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    delays = [policy.delay(attempt) for attempt in range(10) for _ in range(20)]
+
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert len(set(delays)) > 1
+    assert all(policy.delay(0) <= 0.1 for _ in range(20))
+
+
+def test_breaker_opens_after_consecutive_failures():
+    # ARRANGE
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=3))
+
+    # ACT & ASSERT
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_breaker_grants_a_single_probe_after_reset_timeout():
+    # ARRANGE
+    clock = FakeClock()
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1, reset_timeout=5.0), clock=clock)
+    breaker.record_failure()
+
+    # ACT & ASSERT
+    assert not breaker.try_begin_probe()
+    clock.now = 5.0
+    assert breaker.try_begin_probe()
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert not breaker.try_begin_probe()
+
+
+def test_successful_probe_closes_the_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1, reset_timeout=1.0), clock=clock)
+    breaker.record_failure()
+    clock.now = 1.0
+    breaker.try_begin_probe()
+
+    breaker.record_success()
+
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_failed_probe_reopens_for_another_reset_timeout():
+    # ARRANGE
+    clock = FakeClock()
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=3, reset_timeout=1.0), clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 1.0
+    breaker.try_begin_probe()
+
+    # ACT
+    breaker.record_failure()
+
+    # ASSERT
+    assert breaker.state is BreakerState.OPEN
+    clock.now = 1.5
+    assert not breaker.probe_due
+    clock.now = 2.0
+    assert breaker.probe_due
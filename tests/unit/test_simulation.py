@@ -0,0 +1,155 @@
+import socket
+
+import pytest
+from pydantic import TypeAdapter
+
+from multiconn_archicad.models.official import commands as official_models
+from multiconn_archicad.models.tapir import commands as tapir_models
+from multiconn_archicad.simulation import (
+    SimulatedArchicad,
+    SimulatedCommands,
+    SimulationSettings,
+    SyntheticProject,
+    official_commands,
+    tapir_commands,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def project():
+    return SyntheticProject.generate(element_count=200, user_property_count=4, seed=7)
+
+
+def sample_parameters(project: SyntheticProject, command: str) -> dict:
+    elements = [{"elementId": {"guid": element.guid}} for element in project.elements[:5]]
+    properties = [{"propertyId": {"guid": prop.guid}} for prop in project.properties]
+    system = {"classificationSystemId": {"guid": project.classification_system_guid}}
+    return {
+        "GetElementsByType": {"elementType": "Wall"},
+        "GetTypesOfElements": {"elements": elements},
+        "GetPropertyIds": {"properties": [prop.user_id for prop in project.properties]},
+        "GetPropertyValuesOfElements": {"elements": elements, "properties": properties},
+        "SetPropertyValuesOfElements": {
+            "elementPropertyValues": [
+                {**elements[0], **properties[0], "propertyValue": {"type": "string", "value": "W-NEW"}}
+            ]
+        },
+        "GetAllClassificationsInSystem": system,
+        "GetClassificationsOfElements": {"elements": elements, "classificationSystemIds": [system]},
+        "GetNavigatorItemTree": {"navigatorTreeId": {"type": "ProjectMap"}},
+        "GetDetailsOfElements": {"elements": elements},
+        "IsAddOnCommandAvailable": {
+            "addOnCommandId": {"commandNamespace": "TapirCommand", "commandName": "GetStories"}
+        },
+    }.get(command, {})
+
+
+def test_generation_is_deterministic():
+    first = SyntheticProject.generate(element_count=50, seed=3)
+    second = SyntheticProject.generate(element_count=50, seed=3)
+    other = SyntheticProject.generate(element_count=50, seed=4)
+
+    assert [e.guid for e in first.elements] == [e.guid for e in second.elements]
+    assert [e.guid for e in first.elements] != [e.guid for e in other.elements]
+    assert first.value_of(first.elements[9], first.properties[3]) == second.value_of(
+        second.elements[9], second.properties[3]
+    )
+
+
+@pytest.mark.parametrize("command", sorted(official_commands()))
+def test_official_responses_match_the_api_schema(project, command):
+    # ARRANGE
+    name = command.removeprefix("API.")
+    commands = SimulatedCommands(project)
+
+    # ACT
+    response = commands.execute({"command": command, "parameters": sample_parameters(project, name)})
+
+    # ASSERT
+    assert response["succeeded"], response
+    result_model = getattr(official_models, f"{name}Result", None)
+    if result_model is not None:
+        TypeAdapter(result_model).validate_python(response["result"])
+
+
+@pytest.mark.parametrize("command", sorted(tapir_commands()))
+def test_tapir_responses_match_the_api_schema(project, command):
+    # ARRANGE
+    commands = SimulatedCommands(project)
+    parameters = {
+        "addOnCommandId": {"commandNamespace": "TapirCommand", "commandName": command},
+        "addOnCommandParameters": sample_parameters(project, command),
+    }
+
+    # ACT
+    response = commands.execute({"command": "API.ExecuteAddOnCommand", "parameters": parameters})
+
+    # ASSERT
+    assert response["succeeded"], response
+    TypeAdapter(getattr(tapir_models, f"{command}Result")).validate_python(response["result"]["addOnCommandResponse"])
+
+
+def test_set_values_are_returned_by_later_reads(project):
+    # ARRANGE
+    commands = SimulatedCommands(project)
+    element, prop = project.elements[1], project.properties[1]
+    ids = {"elementId": {"guid": element.guid}, "propertyId": {"guid": prop.guid}}
+
+    # ACT
+    commands.execute(
+        {
+            "command": "API.SetPropertyValuesOfElements",
+            "parameters": {"elementPropertyValues": [{**ids, "propertyValue": {"type": "length", "value": 4.2}}]},
+        }
+    )
+    response = commands.execute(
+        {
+            "command": "API.GetPropertyValuesOfElements",
+            "parameters": {
+                "elements": [{"elementId": ids["elementId"]}],
+                "properties": [{"propertyId": ids["propertyId"]}],
+            },
+        }
+    )
+
+    # ASSERT
+    value = response["result"]["propertyValuesForElements"][0]["propertyValues"][0]["propertyValue"]
+    assert value["value"] == 4.2
+
+
+def test_unknown_commands_and_elements_are_errors(project):
+    commands = SimulatedCommands(project)
+    missing = {"elementId": {"guid": "00000000-0000-0000-0000-000000000000"}}
+
+    unknown = commands.execute({"command": "API.DoesNotExist", "parameters": {}})
+    types = commands.execute({"command": "API.GetTypesOfElements", "parameters": {"elements": [missing]}})
+
+    assert unknown["succeeded"] is False
+    assert "error" in types["result"]["typesOfElements"][0]
+
+
+def test_latency_scales_with_the_elements_of_a_command():
+    settings = SimulationSettings(latency=0.1, latencies={"API.IsAlive": 0.0}, latency_per_element=0.001)
+
+    assert settings.latency_of("API.IsAlive", 0) == 0.0
+    assert settings.latency_of("GetDetailsOfElements", 100) == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"latency": -1}, {"max_concurrency": 0}, {"failure_rate": 1.5}, {"failures": ("explode",)}, {"failures": ()}],
+)
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        SimulationSettings(**kwargs)
+
+
+def test_ports_with_a_listener_are_not_taken():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+
+        with pytest.raises(OSError):
+            SimulatedArchicad(port=listener.getsockname()[1]).start()
@@ -0,0 +1,78 @@
+import pytest
+import threading
+
+from multiconn_archicad.core.single_flight import SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+def test_first_joiner_leads_and_followers_share_the_flight():
+    flights = SingleFlight()
+
+    future, is_leader = flights.join("a")
+    follower_future, follower_is_leader = flights.join("a")
+
+    assert is_leader and not follower_is_leader
+    assert follower_future is future
+    assert flights.stats().coalesced == 1
+
+
+def test_landing_shares_result_and_clears_the_key():
+    # ARRANGE
+    flights = SingleFlight()
+    future, _ = flights.join("a")
+    follower_future, _ = flights.join("a")
+
+    # ACT
+    flights.land("a", future, content=b"{}")
+
+    # ASSERT
+    assert follower_future.result() == b"{}"
+    _, is_leader = flights.join("a")
+    assert is_leader
+    assert flights.stats().flights == 2
+
+
+def test_landing_with_an_error_raises_for_followers():
+    flights = SingleFlight()
+    future, _ = flights.join("a")
+
+    flights.land("a", future, error=ValueError("boom"))
+
+    with pytest.raises(ValueError, match="boom"):
+        future.result()
+
+
+def test_different_keys_fly_separately():
+    flights = SingleFlight()
+
+    _, first = flights.join("a")
+    _, second = flights.join("b")
+
+    assert first and second
+
+
+def test_threads_coalesce_while_the_leader_is_in_flight():
+    # ARRANGE
+    flights = SingleFlight()
+    future, _ = flights.join("a")
+    results = []
+
+    def follower():
+        follower_future, is_leader = flights.join("a")
+        assert not is_leader
+        results.append(follower_future.result(timeout=2.0))
+
+    threads = [threading.Thread(target=follower) for _ in range(5)]
+
+    # ACT
+    for thread in threads:
+        thread.start()
+    while flights.stats().coalesced < 5:
+        pass
+    flights.land("a", future, content=b"shared")
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert results == [b"shared"] * 5
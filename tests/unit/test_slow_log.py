@@ -0,0 +1,76 @@
+import json
+import pytest
+
+from multiconn_archicad.core.config import SlowCommandPolicy
+from multiconn_archicad.core.slow_log import SlowCommand, SlowCommandLog, parameters_preview
+
+pytestmark = pytest.mark.unit
+
+
+def entry(command: str, latency: float = 1.0) -> SlowCommand:
+    return SlowCommand(command=command, port=19723, project="Office", latency=latency, parameters="{}")
+
+
+def test_command_threshold_overrides_the_global_one():
+    slow_log = SlowCommandLog(SlowCommandPolicy(threshold=1.0, thresholds={"GetNavigatorItemTree": 30.0}))
+
+    assert slow_log.is_slow("API.IsAlive", 1.5)
+    assert not slow_log.is_slow("API.IsAlive", 0.5)
+    assert not slow_log.is_slow("GetNavigatorItemTree", 1.5)
+    assert slow_log.is_slow("GetNavigatorItemTree", 31.0)
+
+
+def test_ring_buffer_keeps_the_most_recent_entries():
+    # ARRANGE
+    slow_log = SlowCommandLog(SlowCommandPolicy(capacity=2))
+
+    # ACT
+    for command in ("First", "Second", "Third"):
+        slow_log.record(entry(command))
+
+    # ASSERT
+    assert [e.command for e in slow_log.entries()] == ["Second", "Third"]
+    slow_log.clear()
+    assert slow_log.entries() == []
+
+
+def test_parameters_preview_is_the_compact_json_of_short_parameters():
+    parameters = {"elements": [{"guid": "a"}], "depth": 2, "flag": None, "name": "Ünïcode"}
+    assert parameters_preview(parameters, 1000) == json.dumps(parameters, ensure_ascii=False, separators=(",", ":"))
+    assert parameters_preview(None, 1000) == "null"
+
+
+def test_parameters_preview_stops_encoding_at_the_limit():
+    # ARRANGE
+    class CountingList(list):
+        visited = 0
+
+        def __iter__(self):
+            for item in super().__iter__():
+                CountingList.visited += 1
+                yield item
+
+    elements = CountingList({"guid": f"{i:036}"} for i in range(100_000))
+
+    # ACT
+    preview = parameters_preview({"elements": elements}, 100)
+
+    # ASSERT
+    assert preview.startswith('{"elements":[{"guid":"000')
+    assert preview.endswith("... (more chars)")
+    assert len(preview) == 100 + len("... (more chars)")
+    assert CountingList.visited < 10
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threshold": -1.0},
+        {"thresholds": {"API.IsAlive": -0.5}},
+        {"capacity": 0},
+        {"max_parameter_chars": -1},
+    ],
+)
+def test_invalid_policy_is_rejected(kwargs):
+    with pytest.raises(ValueError):
+        SlowCommandPolicy(**kwargs)
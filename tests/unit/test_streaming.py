@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from multiconn_archicad.core import streaming
+from multiconn_archicad.core.streaming import ItemStreamParser
+
+pytestmark = pytest.mark.unit
+
+PATH = ("result", "addOnCommandResponse", "detailsOfElements")
+ITEMS = [{"index": i, "name": "Fal ő" * i} for i in range(40)] + [3, 4.5e-3, -12, None, True, "]}", 'a "{[" \\']
+RESPONSE = {
+    "succeeded": True,
+    "result": {"before": [1, {"x": "]}"}], "addOnCommandResponse": {"count": 46, "detailsOfElements": ITEMS}},
+}
+
+
+def _parse(body: bytes, chunk_size: int, path=PATH) -> tuple[ItemStreamParser, list]:
+    parser = ItemStreamParser(path)
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items += parser.feed(body[start : start + chunk_size])
+    items += parser.close()
+    return parser, items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_survive_any_chunking(chunk_size, indent):
+    body = json.dumps(RESPONSE, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    parser, items = _parse(body, chunk_size)
+
+    assert items == ITEMS
+    assert parser.found
+    assert parser.items_parsed == len(ITEMS)
+    assert parser.envelope == {"succeeded": True, "result": {"before": [1, {"x": "]}"}], "addOnCommandResponse": {"count": 46}}}
+
+
+def test_items_are_emitted_as_soon_as_they_are_complete():
+    # ARRANGE
+    parser = ItemStreamParser(("result", "elements"))
+
+    # ACT
+    first = parser.feed(b'{"succeeded": true, "result": {"elements": [{"a": 1}, {"a"')
+    second = parser.feed(b': 2}]}}')
+
+    # ASSERT
+    assert first == [{"a": 1}]
+    assert second == [{"a": 2}]
+    assert parser.done
+
+
+def test_missing_list_keeps_the_error_envelope():
+    parser, items = _parse(b'{"succeeded": false, "error": {"code": 4, "message": "nope"}}', 5, ("result", "elements"))
+
+    assert items == []
+    assert not parser.found
+    assert parser.envelope == {"succeeded": False, "error": {"code": 4, "message": "nope"}}
+
+
+def test_null_in_place_of_the_list_is_not_found():
+    parser, items = _parse(b'{"succeeded": true, "result": {"elements": null}}', 4, ("result", "elements"))
+
+    assert items == []
+    assert not parser.found
+
+
+def test_long_streams_do_not_keep_consumed_data():
+    body = json.dumps({"result": {"elements": [{"i": i} for i in range(20000)]}}).encode()
+    parser = ItemStreamParser(("result", "elements"))
+
+    for start in range(0, len(body), 4096):
+        parser.feed(body[start : start + 4096])
+        assert len(parser._buffer) < 70000
+
+
+def test_a_large_item_is_decoded_once_however_it_is_chunked(monkeypatch):
+    # ARRANGE
+    class CountingDecoder(json.JSONDecoder):
+        calls = 0
+
+        def raw_decode(self, s, idx=0):
+            CountingDecoder.calls += 1
+            return super().raw_decode(s, idx)
+
+    monkeypatch.setattr(streaming, "_DECODER", CountingDecoder())
+    item = {"properties": [{"name": f"P{i}", "value": "x" * 50} for i in range(2000)]}
+    body = json.dumps({"result": {"elements": [item]}}).encode()
+
+    # ACT
+    parser, items = _parse(body, 64, ("result", "elements"))
+
+    # ASSERT
+    assert items == [item]
+    assert CountingDecoder.calls == 4  # the keys, a first try of the cut item, then the complete item
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"result": {"elements": [1, 2', b'{"result": {"elements": [1 2]}}', b"[1, 2]", b'{"result": {"elements": [{]}}']
+)
+def test_truncated_or_malformed_body_raises_value_error(body):
+    with pytest.raises(ValueError):
+        _parse(body, 3, ("result", "elements"))
@@ -0,0 +1,112 @@
+import logging
+
+import pytest
+
+from multiconn_archicad.core.tracing import (
+    InMemorySpanExporter,
+    SpanExporter,
+    TraceContextFilter,
+    Tracer,
+    current_span,
+    current_trace_id,
+    use_span,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FailingExporter(SpanExporter):
+    def export(self, span):
+        raise RuntimeError("collector is down")
+
+
+def test_nested_spans_share_the_trace_of_their_root():
+    # ARRANGE
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+
+    # ACT
+    with tracer.span("workflow") as root:
+        with tracer.span("step", {"port": 19723}) as child:
+            assert current_span() is child
+            assert current_trace_id() == root.trace_id
+        assert current_span() is root
+
+    # ASSERT
+    assert current_span() is None
+    step, workflow = exporter.spans
+    assert (step.name, workflow.name) == ("step", "workflow")
+    assert step.trace_id == workflow.trace_id
+    assert step.parent_id == workflow.span_id
+    assert workflow.parent_id is None
+    assert step.attributes == {"port": 19723}
+    assert step.duration is not None and step.duration <= workflow.duration
+
+
+def test_separate_roots_start_separate_traces():
+    tracer = Tracer(InMemorySpanExporter())
+
+    with tracer.span("first") as first:
+        pass
+    with tracer.span("second") as second:
+        pass
+
+    assert first.trace_id != second.trace_id
+
+
+def test_span_records_the_exception_that_ended_it():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+
+    with pytest.raises(KeyError):
+        with tracer.span("failing"):
+            raise KeyError("missing")
+
+    assert exporter.spans[0].error == "KeyError"
+    assert current_span() is None
+
+
+def test_started_span_is_not_current_until_used():
+    # ARRANGE
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+
+    # ACT
+    span = tracer.start_span("stream")
+    assert current_span() is None
+    with use_span(span):
+        assert current_span() is span
+    tracer.end_span(span)
+
+    # ASSERT
+    assert current_span() is None
+    assert exporter.spans == [span]
+    assert span.end_time is not None
+
+
+def test_failing_exporter_does_not_break_the_traced_code(caplog):
+    tracer = Tracer(FailingExporter())
+
+    with caplog.at_level(logging.WARNING, logger="multiconn_archicad.core.tracing"):
+        with tracer.span("work") as span:
+            pass
+
+    assert span.end_time is not None
+    assert "Span exporter" in caplog.text
+
+
+def test_log_filter_adds_the_ids_of_the_current_span():
+    # ARRANGE
+    tracer = Tracer(InMemorySpanExporter())
+    log_filter = TraceContextFilter()
+    outside = logging.LogRecord("test", logging.INFO, __file__, 1, "outside", None, None)
+    inside = logging.LogRecord("test", logging.INFO, __file__, 1, "inside", None, None)
+
+    # ACT
+    log_filter.filter(outside)
+    with tracer.span("work") as span:
+        log_filter.filter(inside)
+
+    # ASSERT
+    assert (outside.trace_id, outside.span_id) == ("-", "-")
+    assert (inside.trace_id, inside.span_id) == (span.trace_id, span.span_id)